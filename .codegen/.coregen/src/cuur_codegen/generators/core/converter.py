@@ -2,15 +2,16 @@
 Converter Generator - Generates entity converters for DAO ↔ Domain mapping
 """
 
+import json
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 from cuur_codegen.base.generator_bases import SingleFileGenerator
 from cuur_codegen.base.generator import GenerateResult
 from cuur_codegen.base.context import GenerationContext
 from cuur_codegen.base.folder_structure import FolderStructureConfig
 from cuur_codegen.utils.openapi import extract_schemas, extract_operations, get_response_schema, is_shared_type
-from cuur_codegen.utils.string import extract_resource_from_operation_id, camel_case
+from cuur_codegen.utils.string import extract_resource_from_operation_id, camel_case, pascal_case
 from cuur_codegen.utils.naming import NamingConvention
 from cuur_codegen.utils.file import write_file
 
@@ -111,7 +112,17 @@ class ConverterGenerator(SingleFileGenerator):
 
         # Store entity types for generate_content()
         self._entity_types = sorted(list(entity_types))
-        return super().generate(context)
+        result = super().generate(context)
+
+        # Parity tests against the generic ConverterPresets (platform/tests/{domain}/converters/)
+        parity_test = self._generate_parity_test(context, self._entity_types)
+        if parity_test:
+            tests_dir = context.config.paths.project_root / "platform" / "tests" / context.domain_name / "converters"
+            test_file = tests_dir / f"{context.domain_name}-converters.parity.test.ts"
+            write_file(test_file, parity_test)
+            result.files.append(test_file)
+
+        return result
 
     def generate_content(self, context: GenerationContext) -> str:
         """Generate converter file content"""
@@ -173,6 +184,7 @@ class ConverterGenerator(SingleFileGenerator):
 
         return component
 
+
     def _generate_converter_file(self, context: GenerationContext, entity_types: List[str]) -> str:
         """Generate single converter file for all entity types in domain"""
         domain_name = context.domain_name
@@ -182,50 +194,72 @@ class ConverterGenerator(SingleFileGenerator):
         header = f"""/**
  * {domain_title} Domain Converters
  *
- * Thin wrappers around centralized converters (packages/core/src/shared/helpers/core-converters.ts)
+ * Entity-specialized converters generated from the OpenAPI schema properties.
  * Converts between domain types (with Date objects) and API types (with ISO strings)
  *
- * Naming convention: {{entity}}ToApi (camelCase)
+ * Each converter builds the response object literal from the known schema keys,
+ * so every entity keeps a single object shape; fields outside the schema are dropped.
+ *
+ * Naming convention: {{entity}}ToApi / {{entity}}ListToApi (camelCase)
  */
 
 """
 
         converter_functions = []
+        uses_presets = False
 
-        # Extract schemas for date-time field detection
+        # Extract schemas for property and date-time field detection
         schemas = extract_schemas(context.spec)
+        entity_set = set(entity_types)
 
         for entity_type in entity_types:
-            # Function name: camelCase entity name + "ToApi"
             func_name = f"{camel_case(entity_type)}ToApi"
+            list_func_name = f"{camel_case(entity_type)}ListToApi"
             param_name = camel_case(entity_type)
 
-            # Detect date-time fields from OpenAPI schema
-            date_fields = self._detect_date_time_fields(entity_type, schemas)
-
-            # Build converter call with detected date fields (explicitly pass empty array if none found)
-            if date_fields:
-                date_fields_str = ", ".join([f'"{field}"' for field in date_fields])
-                converter_call = f'ConverterPresets.standardApiResponse({param_name}, {{ dateFields: [{date_fields_str}] }})'
+            properties = self._collect_properties(entity_type, schemas)
+            date_fields = self._converted_date_fields(entity_type, schemas)
+
+            if properties:
+                body = self._build_converter_body(
+                    entity_type, param_name, properties, date_fields, schemas, entity_set
+                )
+                dropped = [name for name, prop in properties.items() if self._is_internal_property(prop)]
+                kept = len(properties) - len(dropped)
+                shape_doc = f"\n *\n * Builds the response from {kept} schema properties; unknown fields are dropped"
+                if dropped:
+                    dropped_list = ", ".join(f"`{name}`" for name in dropped)
+                    shape_doc += f"\n * Internal fields dropped: {dropped_list}"
             else:
-                # Explicitly pass empty array to avoid default dateFields conversion
-                converter_call = f'ConverterPresets.standardApiResponse({param_name}, {{ dateFields: [] }})'
+                # No declared properties - nothing to specialize on, keep the generic preset
+                uses_presets = True
+                date_fields_str = ", ".join(json.dumps(field) for field in date_fields)
+                body = f"""  return ConverterPresets.standardApiResponse({param_name}, {{ dateFields: [{date_fields_str}] }}) as {entity_type};"""
+                shape_doc = "\n *\n * No schema properties declared - uses ConverterPresets.standardApiResponse"
 
-            # Build date fields documentation
             if date_fields:
-                date_fields_list = ", ".join([f"`{field}`" for field in date_fields])
-                date_fields_doc = f"\n *\n * Date fields converted: {date_fields_list}\n *\n * Error handling:\n * - Invalid Date objects are converted to null\n * - Non-Date values are left unchanged (with console warnings in development mode)\n * - String values are assumed to already be in ISO format and are left unchanged"
+                date_fields_list = ", ".join(f"`{field}`" for field in date_fields)
+                date_fields_doc = f"\n *\n * Date fields converted: {date_fields_list}\n *\n * Error handling:\n * - Invalid Date objects are converted to null\n * - Parseable strings are normalized to ISO format, other values are left unchanged"
             else:
                 date_fields_doc = "\n *\n * No date-time fields detected in OpenAPI schema - no date conversion performed"
 
             converter_functions.append(f"""
 /**
- * Convert {entity_type} domain entity to API response
- * Uses structural typing to accept repository output (may include extra fields from Zod passthrough)
- *{date_fields_doc}
+ * Convert {entity_type} domain entity to API response{shape_doc}{date_fields_doc}
  */
 export function {func_name}({param_name}: {entity_type}): {entity_type} {{
-  return {converter_call} as {entity_type};
+{body}
+}}
+
+/**
+ * Convert a list of {entity_type} entities (output array is pre-sized)
+ */
+export function {list_func_name}(items: readonly {entity_type}[]): {entity_type}[] {{
+  const result = new Array<{entity_type}>(items.length);
+  for (let i = 0; i < items.length; i++) {{
+    result[i] = {func_name}(items[i]);
+  }}
+  return result;
 }}""")
 
         # Separate shared types from domain-specific types
@@ -265,7 +299,9 @@ export function {func_name}({param_name}: {entity_type}): {entity_type} {{
             shared_type="types"
         )
 
-        imports = [f'import {{ ConverterPresets }} from "{shared_helpers_path}";']
+        imports = []
+        if uses_presets:
+            imports.append(f'import {{ ConverterPresets }} from "{shared_helpers_path}";')
 
         # Import domain-specific types
         if domain_types_list:
@@ -277,32 +313,183 @@ export function {func_name}({param_name}: {entity_type}): {entity_type} {{
             shared_imports = ",\n".join(f"  {t}" for t in shared_types_list)
             imports.append(f'import type {{\n{shared_imports},\n}} from "{shared_types_path}";')
 
+        to_iso_helper = """
+/**
+ * Date → ISO string; parseable strings are normalized, invalid Dates become null
+ */
+function toIsoString<V>(value: V): V {
+  if (value instanceof Date) {
+    return (Number.isNaN(value.getTime()) ? null : value.toISOString()) as unknown as V;
+  }
+  if (typeof value === "string" && value) {
+    const time = Date.parse(value);
+    return (Number.isNaN(time) ? value : new Date(time).toISOString()) as unknown as V;
+  }
+  return value;
+}
+"""
+
         return f"""{header}{chr(10).join(imports)}
-{chr(10).join(converter_functions)}
+{to_iso_helper}{chr(10).join(converter_functions)}
 """
 
-    def _detect_date_time_fields(self, entity_type: str, schemas: Dict[str, Any]) -> List[str]:
-        """Detect date-time fields from OpenAPI schema for an entity type"""
-        date_fields = []
+    def _build_converter_body(
+        self,
+        entity_type: str,
+        param_name: str,
+        properties: Dict[str, Any],
+        date_fields: List[str],
+        schemas: Dict[str, Any],
+        entity_types: set
+    ) -> str:
+        """Build the straight-line converter body: one object literal with the schema keys"""
+        date_field_set = set(date_fields)
+        lines = []
+
+        # Schemas that allow extra keys keep them; everything else gets an exact shape
+        if self._allows_additional_properties(entity_type, schemas):
+            lines.append(f"    ...{param_name},")
 
-        # Get schema for this entity type
-        entity_schema = schemas.get(entity_type)
-        if not entity_schema:
-            return date_fields
+        for prop_name, prop_schema in properties.items():
+            if self._is_internal_property(prop_schema):
+                continue
+
+            key = prop_name if prop_name.isidentifier() else json.dumps(prop_name)
+            access = f"{param_name}.{prop_name}" if prop_name.isidentifier() else f"{param_name}[{json.dumps(prop_name)}]"
+
+            if prop_name in date_field_set:
+                value = f"toIsoString({access})"
+            else:
+                nested = self._nested_entity_ref(prop_schema, entity_types)
+                if nested:
+                    kind, nested_type = nested
+                    nested_func = camel_case(nested_type)
+                    if kind == "array":
+                        value = f"{access} ? {nested_func}ListToApi({access}) : {access}"
+                    else:
+                        value = f"{access} ? {nested_func}ToApi({access}) : {access}"
+                else:
+                    value = access
+
+            lines.append(f"    {key}: {value},")
+
+        return f"""  if (!{param_name}) return {param_name};
+  return {{
+{chr(10).join(lines)}
+  }} as {entity_type};"""
+
+    def _collect_properties(
+        self, entity_type: str, schemas: Dict[str, Any], seen: Optional[set] = None
+    ) -> Dict[str, Any]:
+        """Collect schema properties in declaration order, merging allOf members"""
+        seen = seen if seen is not None else set()
+        if entity_type in seen:
+            return {}
+        seen.add(entity_type)
+
+        schema = schemas.get(entity_type)
+        if not isinstance(schema, dict):
+            return {}
+
+        return self._collect_schema_properties(schema, schemas, seen)
+
+    def _collect_schema_properties(
+        self, schema: Dict[str, Any], schemas: Dict[str, Any], seen: set
+    ) -> Dict[str, Any]:
+        """Collect properties of an inline schema (allOf members first, then own properties)"""
+        properties: Dict[str, Any] = {}
+
+        for member in schema.get("allOf", []) or []:
+            if not isinstance(member, dict):
+                continue
+            if "$ref" in member:
+                properties.update(self._collect_properties(member["$ref"].split("/")[-1], schemas, seen))
+            else:
+                properties.update(self._collect_schema_properties(member, schemas, seen))
+
+        own = schema.get("properties", {})
+        if isinstance(own, dict):
+            properties.update(own)
+
+        return properties
+
+    def _allows_additional_properties(self, entity_type: str, schemas: Dict[str, Any]) -> bool:
+        """True when the entity schema explicitly allows undeclared keys"""
+        schema = schemas.get(entity_type)
+        if not isinstance(schema, dict):
+            return False
+        additional = schema.get("additionalProperties")
+        return additional is True or isinstance(additional, dict) and bool(additional)
+
+    @staticmethod
+    def _is_internal_property(prop_schema: Any) -> bool:
+        """Internal fields never leave the API: x-internal: true or writeOnly: true"""
+        if not isinstance(prop_schema, dict):
+            return False
+        return prop_schema.get("x-internal") is True or prop_schema.get("writeOnly") is True
+
+    @staticmethod
+    def _nested_entity_ref(prop_schema: Any, entity_types: set) -> Optional[Tuple[str, str]]:
+        """
+        Detect a property holding another converted entity.
+
+        Returns ("array", Entity) for arrays of $ref items, ("object", Entity) for a single
+        $ref (directly, via allOf, or as the non-null oneOf/anyOf variant), otherwise None.
+        """
+        if not isinstance(prop_schema, dict):
+            return None
+
+        def ref_name(schema: Any) -> Optional[str]:
+            if not isinstance(schema, dict):
+                return None
+            if "$ref" in schema:
+                name = schema["$ref"].split("/")[-1]
+                return name if name in entity_types else None
+            for key in ("allOf", "oneOf", "anyOf"):
+                variants = [v for v in schema.get(key, []) or [] if isinstance(v, dict) and v.get("type") != "null"]
+                if len(variants) == 1:
+                    return ref_name(variants[0])
+            return None
+
+        if prop_schema.get("type") == "array" or "items" in prop_schema:
+            name = ref_name(prop_schema.get("items"))
+            return ("array", name) if name else None
+
+        name = ref_name(prop_schema)
+        return ("object", name) if name else None
+
+    def _converted_date_fields(self, entity_type: str, schemas: Dict[str, Any]) -> List[str]:
+        """
+        Date fields the converter rewrites.
 
-        # Check if schema has properties
-        properties = entity_schema.get("properties", {})
-        if not isinstance(properties, dict):
+        Mirrors ConverterPresets.standardApiResponse, which falls back to createdAt/updatedAt
+        when no date fields are passed.
+        """
+        date_fields = self._detect_date_time_fields(entity_type, schemas)
+        if date_fields:
             return date_fields
+        properties = self._collect_properties(entity_type, schemas)
+        return [field for field in ("createdAt", "updatedAt") if field in properties]
+
+    def _detect_date_time_fields(self, entity_type: str, schemas: Dict[str, Any]) -> List[str]:
+        """Detect date-time fields from OpenAPI schema for an entity type (including allOf members)"""
+        date_fields = []
 
         # Scan properties for date-time format
-        for prop_name, prop_schema in properties.items():
+        for prop_name, prop_schema in self._collect_properties(entity_type, schemas).items():
             if not isinstance(prop_schema, dict):
                 continue
 
+            # Resolve a $ref to a named date-time scalar (e.g. Timestamp)
+            if "$ref" in prop_schema:
+                referenced = schemas.get(prop_schema["$ref"].split("/")[-1])
+                if isinstance(referenced, dict):
+                    prop_schema = referenced
+
             # Check for format: date-time
             if prop_schema.get("format") == "date-time":
                 date_fields.append(prop_name)
+                continue
 
             # Also check for oneOf with date-time (nullable dates)
             if "oneOf" in prop_schema:
@@ -312,3 +499,172 @@ export function {func_name}({param_name}: {entity_type}): {entity_type} {{
                         break
 
         return sorted(date_fields)
+
+    def _generate_parity_test(self, context: GenerationContext, entity_types: List[str]) -> str | None:
+        """
+        Generate a vitest suite checking each specialized converter against
+        ConverterPresets.standardApiResponse (compared as JSON, restricted to schema keys).
+        """
+        schemas = extract_schemas(context.spec)
+        entity_set = set(entity_types)
+        domain_name = context.domain_name
+
+        suites = []
+        imported = []
+        for entity_type in entity_types:
+            properties = self._collect_properties(entity_type, schemas)
+            if not properties:
+                continue
+
+            func_name = f"{camel_case(entity_type)}ToApi"
+            list_func_name = f"{camel_case(entity_type)}ListToApi"
+            imported.extend([func_name, list_func_name])
+
+            keys = [name for name, prop in properties.items() if not self._is_internal_property(prop)]
+            date_fields = self._converted_date_fields(entity_type, schemas)
+            dates_fixture = self._build_fixture(entity_type, schemas, entity_set, "date", 0)
+            strings_fixture = self._build_fixture(entity_type, schemas, entity_set, "string", 0)
+
+            drop_test = ""
+            if not self._allows_additional_properties(entity_type, schemas):
+                drop_test = f"""
+
+  it("drops fields outside the schema", () => {{
+    const converted = {func_name}({{ ...fixtures.dates, __unknownField: "x" }} as never) as Record<string, unknown>;
+    expect(Object.keys(converted).filter((key) => !KEYS.includes(key))).toEqual([]);
+  }});"""
+
+            suites.append(f"""
+describe("{entity_type} converters", () => {{
+  const KEYS: readonly string[] = {json.dumps(keys)};
+  const DATE_FIELDS: string[] = {json.dumps(date_fields)};
+  const fixtures: Record<string, Record<string, unknown>> = {{
+    dates: {dates_fixture},
+    strings: {strings_fixture},
+  }};
+
+  it.each(Object.keys(fixtures))("{func_name} matches ConverterPresets (%s)", (label) => {{
+    const fixture = fixtures[label];
+    const expected = pick(ConverterPresets.standardApiResponse(fixture, {{ dateFields: DATE_FIELDS }}), KEYS);
+    expect(toJson({func_name}(fixture as never))).toEqual(toJson(expected));
+  }});
+
+  it("{list_func_name} converts every item in order", () => {{
+    const items = [fixtures.dates, fixtures.strings] as never[];
+    expect(toJson({list_func_name}(items))).toEqual(toJson(items.map((item) => {func_name}(item))));
+  }});{drop_test}
+}});""")
+
+        if not suites:
+            return None
+
+        imports_block = ",\n".join(f"  {name}" for name in imported)
+        return f"""/**
+ * {pascal_case(domain_name)} Converter Parity Tests
+ *
+ * Generated by {self.name} v{self.version}
+ * Domain: {domain_name}
+ *
+ * ⚠️  DO NOT EDIT THIS FILE MANUALLY
+ * This file is auto-generated. Any manual changes will be overwritten.
+ */
+
+/**
+ * Specialized {{entity}}ToApi converters must produce the same API JSON as the
+ * generic ConverterPresets.standardApiResponse for every schema key.
+ */
+
+import {{ describe, it, expect }} from "vitest";
+import {{ ConverterPresets }} from "@cuur-cde/core/_shared";
+import {{
+{imports_block},
+}} from "@cuur-cde/core/{domain_name}";
+
+function toJson(value: unknown): unknown {{
+  return JSON.parse(JSON.stringify(value));
+}}
+
+function pick(value: Record<string, unknown>, keys: readonly string[]): Record<string, unknown> {{
+  const result: Record<string, unknown> = {{}};
+  for (const key of keys) {{
+    if (key in value) {{
+      result[key] = value[key];
+    }}
+  }}
+  return result;
+}}
+{chr(10).join(suites)}
+"""
+
+    def _build_fixture(
+        self,
+        entity_type: str,
+        schemas: Dict[str, Any],
+        entity_types: set,
+        date_mode: str,
+        depth: int
+    ) -> str:
+        """
+        Build a deterministic TS object literal for an entity.
+
+        Top-level date strings are non-canonical ISO (exercises normalization); nested entities use
+        canonical values only, since the preset does not descend into nested objects.
+        """
+        date_fields = set(self._converted_date_fields(entity_type, schemas))
+        indent = "  " * (depth + 2)
+        entries = []
+
+        for prop_name, prop_schema in self._collect_properties(entity_type, schemas).items():
+            if depth > 0 and self._is_internal_property(prop_schema):
+                continue
+
+            if prop_name in date_fields:
+                if date_mode == "date":
+                    value = 'new Date("2025-01-02T03:04:05.000Z")'
+                elif depth == 0:
+                    value = '"2025-01-02T03:04:05Z"'
+                else:
+                    value = '"2025-01-02T03:04:05.000Z"'
+            else:
+                nested = self._nested_entity_ref(prop_schema, entity_types)
+                if nested and depth < 2:
+                    kind, nested_type = nested
+                    nested_value = self._build_fixture(nested_type, schemas, entity_types, date_mode, depth + 1)
+                    value = f"[{nested_value}]" if kind == "array" else nested_value
+                elif nested:
+                    value = "[]" if nested[0] == "array" else "null"
+                else:
+                    value = self._fixture_scalar(prop_name, prop_schema, schemas)
+
+            key = prop_name if prop_name.isidentifier() else json.dumps(prop_name)
+            entries.append(f"{indent}  {key}: {value},")
+
+        if not entries:
+            return "{}"
+        return "{\n" + chr(10).join(entries) + f"\n{indent}}}"
+
+    @staticmethod
+    def _fixture_scalar(prop_name: str, prop_schema: Any, schemas: Dict[str, Any]) -> str:
+        """Deterministic fixture value for a non-entity property"""
+        if not isinstance(prop_schema, dict):
+            return "null"
+        if "$ref" in prop_schema:
+            referenced = schemas.get(prop_schema["$ref"].split("/")[-1])
+            prop_schema = referenced if isinstance(referenced, dict) else {}
+        if prop_schema.get("enum"):
+            return json.dumps(prop_schema["enum"][0])
+
+        schema_type = prop_schema.get("type")
+        if isinstance(schema_type, list):
+            schema_type = next((t for t in schema_type if t != "null"), None)
+        if schema_type == "string":
+            return json.dumps(f"{prop_name}-value")
+        if schema_type in ("integer", "number"):
+            return "1"
+        if schema_type == "boolean":
+            return "true"
+        if schema_type == "array":
+            return "[]"
+        if schema_type == "object":
+            return "{}"
+        return "null"
@@ -2,7 +2,7 @@
 Handler Body Orchestrator - Orchestrates building handler function bodies for different HTTP verbs
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from cuur_codegen.base.context import GenerationContext
 from cuur_codegen.utils.string import camel_case, pascal_case
 from cuur_codegen.generators.core.repositories.entity_extractor import EntityExtractor
@@ -28,6 +28,13 @@ class HandlerBodyBuilder:
         "scheduling": "sc",
     }
 
+    # Query parameters that page or sort a list rather than filter it
+    LIST_PAGING_PARAMS = frozenset({
+        "cursor", "limit", "page", "offset",
+        "sort", "sortBy", "sort_by", "orderBy", "order_by",
+        "order", "sortOrder", "sort_order", "direction",
+    })
+
     @staticmethod
     def build_body(
         context: GenerationContext,
@@ -84,7 +91,50 @@ class HandlerBodyBuilder:
     ) -> str:
         """Build create handler body"""
         from cuur_codegen.generators.core.handlers.body.create import CreateBodyBuilder
-        return CreateBodyBuilder.build(context, operation, resource, entity_var, id_function, operation_id, verb)
+        body = CreateBodyBuilder.build(context, operation, resource, entity_var, id_function, operation_id, verb)
+        if verb == "create":
+            body = HandlerBodyBuilder._add_duplicate_check(context, operation, resource, body)
+        return body
+
+    @staticmethod
+    def _add_duplicate_check(
+        context: GenerationContext,
+        operation: Dict[str, Any],
+        resource: str,
+        body: str
+    ) -> str:
+        """
+        Reject a create whose client-supplied id already exists.
+
+        Only applies when the request schema declares an `id` property. The check uses
+        repo.exists(), which selects the id column alone instead of fetching the full row.
+        """
+        from cuur_codegen.utils.openapi import get_request_body_schema, resolve_ref
+
+        validated_line = "  const validated = mapInputToValidated(input);\n"
+        if validated_line not in body or "repo.create(orgId, validated)" not in body:
+            return body
+
+        request_schema = get_request_body_schema(operation, context.spec) or {}
+        parts = [request_schema, *request_schema.get("allOf", [])]
+        declares_id = False
+        for part in parts:
+            if isinstance(part, dict) and "$ref" in part:
+                part = resolve_ref(context.spec, part["$ref"]) or {}
+            if isinstance(part, dict) and "id" in (part.get("properties") or {}):
+                declares_id = True
+                break
+        if not declares_id:
+            return body
+
+        entity_name = EntityExtractor.extract_entity_name_from_operations(context, resource) or pascal_case(resource)
+        duplicate_check = f"""
+  // Reject duplicates of a client-supplied id (exists() reads only the id column)
+  if (validated.id && (await repo.exists(orgId, validated.id))) {{
+    throw new DomainConflictError("{entity_name}", "duplicate id", {{ id: validated.id }});
+  }}
+"""
+        return body.replace(validated_line, validated_line + duplicate_check, 1)
 
     @staticmethod
     def _build_get_body(
@@ -153,44 +203,88 @@ class HandlerBodyBuilder:
         # Build converter code if entity type found (skip if mismatch detected)
         converter_code = ""
         if converter_func and not has_mismatch:
-            converter_code = f"""  // Convert domain entities to API format (Date → ISO string)
-  const convertedItems = {items_var_base}.map(item => {{
-    try {{
-      return {converter_func}(item);
-    }} catch (error) {{
-      // Log conversion error but continue with original item
-      if (process.env.NODE_ENV === "development") {{
-        console.warn(`[Handler] Failed to convert entity:`, error);
-      }}
-      return item;
-    }}
-  }});"""
+            list_converter_func = f"{camel_case(list_response_entity_type)}ListToApi"
+            converter_code = f"""  // Convert domain entities to API format (Date → ISO string, pre-sized output array)
+  const convertedItems = {list_converter_func}({items_var_base});"""
             items_var = "convertedItems"
         else:
             items_var = items_var_base
 
-        return f"""  // Call repository list method with params (if provided)
-  const result = await repo.list(orgId, {params_arg});
+        # Envelopes declaring a total get an exact COUNT(*) issued alongside the page query
+        total_location = ResponseAnalyzer.find_total_location(operation, context, "200")
+        if total_location:
+            # count() gets the list's equality filters so the total matches the filtered list
+            filter_fields = HandlerBodyBuilder._list_filter_fields(context, operation, repo_entity_type)
+            filter_arg = (
+                ", { " + ", ".join(f"{field}: params?.{field}" for field in filter_fields) + " }"
+                if filter_fields and has_query else ""
+            )
+            list_call = f"""  // Call repository list method and count live rows in parallel (the envelope declares a total)
+  const [result, total] = await Promise.all([
+    repo.list(orgId, {params_arg}),
+    repo.count(orgId{filter_arg}),
+  ]);"""
+        else:
+            list_call = f"""  // Call repository list method with params (if provided)
+  const result = await repo.list(orgId, {params_arg});"""
+        data_total = "\n      total," if total_location == "data" else ""
+        meta_total = "\n      total," if total_location == "meta" else ""
+        pagination_total = "\n        total," if total_location and total_location.endswith("pagination") else ""
+
+        return f"""{list_call}
 {type_assertion}
 {converter_code}
   // Return paginated response matching OpenAPI response type
   // Structure matches ProviderAccountListResponse: {{ data: {{ items: [...] }}, meta: {{ ... }} }}
   return {{
     data: {{
-      items: {items_var},
+      items: {items_var},{data_total}
     }},
     meta: {{
       correlationId: {id_function}(),
-      timestamp: new Date().toISOString(),
+      timestamp: new Date().toISOString(),{meta_total}
       pagination: {{
         nextCursor: result.nextCursor ?? null,
         prevCursor: result.prevCursor ?? null,
-        limit: result.items.length,
+        limit: result.items.length,{pagination_total}
       }},
     }},
   }};
 """
 
+    @staticmethod
+    def _list_filter_fields(
+        context: GenerationContext,
+        operation: Dict[str, Any],
+        entity_name: str
+    ) -> List[str]:
+        """
+        Query parameters named after an entity property, plus the `{by}From` / `{by}To`
+        window of an `x-partition` entity.
+
+        Mirrors the filter fields the DAO list() derives (servicesgen MethodBuilder), so a
+        count() issued with them covers exactly the rows the list pages through.
+        """
+        from cuur_codegen.generators.core.handlers.body.response_analyzer import ResponseAnalyzer
+        from cuur_codegen.utils.openapi import extract_schemas, resolve_ref
+
+        entity_schema = extract_schemas(context.spec).get(entity_name) or {}
+        properties = ResponseAnalyzer.schema_properties(context, entity_schema)
+        partition = entity_schema.get("x-partition") if isinstance(entity_schema, dict) else None
+        partition_by = partition.get("by", "createdAt") if isinstance(partition, dict) else "createdAt"
+        window_params = {f"{partition_by}From", f"{partition_by}To"} if partition else set()
+
+        fields = []
+        for param in operation.get("parameters", []):
+            if isinstance(param, dict) and "$ref" in param:
+                param = resolve_ref(context.spec, param["$ref"]) or {}
+            if not isinstance(param, dict) or param.get("in") != "query":
+                continue
+            name = param.get("name")
+            if name in window_params or (name in properties and name not in HandlerBodyBuilder.LIST_PAGING_PARAMS):
+                fields.append(name)
+        return fields
+
     @staticmethod
     def _build_update_body(
         context: GenerationContext,
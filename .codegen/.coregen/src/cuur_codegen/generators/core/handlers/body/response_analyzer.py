@@ -134,6 +134,64 @@ class ResponseAnalyzer:
 
         return False
 
+    @staticmethod
+    def schema_properties(
+        context: GenerationContext,
+        schema: Any,
+        seen: frozenset = frozenset()
+    ) -> Dict[str, Any]:
+        """Properties of a schema, merged through $ref and allOf compositions"""
+        from cuur_codegen.utils.openapi import resolve_ref
+
+        if not isinstance(schema, dict):
+            return {}
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            if ref in seen:
+                return {}
+            return ResponseAnalyzer.schema_properties(context, resolve_ref(context.spec, ref), seen | {ref})
+        merged: Dict[str, Any] = {}
+        for part in schema.get("allOf", []):
+            merged.update(ResponseAnalyzer.schema_properties(context, part, seen))
+        if isinstance(schema.get("properties"), dict):
+            merged.update(schema["properties"])
+        return merged
+
+    @staticmethod
+    def find_total_location(
+        operation: Dict[str, Any],
+        context: GenerationContext,
+        status_code: str = "200"
+    ) -> Optional[str]:
+        """
+        Locate a `total` count declared by a list envelope.
+
+        Returns the dotted path of the object holding it ("meta.pagination", "meta", "data"),
+        or None when the envelope has no total. Arrays are not descended into, so an entity
+        field named `total` never counts.
+        """
+        from cuur_codegen.utils.openapi import get_response_schema
+
+        # List envelopes are usually inline allOf compositions, so take the schema itself
+        response_schema = get_response_schema(operation, context.spec, status_code)
+        if not response_schema:
+            return None
+
+        def search(schema: Any, path: str, depth: int) -> Optional[str]:
+            properties = ResponseAnalyzer.schema_properties(context, schema)
+            if "total" in properties and path:
+                return path
+            if depth == 0:
+                return None
+            for name in ("meta", "pagination", "data"):
+                if name in properties:
+                    found = search(properties[name], f"{path}.{name}" if path else name, depth - 1)
+                    if found:
+                        return found
+            return None
+
+        return search(response_schema, "", 2)
+
     @staticmethod
     def is_items_response(operation: Dict[str, Any], context: GenerationContext, status_code: str) -> bool:
         """Check if response has data.items structure (list-like response)"""
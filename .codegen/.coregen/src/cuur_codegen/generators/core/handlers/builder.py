@@ -65,7 +65,12 @@ class HandlerBuilder:
             # Check if body uses validated (not commented out)
             body_uses_validated = "const validated" in body and "// const validated" not in body
             if body_uses_validated:
-                map_input_func = HandlerBuilder._build_map_input_function(input_type)
+                validator_func = HandlerBuilder._resolve_validator_function(context, op, operation_id)
+                map_input_func = HandlerBuilder._build_map_input_function(input_type, validator_func)
+                if validator_func:
+                    imports += HandlerBuilder._build_validator_import(context, validator_func)
+                if "DomainConflictError" in body:
+                    imports += HandlerBuilder._build_shared_errors_import("DomainConflictError")
             else:
                 # Comment out mapInputToValidated function since validated is not used
                 map_input_func = HandlerBuilder._build_map_input_function_commented(input_type)
@@ -204,8 +209,92 @@ class HandlerBuilder:
         return "\n".join(lines) + "\n"
 
     @staticmethod
-    def _build_map_input_function(input_type: Optional[str] = None) -> str:
+    def _resolve_validator_function(
+        context: GenerationContext,
+        op: Dict[str, Any],
+        operation_id: str
+    ) -> Optional[str]:
+        """
+        Name of the compiled validator for the request body, if {domain}.validators.ts exports one.
+
+        The schemas_file generator runs before handlers and writes validate{Schema} for every
+        request body with a Zod schema. Envelope bodies are validated against their `data`
+        schema, since routes pass handlers the bare payload.
+        """
+        from cuur_codegen.base.folder_structure import FolderStructureConfig
+        from cuur_codegen.generators.core.schemas.validator_compiler import ValidatorCompiler
+        from cuur_codegen.utils.file import file_exists
+
+        target = ValidatorCompiler.request_body_target(context.spec, op, operation_id)
+        if not target:
+            return None
+        schema_name = target[0]
+
+        folder_config = FolderStructureConfig()
+        schemas_dir = folder_config.get_layer_output_path(
+            project_root=context.config.paths.project_root,
+            layer="core",
+            domain_name=context.domain_name,
+            generator_type="schemas_file",
+        )
+        validators_file = schemas_dir / f"{context.domain_name}.validators.ts"
+        if not file_exists(validators_file):
+            return None
+
+        validator_func = ValidatorCompiler.validate_function_name(schema_name)
+        if f"export function {validator_func}<" not in validators_file.read_text():
+            return None
+        return validator_func
+
+    @staticmethod
+    def _build_validator_import(context: GenerationContext, validator_func: str) -> str:
+        """Import line for a compiled validator (schemas/{domain}.validators.js)"""
+        from cuur_codegen.base.folder_structure import FolderStructureConfig
+
+        import posixpath
+
+        # Validators sit in schemas/, a sibling of the converters' utils/ directory
+        converters_path = FolderStructureConfig().get_layer_import_path(
+            layer="core",
+            from_generator="handler",
+            to_generator="converter",
+            domain_name=context.domain_name
+        )
+        src_root = posixpath.dirname(posixpath.dirname(converters_path))
+        validators_path = f"{src_root}/schemas/{context.domain_name}.validators.js"
+        return f'import {{ {validator_func} }} from "{validators_path}";\n'
+
+    @staticmethod
+    def _build_shared_errors_import(error_class: str) -> str:
+        """Import line for a shared error class (shared/errors/index.js)"""
+        from cuur_codegen.base.folder_structure import FolderStructureConfig
+
+        import posixpath
+
+        # Errors sit in shared/errors/, a sibling of shared/repositories/
+        shared_repos_path = FolderStructureConfig().get_layer_shared_import_path(
+            layer="core",
+            generator_type="handler",
+            shared_type="repositories"
+        )
+        shared_root = posixpath.dirname(posixpath.dirname(shared_repos_path))
+        return f'import {{ {error_class} }} from "{shared_root}/errors/index.js";\n'
+
+    @staticmethod
+    def _build_map_input_function(input_type: Optional[str] = None, validator_func: Optional[str] = None) -> str:
         """Build mapInputToValidated function"""
+        if validator_func:
+            param_type = input_type or "unknown"
+            return_type = input_type or "any"
+            return f"""/**
+ * Mapper: input → validated
+ */
+function mapInputToValidated(input: {param_type}): {return_type} {{
+  // Compiled checks from the bundled schema; Zod only runs to report errors when they fail
+  return {validator_func}(input);
+}}
+
+"""
         if input_type:
             return f"""/**
  * Mapper: input → validated
@@ -390,7 +390,9 @@ class HandlerImportsBuilder:
                             if repo_entity_type and repo_entity_type != list_response_entity_type:
                                 return False
 
-                        converter_func = f"{camel_case(list_response_entity_type)}ToApi"
+                        # List handlers convert the whole page with the pre-sized {entity}ListToApi
+                        converter_suffix = "ListToApi" if verb == "list" else "ToApi"
+                        converter_func = f"{camel_case(list_response_entity_type)}{converter_suffix}"
                         folder_config = FolderStructureConfig()
                         converters_path = folder_config.get_layer_import_path(
                             layer="core",
@@ -63,6 +63,12 @@ class IndexBuilderGenerator(BaseGenerator):
             converter_base = converter_filename.replace(".ts", "")
             converter_export = f"\n// Converters\nexport * from \"./utils/{converter_base}.js\";"
 
+        # Check if compiled validators exist (written next to the Zod schemas)
+        validators_file = domain_dir / "schemas" / f"{domain_name}.validators.ts"
+        validators_export = ""
+        if file_exists(validators_file):
+            validators_export = f"\n// Compiled request validators (Zod fallback for error reporting)\nexport * from \"./schemas/{domain_name}.validators.js\";"
+
         return f"""{header}// Types (Domain layer with Date objects + API operation types)
 export * from "./types/index.js";
 
@@ -73,5 +79,5 @@ export * from "./repositories/index.js";
 export * from "./handlers/index.js";
 
 // Schemas (Zod schemas from OpenAPI) - domain-specific export name
-export {{ schemas as {domain_schemas_name}Schemas }} from "./schemas/{domain_name}.schemas.js";{converter_export}
+export {{ schemas as {domain_schemas_name}Schemas }} from "./schemas/{domain_name}.schemas.js";{validators_export}{converter_export}
 """
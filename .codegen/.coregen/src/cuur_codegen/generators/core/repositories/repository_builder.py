@@ -404,103 +404,34 @@ class RepositoryBuilder:
         if schema_mismatch_warning:
             todo_comment = f"\n/**\n * TODO: {schema_mismatch_warning}\n */\n"
 
-        repo_interfaces = {
-            "CrudRepository": f"""import type {{
-  CrudRepository,
-}} from "{shared_repos_path}";
-
-{types_import}
-{todo_comment}/**
- * {repo_name} Interface
- */
-export interface {repo_name} extends CrudRepository<{entity_name}, {create_type}, {update_type}, string, {list_params_in_interface}> {{
-
-}}
-""",
-            "CreateUpdateReadRepository": f"""import type {{
-  CreateUpdateReadRepository,
-}} from "{shared_repos_path}";
-
-{types_import}
-{todo_comment}/**
- * {repo_name} Interface
- */
-export interface {repo_name} extends CreateUpdateReadRepository<{entity_name}, {create_type}, {update_type}, string, {list_params_in_interface}> {{
-
-}}
-""",
-            "CreateDeleteReadRepository": f"""import type {{
-  CreateDeleteReadRepository,
-}} from "{shared_repos_path}";
-
-{types_import}
-{todo_comment}/**
- * {repo_name} Interface
- */
-export interface {repo_name} extends CreateDeleteReadRepository<{entity_name}, {create_type}, string, {list_params_in_interface}> {{
-
-}}
-""",
-            "UpdateDeleteReadRepository": f"""import type {{
-  UpdateDeleteReadRepository,
-}} from "{shared_repos_path}";
-
-{types_import}
-{todo_comment}/**
- * {repo_name} Interface
- */
-export interface {repo_name} extends UpdateDeleteReadRepository<{entity_name}, {update_type}, string, {list_params_in_interface}> {{
-
-}}
-""",
-            "CreateReadRepository": f"""import type {{
-  CreateReadRepository,
-}} from "{shared_repos_path}";
-
-{types_import}
-{todo_comment}/**
- * {repo_name} Interface
- */
-export interface {repo_name} extends CreateReadRepository<{entity_name}, {create_type}, string, {list_params_in_interface}> {{
-
-}}
-""",
-            "UpdateReadRepository": f"""import type {{
-  UpdateReadRepository,
-}} from "{shared_repos_path}";
-
-{types_import}
-{todo_comment}/**
- * {repo_name} Interface
- */
-export interface {repo_name} extends UpdateReadRepository<{entity_name}, {update_type}, string, {list_params_in_interface}> {{
-
-}}
-""",
-            "DeleteReadRepository": f"""import type {{
-  DeleteReadRepository,
-}} from "{shared_repos_path}";
-
-{types_import}
-{todo_comment}/**
- * {repo_name} Interface
- */
-export interface {repo_name} extends DeleteReadRepository<{entity_name}, string, {list_params_in_interface}> {{
-
-}}
-""",
-            "ReadRepository": f"""import type {{
-  ReadRepository,
+        # Generic arguments of each base interface (TEntity, TCreate?, TUpdate?, TId, TListParams)
+        base_generics = {
+            "CrudRepository": [entity_name, create_type, update_type],
+            "CreateUpdateReadRepository": [entity_name, create_type, update_type],
+            "CreateDeleteReadRepository": [entity_name, create_type],
+            "UpdateDeleteReadRepository": [entity_name, update_type],
+            "CreateReadRepository": [entity_name, create_type],
+            "UpdateReadRepository": [entity_name, update_type],
+            "DeleteReadRepository": [entity_name],
+            "ReadRepository": [entity_name],
+        }
+        if repo_type not in base_generics:
+            repo_type = "ReadRepository"
+        generics = ", ".join([*base_generics[repo_type], "string", list_params_in_interface])
+
+        # Every repository also answers exists/count without loading rows (CountableRepository)
+        return header + f"""import type {{
+  {repo_type},
+  CountableRepository,
 }} from "{shared_repos_path}";
 
 {types_import}
 {todo_comment}/**
  * {repo_name} Interface
  */
-export interface {repo_name} extends ReadRepository<{entity_name}, string, {list_params_in_interface}> {{
+export interface {repo_name}
+  extends {repo_type}<{generics}>,
+    CountableRepository<string> {{
 
 }}
-""",
-        }
-
-        return header + repo_interfaces.get(repo_type, repo_interfaces["ReadRepository"])
+"""
@@ -7,6 +7,7 @@ from cuur_codegen.generators.core.schemas.entity_builder import EntityBuilder
 from cuur_codegen.generators.core.schemas.schema_resolver import SchemaResolver
 from cuur_codegen.generators.core.schemas.parameter_extractor import ParameterExtractor
 from cuur_codegen.generators.core.schemas.zod_converter import ZodConverter
+from cuur_codegen.generators.core.schemas.validator_compiler import ValidatorCompiler
 
 __all__ = [
     "DtoBuilder",
@@ -14,4 +15,5 @@ __all__ = [
     "SchemaResolver",
     "ParameterExtractor",
     "ZodConverter",
+    "ValidatorCompiler",
 ]
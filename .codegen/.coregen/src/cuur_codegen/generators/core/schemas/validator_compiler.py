@@ -0,0 +1,609 @@
+"""
+Validator Compiler - Compiles OpenAPI schemas into straight-line TypeScript validators
+
+The compiled checks mirror the Zod schemas emitted by openapi-zod-client for the same
+bundled spec (passthrough objects, optional non-required keys, defaults filled in), but
+run as plain typeof/Set/loop checks with no runtime schema compilation.
+
+A check may only be stricter than Zod, never looser: anything it does not understand
+compiles to `return false`, which sends the input through Zod instead.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from cuur_codegen.utils.openapi import extract_schemas, extract_operations, extract_schema_name_from_ref
+
+
+@dataclass
+class _CompileState:
+    """Module-level constants and helper functions collected while compiling"""
+    enums: Dict[str, str] = field(default_factory=dict)
+    patterns: Dict[str, str] = field(default_factory=dict)
+    helpers: List[str] = field(default_factory=list)
+    counter: int = 0
+
+    def next_id(self) -> int:
+        self.counter += 1
+        return self.counter
+
+    def enum_const(self, values: List[Any]) -> str:
+        key = json.dumps(values)
+        if key not in self.enums:
+            self.enums[key] = f"ENUM_{len(self.enums) + 1}"
+        return self.enums[key]
+
+    def pattern_const(self, pattern: str) -> str:
+        if pattern not in self.patterns:
+            self.patterns[pattern] = f"PATTERN_{len(self.patterns) + 1}"
+        return self.patterns[pattern]
+
+
+class ValidatorCompiler:
+    """Builds {domain}.validators.ts plus its parity tests and benchmark"""
+
+    SAMPLE_DATE_TIME = "2025-01-02T03:04:05.000Z"
+
+    @staticmethod
+    def check_function_name(schema_name: str) -> str:
+        """check{SchemaName} (schema names may contain non-identifier characters)"""
+        safe = re.sub(r"\W", "_", schema_name)
+        return f"check{safe[:1].upper()}{safe[1:]}"
+
+    @staticmethod
+    def validate_function_name(schema_name: str) -> str:
+        """validate{SchemaName}"""
+        safe = re.sub(r"\W", "_", schema_name)
+        return f"validate{safe[:1].upper()}{safe[1:]}"
+
+    @staticmethod
+    def request_body_schemas(spec: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Request body schemas keyed by their Zod schema name (see request_body_target).
+        """
+        bodies: Dict[str, Dict[str, Any]] = {}
+        for op_data in extract_operations(spec):
+            target = ValidatorCompiler.request_body_target(
+                spec, op_data.get("operation", {}), op_data.get("operation_id")
+            )
+            if target:
+                bodies[target[0]] = target[1]
+        return bodies
+
+    @staticmethod
+    def request_body_target(
+        spec: Dict[str, Any],
+        operation: Dict[str, Any],
+        operation_id: Optional[str]
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        (Zod schema name, schema) of the payload routes pass to the operation's handler.
+
+        Component bodies keep the component name; inline bodies are named
+        {operationId}_Body, matching openapi-zod-client. Response-style envelopes
+        (allOf [ApiResponse, {data: $ref X}]) validate against X: routes hand handlers
+        the bare payload, which has no envelope `meta`.
+        """
+        request_body = operation.get("requestBody")
+        if not isinstance(request_body, dict):
+            return None
+        if "$ref" in request_body:
+            request_body = ValidatorCompiler._resolve(spec, request_body["$ref"]) or {}
+        schema = request_body.get("content", {}).get("application/json", {}).get("schema")
+        if not isinstance(schema, dict):
+            return None
+
+        ref = schema.get("$ref") or ValidatorCompiler._envelope_data_ref(schema)
+        if ref:
+            schemas = extract_schemas(spec)
+            name = extract_schema_name_from_ref(ref)
+            return (name, schemas[name]) if name and name in schemas else None
+        if operation_id:
+            return f"{operation_id}_Body", schema
+        return None
+
+    @staticmethod
+    def _envelope_data_ref(schema: Dict[str, Any]) -> Optional[str]:
+        """$ref of `data` when the body is an allOf envelope around a component payload"""
+        members = schema.get("allOf")
+        if not isinstance(members, list):
+            return None
+        for member in members:
+            properties = member.get("properties") if isinstance(member, dict) else None
+            data = properties.get("data") if isinstance(properties, dict) else None
+            if isinstance(data, dict) and isinstance(data.get("$ref"), str):
+                return data["$ref"]
+        return None
+
+    @staticmethod
+    def zod_schema_names(schemas_content: str) -> Set[str]:
+        """Names listed in the `export const schemas = { ... }` map of {domain}.schemas.ts"""
+        match = re.search(r"export const schemas[^=]*=\s*\{(.*?)\};", schemas_content, re.DOTALL)
+        if not match:
+            return set()
+        return set(re.findall(r"\b([A-Za-z_$][\w$]*)\b\s*(?:,|$|:)", match.group(1), re.MULTILINE))
+
+    @staticmethod
+    def build_validators_file(
+        spec: Dict[str, Any],
+        domain_name: str,
+        zod_names: Set[str],
+        header: str
+    ) -> str:
+        """Generate {domain}.validators.ts"""
+        state = _CompileState()
+        schemas = extract_schemas(spec)
+        functions: List[str] = []
+
+        for name, schema in schemas.items():
+            functions.append(ValidatorCompiler._build_check_function(name, schema, state))
+
+        bodies = ValidatorCompiler.request_body_schemas(spec)
+        for name, schema in bodies.items():
+            if name not in schemas:
+                functions.append(ValidatorCompiler._build_check_function(name, schema, state))
+
+        validators: List[str] = []
+        for name in sorted(bodies):
+            if name not in zod_names:
+                continue
+            check_name = ValidatorCompiler.check_function_name(name)
+            validate_name = ValidatorCompiler.validate_function_name(name)
+            validators.append(f"""
+/**
+ * Validate the {name} request body.
+ * Returns the input (schema defaults filled in) when the compiled checks pass;
+ * otherwise Zod parses it and throws a ZodError with the detailed issues.
+ */
+export function {validate_name}<T>(input: T): T {{
+  if ({check_name}(input)) {{
+    return input;
+  }}
+  return schemas.{name}.parse(input) as T;
+}}""")
+
+        constants: List[str] = []
+        for key, const_name in state.enums.items():
+            constants.append(f"const {const_name} = new Set<unknown>({key});")
+        for pattern, const_name in state.patterns.items():
+            constants.append(f"const {const_name} = new RegExp({json.dumps(pattern)});")
+        constants_block = chr(10).join(constants)
+
+        return f"""{header}/**
+ * Straight-line request validators compiled from the bundled OpenAPI schemas.
+ *
+ * check{{Schema}} mirrors the Zod schema of the same name without building it at runtime;
+ * it fills schema defaults in place and is only ever stricter than Zod.
+ * validate{{Schema}} runs the check and falls back to Zod to report (or accept) anything it rejects.
+ */
+
+import {{ schemas }} from "./{domain_name}.schemas.js";
+
+{constants_block}
+
+const DATE_TIME = /^(\\d{{4}})-(0[1-9]|1[0-2])-(0[1-9]|[12]\\d|3[01])T([01]\\d|2[0-3]):[0-5]\\d:[0-5]\\d(\\.\\d+)?(Z|[+-]([01]\\d|2[0-3]):[0-5]\\d)$/;
+
+/** ISO date-time with offset, including day-of-month validity (z.string().datetime({{ offset: true }})) */
+function isDateTime(value: string): boolean {{
+  const match = DATE_TIME.exec(value);
+  if (!match) {{
+    return false;
+  }}
+  const day = Number(match[3]);
+  return new Date(Date.UTC(Number(match[1]), Number(match[2]) - 1, day)).getUTCDate() === day;
+}}
+
+/** z.string().url() */
+function isUrl(value: string): boolean {{
+  try {{
+    new URL(value);
+    return true;
+  }} catch {{
+    return false;
+  }}
+}}
+{chr(10).join(state.helpers)}
+{chr(10).join(functions)}
+{chr(10).join(validators)}
+"""
+
+    @staticmethod
+    def _build_check_function(name: str, schema: Any, state: _CompileState) -> str:
+        """Compile one schema into `export function check{Name}(value: unknown): boolean`"""
+        func_name = ValidatorCompiler.check_function_name(name)
+        lines = ValidatorCompiler._emit(schema, "value", state, "  ")
+        return f"""
+export function {func_name}(value: unknown): boolean {{
+{chr(10).join(lines)}{chr(10) if lines else ""}  return true;
+}}"""
+
+    @staticmethod
+    def _emit(schema: Any, expr: str, state: _CompileState, indent: str) -> List[str]:
+        """Emit `if (...) return false;` statements validating expr against schema"""
+        if not isinstance(schema, dict):
+            return []
+
+        if "$ref" in schema:
+            ref = schema["$ref"]
+            if not ref.startswith("#/components/schemas/"):
+                return [f"{indent}return false; // not compiled: {ref}"]
+            func_name = ValidatorCompiler.check_function_name(ref.split("/")[-1])
+            return [f"{indent}if (!{func_name}({expr})) return false;"]
+
+        nullable = schema.get("nullable") is True
+        inner = indent + "  " if nullable else indent
+        body: List[str] = []
+
+        for member in schema.get("allOf", []) or []:
+            body.extend(ValidatorCompiler._emit(member, expr, state, inner))
+
+        variants = schema.get("oneOf") or schema.get("anyOf")
+        if variants:
+            variant_funcs = []
+            for variant in variants:
+                helper_name = f"checkVariant{state.next_id()}"
+                variant_lines = ValidatorCompiler._emit(variant, "value", state, "  ")
+                state.helpers.append(f"""
+function {helper_name}(value: unknown): boolean {{
+{chr(10).join(variant_lines)}{chr(10) if variant_lines else ""}  return true;
+}}""")
+                variant_funcs.append(f"{helper_name}({expr})")
+            body.append(f"{inner}if (!({' || '.join(variant_funcs)})) return false;")
+
+        schema_type = schema.get("type")
+        if schema_type is None and ("properties" in schema or "additionalProperties" in schema):
+            schema_type = "object"
+
+        if "enum" in schema:
+            const_name = state.enum_const(schema["enum"])
+            body.append(f"{inner}if (!{const_name}.has({expr})) return false;")
+        elif schema_type == "string":
+            body.extend(ValidatorCompiler._emit_string(schema, expr, state, inner))
+        elif schema_type in ("integer", "number"):
+            body.extend(ValidatorCompiler._emit_number(schema, expr, inner))
+        elif schema_type == "boolean":
+            body.append(f'{inner}if (typeof {expr} !== "boolean") return false;')
+        elif schema_type == "array":
+            body.extend(ValidatorCompiler._emit_array(schema, expr, state, inner))
+        elif schema_type == "object":
+            body.extend(ValidatorCompiler._emit_object(schema, expr, state, inner))
+        elif schema_type is not None:
+            body.append(f"{inner}return false; // not compiled: type {json.dumps(schema_type)}")
+
+        if not nullable or not body:
+            return body
+        return [f"{indent}if ({expr} !== null) {{", *body, f"{indent}}}"]
+
+    @staticmethod
+    def _emit_string(schema: Dict[str, Any], expr: str, state: _CompileState, indent: str) -> List[str]:
+        lines = [f'{indent}if (typeof {expr} !== "string") return false;']
+        if "minLength" in schema:
+            lines.append(f"{indent}if ({expr}.length < {int(schema['minLength'])}) return false;")
+        if "maxLength" in schema:
+            lines.append(f"{indent}if ({expr}.length > {int(schema['maxLength'])}) return false;")
+        if "pattern" in schema:
+            lines.append(f"{indent}if (!{state.pattern_const(schema['pattern'])}.test({expr})) return false;")
+        string_format = schema.get("format")
+        if string_format == "date-time":
+            lines.append(f"{indent}if (!isDateTime({expr})) return false;")
+        elif string_format in ("uri", "url"):
+            lines.append(f"{indent}if (!isUrl({expr})) return false;")
+        return lines
+
+    @staticmethod
+    def _emit_number(schema: Dict[str, Any], expr: str, indent: str) -> List[str]:
+        lines = [f'{indent}if (typeof {expr} !== "number" || Number.isNaN({expr})) return false;']
+        if schema.get("type") == "integer":
+            lines.append(f"{indent}if (!Number.isInteger({expr})) return false;")
+        for key, exclusive_key, op, exclusive_op in (
+            ("minimum", "exclusiveMinimum", "<", "<="),
+            ("maximum", "exclusiveMaximum", ">", ">="),
+        ):
+            exclusive = schema.get(exclusive_key)
+            if isinstance(exclusive, (int, float)) and not isinstance(exclusive, bool):
+                lines.append(f"{indent}if ({expr} {exclusive_op} {exclusive}) return false;")
+            if key in schema:
+                compare = exclusive_op if exclusive is True else op
+                lines.append(f"{indent}if ({expr} {compare} {schema[key]}) return false;")
+        return lines
+
+    @staticmethod
+    def _emit_array(schema: Dict[str, Any], expr: str, state: _CompileState, indent: str) -> List[str]:
+        lines = [f"{indent}if (!Array.isArray({expr})) return false;"]
+        if "minItems" in schema:
+            lines.append(f"{indent}if ({expr}.length < {int(schema['minItems'])}) return false;")
+        if "maxItems" in schema:
+            lines.append(f"{indent}if ({expr}.length > {int(schema['maxItems'])}) return false;")
+
+        n = state.next_id()
+        item_lines = ValidatorCompiler._emit(schema.get("items"), f"e{n}", state, indent + "  ")
+        if item_lines:
+            lines.append(f"{indent}for (let i{n} = 0; i{n} < {expr}.length; i{n}++) {{")
+            lines.append(f"{indent}  const e{n}: unknown = {expr}[i{n}];")
+            lines.extend(item_lines)
+            lines.append(f"{indent}}}")
+        return lines
+
+    @staticmethod
+    def _emit_object(schema: Dict[str, Any], expr: str, state: _CompileState, indent: str) -> List[str]:
+        n = state.next_id()
+        obj = f"o{n}"
+        lines = [
+            f'{indent}if (typeof {expr} !== "object" || {expr} === null || Array.isArray({expr})) return false;',
+            f"{indent}const {obj} = {expr} as Record<string, unknown>;",
+        ]
+
+        properties = schema.get("properties", {}) or {}
+        required = set(schema.get("required", []) or [])
+        additional = schema.get("additionalProperties")
+
+        for prop_name, prop_schema in properties.items():
+            access = f"{obj}.{prop_name}" if prop_name.isidentifier() else f"{obj}[{json.dumps(prop_name)}]"
+            value = f"v{state.next_id()}"
+            prop_lines = ValidatorCompiler._emit(prop_schema, value, state, indent + "  ")
+            has_default = isinstance(prop_schema, dict) and "default" in prop_schema
+
+            if has_default:
+                # Zod's .default() fills missing values; do the same so the fast path returns the same data
+                lines.append(f"{indent}let {value}: unknown = {access};")
+                lines.append(f"{indent}if ({value} === undefined) {{")
+                lines.append(f"{indent}  {value} = {access} = {json.dumps(prop_schema['default'])};")
+                lines.append(f"{indent}}}")
+                lines.extend(line[2:] for line in prop_lines)
+            elif not prop_lines:
+                continue
+            elif prop_name in required:
+                lines.append(f"{indent}const {value}: unknown = {access};")
+                lines.extend(line[2:] for line in prop_lines)
+            else:
+                lines.append(f"{indent}const {value}: unknown = {access};")
+                lines.append(f"{indent}if ({value} !== undefined) {{")
+                lines.extend(prop_lines)
+                lines.append(f"{indent}}}")
+
+        if additional is False:
+            known = state.enum_const(sorted(properties))
+            lines.append(f"{indent}for (const key in {obj}) {{")
+            lines.append(f"{indent}  if (!{known}.has(key)) return false;")
+            lines.append(f"{indent}}}")
+        elif isinstance(additional, dict) and additional:
+            if properties:
+                lines.append(f"{indent}return false; // not compiled: additionalProperties schema next to properties")
+            else:
+                value = f"v{state.next_id()}"
+                value_lines = ValidatorCompiler._emit(additional, value, state, indent + "  ")
+                if value_lines:
+                    lines.append(f"{indent}for (const key in {obj}) {{")
+                    lines.append(f"{indent}  const {value}: unknown = {obj}[key];")
+                    lines.extend(value_lines)
+                    lines.append(f"{indent}}}")
+
+        return lines
+
+    # ------------------------------------------------------------------
+    # Sample payloads (parity tests and benchmark)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def build_sample(schema: Any, spec: Dict[str, Any], array_length: int, depth: int = 0) -> Any:
+        """
+        Build a payload that satisfies schema (optional properties filled down to four object
+        levels, arrays of array_length).
+
+        Raises ValueError for constructs a valid value cannot be derived for (e.g. pattern).
+        """
+        if not isinstance(schema, dict):
+            return None
+        if depth > 20:
+            raise ValueError("required properties form a cycle")
+
+        if "$ref" in schema:
+            resolved = ValidatorCompiler._resolve(spec, schema["$ref"])
+            return ValidatorCompiler.build_sample(resolved, spec, array_length, depth)
+
+        if schema.get("enum"):
+            return schema["enum"][0]
+
+        if schema.get("allOf"):
+            merged: Dict[str, Any] = {}
+            for member in schema["allOf"]:
+                part = ValidatorCompiler.build_sample(member, spec, array_length, depth)
+                if not isinstance(part, dict):
+                    raise ValueError("allOf member is not an object")
+                merged.update(part)
+            if "properties" in schema:
+                merged.update(ValidatorCompiler.build_sample(
+                    {k: v for k, v in schema.items() if k != "allOf"}, spec, array_length, depth
+                ))
+            return merged
+
+        variants = schema.get("oneOf") or schema.get("anyOf")
+        if variants:
+            return ValidatorCompiler.build_sample(variants[0], spec, array_length, depth)
+
+        schema_type = schema.get("type")
+        if schema_type is None and ("properties" in schema or "additionalProperties" in schema):
+            schema_type = "object"
+
+        if schema_type == "string":
+            if "pattern" in schema:
+                raise ValueError("cannot sample a pattern-constrained string")
+            string_format = schema.get("format")
+            if string_format == "date-time":
+                return ValidatorCompiler.SAMPLE_DATE_TIME
+            if string_format in ("uri", "url"):
+                return "https://example.com/resource"
+            if string_format == "date":
+                return ValidatorCompiler.SAMPLE_DATE_TIME[:10]
+            value = "sample-value"
+            min_length = int(schema.get("minLength", 0))
+            max_length = int(schema.get("maxLength", len(value)))
+            return (value * (min_length // len(value) + 1))[:max(min_length, min(len(value), max_length))]
+        if schema_type in ("integer", "number"):
+            minimum = schema.get("minimum")
+            if isinstance(minimum, (int, float)) and not isinstance(minimum, bool):
+                return int(minimum) + (1 if schema.get("exclusiveMinimum") is True else 0)
+            maximum = schema.get("maximum")
+            return min(1, maximum) if isinstance(maximum, (int, float)) else 1
+        if schema_type == "boolean":
+            return True
+        if schema_type == "array":
+            count = max(int(schema.get("minItems", 0)), min(array_length, int(schema.get("maxItems", array_length))))
+            item = schema.get("items")
+            return [ValidatorCompiler.build_sample(item, spec, array_length, depth + 1) for _ in range(count)]
+        if schema_type == "object":
+            sample = {}
+            required = set(schema.get("required", []) or [])
+            for prop_name, prop_schema in (schema.get("properties", {}) or {}).items():
+                # Deeply nested optional properties are left out so recursive schemas terminate
+                if depth >= 4 and prop_name not in required:
+                    continue
+                sample[prop_name] = ValidatorCompiler.build_sample(prop_schema, spec, array_length, depth + 1)
+            return sample
+        return "sample-value"
+
+    @staticmethod
+    def testable_bodies(spec: Dict[str, Any], zod_names: Set[str], array_length: int) -> Dict[str, Any]:
+        """Object request body schemas with a Zod schema and a derivable sample payload"""
+        samples: Dict[str, Any] = {}
+        for name, schema in sorted(ValidatorCompiler.request_body_schemas(spec).items()):
+            if name not in zod_names:
+                continue
+            try:
+                sample = ValidatorCompiler.build_sample(schema, spec, array_length)
+            except (ValueError, RecursionError):
+                continue
+            if isinstance(sample, dict):
+                samples[name] = sample
+        return samples
+
+    @staticmethod
+    def build_parity_test(spec: Dict[str, Any], domain_name: str, zod_names: Set[str], header: str) -> Optional[str]:
+        """vitest suite: compiled checks accept/reject exactly what Zod accepts/rejects for the samples"""
+        samples = ValidatorCompiler.testable_bodies(spec, zod_names, 2)
+        if not samples:
+            return None
+
+        schemas_export = f"{domain_name.replace('-', '')}Schemas"
+        bodies = ValidatorCompiler.request_body_schemas(spec)
+        imported: List[str] = []
+        suites: List[str] = []
+        for name, sample in samples.items():
+            check_name = ValidatorCompiler.check_function_name(name)
+            validate_name = ValidatorCompiler.validate_function_name(name)
+            imported.extend([check_name, validate_name])
+
+            invalid = ["null", "[]"]
+            broken = ValidatorCompiler._broken_sample(bodies[name], spec, sample)
+            if broken is not None:
+                invalid.append(json.dumps(broken))
+
+            suites.append(f"""
+describe("{name} validator", () => {{
+  const valid = {json.dumps(sample)};
+  const invalid: unknown[] = [{", ".join(invalid)}];
+
+  it("accepts what Zod accepts", () => {{
+    expect({schemas_export}.{name}.safeParse(structuredClone(valid)).success).toBe(true);
+    expect({check_name}(structuredClone(valid))).toBe(true);
+  }});
+
+  it("rejects what Zod rejects", () => {{
+    for (const input of invalid) {{
+      expect({schemas_export}.{name}.safeParse(input).success).toBe(false);
+      expect({check_name}(structuredClone(input))).toBe(false);
+    }}
+  }});
+
+  it("{validate_name} returns Zod's output for valid input and throws on invalid input", () => {{
+    expect({validate_name}(structuredClone(valid))).toEqual({schemas_export}.{name}.parse(structuredClone(valid)));
+    expect(() => {validate_name}(invalid[0])).toThrow();
+  }});
+}});""")
+
+        imports_block = ",\n".join(f"  {name}" for name in imported)
+        return f"""{header}import {{ describe, it, expect }} from "vitest";
+import {{
+  {schemas_export},
+{imports_block},
+}} from "@cuur-cde/core/{domain_name}";
+{chr(10).join(suites)}
+"""
+
+    @staticmethod
+    def build_benchmark(spec: Dict[str, Any], domain_name: str, zod_names: Set[str], header: str) -> Optional[str]:
+        """vitest bench: compiled check vs schema.parse on large nested request bodies"""
+        samples = ValidatorCompiler.testable_bodies(spec, zod_names, 10)
+        if not samples:
+            return None
+
+        schemas_export = f"{domain_name.replace('-', '')}Schemas"
+        imported: List[str] = []
+        suites: List[str] = []
+        for name, sample in samples.items():
+            check_name = ValidatorCompiler.check_function_name(name)
+            imported.append(check_name)
+            suites.append(f"""
+describe("{name}", () => {{
+  const payload = {json.dumps(sample)};
+
+  bench("compiled {check_name}", () => {{
+    {check_name}(payload);
+  }});
+
+  bench("zod schema.parse", () => {{
+    {schemas_export}.{name}.parse(payload);
+  }});
+}});""")
+
+        imports_block = ",\n".join(f"  {name}" for name in imported)
+        return f"""{header}import {{ bench, describe }} from "vitest";
+import {{
+  {schemas_export},
+{imports_block},
+}} from "@cuur-cde/core/{domain_name}";
+{chr(10).join(suites)}
+"""
+
+    @staticmethod
+    def _broken_sample(schema: Any, spec: Dict[str, Any], sample: Any) -> Optional[Dict[str, Any]]:
+        """The sample with its first required string/number/boolean property set to a wrong type"""
+        if not isinstance(sample, dict):
+            return None
+        while isinstance(schema, dict) and "$ref" in schema:
+            schema = ValidatorCompiler._resolve(spec, schema["$ref"])
+        if not isinstance(schema, dict):
+            return None
+
+        properties = dict(schema.get("properties", {}) or {})
+        required = list(schema.get("required", []) or [])
+        for member in schema.get("allOf", []) or []:
+            while isinstance(member, dict) and "$ref" in member:
+                member = ValidatorCompiler._resolve(spec, member["$ref"])
+            if isinstance(member, dict):
+                properties.update(member.get("properties", {}) or {})
+                required.extend(member.get("required", []) or [])
+
+        for prop_name in required:
+            prop_schema = properties.get(prop_name)
+            while isinstance(prop_schema, dict) and "$ref" in prop_schema:
+                prop_schema = ValidatorCompiler._resolve(spec, prop_schema["$ref"])
+            if not isinstance(prop_schema, dict) or prop_schema.get("nullable") is True:
+                continue
+            if prop_schema.get("type") in ("string", "integer", "number", "boolean") or "enum" in prop_schema:
+                return {**sample, prop_name: []}
+        return None
+
+    @staticmethod
+    def _resolve(spec: Dict[str, Any], ref: str) -> Optional[Dict[str, Any]]:
+        """Resolve a local #/... reference"""
+        if not ref.startswith("#/"):
+            return None
+        node: Any = spec
+        for part in ref[2:].split("/"):
+            if not isinstance(node, dict):
+                return None
+            node = node.get(part)
+        return node if isinstance(node, dict) else None
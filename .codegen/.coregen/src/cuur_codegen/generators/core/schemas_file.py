@@ -9,9 +9,10 @@ import re
 from cuur_codegen.base.generator import BaseGenerator, GenerateResult
 from cuur_codegen.base.context import GenerationContext
 from cuur_codegen.base.errors import GenerationError
-from cuur_codegen.utils.file import ensure_directory, file_exists, clean_directory
+from cuur_codegen.utils.file import ensure_directory, file_exists, clean_directory, write_file
 from cuur_codegen.utils.openapi import extract_schemas, extract_schema_name_from_ref
 from cuur_codegen.generators.core.schemas.schema_resolver import SchemaResolver
+from cuur_codegen.generators.core.schemas.validator_compiler import ValidatorCompiler
 
 
 class SchemasGenerator(BaseGenerator):
@@ -88,8 +89,47 @@ class SchemasGenerator(BaseGenerator):
                 self.type,
             )
 
+        files.extend(self._generate_validators(context, output_dir, cleaned_content))
+
         return GenerateResult(files=files, warnings=warnings)
 
+    def _generate_validators(self, context: GenerationContext, output_dir: Path, schemas_content: str) -> List[Path]:
+        """
+        Compile request validators next to the Zod schemas ({domain}.validators.ts), plus
+        their Zod parity tests and benchmark under platform/tests/{domain}/validators/.
+        """
+        domain_name = context.domain_name
+        zod_names = ValidatorCompiler.zod_schema_names(schemas_content)
+
+        validators_file = output_dir / f"{domain_name}.validators.ts"
+        header = self.generate_header(context, "Compiled Request Validators")
+        write_file(
+            validators_file,
+            ValidatorCompiler.build_validators_file(context.spec, domain_name, zod_names, header),
+        )
+        files = [validators_file]
+
+        tests_dir = context.config.paths.project_root / "platform" / "tests" / domain_name / "validators"
+        parity_test = ValidatorCompiler.build_parity_test(
+            context.spec, domain_name, zod_names,
+            self.generate_header(context, "Compiled Validator Parity Tests"),
+        )
+        if parity_test:
+            test_file = tests_dir / f"{domain_name}-validators.test.ts"
+            write_file(test_file, parity_test)
+            files.append(test_file)
+
+        benchmark = ValidatorCompiler.build_benchmark(
+            context.spec, domain_name, zod_names,
+            self.generate_header(context, "Compiled Validators vs Zod schema.parse"),
+        )
+        if benchmark:
+            bench_file = tests_dir / f"{domain_name}-validators.bench.ts"
+            write_file(bench_file, benchmark)
+            files.append(bench_file)
+
+        return files
+
     def _remove_api_client_parts(self, content: str) -> str:
         """
         Remove API client parts from the Zod schema file:
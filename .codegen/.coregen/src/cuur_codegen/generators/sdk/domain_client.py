@@ -4,6 +4,7 @@ SDK Domain Client Generator - Generates TypeScript domain client classes
 Generates domain client classes that wrap HTTP calls using generated types and schemas.
 """
 
+import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -67,6 +68,16 @@ class DomainClientGenerator(BaseGenerator):
             warnings.append("No operations found in OpenAPI spec")
             return GenerateResult(files=files, warnings=warnings)
 
+        # Generate shared transport (timeouts, retries, GET de-duplication)
+        transport_file = output_dir / "transport.ts"
+        write_file(transport_file, self._generate_transport())
+        files.append(transport_file)
+
+        # Generate shared pagination helpers (async iterators over cursor pages)
+        pagination_file = output_dir / "pagination.ts"
+        write_file(pagination_file, self._generate_pagination())
+        files.append(pagination_file)
+
         # Generate domain client file
         client_file = output_dir / f"{context.domain_name}.client.ts"
         client_content = self._generate_domain_client(context, operations)
@@ -84,9 +95,13 @@ class DomainClientGenerator(BaseGenerator):
         domain_name = context.domain_name
         client_class_name = self._get_client_class_name(domain_name)
 
-        # Generate methods for each operation
+        # Generate query interfaces and methods for each operation
+        query_interfaces = []
         methods = []
         for op_data in operations:
+            query_interface = self._generate_query_interface(context, op_data)
+            if query_interface:
+                query_interfaces.append(query_interface)
             method = self._generate_method(context, op_data)
             if method:
                 methods.append(method)
@@ -94,13 +109,17 @@ class DomainClientGenerator(BaseGenerator):
         # Build class content
         header = self._generate_header()
         imports = self._generate_imports()
-        class_content = f"""{header}{imports}
-
+        interfaces_block = "".join(f"{chr(10)}{interface}" for interface in query_interfaces)
+        class_content = f"""{header}{imports}{interfaces_block}
 /**
  * {client_class_name} domain client
  */
 export class {client_class_name} {{
-  constructor(private http: HttpClient) {{}}
+  private readonly transport: Transport;
+
+  constructor(transport: Transport | TransportOptions) {{
+    this.transport = transport instanceof Transport ? transport : new Transport(transport);
+  }}
 
 {chr(10).join(methods)}
 }}
@@ -126,7 +145,8 @@ export class {client_class_name} {{
         """Generate import statements"""
         # Note: paths type import removed as it's not currently used
         # If needed in future, can be conditionally added
-        return """import { HttpClient } from "../http/http-client";
+        return """import { Transport, type CallOptions, type TransportOptions } from "./transport";
+import { paginate, type IterateOptions, type PageItem } from "./pagination";
 """
 
     def _generate_method(
@@ -147,19 +167,116 @@ export class {client_class_name} {{
         request_type = self._get_request_type(operation, context)
         response_type = self._get_response_type(operation, context, path, method)
 
+        # Resolve $ref parameters once so path/query handling sees real definitions
+        operation = {**operation, "parameters": self._resolve_parameters(operation, context.spec)}
+        query_type = self._get_query_type_name(operation_id) if self._get_query_params(operation) else None
+
         # Build path with parameters
         path_with_params = self._build_path_with_params(path, operation)
 
         # Generate method signature and body
-        if request_type:
-            method_signature = f"  async {method_name}({self._get_method_params(operation, request_type)}): Promise<{response_type}>"
-        else:
-            method_signature = f"  async {method_name}({self._get_method_params(operation, None)}): Promise<{response_type}>"
+        method_signature = f"  async {method_name}({self._get_method_params(operation, request_type, query_type)}): Promise<{response_type}>"
+
+        method_body = self._build_method_body(
+            method,
+            path_with_params,
+            request_type,
+            has_query=query_type is not None,
+            idempotent=operation.get("x-idempotent"),
+            response_type=response_type,
+        )
+
+        method_code = f"""{method_signature} {{
+{method_body}
+  }}
+"""
 
-        method_body = self._build_method_body(method, path_with_params, request_type)
+        if method == "get" and not request_type and self._is_cursor_paginated(operation, context.spec):
+            method_code += self._generate_iterator_method(method_name, operation, query_type, response_type)
 
-        return f"""{method_signature} {{
-{method_body}
+        return method_code
+
+    # Query parameters the specs use for list pagination
+    PAGINATION_PARAM_NAMES = ("cursor", "limit", "page")
+
+    def _is_cursor_paginated(self, operation: Dict[str, Any], spec: Dict[str, Any]) -> bool:
+        """
+        A list operation whose response envelope exposes nextCursor/hasMore, or that takes the
+        specs' pagination query params (cursor/limit/page).
+
+        Generated list handlers always return meta.pagination.nextCursor and read `cursor` from
+        the query string, even where the spec only declares page/limit.
+        """
+        query_names = {p.get("name") for p in self._get_query_params(operation)}
+        if not query_names:
+            return False
+        if query_names & set(self.PAGINATION_PARAM_NAMES):
+            return True
+
+        success = next(
+            (response for status, response in operation.get("responses", {}).items() if str(status).startswith("2")),
+            None,
+        )
+        return self._schema_mentions(success, spec, ("nextCursor", "hasMore"), set(), 0)
+
+    def _schema_mentions(
+        self,
+        node: Any,
+        spec: Dict[str, Any],
+        keys: tuple,
+        seen: set,
+        depth: int
+    ) -> bool:
+        """Search a (possibly $ref'd) schema tree for any of the given property names"""
+        if depth > 12 or node is None:
+            return False
+        if isinstance(node, list):
+            return any(self._schema_mentions(item, spec, keys, seen, depth + 1) for item in node)
+        if not isinstance(node, dict):
+            return False
+
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/"):
+            if ref in seen:
+                return False
+            seen.add(ref)
+            target: Any = spec
+            for part in ref[2:].split("/"):
+                target = target.get(part, {}) if isinstance(target, dict) else {}
+            return self._schema_mentions(target, spec, keys, seen, depth + 1)
+
+        properties = node.get("properties")
+        if isinstance(properties, dict) and any(key in properties for key in keys):
+            return True
+        return any(
+            self._schema_mentions(value, spec, keys, seen, depth + 1)
+            for key, value in node.items()
+            if key not in ("example", "examples", "description")
+        )
+
+    def _generate_iterator_method(
+        self,
+        method_name: str,
+        operation: Dict[str, Any],
+        query_type: Optional[str],
+        response_type: str
+    ) -> str:
+        """Generate `{method}Iter()` yielding items across cursor pages"""
+        path_params = [p for p in operation.get("parameters", []) if p.get("in") == "path"]
+        path_args = [p.get("name", "") for p in path_params]
+        signature_params = [f"{p.get('name', '')}: {self._get_parameter_type(p)}" for p in path_params]
+        # The cursor is sent even when the spec does not declare it (page numbers are superseded)
+        signature_params.append(f'query?: Omit<{query_type}, "cursor" | "page"> & IterateOptions')
+        signature_params.append("options?: CallOptions")
+        call_args = ", ".join(path_args + [f"{{ ...pageQuery, cursor }} as {query_type}", "options"])
+
+        return f"""
+  /**
+   * Iterate every item across pages, prefetching the next page while the current one is consumed
+   */
+  {method_name}Iter({", ".join(signature_params)}): AsyncIterable<PageItem<{response_type}>> {{
+    const {{ maxItems, ...pageQuery }} = query ?? ({{}} as IterateOptions);
+    return paginate<{response_type}>((cursor) => this.{method_name}({call_args}), {{ maxItems }});
   }}
 """
 
@@ -230,10 +347,64 @@ export class {client_class_name} {{
 
         return f"`{result}`"
 
+    def _resolve_parameters(
+        self,
+        operation: Dict[str, Any],
+        spec: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Resolve #/components/parameters/* references in an operation's parameters"""
+        components = spec.get("components", {}).get("parameters", {}) if isinstance(spec, dict) else {}
+        resolved = []
+        for param in operation.get("parameters", []):
+            if isinstance(param, dict) and "$ref" in param:
+                param = components.get(param["$ref"].split("/")[-1], {})
+            if isinstance(param, dict) and param:
+                resolved.append(param)
+        return resolved
+
+    def _get_query_params(self, operation: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get query parameters of an operation"""
+        parameters = operation.get("parameters", [])
+        return [p for p in parameters if isinstance(p, dict) and p.get("in") == "query"]
+
+    def _get_query_type_name(self, operation_id: str) -> str:
+        """Query interface name, e.g. listMarkets -> ListMarketsQuery"""
+        return f"{pascal_case(operation_id)}Query"
+
+    def _generate_query_interface(
+        self,
+        context: GenerationContext,
+        op_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """Generate a typed interface for an operation's query parameters"""
+        operation = op_data["operation"]
+        resolved = {**operation, "parameters": self._resolve_parameters(operation, context.spec)}
+        query_params = self._get_query_params(resolved)
+        if not query_params:
+            return None
+
+        fields = []
+        for param in query_params:
+            name = param.get("name", "")
+            if not name:
+                continue
+            key = name if name.isidentifier() else f'"{name}"'
+            optional = "" if param.get("required") else "?"
+            description = param.get("description")
+            if description:
+                fields.append(f"  /** {description.strip().splitlines()[0]} */")
+            fields.append(f"  {key}{optional}: {self._get_parameter_type(param)};")
+
+        return f"""export interface {self._get_query_type_name(op_data["operation_id"])} {{
+{chr(10).join(fields)}
+}}
+"""
+
     def _get_method_params(
         self,
         operation: Dict[str, Any],
-        request_type: Optional[str]
+        request_type: Optional[str],
+        query_type: Optional[str] = None
     ) -> str:
         """Get method parameters string"""
         params = []
@@ -249,19 +420,28 @@ export class {client_class_name} {{
         # Add query parameters (as optional object)
         query_params = [p for p in parameters if isinstance(p, dict) and p.get("in") == "query"]
         if query_params:
-            params.append("options?: any")
+            params.append(f"query?: {query_type or 'Record<string, unknown>'}")
 
         # Add request body
         if request_type:
             params.append(f"input: {request_type}")
 
-        return ", ".join(params) if params else ""
+        # Per-call overrides (timeout, abort signal)
+        params.append("options?: CallOptions")
+
+        return ", ".join(params)
 
     def _get_parameter_type(self, param: Dict[str, Any]) -> str:
         """Get TypeScript type for a parameter"""
         schema = param.get("schema", {})
         param_type = schema.get("type", "string")
 
+        if isinstance(schema.get("enum"), list) and schema["enum"]:
+            return " | ".join(json.dumps(value) for value in schema["enum"])
+        if param_type == "array":
+            item_type = self._get_parameter_type({"schema": schema.get("items", {})})
+            return f"Array<{item_type}>" if "|" in item_type else f"{item_type}[]"
+
         type_map = {
             "string": "string",
             "number": "number",
@@ -276,40 +456,284 @@ export class {client_class_name} {{
         self,
         method: str,
         path: str,
-        request_type: Optional[str]
+        request_type: Optional[str],
+        has_query: bool = False,
+        idempotent: Optional[bool] = None,
+        response_type: str = "any"
     ) -> str:
         """Build method body"""
-        if method == "get":
-            if request_type:
-                return f"""    const response = await this.http.get({path}, input);
-    return response.data;"""
-            else:
-                return f"""    const response = await this.http.get({path});
-    return response.data;"""
-        elif method == "post":
-            if request_type:
-                return f"""    const response = await this.http.post({path}, input);
-    return response.data;"""
-            else:
-                return f"""    const response = await this.http.post({path});
-    return response.data;"""
-        elif method == "put":
-            if request_type:
-                return f"""    const response = await this.http.put({path}, input);
-    return response.data;"""
-            else:
-                return f"""    const response = await this.http.put({path});
-    return response.data;"""
-        elif method == "patch":
-            if request_type:
-                return f"""    const response = await this.http.patch({path}, input);
-    return response.data;"""
-            else:
-                return f"""    const response = await this.http.patch({path});
-    return response.data;"""
-        elif method == "delete":
-            return f"""    const response = await this.http.delete({path});
-    return response.data;"""
-        else:
-            return f"""    const response = await this.http.request({path}, {{ method: "{method.upper()}" }});
-    return response.data;"""
+        request_fields = [f'method: "{method.upper()}"', f"path: {path}"]
+        if has_query:
+            request_fields.append("query")
+        if request_type and method in ("post", "put", "patch", "delete"):
+            request_fields.append("body: input")
+        elif request_type and not has_query:
+            # Bodies are not allowed on GET/HEAD - send the input as query params
+            request_fields.append("query: input")
+        # x-idempotent overrides the verb-based default (GET/HEAD/PUT/DELETE/OPTIONS retry)
+        if idempotent is not None:
+            request_fields.append(f"idempotent: {'true' if idempotent else 'false'}")
+        request_fields.append("...options")
+
+        return f"""    return this.transport.request<{response_type}>({{ {", ".join(request_fields)} }});"""
+
+    def _generate_pagination(self) -> str:
+        """Generate shared pagination helpers (cursor page iteration with prefetch)"""
+        return self._generate_header() + """export interface IterateOptions {
+  /** Stop after yielding this many items (bounds memory and requests) */
+  maxItems?: number;
+}
+
+/**
+ * Item type of a paginated response envelope
+ * ({ data: { items } }, { data: { data: [] } }, { data: [] } or { items })
+ */
+export type PageItem<T> = T extends { data: { items: Array<infer I> } }
+  ? I
+  : T extends { data: { data: Array<infer I> } }
+    ? I
+    : T extends { data: Array<infer I> }
+      ? I
+      : T extends { items: Array<infer I> }
+        ? I
+        : unknown;
+
+interface Page<I> {
+  items: I[];
+  nextCursor: string | null;
+}
+
+/**
+ * Read items and the next cursor from any of the envelope shapes used by the API
+ */
+export function readPage<I>(response: any): Page<I> {
+  const items = Array.isArray(response?.data?.items)
+    ? response.data.items
+    : Array.isArray(response?.data?.data)
+      ? response.data.data
+      : Array.isArray(response?.data)
+        ? response.data
+        : Array.isArray(response?.items)
+          ? response.items
+          : [];
+  const meta = response?.meta?.pagination ?? response?.meta ?? response ?? {};
+  const nextCursor = meta.hasMore === false ? null : (meta.nextCursor ?? null);
+  return { items, nextCursor };
+}
+
+/**
+ * Yield items page by page. The next page is requested as soon as the current
+ * one arrives, so its round trip overlaps with consumption of the current page.
+ */
+export async function* paginate<TPage>(
+  fetchPage: (cursor?: string) => Promise<TPage>,
+  options: IterateOptions = {}
+): AsyncGenerator<PageItem<TPage>> {
+  const maxItems = options.maxItems ?? Number.POSITIVE_INFINITY;
+  let yielded = 0;
+  let cursor: string | undefined;
+  let pending: Promise<TPage> | null = maxItems > 0 ? fetchPage(undefined) : null;
+
+  try {
+    while (pending) {
+      const page = readPage<PageItem<TPage>>(await pending);
+      const more =
+        page.nextCursor !== null && page.nextCursor !== cursor && yielded + page.items.length < maxItems;
+      cursor = page.nextCursor ?? undefined;
+      pending = more ? fetchPage(cursor) : null;
+
+      for (const item of page.items) {
+        if (yielded >= maxItems) {
+          return;
+        }
+        yield item;
+        yielded++;
+      }
+    }
+  } finally {
+    // Consumer stopped early - don't surface the abandoned prefetch as an unhandled rejection
+    pending?.catch(() => undefined);
+  }
+}
+"""
+
+    def _generate_transport(self) -> str:
+        """Generate shared transport module (fetch + timeout + retries + GET de-duplication)"""
+        return self._generate_header() + """export type HttpMethod = "GET" | "HEAD" | "POST" | "PUT" | "PATCH" | "DELETE" | "OPTIONS";
+
+export interface TransportOptions {
+  baseUrl: string;
+  /** Injected fetch implementation (defaults to globalThis.fetch; pass a mock in tests) */
+  fetch?: typeof fetch;
+  /** Default per-attempt timeout in milliseconds */
+  timeoutMs?: number;
+  /** Max retries for idempotent requests */
+  retries?: number;
+  /** Base delay for exponential backoff in milliseconds */
+  retryBaseDelayMs?: number;
+  /** Static headers or a provider evaluated per request (e.g. auth tokens) */
+  headers?: Record<string, string> | (() => Record<string, string> | Promise<Record<string, string>>);
+}
+
+export interface CallOptions {
+  /** Overrides the transport timeout for this call */
+  timeoutMs?: number;
+  signal?: AbortSignal;
+  headers?: Record<string, string>;
+}
+
+export interface RequestOptions extends CallOptions {
+  method: HttpMethod;
+  path: string;
+  query?: object;
+  body?: unknown;
+  /** Overrides the verb-based idempotency default (x-idempotent) */
+  idempotent?: boolean;
+}
+
+export class TransportError extends Error {
+  constructor(
+    public readonly status: number,
+    public readonly body: unknown,
+    message: string
+  ) {
+    super(message);
+    this.name = "TransportError";
+  }
+}
+
+const IDEMPOTENT_METHODS = new Set<HttpMethod>(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"]);
+const RETRYABLE_STATUS = new Set([408, 425, 429, 500, 502, 503, 504]);
+const DEFAULT_TIMEOUT_MS = 30_000;
+const DEFAULT_RETRIES = 2;
+const DEFAULT_RETRY_BASE_DELAY_MS = 100;
+const MAX_RETRY_DELAY_MS = 5_000;
+
+function buildQueryString(query?: object): string {
+  if (!query) {
+    return "";
+  }
+  const search = new URLSearchParams();
+  for (const [key, value] of Object.entries(query)) {
+    if (value === undefined || value === null) {
+      continue;
+    }
+    for (const item of Array.isArray(value) ? value : [value]) {
+      search.append(key, String(item));
+    }
+  }
+  const qs = search.toString();
+  return qs ? `?${qs}` : "";
+}
+
+/**
+ * Error payload as JSON when it parses, otherwise the raw text (undefined when empty)
+ */
+function parseErrorBody(text: string): unknown {
+  if (!text) {
+    return undefined;
+  }
+  try {
+    return JSON.parse(text);
+  } catch {
+    return text;
+  }
+}
+
+const sleep = (ms: number) => new Promise<void>((resolve) => setTimeout(resolve, ms));
+
+/**
+ * HTTP transport shared by all domain clients.
+ *
+ * - Every attempt is bounded by AbortSignal.timeout(timeoutMs)
+ * - Idempotent requests (by verb or x-idempotent) retry on network errors,
+ *   timeouts and 408/425/429/5xx with full-jitter exponential backoff
+ * - Identical concurrent GETs share one in-flight request
+ */
+export class Transport {
+  private readonly inFlight = new Map<string, Promise<unknown>>();
+  private readonly fetchImpl: typeof fetch;
+
+  constructor(private readonly options: TransportOptions) {
+    this.fetchImpl = options.fetch ?? globalThis.fetch.bind(globalThis);
+  }
+
+  request<T>(request: RequestOptions): Promise<T> {
+    const url = `${this.options.baseUrl.replace(/\\/$/, "")}${request.path}${buildQueryString(request.query)}`;
+
+    // Only share GETs the caller cannot cancel individually
+    if (request.method !== "GET" || request.signal || request.headers) {
+      return this.execute<T>(url, request);
+    }
+
+    const pending = this.inFlight.get(url);
+    if (pending) {
+      return pending as Promise<T>;
+    }
+    const promise = this.execute<T>(url, request).finally(() => {
+      this.inFlight.delete(url);
+    });
+    this.inFlight.set(url, promise);
+    return promise;
+  }
+
+  private async execute<T>(url: string, request: RequestOptions): Promise<T> {
+    const idempotent = request.idempotent ?? IDEMPOTENT_METHODS.has(request.method);
+    const retries = idempotent ? this.options.retries ?? DEFAULT_RETRIES : 0;
+
+    for (let attempt = 0; ; attempt++) {
+      try {
+        return await this.attempt<T>(url, request);
+      } catch (error) {
+        if (attempt >= retries || !this.isRetryable(error, request.signal)) {
+          throw error;
+        }
+        await sleep(this.backoffDelay(attempt));
+      }
+    }
+  }
+
+  private async attempt<T>(url: string, request: RequestOptions): Promise<T> {
+    const timeout = AbortSignal.timeout(request.timeoutMs ?? this.options.timeoutMs ?? DEFAULT_TIMEOUT_MS);
+    const signal = request.signal ? AbortSignal.any([request.signal, timeout]) : timeout;
+    const baseHeaders =
+      typeof this.options.headers === "function" ? await this.options.headers() : this.options.headers;
+    const hasBody = request.body !== undefined;
+
+    const response = await this.fetchImpl(url, {
+      method: request.method,
+      headers: {
+        accept: "application/json",
+        ...(hasBody ? { "content-type": "application/json" } : {}),
+        ...baseHeaders,
+        ...request.headers,
+      },
+      body: hasBody ? JSON.stringify(request.body) : undefined,
+      signal,
+    });
+
+    const text = await response.text();
+    // Check the status before parsing: gateway errors (502/503/504) often carry HTML or plain text
+    if (!response.ok) {
+      throw new TransportError(response.status, parseErrorBody(text), `${request.method} ${request.path} failed with ${response.status}`);
+    }
+    return (text ? JSON.parse(text) : undefined) as T;
+  }
+
+  private isRetryable(error: unknown, callerSignal?: AbortSignal): boolean {
+    if (callerSignal?.aborted) {
+      return false;
+    }
+    if (error instanceof TransportError) {
+      return RETRYABLE_STATUS.has(error.status);
+    }
+    // Network failures (TypeError from fetch) and per-attempt timeouts
+    return error instanceof TypeError || (error instanceof Error && error.name === "TimeoutError");
+  }
+
+  private backoffDelay(attempt: number): number {
+    const base = this.options.retryBaseDelayMs ?? DEFAULT_RETRY_BASE_DELAY_MS;
+    return Math.random() * Math.min(MAX_RETRY_DELAY_MS, base * 2 ** attempt);
+  }
+}
+"""
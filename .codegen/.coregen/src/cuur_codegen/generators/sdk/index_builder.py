@@ -68,6 +68,14 @@ class SdkIndexBuilderGenerator(BaseGenerator):
 
         if not exports:
             exports.append("// No domain clients found")
+        elif (domains_dir / "transport.ts").exists():
+            exports.append(
+                'export { Transport, TransportError, type CallOptions, type TransportOptions } from "./transport.js";'
+            )
+        if exports and (domains_dir / "pagination.ts").exists():
+            exports.append(
+                'export { paginate, readPage, type IterateOptions, type PageItem } from "./pagination.js";'
+            )
 
         return f"""{header}{chr(10).join(exports)}
 """
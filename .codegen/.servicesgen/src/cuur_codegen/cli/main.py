@@ -87,12 +87,12 @@ def _process_layer_selection(layer: tuple[str, ...], config: Config) -> list[str
         return []
 
     if "all" in layer:
-        return ["adapters", "services", "tests", "orchestrators"]
+        return ["adapters", "services", "loadtest", "tests", "orchestrators"]
 
     # Validate and return selected layers (servicesgen only supports these)
     valid_layers = []
     for l in layer:
-        if l in ["adapters", "services", "tests", "orchestrators"]:
+        if l in ["adapters", "services", "loadtest", "tests", "orchestrators"]:
             if l not in valid_layers:  # Avoid duplicates
                 valid_layers.append(l)
 
@@ -123,8 +123,8 @@ def _process_layer_selection(layer: tuple[str, ...], config: Config) -> list[str
     "--layer",
     "-l",
     multiple=True,
-    type=click.Choice(["adapters", "services", "tests", "orchestrators", "all"]),
-    help="Layer(s) to generate: adapters (includes Prisma schema generation), services, tests, orchestrators, or all",
+    type=click.Choice(["adapters", "services", "loadtest", "tests", "orchestrators", "all"]),
+    help="Layer(s) to generate: adapters (includes Prisma schema generation), services, loadtest, tests, orchestrators, or all",
 )
 @click.option(
     "--clean",
@@ -253,8 +253,8 @@ def generate(
     "--layer",
     "-l",
     multiple=True,
-    type=click.Choice(["adapters", "services", "tests", "orchestrators", "all"]),
-    help="Layer(s) to generate: adapters (includes Prisma schema generation), services, tests, orchestrators, or all",
+    type=click.Choice(["adapters", "services", "loadtest", "tests", "orchestrators", "all"]),
+    help="Layer(s) to generate: adapters (includes Prisma schema generation), services, loadtest, tests, orchestrators, or all",
 )
 @click.option(
     "--clean",
@@ -19,7 +19,7 @@ Core Domains Configuration:
 
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Literal, Dict, Any, Union
+from typing import Optional, Literal, Dict, Any, List, Union
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -119,6 +119,13 @@ class CoreLayerConfig(BaseModel):
     re_export_generated_types: bool = Field(True, description="Re-export from generated types")
 
 
+class RepositoryCacheOptions(BaseModel):
+    """Read-through cache options for a generated DAO repository"""
+
+    ttl: int = Field(300, description="Time-to-live for cached entries in seconds")
+    max_entries: int = Field(1000, description="Maximum cached entries (LRU eviction)")
+
+
 class AdaptersLayerConfig(BaseModel):
     """Configuration for adapters layer (repositories and Prisma)"""
 
@@ -130,11 +137,29 @@ class AdaptersLayerConfig(BaseModel):
     include_custom_methods: bool = Field(True, description="Include custom query methods")
     interface_prefix: str = Field("", description="Prefix for repository interfaces")
     interface_suffix: str = Field("Repository", description="Suffix for repository interfaces")
+    cache: Dict[str, RepositoryCacheOptions] = Field(
+        default_factory=dict,
+        description="Per-resource read-through cache (keyed by entity or resource name); overrides spec x-cache",
+    )
 
     # Prisma-specific options
     generate_enums: bool = Field(True, description="Generate Prisma enum types")
     generate_indexes: bool = Field(True, description="Generate database indexes")
     multi_tenancy: bool = Field(True, description="Add orgId fields for multi-tenancy")
+    prisma_schema_folder: Optional[str] = Field(
+        None,
+        description=(
+            "prismaSchemaFolder (relative to project root, e.g. packages/database/prisma/schema) that "
+            "receives one content-hashed {domain}.prisma per domain; unchanged domains are not rewritten"
+        ),
+    )
+    per_service_clients: bool = Field(
+        False,
+        description=(
+            "Generate a per-service Prisma schema/client limited to the models the service's DAOs use; "
+            "the service main.ts imports it and its package.json runs prisma generate before build/dev"
+        ),
+    )
 
 
 class ServicesLayerConfig(BaseModel):
@@ -173,12 +198,32 @@ class TestsLayerConfig(BaseModel):
     generate_setup: bool = Field(True, description="Generate setup files")
     generate_handler_tests: bool = Field(True, description="Generate handler test files")
     generate_integration_tests: bool = Field(False, description="Generate integration tests")
+    generate_perf_tests: bool = Field(False, description="Generate vitest bench suites with p95 regression gate")
+    perf_payload_sizes: List[int] = Field(
+        default_factory=lambda: [1, 100, 10000],
+        description="Payload sizes (seeded records / scaled array lengths) each benchmark runs with",
+    )
+    perf_regression_threshold: float = Field(
+        20.0, description="Allowed p95 regression over perf/baseline.json, in percent"
+    )
+    generate_query_plan_tests: bool = Field(
+        False, description="Generate the PGlite query-plan suite (EXPLAIN every DAO method, fail on seq scans)"
+    )
+    query_plan_row_threshold: int = Field(
+        1000, description="Tables above this many rows must not be sequentially scanned by DAO queries"
+    )
 
     # Mock-specific options
     mock_prefix: str = Field("mock", description="Prefix for mock repositories")
     use_vi_mock: bool = Field(True, description="Use vitest vi.fn() for mocks")
 
 
+class LoadTestLayerConfig(BaseModel):
+    """Configuration for loadtest layer"""
+
+    loadtest: GeneratorOptions = Field(default_factory=lambda: GeneratorOptions())
+
+
 class GeneratorConfig(BaseModel):
     """Configuration for all generators (legacy - use layers instead)"""
 
@@ -199,6 +244,7 @@ class LayersConfig(BaseModel):
     adapters: AdaptersLayerConfig = Field(default_factory=lambda: AdaptersLayerConfig())
     services: ServicesLayerConfig = Field(default_factory=lambda: ServicesLayerConfig())
     tests: TestsLayerConfig = Field(default_factory=lambda: TestsLayerConfig())
+    loadtest: LoadTestLayerConfig = Field(default_factory=lambda: LoadTestLayerConfig())
 
 
 class PipelineOptions(BaseModel):
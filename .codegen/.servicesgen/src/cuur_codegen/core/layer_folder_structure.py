@@ -67,6 +67,7 @@ class LayerFolderStructure(BaseModel):
     service: Optional[GeneratorFolderConfig] = Field(None, description="Service generator folder structure")
     prisma: Optional[GeneratorFolderConfig] = Field(None, description="Prisma generator folder structure")
     test: Optional[GeneratorFolderConfig] = Field(None, description="Test generator folder structure")
+    loadtest: Optional[GeneratorFolderConfig] = Field(None, description="Load test generator folder structure")
     index_builder: Optional[GeneratorFolderConfig] = Field(None, description="Index builder generator folder structure")
 
     def get_generator_config(self, generator_type: str) -> Optional[GeneratorFolderConfig]:
@@ -83,6 +84,7 @@ class LayerFolderStructure(BaseModel):
             "prisma": self.prisma,
             "test": self.test,
             "tests": self.test,  # Alias for test
+            "loadtest": self.loadtest,
             "index_builder": self.index_builder,
             # Orchestrator generators
             "orchestrator_service_client": self.service,  # Uses service config
@@ -253,6 +255,20 @@ class FolderStructureConfig(BaseModel):
                     shared_types="@cuur/core/shared/types",
                 ),
             ),
+            loadtest=GeneratorFolderConfig(
+                output_dir="{domain}/loadtest",
+                imports=ImportPathConfig(
+                    types="@cuur/core",
+                    repositories="@cuur/core",
+                    handlers="@cuur/core",
+                    schemas="@cuur/core",
+                    validators="@cuur/core",
+                    converters="@cuur/core",
+                    shared_helpers="@cuur/core/shared/helpers",
+                    shared_repositories="@cuur/core/shared/repositories",
+                    shared_types="@cuur/core/shared/types",
+                ),
+            ),
             handlers=None,
             repositories=None,
             types=None,
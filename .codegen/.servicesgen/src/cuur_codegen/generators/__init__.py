@@ -1,8 +1,9 @@
-"""Code generators - ServicesGen only: services, adapters (includes Prisma schema generation), tests, orchestrators"""
+"""Code generators - ServicesGen only: services, adapters (includes Prisma schema generation), loadtest, tests, orchestrators"""
 
 from cuur_codegen.generators.services.service import ServiceGenerator
 from cuur_codegen.generators.adapters.adapter import AdapterGenerator
 from cuur_codegen.generators.tests.test import TestGenerator
+from cuur_codegen.generators.loadtest.loadtest import LoadTestGenerator
 from cuur_codegen.generators.orchestrators.aggregator import AggregatorGenerator
 from cuur_codegen.generators.orchestrators.orchestrator_flow import OrchestratorFlowGenerator
 
@@ -10,6 +11,7 @@ __all__ = [
     "ServiceGenerator",
     "AdapterGenerator",
     "TestGenerator",
+    "LoadTestGenerator",
     "AggregatorGenerator",
     "OrchestratorFlowGenerator",
 ]
@@ -2,6 +2,7 @@
 Adapter Generator - Generates DAO repository implementations
 """
 
+import os
 from pathlib import Path
 from typing import List, Optional
 
@@ -14,10 +15,17 @@ from .builders import (
     RepositoryDiscovery,
     RepositoryBuilder,
     IndexBuilder,
-    MethodBuilder
+    MethodBuilder,
+    CachedRepositoryBuilder,
 )
 # Import Prisma builders for schema generation
-from cuur_codegen.generators.prisma.builders import PrismaSchemaBuilder
+from cuur_codegen.generators.prisma.builders import (
+    PartialIndexBuilder,
+    PartitionBuilder,
+    PrismaModelBuilder,
+    PrismaSchemaBuilder,
+    RowWidthBuilder,
+)
 
 
 class AdapterGenerator(FileGenerator):
@@ -119,6 +127,20 @@ class AdapterGenerator(FileGenerator):
             try:
                 # Extract entity fields from OpenAPI spec for selective queries
                 entity_fields = MethodBuilder._extract_entity_fields(repo.entity_name, context.spec)
+                # Derive keyset cursor shape from the spec's list pagination parameters
+                pagination = MethodBuilder._extract_pagination_config(
+                    repo.entity_name, context.spec, entity_fields
+                )
+                # Object-typed properties are native Json columns (no string round-trip)
+                # Relations the response embeds are loaded with Prisma include (not stored as Json)
+                include_relations = PrismaModelBuilder.embedded_includes(context, repo.entity_name)
+                json_fields = MethodBuilder._extract_json_fields(
+                    repo.entity_name, context.spec
+                ) - set(include_relations)
+                # Table-wide planner estimate, only for entities that opt in
+                estimated_count = MethodBuilder._extract_estimated_count(repo.entity_name, context.spec)
+                # x-partition: list queries bound the partition key so partitions are pruned
+                partition = PartitionBuilder.extract_config(repo.entity_name, context.spec)
 
                 repo_header = self.generate_header(
                     context,
@@ -128,7 +150,12 @@ class AdapterGenerator(FileGenerator):
                     repo,
                     repo_header,
                     core_package_path,
-                    entity_fields
+                    entity_fields,
+                    pagination,
+                    json_fields,
+                    include_relations,
+                    estimated_count,
+                    partition
                 )
                 write_file(repo_file, repo_content)
                 # Verify file was written
@@ -144,6 +171,66 @@ class AdapterGenerator(FileGenerator):
                 context.logger.debug(traceback.format_exc())
                 continue
 
+        # Generate opt-in read-through cache wrappers (x-cache / layers.adapters.cache)
+        files.extend(self._generate_cached_repositories(context, output_dir, repositories, core_package_path))
+
+        # Per-service Prisma client limited to the models these DAOs use
+        if context.config.layers.adapters.per_service_clients:
+            files.extend(self._generate_service_prisma_schema(context, repositories))
+
+        return files
+
+    def _generate_cached_repositories(
+        self,
+        context: GenerationContext,
+        output_dir: Path,
+        repositories: list,
+        core_package_path: Path
+    ) -> List[Path]:
+        """
+        Generate cached repository wrappers for repositories with cache settings.
+
+        Args:
+            context: Generation context
+            output_dir: Output directory (adapters/{domain})
+            repositories: Discovered repositories
+            core_package_path: Path to packages/core/src
+
+        Returns:
+            List of generated file paths (wrappers plus cache-store.ts)
+        """
+        files: List[Path] = []
+        cache_config = context.config.layers.adapters.cache
+
+        for repo in repositories:
+            settings = CachedRepositoryBuilder.resolve_cache_settings(repo, context.spec, cache_config)
+            if not settings:
+                continue
+
+            cached_file = output_dir / CachedRepositoryBuilder.cached_repository_filename(repo)
+            try:
+                header = self.generate_header(
+                    context,
+                    f"Read-through cache for {repo.interface_name}"
+                )
+                content = CachedRepositoryBuilder.build_cached_repository_file(
+                    repo, header, core_package_path, settings
+                )
+                write_file(cached_file, content)
+                files.append(cached_file)
+                context.logger.info(
+                    f"✓ Generated {cached_file.name} (ttl {settings.ttl_seconds}s, max {settings.max_entries} entries)"
+                )
+            except Exception as e:
+                context.logger.error(f"Failed to generate {cached_file.name}: {e}")
+                continue
+
+        if files:
+            store_file = output_dir / "cache-store.ts"
+            store_header = self.generate_header(context, "Cache store for cached DAO repositories")
+            write_file(store_file, CachedRepositoryBuilder.build_cache_store_file(store_header))
+            files.append(store_file)
+
         return files
 
     def generate_index(
@@ -195,7 +282,12 @@ class AdapterGenerator(FileGenerator):
             context,
             f"Adapter barrel exports for {context.domain_name}"
         )
-        index_content = IndexBuilder.build_index_file(repositories, index_header)
+        cache_config = context.config.layers.adapters.cache
+        cached_repositories = [
+            repo for repo in repositories
+            if CachedRepositoryBuilder.resolve_cache_settings(repo, context.spec, cache_config)
+        ]
+        index_content = IndexBuilder.build_index_file(repositories, index_header, cached_repositories)
         write_file(index_file, index_content)
         return index_file
 
@@ -237,6 +329,9 @@ class AdapterGenerator(FileGenerator):
         # Clean only the prisma subdirectory, not the entire domain directory
         # This prevents deleting DAO repository files
         from cuur_codegen.utils.file import ensure_directory, clean_directory, write_file
+        # Read the partial index manifest before cleaning so removed indexes get dropped
+        manifest_file = prisma_dir / "partial-indexes.manifest.json"
+        previous_manifest = PartialIndexBuilder.load_manifest(manifest_file)
         if prisma_dir.exists():
             clean_directory(prisma_dir)
 
@@ -264,4 +359,195 @@ class AdapterGenerator(FileGenerator):
         files.append(schema_file)
         context.logger.info(f"✓ Generated Prisma schema: {schema_file.name}")
 
+        # Estimated per-model row widths for the native column types just emitted
+        row_width_file = prisma_dir / "row-width.md"
+        write_file(row_width_file, RowWidthBuilder.build_report(context.domain_name, schema_content, self.version))
+        files.append(row_width_file)
+
+        files.extend(self._generate_partial_indexes(context, prisma_dir, manifest_file, previous_manifest))
+        files.extend(self._generate_partitions(context, prisma_dir))
+
+        # Multi-file prismaSchemaFolder (one content-hashed file per domain)
+        schema_folder = context.config.layers.adapters.prisma_schema_folder
+        if schema_folder:
+            files.extend(self._generate_schema_folder_files(context, schema_folder))
+
         return files
+
+    def _generate_schema_folder_files(self, context: GenerationContext, schema_folder: str) -> List[Path]:
+        """
+        Write this domain's models into a Prisma multi-file schema folder.
+
+        The folder holds a main schema.prisma (generator + datasource) and one {domain}.prisma
+        per domain. Files are only rewritten when their content hash changes, so regenerating one
+        domain leaves the others (and their timestamps) untouched.
+        """
+        from cuur_codegen.utils.file import ensure_directory
+
+        folder_dir = context.config.paths.project_root / schema_folder
+        ensure_directory(folder_dir)
+
+        files: List[Path] = []
+        main_file = folder_dir / "schema.prisma"
+        if self._write_hashed_schema(
+            context, main_file, "Prisma generator and datasource", PrismaSchemaBuilder.build_datasource_block(None)
+        ):
+            files.append(main_file)
+
+        body = PrismaSchemaBuilder.build_domain_body(context)
+        domain_file = folder_dir / f"{context.domain_name}.prisma"
+        if self._write_hashed_schema(context, domain_file, f"Prisma models for domain: {context.domain_name}", body):
+            files.append(domain_file)
+
+        # Every file in the folder shares one namespace - report clashes with other domains
+        declared = PrismaSchemaBuilder.declared_names(body)
+        for other_file in sorted(folder_dir.glob("*.prisma")):
+            if other_file in (main_file, domain_file):
+                continue
+            clashes = declared & PrismaSchemaBuilder.declared_names(other_file.read_text(encoding="utf-8"))
+            if clashes:
+                context.logger.warn(
+                    f"Prisma schema folder: {domain_file.name} and {other_file.name} both declare "
+                    f"{', '.join(sorted(clashes))}"
+                )
+
+        return files
+
+    def _generate_service_prisma_schema(self, context: GenerationContext, repositories: list) -> List[Path]:
+        """
+        Generate a Prisma schema for this service containing only the models its DAOs use.
+
+        Relations to models outside the set stay scalar FK columns, so the service gets a smaller
+        client (faster cold start, less memory) generated into its own output directory.
+        """
+        from cuur_codegen.utils.generator_setup import GeneratorSetup
+
+        models = {repo.entity_name for repo in repositories}
+        if not models:
+            return []
+
+        services_dir = GeneratorSetup.get_output_directory_no_clean(context, "service", "services")
+        schema_file = services_dir / "db" / "prisma" / "schema.prisma"
+        body = PrismaSchemaBuilder.build_datasource_block("./generated") + PrismaSchemaBuilder.build_domain_body(
+            context, models
+        )
+        title = (
+            f"Prisma schema for the {context.domain_name} service ({len(models)} DAO models)\n"
+            "// prisma generate --schema db/prisma/schema.prisma (the service's prisma:generate script);\n"
+            "// the client is written to db/prisma/generated, which src/main.ts imports PrismaClient from"
+        )
+        if not self._write_hashed_schema(context, schema_file, title, body):
+            return []
+        return [schema_file]
+
+    def _write_hashed_schema(self, context: GenerationContext, schema_file: Path, title: str, body: str) -> bool:
+        """Write a schema file with its content hash; returns False when the file is unchanged"""
+        from cuur_codegen.utils.file import ensure_directory, write_file
+
+        content_hash = PrismaSchemaBuilder.content_hash(body)
+        if PrismaSchemaBuilder.read_content_hash(schema_file) == content_hash:
+            context.logger.debug(f"Prisma schema unchanged, skipping: {schema_file}")
+            return False
+
+        ensure_directory(schema_file.parent)
+        header = f"""// {title}
+// Generated by Adapter Generator v{self.version}
+//
+// ⚠️  DO NOT EDIT THIS FILE MANUALLY
+// This file is auto-generated. Any manual changes will be overwritten.
+{PrismaSchemaBuilder.CONTENT_HASH_PREFIX}{content_hash}
+
+"""
+        write_file(schema_file, header + body)
+        context.logger.info(f"✓ Generated Prisma schema: {schema_file}")
+        return True
+
+    def _generate_partial_indexes(
+        self,
+        context: GenerationContext,
+        prisma_dir: Path,
+        manifest_file: Path,
+        previous_manifest: dict
+    ) -> List[Path]:
+        """
+        Generate the soft-delete partial index SQL fragment, its manifest and a snapshot test.
+
+        Indexes follow each entity's keyset list query, so the sort column comes from the same
+        pagination config the DAO list method is generated from.
+        """
+        from cuur_codegen.utils.file import ensure_directory, write_file
+        from cuur_codegen.utils.openapi import extract_schemas
+        from cuur_codegen.utils.string import pascal_case
+
+        schemas = extract_schemas(context.spec)
+        if not isinstance(schemas, dict):
+            return []
+
+        indexes = []
+        for entity_name in PrismaModelBuilder.classify_entity_schemas(context, schemas).entities:
+            properties, _ = PrismaModelBuilder.merge_properties(schemas.get(entity_name, {}), schemas)
+            entity_fields = MethodBuilder._extract_entity_fields(entity_name, context.spec)
+            pagination = MethodBuilder._extract_pagination_config(entity_name, context.spec, entity_fields)
+            indexes.extend(PartialIndexBuilder.build_model_indexes(
+                pascal_case(entity_name), properties, pagination.sort_field, pagination.sort_direction
+            ))
+
+        dropped = PartialIndexBuilder.dropped_index_names(indexes, previous_manifest)
+        if not indexes and not dropped:
+            return []
+
+        sql_file = prisma_dir / "partial-indexes.sql"
+        write_file(sql_file, PartialIndexBuilder.build_sql(context.domain_name, indexes, dropped, self.version))
+        write_file(manifest_file, PartialIndexBuilder.build_manifest(indexes, dropped))
+        context.logger.info(
+            f"✓ Generated partial indexes: {sql_file.name} ({len(indexes)} indexes, {len(dropped)} dropped)"
+        )
+
+        # Snapshot test on the emitted SQL (platform/tests/{domain}/prisma)
+        test_dir = context.config.paths.project_root / "platform" / "tests" / context.domain_name / "prisma"
+        ensure_directory(test_dir)
+        test_file = test_dir / "partial-indexes.test.ts"
+        test_header = self.generate_header(context, "Partial index snapshot tests")
+        write_file(test_file, PartialIndexBuilder.build_snapshot_test(
+            test_header,
+            os.path.relpath(sql_file, test_dir),
+            os.path.relpath(manifest_file, test_dir),
+        ))
+
+        return [sql_file, manifest_file, test_file]
+
+    def _generate_partitions(self, context: GenerationContext, prisma_dir: Path) -> List[Path]:
+        """
+        Generate partitions.sql for entities declaring `x-partition` (range-partitioned parents,
+        rolling partitions and their maintenance functions).
+        """
+        from cuur_codegen.utils.file import write_file
+        from cuur_codegen.utils.openapi import extract_schemas
+        from cuur_codegen.utils.string import pascal_case
+
+        schemas = extract_schemas(context.spec)
+        if not isinstance(schemas, dict):
+            return []
+
+        entity_names = PrismaModelBuilder.classify_entity_schemas(context, schemas).entities
+        tables = []
+        for entity_name in entity_names:
+            schema = schemas.get(entity_name, {})
+            config = PartitionBuilder.extract_config(entity_name, context.spec)
+            if not config:
+                if isinstance(schema, dict) and "x-partition" in schema:
+                    context.logger.warn(
+                        f"Ignoring invalid x-partition on {entity_name} (expects a date partition key, "
+                        "interval day/week/month/year and a positive retain)"
+                    )
+                continue
+            properties, _ = PrismaModelBuilder.merge_properties(schema, schemas)
+            tables.append(PartitionBuilder.build_table(pascal_case(entity_name), properties, config))
+
+        if not tables:
+            return []
+
+        sql_file = prisma_dir / "partitions.sql"
+        write_file(sql_file, PartitionBuilder.build_sql(context.domain_name, tables, self.version))
+        context.logger.info(f"✓ Generated partitioned tables: {sql_file.name} ({len(tables)} tables)")
+        return [sql_file]
@@ -6,10 +6,13 @@ from .repository_discovery import RepositoryDiscovery
 from .repository_builder import RepositoryBuilder
 from .method_builder import MethodBuilder
 from .index_builder import IndexBuilder
+from .cache_builder import CachedRepositoryBuilder, CacheSettings
 
 __all__ = [
     "RepositoryDiscovery",
     "RepositoryBuilder",
     "MethodBuilder",
     "IndexBuilder",
+    "CachedRepositoryBuilder",
+    "CacheSettings",
 ]
@@ -0,0 +1,419 @@
+"""
+Cache Builder
+
+Builds opt-in read-through cache decorators around DAO repositories.
+
+Caching is enabled per resource with an `x-cache: { ttl, maxEntries }` extension on the
+entity schema (or a GET operation returning it), or via `layers.adapters.cache` in the
+servicesgen config, which takes precedence over the spec.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cuur_codegen.utils.string import kebab_case
+from .repository_discovery import RepositoryInfo
+from .type_discovery import TypeDiscovery
+
+
+@dataclass
+class CacheSettings:
+    """Resolved cache settings for a single repository"""
+    ttl_seconds: int = 300
+    max_entries: int = 1000
+
+
+class CachedRepositoryBuilder:
+    """Builds cached repository wrappers and the shared cache store module"""
+
+    # Custom method prefixes that only read data (everything else invalidates the org's entries)
+    READ_METHOD_PREFIXES = ("get", "find", "list", "search", "count", "exists")
+
+    @staticmethod
+    def resolve_cache_settings(
+        repo: RepositoryInfo,
+        spec: Optional[Dict[str, Any]] = None,
+        cache_config: Optional[Dict[str, Any]] = None
+    ) -> Optional[CacheSettings]:
+        """
+        Resolve cache settings for a repository.
+
+        Lookup order:
+        1. servicesgen config `layers.adapters.cache` keyed by entity name or resource name
+        2. `x-cache` on the entity schema
+        3. `x-cache` on a GET operation whose response references the entity schema
+
+        Returns None when caching is not configured for the repository.
+        """
+        if cache_config:
+            for key in (repo.entity_name, repo.name, kebab_case(repo.name)):
+                options = cache_config.get(key)
+                if options is not None:
+                    return CacheSettings(
+                        ttl_seconds=int(getattr(options, "ttl", 300)),
+                        max_entries=int(getattr(options, "max_entries", 1000)),
+                    )
+
+        if not spec or not isinstance(spec, dict):
+            return None
+
+        extension = None
+        schemas = spec.get("components", {}).get("schemas", {})
+        entity_schema = schemas.get(repo.entity_name) if isinstance(schemas, dict) else None
+        if isinstance(entity_schema, dict):
+            extension = entity_schema.get("x-cache")
+
+        if extension is None:
+            entity_ref = f'"#/components/schemas/{repo.entity_name}"'
+            for path_item in spec.get("paths", {}).values():
+                operation = path_item.get("get") if isinstance(path_item, dict) else None
+                if not isinstance(operation, dict) or "x-cache" not in operation:
+                    continue
+                if entity_ref in json.dumps(operation.get("responses", {})):
+                    extension = operation["x-cache"]
+                    break
+
+        if extension is None or extension is False:
+            return None
+        if not isinstance(extension, dict):
+            return CacheSettings()
+
+        return CacheSettings(
+            ttl_seconds=int(extension.get("ttl", 300)),
+            max_entries=int(extension.get("maxEntries", extension.get("max_entries", 1000))),
+        )
+
+    @staticmethod
+    def cached_repository_filename(repo: RepositoryInfo) -> str:
+        """Pattern: {resource-name}.cached.dao.repository.ts"""
+        return f"{kebab_case(repo.name)}.cached.dao.repository.ts"
+
+    @staticmethod
+    def build_cache_store_file(header: str) -> str:
+        """Generate the pluggable cache store module (interface, in-memory LRU, single-flight)"""
+        return f"""{header}/**
+ * Pluggable cache store used by cached DAO repositories.
+ *
+ * Implement this interface to swap the in-process LRU for a shared cache (e.g., Redis).
+ */
+export interface CacheStore<V> {{
+  get(key: string): Promise<V | undefined>;
+  set(key: string, value: V, ttlMs: number): Promise<void>;
+  delete(key: string): Promise<void>;
+  /** Delete every entry whose key starts with prefix */
+  deletePrefix(prefix: string): Promise<void>;
+}}
+
+interface CacheEntry<V> {{
+  value: V;
+  expiresAt: number;
+}}
+
+/**
+ * In-process LRU cache with per-entry TTL.
+ *
+ * Map insertion order tracks recency: hits are re-inserted at the tail and the
+ * head is evicted once maxEntries is exceeded.
+ */
+export class InMemoryLruCacheStore<V> implements CacheStore<V> {{
+  private readonly entries = new Map<string, CacheEntry<V>>();
+
+  constructor(
+    private readonly maxEntries: number,
+    private readonly now: () => number = Date.now
+  ) {{}}
+
+  async get(key: string): Promise<V | undefined> {{
+    const entry = this.entries.get(key);
+    if (!entry) {{
+      return undefined;
+    }}
+    if (entry.expiresAt <= this.now()) {{
+      this.entries.delete(key);
+      return undefined;
+    }}
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }}
+
+  async set(key: string, value: V, ttlMs: number): Promise<void> {{
+    this.entries.delete(key);
+    this.entries.set(key, {{ value, expiresAt: this.now() + ttlMs }});
+    while (this.entries.size > this.maxEntries) {{
+      const oldest = this.entries.keys().next().value;
+      if (oldest === undefined) {{
+        break;
+      }}
+      this.entries.delete(oldest);
+    }}
+  }}
+
+  async delete(key: string): Promise<void> {{
+    this.entries.delete(key);
+  }}
+
+  async deletePrefix(prefix: string): Promise<void> {{
+    for (const key of this.entries.keys()) {{
+      if (key.startsWith(prefix)) {{
+        this.entries.delete(key);
+      }}
+    }}
+  }}
+
+  get size(): number {{
+    return this.entries.size;
+  }}
+}}
+
+/**
+ * De-duplicates concurrent loads for the same key so a burst of misses
+ * results in a single database query.
+ */
+export class SingleFlight<V> {{
+  private readonly inFlight = new Map<string, Promise<V>>();
+
+  run(key: string, load: () => Promise<V>): Promise<V> {{
+    const pending = this.inFlight.get(key);
+    if (pending) {{
+      return pending;
+    }}
+    const promise = load().finally(() => {{
+      this.inFlight.delete(key);
+    }});
+    this.inFlight.set(key, promise);
+    return promise;
+  }}
+}}
+"""
+
+    @staticmethod
+    def build_cached_repository_file(
+        repo: RepositoryInfo,
+        header: str,
+        core_package_path: Path,
+        settings: CacheSettings
+    ) -> str:
+        """Generate cached repository wrapper implementing the same repository interface"""
+        interface = repo.interface_name
+        entity = repo.entity_name
+        class_name = f"Cached{interface}"
+
+        type_groups = TypeDiscovery.separate_types_by_import_path(
+            {interface, entity, "OrgId"}, repo.domain_name, core_package_path
+        )
+        import_statements = []
+        for import_path, type_names in sorted(type_groups.items()):
+            names = ", ".join(sorted(type_names))
+            import_statements.append(f'import type {{ {names} }} from "{import_path}";')
+        imports_block = chr(10).join(import_statements)
+
+        def method_type(name: str) -> str:
+            return f'Promise<Awaited<ReturnType<{interface}["{name}"]>>>'
+
+        def params_type(name: str) -> str:
+            return f'Parameters<{interface}["{name}"]>'
+
+        methods: List[str] = []
+
+        methods.append(f"""  list(...args: {params_type("list")}): {method_type("list")} {{
+    return this.inner.list(...args);
+  }}""")
+
+        methods.append(f"""  async findById(orgId: OrgId, id: string): Promise<{entity} | null> {{
+    return this.read("findById", orgId, id, () => this.inner.findById(orgId, id));
+  }}""")
+
+        methods.append(f"""  async findByIds(orgId: OrgId, ids: readonly string[]): Promise<{entity}[]> {{
+    const found: {entity}[] = [];
+    const misses: string[] = [];
+    for (const id of ids) {{
+      const cached = await this.store.get(this.key(orgId, id));
+      if (cached) {{
+        found.push(cached);
+      }} else {{
+        misses.push(id);
+      }}
+    }}
+    if (misses.length > 0) {{
+      // Core repository interfaces do not declare findByIds; DAO repositories implement it
+      const inner = this.inner as {interface} & {{
+        findByIds?: (orgId: OrgId, ids: readonly string[]) => Promise<{entity}[]>;
+      }};
+      const tracked = new Map(misses.map((id) => [id, this.track(this.key(orgId, id))] as const));
+      try {{
+        const records = inner.findByIds
+          ? await inner.findByIds(orgId, misses)
+          : (await Promise.all(misses.map((id) => this.inner.findById(orgId, id)))).filter(
+              (record): record is {entity} => record !== null
+            );
+        for (const record of records) {{
+          const id = (record as {{ id: string }}).id;
+          const load = tracked.get(id);
+          if (load && load.state.version === load.version) {{
+            await this.store.set(this.key(orgId, id), record, this.ttlMs);
+          }}
+        }}
+        found.push(...records);
+      }} finally {{
+        for (const [id, load] of tracked) {{
+          this.release(this.key(orgId, id), load.state);
+        }}
+      }}
+    }}
+    return found;
+  }}""")
+
+        methods.append(f"""  async get(orgId: OrgId, id: string): Promise<{entity} | null> {{
+    return this.read("get", orgId, id, () => this.inner.get(orgId, id));
+  }}""")
+
+        # CountableRepository: counts change with every write elsewhere, so they are never cached
+        methods.append(f"""  exists(...args: {params_type("exists")}): {method_type("exists")} {{
+    return this.inner.exists(...args);
+  }}""")
+
+        methods.append(f"""  count(...args: {params_type("count")}): {method_type("count")} {{
+    return this.inner.count(...args);
+  }}""")
+
+        methods.append("""  /** Present only when the inner repository estimates counts (x-estimated-count) */
+  get estimatedCount(): (() => Promise<number>) | undefined {
+    return this.inner.estimatedCount?.bind(this.inner);
+  }""")
+
+        if repo.has_create or repo.is_crud:
+            methods.append(f"""  async create(...args: {params_type("create")}): {method_type("create")} {{
+    const record = await this.inner.create(...args);
+    await this.invalidate(args[0], (record as {{ id?: string }})?.id);
+    return record;
+  }}""")
+
+        if repo.has_update or repo.is_crud:
+            if repo.update_has_id:
+                methods.append(f"""  async update(...args: {params_type("update")}): {method_type("update")} {{
+    const record = await this.inner.update(...args);
+    await this.invalidate(args[0], args[1] as string);
+    return record;
+  }}""")
+            else:
+                methods.append(f"""  async update(...args: {params_type("update")}): {method_type("update")} {{
+    const record = await this.inner.update(...args);
+    await this.invalidate(args[0], (record as {{ id?: string }})?.id);
+    return record;
+  }}""")
+
+        if repo.has_delete:
+            methods.append(f"""  async delete(...args: {params_type("delete")}): {method_type("delete")} {{
+    await this.inner.delete(...args);
+    await this.invalidate(args[0], args[1] as string);
+  }}""")
+
+        for custom_method in repo.custom_methods or []:
+            name = custom_method["name"]
+            if name in ("exists", "count", "estimatedCount"):
+                continue  # Already delegated above (CountableRepository)
+            if name.startswith(CachedRepositoryBuilder.READ_METHOD_PREFIXES):
+                methods.append(f"""  {name}(...args: {params_type(name)}): {method_type(name)} {{
+    return this.inner.{name}(...args);
+  }}""")
+            else:
+                # Unknown side effects - drop every cached entry for the org
+                methods.append(f"""  async {name}(...args: {params_type(name)}): {method_type(name)} {{
+    const result = await this.inner.{name}(...args);
+    await this.invalidate(args[0] as OrgId);
+    return result;
+  }}""")
+
+        ttl_ms = settings.ttl_seconds * 1000
+        return f"""{header}{imports_block}
+import {{ InMemoryLruCacheStore, SingleFlight, type CacheStore }} from "./cache-store.js";
+
+const CACHE_TTL_MS = {ttl_ms};
+const CACHE_MAX_ENTRIES = {settings.max_entries};
+
+/**
+ * Read-through cache for {interface}.
+ *
+ * findById/get are served from the cache store (TTL {settings.ttl_seconds}s, max {settings.max_entries} entries);
+ * concurrent misses for the same id share one query; writes invalidate affected entries, and a
+ * load that was already running when its key was invalidated does not write the old row back.
+ * list, exists and count always go to the inner repository.
+ */
+export class {class_name} implements {interface} {{
+  private readonly loads = new SingleFlight<{entity} | null>();
+  /** Per-key version while loads are in flight; invalidate() bumps it so stale loads skip store.set */
+  private readonly versions = new Map<string, {{ version: number; loads: number }}>();
+
+  constructor(
+    private readonly inner: {interface},
+    private readonly store: CacheStore<{entity}> = new InMemoryLruCacheStore<{entity}>(CACHE_MAX_ENTRIES),
+    private readonly ttlMs: number = CACHE_TTL_MS
+  ) {{}}
+
+{chr(10).join(methods)}
+
+  private key(orgId: OrgId, id: string): string {{
+    return `{entity}:${{orgId}}:${{id}}`;
+  }}
+
+  /**
+   * Cache hit, or one shared load per (method, key, version) that fills the cache
+   * only if no invalidation happened while it was running.
+   */
+  private async read(
+    method: string,
+    orgId: OrgId,
+    id: string,
+    load: () => Promise<{entity} | null>
+  ): Promise<{entity} | null> {{
+    const key = this.key(orgId, id);
+    const cached = await this.store.get(key);
+    if (cached !== undefined) {{
+      return cached;
+    }}
+
+    const {{ state, version }} = this.track(key);
+    try {{
+      return await this.loads.run(`${{method}}:${{key}}@${{version}}`, async () => {{
+        const record = await load();
+        if (record && state.version === version) {{
+          await this.store.set(key, record, this.ttlMs);
+        }}
+        return record;
+      }});
+    }} finally {{
+      this.release(key, state);
+    }}
+  }}
+
+  private track(key: string): {{ state: {{ version: number; loads: number }}; version: number }} {{
+    const state = this.versions.get(key) ?? {{ version: 0, loads: 0 }};
+    this.versions.set(key, state);
+    state.loads++;
+    return {{ state, version: state.version }};
+  }}
+
+  private release(key: string, state: {{ version: number; loads: number }}): void {{
+    if (--state.loads === 0 && this.versions.get(key) === state) {{
+      this.versions.delete(key);
+    }}
+  }}
+
+  private async invalidate(orgId: OrgId, id?: string): Promise<void> {{
+    const prefix = id ? this.key(orgId, id) : `{entity}:${{orgId}}:`;
+    for (const [key, state] of this.versions) {{
+      if (id ? key === prefix : key.startsWith(prefix)) {{
+        state.version++;
+      }}
+    }}
+    if (id) {{
+      await this.store.delete(prefix);
+    }} else {{
+      await this.store.deletePrefix(prefix);
+    }}
+  }}
+}}
+"""
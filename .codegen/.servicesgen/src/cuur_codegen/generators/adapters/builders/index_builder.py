@@ -4,6 +4,7 @@ Index Builder
 Generates adapter index barrel exports
 """
 
+from typing import Optional
 from .repository_discovery import RepositoryInfo
 from cuur_codegen.utils.string import kebab_case
 
@@ -12,7 +13,11 @@ class IndexBuilder:
     """Builds index file content"""
 
     @staticmethod
-    def build_index_file(repositories: list[RepositoryInfo], header: str) -> str:
+    def build_index_file(
+        repositories: list[RepositoryInfo],
+        header: str,
+        cached_repositories: Optional[list[RepositoryInfo]] = None
+    ) -> str:
         """Generate index file with barrel exports"""
         exports = []
         for repo in repositories:
@@ -21,5 +26,16 @@ class IndexBuilder:
             # Pattern: {resource-name}.dao.repository.ts (e.g., auth-account.dao.repository.ts)
             exports.append(f'export {{ {dao_class_name} }} from "./{kebab}.dao.repository.js";')
 
+        # Opt-in read-through cache wrappers (x-cache) and their shared store module
+        if cached_repositories:
+            for repo in cached_repositories:
+                kebab = kebab_case(repo.name)
+                exports.append(
+                    f'export {{ Cached{repo.interface_name} }} from "./{kebab}.cached.dao.repository.js";'
+                )
+            exports.append(
+                'export { InMemoryLruCacheStore, SingleFlight, type CacheStore } from "./cache-store.js";'
+            )
+
         return f"""{header}{chr(10).join(exports)}
 """
@@ -4,14 +4,44 @@ Method Builder
 Builds repository method implementations
 """
 
+import json
 import re
-from typing import List, Optional, Set
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+from cuur_codegen.generators.prisma.builders.partition_builder import PartitionConfig
 from .repository_discovery import RepositoryInfo
 
 
+@dataclass
+class PaginationConfig:
+    """Keyset pagination settings derived from the spec's list operation parameters"""
+    sort_field: str = "createdAt"  # Keyset sort column (tie-broken by id)
+    sort_direction: str = "desc"  # "asc" or "desc"
+    sort_value_type: str = "date"  # Sort column kind: date, number, bigint, decimal, boolean or string
+    default_limit: int = 50  # Default page size (limit parameter default)
+    max_limit: Optional[int] = None  # Upper bound for page size (limit parameter maximum)
+    filter_fields: Tuple[str, ...] = ()  # Query parameters that name an entity column (equality filters)
+
+
 class MethodBuilder:
     """Builds repository method implementations"""
 
+    # Query parameter names that select the list sort column
+    SORT_PARAM_NAMES = ("sort", "sortBy", "sort_by", "orderBy", "order_by")
+    # Query parameter names that select the list sort direction
+    SORT_DIRECTION_PARAM_NAMES = ("order", "sortOrder", "sort_order", "direction")
+    # Query parameter names that page the list rather than filter it
+    PAGE_PARAM_NAMES = ("cursor", "limit", "page", "offset")
+    # Cursor sort values are stored as strings; decode them back to the column's type
+    CURSOR_VALUE_DECODERS = {
+        "date": "new Date(cursor[0])",
+        "number": "Number(cursor[0])",
+        "bigint": "BigInt(cursor[0])",
+        "decimal": "cursor[0]",  # Prisma Decimal filters accept the exact string form
+        "boolean": 'cursor[0] === "true"',
+        "string": "cursor[0]",
+    }
+
     @staticmethod
     def _extract_entity_fields(entity_name: str, spec: Optional[dict] = None) -> Set[str]:
         """
@@ -42,6 +72,294 @@ class MethodBuilder:
 
         return field_names
 
+    @staticmethod
+    def _extract_json_fields(entity_name: str, spec: Optional[dict] = None) -> Set[str]:
+        """
+        Extract entity properties stored in Json/JSONB columns.
+
+        Uses the same object detection as the Prisma type converter (type: object,
+        additionalProperties maps, $refs to object schemas, arrays of objects) so the
+        DAO and schema.prisma agree on which columns are native JSON.
+        """
+        if not spec or not isinstance(spec, dict):
+            return set()
+
+        from cuur_codegen.generators.prisma.builders import PrismaModelBuilder, PrismaTypeConverter
+
+        schemas = spec.get("components", {}).get("schemas", {})
+        entity_schema = schemas.get(entity_name) if isinstance(schemas, dict) else None
+        if not isinstance(entity_schema, dict):
+            return set()
+
+        properties, _ = PrismaModelBuilder.merge_properties(entity_schema, schemas)
+        json_fields = set()
+        for prop_name, prop_schema in properties.items():
+            if not isinstance(prop_name, str) or not isinstance(prop_schema, dict):
+                continue
+            if prop_schema.get("type") == "array":
+                prop_schema = prop_schema.get("items") or {}
+            if PrismaTypeConverter.is_json_schema(prop_schema, spec):
+                json_fields.add(prop_name)
+        return json_fields
+
+    @staticmethod
+    def _extract_estimated_count(entity_name: str, spec: Optional[dict] = None) -> bool:
+        """Whether the entity schema opts into estimatedCount() (`x-estimated-count: true`)"""
+        if not spec or not isinstance(spec, dict):
+            return False
+        schemas = spec.get("components", {}).get("schemas", {})
+        entity_schema = schemas.get(entity_name) if isinstance(schemas, dict) else None
+        return isinstance(entity_schema, dict) and entity_schema.get("x-estimated-count") is True
+
+    @staticmethod
+    def _extract_pagination_config(
+        entity_name: str,
+        spec: Optional[dict] = None,
+        entity_fields: Optional[Set[str]] = None
+    ) -> PaginationConfig:
+        """
+        Derive the keyset cursor shape from the list operation that returns the entity.
+
+        Looks for GET operations with cursor/limit query parameters whose response
+        references the entity schema (directly or through a list component), then reads:
+        - sort/orderBy parameter default (e.g., "-createdAt", "name:asc") -> sort field/direction
+        - order/direction parameter default -> sort direction
+        - limit parameter default/maximum -> page size bounds
+        - parameters named after an entity property -> equality filters (list and count)
+
+        Falls back to createdAt desc (every generated model has createdAt) when the
+        spec does not declare a usable sort parameter.
+        """
+        config = PaginationConfig()
+        if not spec or not isinstance(spec, dict):
+            return config
+
+        from cuur_codegen.utils.openapi import resolve_ref
+
+        entity_ref = f'"#/components/schemas/{entity_name}"'
+        list_parameters: List[Dict[str, Any]] = []
+        for path, path_item in spec.get("paths", {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            operation = path_item.get("get")
+            if not isinstance(operation, dict):
+                continue
+
+            parameters = []
+            for param in list(path_item.get("parameters", [])) + list(operation.get("parameters", [])):
+                if isinstance(param, dict) and "$ref" in param:
+                    param = resolve_ref(spec, param["$ref"]) or {}
+                if isinstance(param, dict) and param.get("in") == "query":
+                    parameters.append(param)
+
+            param_names = {p.get("name") for p in parameters}
+            if not param_names & {"cursor", "limit"}:
+                continue
+
+            responses = json.dumps(operation.get("responses", {}))
+            if entity_ref not in responses:
+                # List envelopes usually wrap a {Entity}List component; look one $ref deep
+                wrapped = [
+                    json.dumps(resolve_ref(spec, ref) or {})
+                    for ref in set(re.findall(r'"\$ref": "(#/components/schemas/[^"]+)"', responses))
+                ]
+                if not any(entity_ref in schema for schema in wrapped):
+                    continue
+
+            # Prefer the top-level collection (/encounters) over nested ones (/patients/{id}/encounters)
+            if "{" not in path:
+                list_parameters = parameters
+                break
+            if not list_parameters:
+                list_parameters = parameters
+
+        schemas = spec.get("components", {}).get("schemas", {})
+        entity_schema = schemas.get(entity_name, {}) if isinstance(schemas, dict) else {}
+        properties = MethodBuilder._schema_properties(spec, entity_schema)
+        known_fields = set(entity_fields or properties.keys()) | {"id", "createdAt", "updatedAt"}
+
+        for param in list_parameters:
+            name = param.get("name")
+            schema = param.get("schema", {}) if isinstance(param.get("schema"), dict) else {}
+            default = schema.get("default")
+
+            if name == "limit":
+                if isinstance(default, int) and default > 0:
+                    config.default_limit = default
+                if isinstance(schema.get("maximum"), int):
+                    config.max_limit = schema["maximum"]
+            elif name in MethodBuilder.SORT_PARAM_NAMES and isinstance(default, str) and default:
+                field_name, direction = default, None
+                if field_name.startswith("-"):
+                    field_name, direction = field_name[1:], "desc"
+                elif field_name.startswith("+"):
+                    field_name, direction = field_name[1:], "asc"
+                if ":" in field_name:
+                    field_name, direction = field_name.split(":", 1)
+                if field_name in known_fields:
+                    config.sort_field = field_name
+                    config.sort_direction = (direction or "asc").lower()
+            elif name in MethodBuilder.SORT_DIRECTION_PARAM_NAMES and isinstance(default, str):
+                if default.lower() in ("asc", "desc"):
+                    config.sort_direction = default.lower()
+
+        if config.sort_direction not in ("asc", "desc"):
+            config.sort_direction = "desc"
+
+        paging_names = set(MethodBuilder.PAGE_PARAM_NAMES) | set(MethodBuilder.SORT_PARAM_NAMES) | set(
+            MethodBuilder.SORT_DIRECTION_PARAM_NAMES
+        )
+        config.filter_fields = tuple(
+            param["name"] for param in list_parameters
+            if param.get("name") in properties and param["name"] not in paging_names
+        )
+
+        sort_schema = properties.get(config.sort_field, {})
+        config.sort_value_type = MethodBuilder._sort_value_type(config.sort_field, sort_schema)
+
+        return config
+
+    @staticmethod
+    def _schema_properties(spec: dict, schema: Any, seen: frozenset = frozenset()) -> Dict[str, Any]:
+        """Properties of a schema, merged through $ref and allOf compositions"""
+        from cuur_codegen.utils.openapi import resolve_ref
+
+        if not isinstance(schema, dict):
+            return {}
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            if ref in seen:
+                return {}
+            return MethodBuilder._schema_properties(spec, resolve_ref(spec, ref), seen | {ref})
+        properties: Dict[str, Any] = {}
+        for part in schema.get("allOf", []):
+            properties.update(MethodBuilder._schema_properties(spec, part, seen))
+        if isinstance(schema.get("properties"), dict):
+            properties.update(schema["properties"])
+        return properties
+
+    @staticmethod
+    def _sort_value_type(field_name: str, schema: Any) -> str:
+        """Cursor value kind for a sort column (matches the Prisma column type)"""
+        if not isinstance(schema, dict) or not schema:
+            return "date" if field_name in ("createdAt", "updatedAt") else "string"
+        schema_type = schema.get("type")
+        schema_format = schema.get("format")
+        if schema_format in ("date-time", "date"):
+            return "date"
+        if schema_type == "integer":
+            return "bigint" if schema_format == "int64" else "number"
+        if schema_type == "number":
+            return "number" if schema_format == "float" else "decimal"
+        if schema_type == "boolean":
+            return "boolean"
+        return "string"
+
+    @staticmethod
+    def build_cursor_helpers(pagination: PaginationConfig) -> str:
+        """
+        Build module-level keyset cursor helpers for a DAO repository file.
+
+        Cursors are opaque base64url-encoded JSON tuples of (sortValue, id) so that
+        ties on non-unique sort columns (e.g., createdAt) are broken by id.
+        """
+        return f"""type ListCursor = [sortValue: string, id: string];
+
+/**
+ * Encode an opaque keyset cursor from the last row of a page ({pagination.sort_field}, id)
+ */
+function encodeCursor(sortValue: unknown, id: string): string {{
+  const value = sortValue instanceof Date ? sortValue.toISOString() : String(sortValue);
+  return Buffer.from(JSON.stringify([value, id])).toString("base64url");
+}}
+
+/**
+ * Decode a keyset cursor; returns null for malformed or legacy (raw id) cursors
+ */
+function decodeCursor(cursor: string): ListCursor | null {{
+  try {{
+    const decoded = JSON.parse(Buffer.from(cursor, "base64url").toString("utf8"));
+    return Array.isArray(decoded) && decoded.length === 2 ? (decoded as ListCursor) : null;
+  }} catch {{
+    return null;
+  }}
+}}"""
+
+    # x-partition interval -> (date parts used, retained window start, next interval start)
+    # with the window bounds as Date.UTC arguments
+    PARTITION_WINDOWS = {
+        "day": ("y, m, d", "y, m, d - PARTITION_RETAIN", "y, m, d + 1"),
+        "week": ("y, m, d", "y, m, d - weekday - 7 * PARTITION_RETAIN", "y, m, d - weekday + 7"),
+        "month": ("y, m", "y, m - PARTITION_RETAIN, 1", "y, m + 1, 1"),
+        "year": ("y", "y - PARTITION_RETAIN, 0, 1", "y + 1, 0, 1"),
+    }
+    PARTITION_DATE_PARTS = {"y": "now.getUTCFullYear()", "m": "now.getUTCMonth()", "d": "now.getUTCDate()"}
+
+    @staticmethod
+    def build_partition_helpers(partition: Optional[PartitionConfig]) -> str:
+        """
+        Build the module-level partition window for entities declaring `x-partition`.
+
+        List and count queries always bound the partition key to the retained partitions (up to the
+        start of the next interval) so PostgreSQL prunes every partition outside the window; optional
+        `{by}From` / `{by}To` list params narrow it further.
+        """
+        if not partition:
+            return ""
+        parts, start, end = MethodBuilder.PARTITION_WINDOWS[partition.interval]
+        getters = ", ".join(MethodBuilder.PARTITION_DATE_PARTS[part] for part in parts.split(", "))
+        date_parts = f"const [{parts}] = [{getters}];" if "," in parts else f"const {parts} = {getters};"
+        weekday = "\n  const weekday = (now.getUTCDay() + 6) % 7; // ISO weeks start on Monday" if partition.interval == "week" else ""
+        return f"""/** x-partition: {partition.by} per {partition.interval}, {partition.retain} retained (see prisma/partitions.sql) */
+const PARTITION_RETAIN = {partition.retain};
+
+/**
+ * Bounded {partition.by} range for list and count queries so only the retained partitions are scanned
+ */
+function partitionWindow(params?: unknown): {{ gte: Date; lt: Date }} {{
+  const range = (params ?? {{}}) as {{ {partition.by}From?: string | Date; {partition.by}To?: string | Date }};
+  const now = new Date();
+  {date_parts}{weekday}
+  const retainedFrom = new Date(Date.UTC({start}));
+  const nextStart = new Date(Date.UTC({end}));
+  const from = range.{partition.by}From ? new Date(range.{partition.by}From) : retainedFrom;
+  const to = range.{partition.by}To ? new Date(range.{partition.by}To) : nextStart;
+  return {{ gte: from > retainedFrom ? from : retainedFrom, lt: to < nextStart ? to : nextStart }};
+}}"""
+
+    @staticmethod
+    def build_json_helpers(json_fields: Set[str]) -> str:
+        """
+        Build module-level helpers for Json columns in a DAO repository file.
+
+        Prisma returns and accepts Json columns as plain values, so no JSON.parse/stringify is
+        needed; only a literal null must be sent as Prisma.DbNull on writes.
+        """
+        if not json_fields:
+            return ""
+        fields = ", ".join(json.dumps(name) for name in sorted(json_fields))
+        return f"""const JSON_FIELDS = [{fields}] as const;
+
+/** Map null Json column values to a database NULL (Prisma rejects a plain null for Json inputs) */
+function toJsonColumns<T extends object>(data: T): T {{
+  const columns: Record<string, unknown> = {{ ...data }};
+  for (const field of JSON_FIELDS) {{
+    if (columns[field] === null) {{
+      columns[field] = Prisma.DbNull;
+    }}
+  }}
+  return columns as T;
+}}"""
+
+    @staticmethod
+    def build_include_constant(include_relations: List[str]) -> str:
+        """Build the module-level Prisma include for relations embedded in the entity response"""
+        if not include_relations:
+            return ""
+        entries = ", ".join(f"{name}: true" for name in include_relations)
+        return f"""/** Relations embedded in the response schema, fetched with the row instead of per-item lookups */
+const INCLUDE_RELATIONS = {{ {entries} }} as const;"""
+
     @staticmethod
     def _build_select_clause(fields: Set[str]) -> str:
         """
@@ -58,9 +376,23 @@ class MethodBuilder:
         return ""
 
     @staticmethod
-    def build_methods(repo: RepositoryInfo, entity_fields: Optional[Set[str]] = None) -> List[str]:
+    def build_methods(
+        repo: RepositoryInfo,
+        entity_fields: Optional[Set[str]] = None,
+        pagination: Optional[PaginationConfig] = None,
+        json_fields: Optional[Set[str]] = None,
+        include_relations: Optional[List[str]] = None,
+        estimated_count: bool = False,
+        partition: Optional[PartitionConfig] = None
+    ) -> List[str]:
         """Build repository methods"""
         methods = []
+        # Reads load relations the response schema embeds in the same round-trip
+        include_clause = "\n        include: INCLUDE_RELATIONS," if include_relations else ""
+        # Write payloads pass through toJsonColumns when the entity has Json columns
+        data_spread = "...toJsonColumns(data)" if json_fields else "...data"
+        item_spread = "...toJsonColumns(item)" if json_fields else "...item"
+        update_data = "toJsonColumns(data)" if json_fields else "data"
         entity_pascal = repo.entity_name
         create_type = repo.create_type or f"Create{entity_pascal}Request"
         update_type = repo.update_type or f"Update{entity_pascal}Request"
@@ -73,7 +405,40 @@ class MethodBuilder:
             repo.uses_string_for_org_id.get('delete', False)
         )
 
-        # List method with selective fields for better performance and soft delete filtering
+        # List method with keyset pagination and soft delete filtering
+        # Rows are ordered by (sortField, id) and the cursor predicate seeks past the last
+        # (sortField, id) pair, so non-unique sort keys never skip or repeat rows.
+        pagination = pagination or PaginationConfig()
+        sort_field = pagination.sort_field
+        direction = pagination.sort_direction
+        comparator = "lt" if direction == "desc" else "gt"
+        cursor_value = MethodBuilder.CURSOR_VALUE_DECODERS.get(pagination.sort_value_type, "cursor[0]")
+        if sort_field == "id":
+            keyset_predicate = f"""id: {{ {comparator}: cursor[1] }},"""
+            order_by = f"""{{ id: "{direction}" }}"""
+        else:
+            keyset_predicate = f"""OR: [
+              {{ {sort_field}: {{ {comparator}: {cursor_value} }} }},
+              {{ {sort_field}: {cursor_value}, id: {{ {comparator}: cursor[1] }} }},
+            ],"""
+            order_by = f"""[{{ {sort_field}: "{direction}" }}, {{ id: "{direction}" }}]"""
+        limit_expr = (
+            "Math.min(params?.limit ?? DEFAULT_LIMIT, MAX_LIMIT)"
+            if pagination.max_limit else "params?.limit ?? DEFAULT_LIMIT"
+        )
+
+        # Filter query parameters are equality predicates; Prisma ignores undefined values.
+        # Generic PaginationParams carries no filter fields, so there is nothing to read.
+        filter_predicate = "".join(
+            f"\n          {field}: params?.{field}," for field in pagination.filter_fields
+        ) if list_params_type != "PaginationParams" else ""
+
+        # Partitioned tables: bound the partition key so only retained partitions are scanned
+        partition_predicate = (
+            f"\n          {partition.by}: partitionWindow(params), // Partition pruning (x-partition)"
+            if partition else ""
+        )
+
         org_id_type_list = 'string' if repo.uses_string_for_org_id.get('list', False) else 'OrgId'
         select_clause = MethodBuilder._build_select_clause(entity_fields) if entity_fields else ""
         list_method = f"""  async list(
@@ -81,26 +446,28 @@ class MethodBuilder:
     params?: {list_params_type}
   ): Promise<PaginatedResult<{entity_pascal}>> {{
     try {{
-      const limit = params?.limit ?? DEFAULT_LIMIT;
+      const limit = {limit_expr};
+      const cursor = params?.cursor ? decodeCursor(params.cursor) : null;
 
       const records = await this.dao.{repo.name}.findMany({{
-        where: {{
+        where: {{{filter_predicate}
           orgId,
-          deletedAt: null, // Soft delete filter - only return non-deleted records
+          deletedAt: null, // Soft delete filter - only return non-deleted records{partition_predicate}
+          ...(cursor ? {{
+            {keyset_predicate}
+          }} : {{}}),
         }},
-        orderBy: {{ createdAt: "desc" }},
-        take: limit,{select_clause}
-        ...(params?.cursor ? {{
-          skip: 1,
-          cursor: {{ id: params.cursor }},
-        }} : {{}}),
+        orderBy: {order_by},
+        take: limit + 1, // Fetch one extra row to detect the next page without a count query{select_clause}{include_clause}
       }});
 
+      const hasMore = records.length > limit;
+      const page = hasMore ? records.slice(0, limit) : records;
+      const last = page[page.length - 1];
+
       return {{
-        items: records.map((r) => this.toDomain(r)),
-        nextCursor: records.length === limit
-          ? records[records.length - 1]?.id
-          : undefined,
+        items: page.map((r) => this.toDomain(r)),
+        nextCursor: hasMore && last ? encodeCursor(last.{sort_field}, last.id) : null,
         prevCursor: undefined,
       }};
     }} catch (error) {{
@@ -120,7 +487,7 @@ class MethodBuilder:
           orgId,
           id,
           deletedAt: null, // Soft delete filter - only return non-deleted records
-        }},{select_clause_find}
+        }},{select_clause_find}{include_clause}
       }});
       return record ? this.toDomain(record) : null;
     }} catch (error) {{
@@ -130,6 +497,95 @@ class MethodBuilder:
   }}"""
         methods.append(find_by_id_method)
 
+        # findByIds method - one IN query for a batch of ids (DataLoader batch function)
+        find_by_ids_method = f"""  async findByIds(orgId: {org_id_type_find_by_id}, ids: readonly string[]): Promise<{entity_pascal}[]> {{
+    if (ids.length === 0) {{
+      return [];
+    }}
+    try {{
+      const records = await this.dao.{repo.name}.findMany({{
+        where: {{
+          orgId,
+          id: {{ in: [...ids] }},
+          deletedAt: null, // Soft delete filter - only return non-deleted records
+        }},{select_clause_find}{include_clause}
+      }});
+      return records.map((r) => this.toDomain(r));
+    }} catch (error) {{
+      handleDatabaseError(error);
+      throw error;
+    }}
+  }}"""
+        methods.append(find_by_ids_method)
+
+        # exists/count - answer existence and totals without loading rows (CountableRepository)
+        exists_method = f"""  async exists(orgId: {org_id_type_find_by_id}, id: string): Promise<boolean> {{
+    try {{
+      const record = await this.dao.{repo.name}.findFirst({{
+        where: {{
+          orgId,
+          id,
+          deletedAt: null, // Soft delete filter - only return non-deleted records
+        }},
+        select: {{ id: true }}, // Index lookup only - no row payload
+      }});
+      return record !== null;
+    }} catch (error) {{
+      handleDatabaseError(error);
+      throw error;
+    }}
+  }}"""
+        methods.append(exists_method)
+
+        # Partitioned tables: count over the same window list() pages through ({by}From/{by}To narrow it)
+        if partition:
+            window_fields = f"{partition.by}From, {partition.by}To"
+            count_filter = f"""
+      const {{ {window_fields}, ...columns }} = filter ?? {{}};"""
+            count_spread = "...columns"
+            count_partition = (
+                f"\n          {partition.by}: partitionWindow({{ {window_fields} }}), // Partition pruning (x-partition)"
+            )
+        else:
+            count_filter, count_spread, count_partition = "", "...filter", ""
+        count_method = f"""  async count(orgId: {org_id_type_list}, filter?: Record<string, unknown>): Promise<number> {{
+    try {{{count_filter}
+      return await this.dao.{repo.name}.count({{
+        where: {{
+          {count_spread},
+          orgId, // After the filter so it can never widen the tenant scope
+          deletedAt: null, // Soft delete filter - only count non-deleted records{count_partition}
+        }},
+      }});
+    }} catch (error) {{
+      handleDatabaseError(error);
+      throw error;
+    }}
+  }}"""
+        methods.append(count_method)
+
+        if estimated_count:
+            # Prisma model (and table) name is the PascalCase delegate name
+            table_name = repo.name[:1].upper() + repo.name[1:]
+            estimated_count_method = f"""  async estimatedCount(): Promise<number> {{
+    try {{
+      // Planner statistics instead of a full scan; table-wide (every organization, deleted rows included)
+      const rows = await this.dao.$queryRaw<Array<{{ estimate: number }}>>`
+        SELECT reltuples::float8 AS estimate FROM pg_class WHERE oid = to_regclass(${{'"{table_name}"'}})
+      `;
+      const estimate = rows[0]?.estimate ?? -1;
+      if (estimate < 0) {{
+        // Never vacuumed or analyzed - no statistics yet, fall back to an exact count
+        return await this.dao.{repo.name}.count();
+      }}
+      return Math.round(estimate);
+    }} catch (error) {{
+      handleDatabaseError(error);
+      throw error;
+    }}
+  }}"""
+            methods.append(estimated_count_method)
+
         # get method - throws NotFoundError if not found
         org_id_type_get = 'string' if repo.uses_string_for_org_id.get('get', False) else 'OrgId'
         get_method = f"""  async get(orgId: {org_id_type_get}, id: string): Promise<{entity_pascal} | null> {{
@@ -141,6 +597,28 @@ class MethodBuilder:
   }}"""
         methods.append(get_method)
 
+        # x-partition: the primary key is (id, partition key), so unique writes address the row
+        # through its composite key, looked up (within the org) by partitionKey()
+        if partition:
+            unique_where = "await this.partitionKey(this.dao, orgId, id)"
+            tx_unique_where = "await this.partitionKey(tx, orgId, id)"
+            if repo.has_update or repo.is_crud or repo.has_delete:
+                methods.append(f"""  /**
+   * Composite primary key ({{ id, {partition.by} }}) of a live row, for update/delete on the partitioned table
+   */
+  private async partitionKey(client: DaoClient, orgId: string, id: string) {{
+    const row = await client.{repo.name}.findFirst({{
+      where: {{ id, orgId, deletedAt: null }},
+      select: {{ {partition.by}: true }},
+    }});
+    if (!row) {{
+      throw new NotFoundError("{entity_pascal}", id);
+    }}
+    return {{ id_{partition.by}: {{ id, {partition.by}: row.{partition.by} }} }};
+  }}""")
+        else:
+            unique_where = tx_unique_where = "{ id }"
+
         # create method with audit trail support
         if repo.has_create or repo.is_crud:
             create_param_type = repo.create_type_full or create_type
@@ -149,7 +627,7 @@ class MethodBuilder:
     try {{
       const record = await this.dao.{repo.name}.create({{
         data: {{
-          ...data,
+          {data_spread},
           orgId, // Set orgId after spread to ensure it's always set correctly
           createdBy: createdBy ?? null, // Audit trail
         }},
@@ -170,9 +648,9 @@ class MethodBuilder:
                 update_method = f"""  async update(orgId: {org_id_type_update}, id: string, data: {update_param_type}, updatedBy?: string): Promise<{entity_pascal}> {{
     try {{
       const record = await this.dao.{repo.name}.update({{
-        where: {{ id }},
+        where: {unique_where},
         data: {{
-          ...data,
+          {data_spread},
           updatedBy: updatedBy ?? null, // Audit trail
         }},
       }});
@@ -189,7 +667,7 @@ class MethodBuilder:
       const record = await this.dao.{repo.name}.update({{
         where: {{ orgId }},
         data: {{
-          ...data,
+          {data_spread},
           updatedBy: updatedBy ?? null, // Audit trail
         }},
       }});
@@ -208,7 +686,7 @@ class MethodBuilder:
     try {{
       // Soft delete: set deletedAt instead of hard delete
       await this.dao.{repo.name}.update({{
-        where: {{ id }},
+        where: {unique_where},
         data: {{
           deletedAt: new Date(),
           deletedBy: deletedBy ?? null,
@@ -231,7 +709,7 @@ class MethodBuilder:
       // Use createMany for better performance
       await this.dao.{repo.name}.createMany({{
         data: items.map(item => ({{
-          ...item,
+          {item_spread},
           orgId,
         }})),
         skipDuplicates: true,
@@ -262,12 +740,12 @@ class MethodBuilder:
             update_many_method = f"""  async updateMany(orgId: {org_id_type_update}, updates: Array<{{ id: string; data: {update_param_type} }}>): Promise<{entity_pascal}[]> {{
     try {{
       // Use transaction for atomic batch updates
-      return await this.transactionManager.execute(orgId, async (tx) => {{
+      return await this.runInTransaction(orgId, async (tx) => {{
         const results: {entity_pascal}[] = [];
         for (const {{ id, data }} of updates) {{
           const record = await tx.{repo.name}.update({{
-            where: {{ id }},
-            data,
+            where: {tx_unique_where},
+            data: {update_data},
           }});
           results.push(this.toDomain(record));
         }}
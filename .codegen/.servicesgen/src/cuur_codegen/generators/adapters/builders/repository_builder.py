@@ -5,9 +5,10 @@ Builds DAO repository class implementations
 """
 
 from pathlib import Path
-from typing import Set, Dict, Optional
+from typing import Set, Dict, List, Optional
 from .repository_discovery import RepositoryInfo
-from .method_builder import MethodBuilder
+from cuur_codegen.generators.prisma.builders.partition_builder import PartitionConfig
+from .method_builder import MethodBuilder, PaginationConfig
 from .type_discovery import TypeDiscovery
 
 
@@ -19,7 +20,12 @@ class RepositoryBuilder:
         repo: RepositoryInfo,
         header: str,
         core_package_path: Path,
-        entity_fields: Optional[Set[str]] = None
+        entity_fields: Optional[Set[str]] = None,
+        pagination: Optional[PaginationConfig] = None,
+        json_fields: Optional[Set[str]] = None,
+        include_relations: Optional[List[str]] = None,
+        estimated_count: bool = False,
+        partition: Optional[PartitionConfig] = None
     ) -> str:
         """Generate repository file content"""
         dao_class_name = f"Dao{repo.interface_name}"
@@ -29,7 +35,25 @@ class RepositoryBuilder:
         list_params_type = repo.list_params_type or "PaginationParams"
 
         # Build methods with entity fields for selective queries
-        methods = MethodBuilder.build_methods(repo, entity_fields)
+        pagination = pagination or PaginationConfig()
+        methods = MethodBuilder.build_methods(
+            repo, entity_fields, pagination, json_fields, include_relations, estimated_count, partition
+        )
+        cursor_helpers = MethodBuilder.build_cursor_helpers(pagination)
+        json_helpers = MethodBuilder.build_json_helpers(json_fields or set())
+        if json_helpers:
+            cursor_helpers += f"\n\n{json_helpers}"
+        include_constant = MethodBuilder.build_include_constant(include_relations or [])
+        if include_constant:
+            cursor_helpers += f"\n\n{include_constant}"
+        partition_helpers = MethodBuilder.build_partition_helpers(partition)
+        if partition_helpers:
+            cursor_helpers += f"\n\n{partition_helpers}"
+
+        # Page size bounds come from the spec's limit parameter
+        limit_constants = f"const DEFAULT_LIMIT = {pagination.default_limit};"
+        if pagination.max_limit:
+            limit_constants += f"\nconst MAX_LIMIT = {pagination.max_limit};"
 
         # Build imports
         imports: Set[str] = {repo.interface_name, entity_pascal}
@@ -98,19 +122,43 @@ class RepositoryBuilder:
 
         shared_imports_str = ", ".join(sorted(shared_imports))
 
+        # Prisma namespace (Prisma.DbNull) for Json column writes, from the domain's generated
+        # client (the one PrismaClient comes from) so the sentinel matches the client instance
+        prisma_import = ""
+        if json_fields:
+            prisma_import = f"""import {{ Prisma }} from "@quub/adapters/{repo.domain_name}/prisma/generated/index.js";
+"""
+
         return f"""{header}{imports_block}
 import type {{ DaoClient }} from "../shared/dao-client.js";
 import {{ {shared_imports_str} }} from "../shared/index.js";
+{prisma_import}
+{limit_constants}
 
-const DEFAULT_LIMIT = 50;
+{cursor_helpers}
 
 export class {dao_class_name} implements {repo.interface_name} {{
   private transactionManager: TransactionManager;
 
-  constructor(private readonly dao: DaoClient) {{
+  /**
+   * @param dao - Prisma client, or an interactive transaction client cast to DaoClient
+   * @param inTransaction - true when dao is a transaction client: batch methods join that
+   *   transaction instead of opening a nested one
+   */
+  constructor(
+    private readonly dao: DaoClient,
+    private readonly inTransaction = false
+  ) {{
     this.transactionManager = new TransactionManager(dao);
   }}
 
+  private runInTransaction<T>(orgId: string, fn: (tx: DaoClient) => Promise<T>): Promise<T> {{
+    if (this.inTransaction) {{
+      return fn(this.dao);
+    }}
+    return this.transactionManager.execute(orgId, fn);
+  }}
+
 {chr(10).join(methods)}
 }}
 """
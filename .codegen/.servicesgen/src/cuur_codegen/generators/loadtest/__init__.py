@@ -0,0 +1,5 @@
+"""Load test generators"""
+
+from cuur_codegen.generators.loadtest.loadtest import LoadTestGenerator
+
+__all__ = ["LoadTestGenerator"]
@@ -0,0 +1,5 @@
+"""Load test generator builders"""
+
+from .loadtest_builder import LoadTestBuilder, LoadScenario, SeededRepository
+
+__all__ = ["LoadTestBuilder", "LoadScenario", "SeededRepository"]
@@ -0,0 +1,613 @@
+"""
+Load Test Builder
+
+Builds the per-service load test harness:
+- load-runner.ts: closed-loop undici driver that records HDR histograms per scenario
+- scenarios.ts: one scenario per OpenAPI operation, plus seeding of the repositories
+- {domain}.loadtest.ts: entry point that boots the service in-process and writes the report
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from cuur_codegen.core.context import GenerationContext
+from cuur_codegen.utils.openapi import get_request_body_schema_name
+from cuur_codegen.utils.string import camel_case, pascal_case, singularize
+
+
+# Relative request mix per verb; delete scenarios only run when selected explicitly
+# (they would otherwise drain the seeded records the other scenarios read)
+DEFAULT_SCENARIO_WEIGHTS = {
+    "list": 4,
+    "get": 4,
+    "create": 1,
+    "update": 1,
+    "patch": 1,
+    "delete": 0,
+}
+
+
+@dataclass
+class LoadScenario:
+    """A single operation exercised by the load test"""
+    name: str
+    method: str
+    path: str
+    repo_var: str
+    weight: int
+    body_factory: Optional[str] = None
+    # Path parameter -> repository variable whose seeded ids fill it
+    path_params: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class SeededRepository:
+    """A repository seeded with records before the run"""
+    repo_var: str
+    interface_name: str
+    factory: str
+
+
+class LoadTestBuilder:
+    """Builds load test harness files for a Fastify service"""
+
+    @staticmethod
+    def _request_body_schema(operation: Dict[str, Any], spec: Dict[str, Any]) -> Optional[str]:
+        """Request body schema name, unwrapping `allOf: [ApiResponse, {data: $ref}]` envelopes"""
+        schema_name = get_request_body_schema_name(operation, spec)
+        if schema_name:
+            return schema_name
+
+        schema = (
+            operation.get("requestBody", {})
+            .get("content", {})
+            .get("application/json", {})
+            .get("schema", {})
+        )
+        for part in schema.get("allOf", []) if isinstance(schema, dict) else []:
+            data = part.get("properties", {}).get("data", {}) if isinstance(part, dict) else {}
+            if isinstance(data, dict) and "$ref" in data:
+                return data["$ref"].split("/")[-1]
+        return None
+
+    @staticmethod
+    def collect_scenarios(
+        context: GenerationContext,
+        resource_routes: Dict[str, List[Dict[str, Any]]]
+    ) -> List[LoadScenario]:
+        """Build one scenario per operation (repository naming matches DependenciesBuilder)"""
+        repo_vars = {
+            f"{camel_case(singularize(resource))}Repo" for resource in resource_routes
+        }
+        scenarios: List[LoadScenario] = []
+
+        for resource, operations in resource_routes.items():
+            repo_var = f"{camel_case(singularize(resource))}Repo"
+            for op_data in operations:
+                operation = op_data.get("operation", {})
+                operation_id = operation.get("operationId") or op_data.get("operation_id", "")
+                verb_match = re.match(r"^(list|get|create|update|delete|patch)", operation_id)
+                if not verb_match:
+                    continue
+
+                path = op_data.get("path", "")
+                path_params: Dict[str, str] = {}
+                # {patientId} -> patientRepo; otherwise the collection segment before the
+                # parameter names it (/patients/{id}/allergies -> patientRepo)
+                for segment, param in re.findall(r"([\w-]*)/\{(\w+)\}", path):
+                    if param == "orgId":
+                        continue
+                    candidates = [
+                        f"{camel_case(param[:-2])}Repo" if param.endswith("Id") else None,
+                        f"{camel_case(singularize(segment.replace('-', '_')))}Repo" if segment else None,
+                    ]
+                    path_params[param] = next(
+                        (candidate for candidate in candidates if candidate in repo_vars), repo_var
+                    )
+
+                body_schema = None
+                if op_data.get("method") in ("POST", "PUT", "PATCH") and operation.get("requestBody"):
+                    body_schema = LoadTestBuilder._request_body_schema(operation, context.spec)
+
+                scenarios.append(LoadScenario(
+                    name=operation_id,
+                    method=op_data.get("method", "GET"),
+                    path=path,
+                    repo_var=repo_var,
+                    weight=DEFAULT_SCENARIO_WEIGHTS[verb_match.group(1)],
+                    body_factory=f"create{body_schema}" if body_schema else None,
+                    path_params=path_params,
+                ))
+
+        return sorted(scenarios, key=lambda scenario: scenario.name)
+
+    @staticmethod
+    def collect_seeded_repositories(
+        context: GenerationContext,
+        resource_routes: Dict[str, List[Dict[str, Any]]]
+    ) -> List[SeededRepository]:
+        """Repositories that are seeded before the run (seed data comes from the create operation's request factory)"""
+        seeded: Dict[str, SeededRepository] = {}
+        for resource, operations in resource_routes.items():
+            entity = pascal_case(singularize(resource))
+            repo_var = f"{camel_case(singularize(resource))}Repo"
+            if repo_var in seeded:
+                continue
+
+            factory = f"create{entity}"
+            for op_data in operations:
+                operation = op_data.get("operation", {})
+                operation_id = operation.get("operationId") or op_data.get("operation_id", "")
+                if operation_id.startswith("create") and operation.get("requestBody"):
+                    body_schema = LoadTestBuilder._request_body_schema(operation, context.spec)
+                    if body_schema:
+                        factory = f"create{body_schema}"
+                    break
+
+            seeded[repo_var] = SeededRepository(
+                repo_var=repo_var,
+                interface_name=f"{entity}Repository",
+                factory=factory,
+            )
+
+        return sorted(seeded.values(), key=lambda repo: repo.repo_var)
+
+    @staticmethod
+    def build_load_runner(header: str) -> str:
+        """Build load-runner.ts (service-agnostic closed-loop driver + HDR report)"""
+        return f"""{header}/**
+ * Closed-loop load driver.
+ *
+ * `connections` workers share one keep-alive undici Pool and each issues its
+ * next request as soon as the previous one completes. Latency is recorded per
+ * scenario in microseconds into HDR histograms. The encoded histograms are part
+ * of the JSON report, so runs from different commits can be merged or diffed
+ * without losing the tail.
+ */
+
+import {{ mkdirSync, writeFileSync }} from "node:fs";
+import {{ join }} from "node:path";
+import {{ Pool }} from "undici";
+import * as hdr from "hdr-histogram-js";
+
+export interface LoadRequest {{
+  method: string;
+  path: string;
+  body?: unknown;
+}}
+
+export interface Scenario {{
+  name: string;
+  weight: number;
+  next(): LoadRequest;
+}}
+
+export interface LoadOptions {{
+  origin: string;
+  scenarios: Scenario[];
+  connections: number;
+  durationMs: number;
+  warmupMs: number;
+  headers?: Record<string, string>;
+}}
+
+export interface LatencySummary {{
+  requests: number;
+  errors: number;
+  non2xx: number;
+  rps: number;
+  latencyUs: {{
+    mean: number;
+    p50: number;
+    p90: number;
+    p99: number;
+    p999: number;
+    max: number;
+  }};
+  /** hdr-histogram-js compressed base64 encoding */
+  histogram: string;
+}}
+
+export interface LoadReport {{
+  startedAt: string;
+  durationMs: number;
+  connections: number;
+  total: LatencySummary;
+  scenarios: Record<string, LatencySummary>;
+}}
+
+interface Recorder {{
+  histogram: hdr.Histogram;
+  errors: number;
+  non2xx: number;
+}}
+
+function createHistogram(): hdr.Histogram {{
+  return hdr.build({{
+    lowestDiscernibleValue: 1,
+    highestTrackableValue: 60_000_000,
+    numberOfSignificantValueDigits: 3,
+  }});
+}}
+
+function summarize(recorder: Recorder, elapsedMs: number): LatencySummary {{
+  const {{ histogram }} = recorder;
+  return {{
+    requests: histogram.totalCount,
+    errors: recorder.errors,
+    non2xx: recorder.non2xx,
+    rps: Number(((histogram.totalCount / elapsedMs) * 1000).toFixed(1)),
+    latencyUs: {{
+      mean: Number(histogram.mean.toFixed(1)),
+      p50: histogram.getValueAtPercentile(50),
+      p90: histogram.getValueAtPercentile(90),
+      p99: histogram.getValueAtPercentile(99),
+      p999: histogram.getValueAtPercentile(99.9),
+      max: histogram.maxValue,
+    }},
+    histogram: hdr.encodeIntoCompressedBase64(histogram),
+  }};
+}}
+
+/**
+ * Expand weights into a fixed rotation so the request mix is deterministic
+ */
+function buildRotation(scenarios: Scenario[]): Scenario[] {{
+  const rotation = scenarios.flatMap((scenario) => Array.from({{ length: scenario.weight }}, () => scenario));
+  if (rotation.length === 0) {{
+    throw new Error("No scenarios with a positive weight selected");
+  }}
+  return rotation;
+}}
+
+async function drive(
+  pool: Pool,
+  options: LoadOptions,
+  rotation: Scenario[],
+  deadline: number,
+  recorders?: Map<string, Recorder>
+): Promise<void> {{
+  let cursor = 0;
+  const headers = {{ "content-type": "application/json", ...options.headers }};
+
+  const worker = async (offset: number) => {{
+    let index = offset;
+    while (performance.now() < deadline) {{
+      const scenario = rotation[index++ % rotation.length];
+      const request = scenario.next();
+      const start = performance.now();
+      let status = 0;
+      try {{
+        const response = await pool.request({{
+          method: request.method as "GET",
+          path: request.path,
+          headers,
+          body: request.body === undefined ? undefined : JSON.stringify(request.body),
+        }});
+        status = response.statusCode;
+        await response.body.dump();
+      }} catch {{
+        status = -1;
+      }}
+      const recorder = recorders?.get(scenario.name);
+      if (!recorder) {{
+        continue;
+      }}
+      recorder.histogram.recordValue(Math.max(1, Math.round((performance.now() - start) * 1000)));
+      if (status < 0) {{
+        recorder.errors++;
+      }} else if (status >= 300) {{
+        recorder.non2xx++;
+      }}
+    }}
+  }};
+
+  await Promise.all(Array.from({{ length: options.connections }}, () => worker(cursor++)));
+}}
+
+export async function runLoad(options: LoadOptions): Promise<LoadReport> {{
+  const rotation = buildRotation(options.scenarios);
+  const pool = new Pool(options.origin, {{ connections: options.connections, pipelining: 1 }});
+
+  try {{
+    if (options.warmupMs > 0) {{
+      await drive(pool, options, rotation, performance.now() + options.warmupMs);
+    }}
+
+    const recorders = new Map<string, Recorder>(
+      options.scenarios.map((scenario) => [scenario.name, {{ histogram: createHistogram(), errors: 0, non2xx: 0 }}])
+    );
+    const startedAt = new Date().toISOString();
+    const start = performance.now();
+    await drive(pool, options, rotation, start + options.durationMs, recorders);
+    const elapsedMs = performance.now() - start;
+
+    const total: Recorder = {{ histogram: createHistogram(), errors: 0, non2xx: 0 }};
+    const scenarios: Record<string, LatencySummary> = {{}};
+    for (const [name, recorder] of recorders) {{
+      if (recorder.histogram.totalCount === 0) {{
+        continue;
+      }}
+      total.histogram.add(recorder.histogram);
+      total.errors += recorder.errors;
+      total.non2xx += recorder.non2xx;
+      scenarios[name] = summarize(recorder, elapsedMs);
+    }}
+
+    return {{
+      startedAt,
+      durationMs: Math.round(elapsedMs),
+      connections: options.connections,
+      total: summarize(total, elapsedMs),
+      scenarios,
+    }};
+  }} finally {{
+    await pool.close();
+  }}
+}}
+
+export function writeReport(directory: string, fileName: string, report: unknown): string {{
+  mkdirSync(directory, {{ recursive: true }});
+  const filePath = join(directory, fileName);
+  writeFileSync(filePath, `${{JSON.stringify(report, null, 2)}}\\n`);
+  return filePath;
+}}
+"""
+
+    @staticmethod
+    def build_scenarios(
+        domain_name: str,
+        scenarios: List[LoadScenario],
+        seeded: List[SeededRepository],
+        header: str
+    ) -> str:
+        """Build scenarios.ts (request scenarios + repository seeding)"""
+        factories = sorted(
+            {scenario.body_factory for scenario in scenarios if scenario.body_factory}
+            | {repo.factory for repo in seeded}
+        )
+        factory_import = (
+            f'import {{ {", ".join(factories)} }} from "@quub/factories";\n' if factories else ""
+        )
+
+        seed_entries = []
+        for repo in seeded:
+            seed_entries.append(
+                f"  {repo.repo_var}: (orgId, repo) => repo.create(orgId, {repo.factory}() as never),"
+            )
+
+        scenario_entries = []
+        for scenario in scenarios:
+            url = re.sub(r"\{orgId\}", "${orgId}", scenario.path)
+            for param, repo_var in scenario.path_params.items():
+                url = url.replace(f"{{{param}}}", f"${{encodeURIComponent(ids.pick({json.dumps(repo_var)}))}}")
+            body = f"\n      body: {scenario.body_factory}()," if scenario.body_factory else ""
+            scenario_entries.append(f"""  {{
+    name: {json.dumps(scenario.name)},
+    weight: {scenario.weight},
+    next: () => ({{
+      method: {json.dumps(scenario.method)},
+      path: `{url}`,{body}
+    }}),
+  }},""")
+
+        uses_org_id = any("{orgId}" in scenario.path for scenario in scenarios)
+        uses_ids = any(scenario.path_params for scenario in scenarios)
+        org_param = "orgId" if uses_org_id else "_orgId"
+        ids_param = "ids" if uses_ids else "_ids"
+
+        return f"""{header}/**
+ * Load test scenarios for {domain_name}
+ *
+ * One scenario per OpenAPI operation. Path ids are drawn round-robin from the
+ * records seeded into the repositories, request bodies come from the request
+ * factories. Weights: list/get 4, create/update 1, delete 0 (run only when
+ * selected with LOADTEST_SCENARIOS, since it drains the seeded records).
+ */
+
+import type {{ Dependencies }} from "../src/index.js";
+import type {{ Scenario }} from "./load-runner.js";
+{factory_import}
+type RepoName = keyof Dependencies;
+
+/**
+ * Seeded ids per repository
+ */
+export class SeededIds {{
+  private readonly ids = new Map<string, string[]>();
+  private readonly cursors = new Map<string, number>();
+
+  add(repo: string, id: string): void {{
+    const ids = this.ids.get(repo) ?? [];
+    ids.push(id);
+    this.ids.set(repo, ids);
+  }}
+
+  pick(repo: string): string {{
+    const ids = this.ids.get(repo);
+    if (!ids || ids.length === 0) {{
+      return "00000000-0000-0000-0000-000000000000";
+    }}
+    const cursor = this.cursors.get(repo) ?? 0;
+    this.cursors.set(repo, cursor + 1);
+    return ids[cursor % ids.length];
+  }}
+
+  count(): number {{
+    let total = 0;
+    for (const ids of this.ids.values()) {{
+      total += ids.length;
+    }}
+    return total;
+  }}
+}}
+
+type Seeder = (orgId: string, repo: any) => Promise<unknown>;
+
+const SEEDERS: Partial<Record<RepoName, Seeder>> = {{
+{chr(10).join(seed_entries)}
+}};
+
+/**
+ * Insert `perRepository` records into every repository that supports create()
+ */
+export async function seedRepositories(deps: Dependencies, orgId: string, perRepository: number): Promise<SeededIds> {{
+  const ids = new SeededIds();
+  for (const [name, seed] of Object.entries(SEEDERS) as Array<[RepoName, Seeder]>) {{
+    const repo = deps[name] as {{ create?: unknown }};
+    if (typeof repo?.create !== "function") {{
+      continue;
+    }}
+    for (let i = 0; i < perRepository; i++) {{
+      try {{
+        const record = (await seed(orgId, repo)) as {{ id?: string }} | undefined;
+        if (record?.id) {{
+          ids.add(name, record.id);
+        }}
+      }} catch {{
+        // Factory data rejected by the repository - scenarios fall back to a placeholder id
+        break;
+      }}
+    }}
+  }}
+  return ids;
+}}
+
+export function buildScenarios({ids_param}: SeededIds, {org_param}: string): Scenario[] {{
+  return [
+{chr(10).join("  " + line if line else line for entry in scenario_entries for line in entry.splitlines())}
+  ];
+}}
+"""
+
+    @staticmethod
+    def build_entry(
+        domain_name: str,
+        seeded: List[SeededRepository],
+        header: str
+    ) -> str:
+        """Build {domain}.loadtest.ts (boots the service in-process and writes the HDR report)"""
+        mock_imports = ", ".join(f"Mock{repo.interface_name}" for repo in seeded)
+        mock_repos = chr(10).join(
+            f"    {repo.repo_var}: new Mock{repo.interface_name}()," for repo in seeded
+        )
+        dao_repos = chr(10).join(
+            f"      {repo.repo_var}: new adapters.Dao{repo.interface_name}(client)," for repo in seeded
+        )
+
+        return f"""{header}/**
+ * {pascal_case(domain_name)} service load test
+ *
+ * Boots the Fastify service in-process (startService on an ephemeral port),
+ * seeds the repositories, drives every selected scenario through undici and
+ * writes an HDR histogram report to loadtest/reports/.
+ *
+ *   npx tsx loadtest/{domain_name}.loadtest.ts
+ *
+ * Environment:
+ *   LOADTEST_REPOS        mock (default) | prisma - prisma uses the DAO repositories
+ *                         over DATABASE_URL (e.g. a local SQLite file)
+ *   LOADTEST_CONNECTIONS  concurrent connections (default 10)
+ *   LOADTEST_DURATION_MS  measured duration (default 10000)
+ *   LOADTEST_WARMUP_MS    unmeasured warmup (default 2000)
+ *   LOADTEST_SEED         records seeded per repository (default 100)
+ *   LOADTEST_SCENARIOS    comma-separated operationIds to run (default: all with weight > 0)
+ *   GIT_SHA               recorded in the report and used in its file name
+ */
+
+import {{ fileURLToPath }} from "node:url";
+import {{ startService, createDependencies }} from "../src/index.js";
+import type {{ Dependencies }} from "../src/index.js";
+import {{ seedFaker }} from "@quub/factories";
+import {{ runLoad, writeReport }} from "./load-runner.js";
+import {{ buildScenarios, seedRepositories }} from "./scenarios.js";
+
+const ORG_ID = "ID_01HQZX3K8PQRS7VN6M9TW1ABJZ";
+const FAKER_SEED = 12345;
+
+function readInt(name: string, fallback: number): number {{
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && value >= 0 ? value : fallback;
+}}
+
+async function createRepositories(mode: string): Promise<{{ deps: Dependencies; close: () => Promise<void> }}> {{
+  if (mode === "prisma") {{
+    const {{ PrismaClient }} = await import("@quub/adapters/{domain_name}/prisma/generated/index.js");
+    const adapters: any = await import("@quub/adapters");
+    const client = new PrismaClient();
+    await client.$connect();
+    const deps = createDependencies({{
+{dao_repos}
+    }});
+    return {{ deps, close: () => client.$disconnect() }};
+  }}
+
+  const {{ {mock_imports} }} = await import("@quub/factories/{domain_name}/mocks/index.js");
+  const deps = createDependencies({{
+{mock_repos}
+  }});
+  return {{ deps, close: async () => {{}} }};
+}}
+
+async function main(): Promise<void> {{
+  const mode = process.env.LOADTEST_REPOS ?? "mock";
+  const connections = readInt("LOADTEST_CONNECTIONS", 10);
+  const durationMs = readInt("LOADTEST_DURATION_MS", 10_000);
+  const warmupMs = readInt("LOADTEST_WARMUP_MS", 2_000);
+  const seedCount = readInt("LOADTEST_SEED", 100);
+  const selected = process.env.LOADTEST_SCENARIOS?.split(",").map((name) => name.trim()).filter(Boolean);
+
+  seedFaker(FAKER_SEED);
+  const {{ deps, close }} = await createRepositories(mode);
+  const ids = await seedRepositories(deps, ORG_ID, seedCount);
+
+  const scenarios = buildScenarios(ids, ORG_ID)
+    .filter((scenario) => (selected ? selected.includes(scenario.name) : scenario.weight > 0))
+    .map((scenario) => (selected && scenario.weight === 0 ? {{ ...scenario, weight: 1 }} : scenario));
+
+  const server = await startService(deps, {{ host: "127.0.0.1", port: 0, logger: false }});
+  const address = server.server.address();
+  const port = typeof address === "object" && address ? address.port : 0;
+
+  try {{
+    const report = await runLoad({{
+      origin: `http://127.0.0.1:${{port}}`,
+      scenarios,
+      connections,
+      durationMs,
+      warmupMs,
+      headers: {{ "x-org-id": ORG_ID }},
+    }});
+
+    const commit = process.env.GIT_SHA ?? "local";
+    const filePath = writeReport(
+      fileURLToPath(new URL("./reports/", import.meta.url)),
+      `{domain_name}-${{commit}}-${{report.startedAt.replace(/[:.]/g, "-")}}.json`,
+      {{
+        service: "{domain_name}",
+        commit,
+        repositories: mode,
+        seededRecords: ids.count(),
+        node: process.version,
+        ...report,
+      }}
+    );
+
+    console.log(
+      `{domain_name}: ${{report.total.rps}} req/s, p50 ${{report.total.latencyUs.p50}}us, ` +
+        `p99 ${{report.total.latencyUs.p99}}us, non-2xx ${{report.total.non2xx}}, errors ${{report.total.errors}}`
+    );
+    console.log(`Report written to ${{filePath}}`);
+  }} finally {{
+    await server.close();
+    await close();
+  }}
+}}
+
+main().catch((error) => {{
+  console.error("Load test failed:", error);
+  process.exit(1);
+}});
+"""
@@ -0,0 +1,90 @@
+"""
+Load Test Generator - Generates an in-process load test harness per Fastify service
+"""
+
+from pathlib import Path
+from typing import List
+
+from cuur_codegen.base.generator_bases import FileGenerator
+from cuur_codegen.core.context import GenerationContext
+from cuur_codegen.utils.openapi import extract_operations
+from cuur_codegen.utils.file import ensure_directory, write_file
+from cuur_codegen.generators.services.routes.operation_grouper import OperationGrouper
+
+from .builders import LoadTestBuilder
+
+
+class LoadTestGenerator(FileGenerator):
+    """Generates services/{domain}/loadtest/ (undici driver, scenarios, entry point)"""
+
+    @property
+    def name(self) -> str:
+        return "Load Test Generator"
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    @property
+    def type(self) -> str:
+        return "loadtest"
+
+    def get_layer(self) -> str:
+        # Output lives next to the service it boots (services/{domain}/loadtest)
+        return "services"
+
+    def should_clean(self) -> bool:
+        """Keep loadtest/reports/ from earlier runs"""
+        return False
+
+    def should_generate_index(self) -> bool:
+        """Load tests are run as a script, no barrel export"""
+        return False
+
+    def generate_files(
+        self, context: GenerationContext, output_dir: Path
+    ) -> List[Path]:
+        """
+        Generate load test files.
+
+        Args:
+            context: Generation context
+            output_dir: Output directory (services/{domain}/loadtest)
+
+        Returns:
+            List of generated file paths
+        """
+        files: List[Path] = []
+        domain_name = context.domain_name
+        ensure_directory(output_dir)
+
+        operations = extract_operations(context.spec)
+        resource_routes = OperationGrouper.group_operations_by_resource(operations)
+        if not resource_routes:
+            context.logger.warn(f"No operations found for {domain_name} - skipping load test generation")
+            return files
+
+        scenarios = LoadTestBuilder.collect_scenarios(context, resource_routes)
+        seeded = LoadTestBuilder.collect_seeded_repositories(context, resource_routes)
+
+        runner_file = output_dir / "load-runner.ts"
+        runner_header = self.generate_header(context, "Closed-loop load driver with HDR histogram reports")
+        write_file(runner_file, LoadTestBuilder.build_load_runner(runner_header))
+        files.append(runner_file)
+
+        scenarios_file = output_dir / "scenarios.ts"
+        scenarios_header = self.generate_header(context, f"Load test scenarios for {domain_name}")
+        write_file(scenarios_file, LoadTestBuilder.build_scenarios(domain_name, scenarios, seeded, scenarios_header))
+        files.append(scenarios_file)
+
+        entry_file = output_dir / f"{domain_name}.loadtest.ts"
+        entry_header = self.generate_header(context, f"{domain_name} service load test")
+        write_file(entry_file, LoadTestBuilder.build_entry(domain_name, seeded, entry_header))
+        files.append(entry_file)
+
+        ensure_directory(output_dir / "reports")
+
+        context.logger.debug(
+            f"Generated load test for {domain_name}: {len(scenarios)} scenarios, {len(seeded)} seeded repositories"
+        )
+        return files
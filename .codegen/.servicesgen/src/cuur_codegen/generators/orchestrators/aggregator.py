@@ -15,14 +15,14 @@ Configuration:
 """
 
 from pathlib import Path
-from typing import List, Optional
-from cuur_codegen.utils.string import camel_case, pascal_case, kebab_case
+from typing import Dict, List, Optional
+from cuur_codegen.utils.string import camel_case, pascal_case
 
 from cuur_codegen.base.generator_bases import FileGenerator
 from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.utils.file import ensure_directory, write_file
 
-from .builders import AggregatorBuilder
+from .builders import AggregatorBuilder, ServiceClientBuilder
 from .config_reader import AggregatorConfig, OrchestratorDomainConfig
 
 
@@ -127,6 +127,16 @@ class AggregatorGenerator(FileGenerator):
         )
         ensure_directory(orchestrator_domain_aggregators_dir)
 
+        # Shared resilience helpers (timeouts, retries, partial results)
+        if orchestrator_domain_config.aggregators:
+            resilience_file = orchestrator_domain_aggregators_dir / "resilience.ts"
+            resilience_header = self.generate_header(
+                context,
+                "Aggregator resilience helpers - timeouts, retries and partial results",
+            )
+            write_file(resilience_file, AggregatorBuilder.build_resilience_module(resilience_header))
+            files.append(resilience_file)
+
         # Generate aggregators from orchestrator domain configuration
         from cuur_codegen.utils.string import generate_file_name
         for aggregator_config in orchestrator_domain_config.aggregators:
@@ -167,69 +177,34 @@ class AggregatorGenerator(FileGenerator):
     ) -> str:
         """Build aggregator TypeScript code from orchestrator domain configuration"""
         aggregator_name = pascal_case(aggregator_config.name.replace(" ", "").replace("-", ""))
+        client_parameters = self._client_parameters(context, aggregator_config)
+        return AggregatorBuilder.build_config_aggregator(
+            aggregator_name, aggregator_config, header, client_parameters
+        )
 
-        # Import service clients for core domains used by this aggregator
-        service_imports = []
-        service_properties = []
-        constructor_params = []
-
-        # Get unique core domains used by this aggregator
-        core_domains_used = set()
-        for call in aggregator_config.core_domain_calls:
-            core_domains_used.add(call.domain)
-
-        from cuur_codegen.utils.string import generate_file_name
-        for core_domain_name in sorted(core_domains_used):
-            core_domain_pascal = pascal_case(core_domain_name.replace("-", "_"))
-            core_domain_camel = camel_case(core_domain_name.replace("-", "_"))
-            # Import from domain-specific folder (use kebab-case for file name)
-            client_file_name = generate_file_name(core_domain_name, "client").replace(".ts", "")
-            service_imports.append(
-                f'import {{ {core_domain_pascal}Client }} from "../services/clients/{client_file_name}.js";'
-            )
-            service_properties.append(f"  private {core_domain_camel}Client: {core_domain_pascal}Client;")
-            constructor_params.append(f"{core_domain_camel}Client: {core_domain_pascal}Client")
-
-        # Build method body from aggregator calls
-        method_body_lines = []
-        for i, call in enumerate(aggregator_config.core_domain_calls):
-            core_domain_camel = camel_case(call.domain.replace("-", "_"))
-            operation_camel = camel_case(call.operation)
-
-            if i == 0:
-                # First call - assign result
-                method_body_lines.append(f"    const result = await this.{core_domain_camel}Client.{operation_camel}(params);")
-            else:
-                # Subsequent calls - await but don't assign (for now)
-                method_body_lines.append(f"    await this.{core_domain_camel}Client.{operation_camel}(params);")
-
-        method_body_lines.append("    return result;")
-
-        # Build class
-        class_content = f"""{header}
-
-/**
- * {aggregator_config.description}
- *
- * Combines data from multiple core domain services into optimized responses.
- */
-
-{chr(10).join(service_imports)}
-
-export class {aggregator_name}Aggregator {{
-{chr(10).join(service_properties)}
-
-  constructor({", ".join(constructor_params)}) {{
-{chr(10).join([f"    this.{camel_case(cd.replace('-', '_'))}Client = {camel_case(cd.replace('-', '_'))}Client;" for cd in sorted(core_domains_used)])}
-  }}
-
-  /**
-   * {aggregator_config.description}
-   */
-  async execute(params?: any): Promise<any> {{
-{chr(10).join(method_body_lines)}
-  }}
-}}
-"""
+    def _client_parameters(
+        self,
+        context: GenerationContext,
+        aggregator_config: AggregatorConfig,
+    ) -> Dict[str, List[str]]:
+        """
+        Positional parameters of each called service client method, keyed "{domain}.{method}",
+        read from the bundled core domain specs the service clients are generated from.
 
-        return class_content.strip()
+        Aggregators need them to place the abort signal in the trailing CallOptions argument.
+        """
+        from cuur_codegen.utils.openapi import extract_operations, load_openapi_spec
+
+        client_parameters: Dict[str, List[str]] = {}
+        for core_domain_name in sorted({call.domain for call in aggregator_config.core_domain_calls}):
+            spec_path = context.config.paths.bundled_dir / f"{core_domain_name}.json"
+            if not spec_path.exists():
+                context.logger.warn(
+                    f"Bundled spec not found for core domain '{core_domain_name}' - "
+                    f"aggregator '{aggregator_config.name}' cannot pass abort signals to its calls"
+                )
+                continue
+            for operation in extract_operations(load_openapi_spec(spec_path)):
+                method = camel_case(operation.get("operation_id", ""))
+                client_parameters[f"{core_domain_name}.{method}"] = ServiceClientBuilder.positional_parameters(operation)
+        return client_parameters
@@ -16,6 +16,7 @@ from .logger_builder import LoggerBuilder
 from .handler_builder import HandlerBuilder
 from .routes_builder import RoutesBuilder
 from .deps_builder import DepsBuilder
+from .circuit_breaker_builder import CircuitBreakerBuilder
 from .validation_builder import ValidationBuilder
 from .models_builder import ModelsBuilder
 from .config_builder import ConfigBuilder
@@ -36,6 +37,7 @@ __all__ = [
     "HandlerBuilder",
     "RoutesBuilder",
     "DepsBuilder",
+    "CircuitBreakerBuilder",
     "ValidationBuilder",
     "ModelsBuilder",
     "ConfigBuilder",
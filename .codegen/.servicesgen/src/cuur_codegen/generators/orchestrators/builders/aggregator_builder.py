@@ -2,10 +2,14 @@
 Aggregator Builder - Builds aggregator classes that combine multiple service calls
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.utils.string import pascal_case, camel_case
 
+# Defaults for sources without explicit resilience settings
+DEFAULT_TIMEOUT_MS = 5000
+DEFAULT_RETRIES = 0
+
 
 class AggregatorBuilder:
     """Builder for aggregator classes"""
@@ -116,6 +120,7 @@ class AggregatorBuilder:
  */
 
 {chr(10).join(service_imports)}
+import {{ aggregateSources, withSignal, type AggregateResult }} from "./resilience.js";
 
 export class {aggregator_name} {{
 {chr(10).join(service_properties)}
@@ -138,40 +143,341 @@ export class {aggregator_name} {{
         params = method_def.get("params", [])
         service_calls = method_def.get("service_calls", [])
 
-        # Build Promise.all call
-        call_vars = []
-        call_promises = []
-
+        # Build resilient fan-out (timeouts, retries, partial results)
+        sources = []
         for i, call in enumerate(service_calls):
             service_name = call["service"]
             method = call["method"]
             call_params = call.get("params", [])
 
             service_camel = camel_case(service_name.replace("-", "_"))
-            var_name = f"result{i + 1}"
-            call_vars.append(var_name)
-
-            # Build method call
             params_str = ", ".join(call_params)
-            call_promises.append(f"      this.{service_camel}Client.{method}({params_str}),")
-
-        # Build return statement
-        return_obj = "{\n"
-        for i, call in enumerate(service_calls):
-            service_name = call["service"]
-            prop_name = camel_case(service_name.replace("-", "_"))
-            return_obj += f"      {prop_name}: result{i + 1},\n"
-        return_obj += "    }"
+            sources.append(AggregatorBuilder._build_source_entry(
+                service_camel,
+                f"this.{service_camel}Client.{method}({params_str})",
+                call.get("timeoutMs", DEFAULT_TIMEOUT_MS),
+                call.get("retries", DEFAULT_RETRIES),
+                call.get("required", True),
+            ))
 
         method_code = f"""  /**
    * {description}
    */
-  async {method_name}({", ".join(params)}): Promise<any> {{
-    const [{", ".join(call_vars)}] = await Promise.all([
-{chr(10).join(call_promises)}
-    ]);
-
-    return {return_obj}
+  async {method_name}({", ".join(params)}): Promise<AggregateResult<Record<string, unknown>>> {{
+    return aggregateSources({{
+{chr(10).join(sources)}
+    }});
   }}"""
 
         return method_code
+
+    @staticmethod
+    def _build_source_entry(
+        source_name: str,
+        call_expression: str,
+        timeout_ms: int,
+        retries: int,
+        required: bool,
+    ) -> str:
+        """Build a single aggregateSources() entry"""
+        return f"""      {source_name}: {{
+        call: (signal) => withSignal({call_expression}, signal),
+        timeoutMs: {timeout_ms},
+        retries: {retries},
+        required: {"true" if required else "false"},
+      }},"""
+
+    @staticmethod
+    def _call_arguments(positional: Optional[List[str]]) -> str:
+        """
+        Arguments for a service client call: the aggregator params in the first positional slot,
+        remaining positional slots left undefined, then `{ signal }` as the trailing CallOptions.
+
+        Without the client's parameter list the signal cannot be placed, so only params is passed
+        (withSignal still settles the source when the attempt times out).
+        """
+        if positional is None:
+            return "params"
+        arguments = ["params"] + ["undefined"] * (len(positional) - 1) if positional else []
+        return ", ".join(arguments + ["{ signal }"])
+
+    @staticmethod
+    def source_names(calls: List[Any]) -> List[str]:
+        """Result field name per core domain call (operation name, prefixed by domain on collision)"""
+        names: List[str] = []
+        for call in calls:
+            source_name = camel_case(call.operation)
+            if source_name in names:
+                source_name = f"{camel_case(call.domain.replace('-', '_'))}{pascal_case(call.operation)}"
+            names.append(source_name)
+        return names
+
+    @staticmethod
+    def build_config_aggregator(
+        aggregator_name: str,
+        aggregator_config: Any,
+        header: str,
+        client_parameters: Optional[Dict[str, List[str]]] = None,
+    ) -> str:
+        """
+        Build an aggregator class from orchestrator domain configuration.
+
+        Each core domain call becomes a source with its own timeout, retry budget and
+        required/optional flag. Sources run concurrently via the shared resilience
+        module; optional failures are reported in meta.errors instead of failing the
+        aggregate. The per-attempt abort signal is passed to the service client in its
+        trailing CallOptions, so timed-out attempts cancel the HTTP request.
+
+        Args:
+            aggregator_name: PascalCase aggregator name (without "Aggregator" suffix)
+            aggregator_config: AggregatorConfig from the orchestrator domains config
+            header: File header comment
+            client_parameters: Positional parameters per client method ("{domain}.{method}"),
+                from ServiceClientBuilder.positional_parameters
+
+        Returns:
+            Generated TypeScript code
+        """
+        from cuur_codegen.utils.string import generate_file_name
+
+        core_domains_used = sorted({call.domain for call in aggregator_config.core_domain_calls})
+
+        service_imports = []
+        service_properties = []
+        constructor_params = []
+        for core_domain_name in core_domains_used:
+            core_domain_pascal = pascal_case(core_domain_name.replace("-", "_"))
+            core_domain_camel = camel_case(core_domain_name.replace("-", "_"))
+            client_file_name = generate_file_name(core_domain_name, "client").replace(".ts", "")
+            service_imports.append(
+                f'import {{ {core_domain_pascal}Client }} from "../services/clients/{client_file_name}.js";'
+            )
+            service_properties.append(f"  private {core_domain_camel}Client: {core_domain_pascal}Client;")
+            constructor_params.append(f"{core_domain_camel}Client: {core_domain_pascal}Client")
+
+        # Build typed result fields and source entries (one per core domain call)
+        result_fields = []
+        sources = []
+        source_names = AggregatorBuilder.source_names(aggregator_config.core_domain_calls)
+        for call, source_name in zip(aggregator_config.core_domain_calls, source_names):
+            core_domain_pascal = pascal_case(call.domain.replace("-", "_"))
+            core_domain_camel = camel_case(call.domain.replace("-", "_"))
+            operation_camel = camel_case(call.operation)
+
+            optional_marker = "" if call.required else "?"
+            result_fields.append(
+                f'  {source_name}{optional_marker}: Awaited<ReturnType<{core_domain_pascal}Client["{operation_camel}"]>>;'
+            )
+            sources.append(AggregatorBuilder._build_source_entry(
+                source_name,
+                f"this.{core_domain_camel}Client.{operation_camel}"
+                f"({AggregatorBuilder._call_arguments((client_parameters or {}).get(f'{call.domain}.{operation_camel}'))})",
+                call.timeout_ms,
+                call.retries,
+                call.required,
+            ))
+
+        result_type = f"{aggregator_name}Result"
+
+        class_content = f"""{header}
+
+/**
+ * {aggregator_config.description}
+ *
+ * Combines data from multiple core domain services into optimized responses.
+ */
+
+{chr(10).join(service_imports)}
+import {{ aggregateSources, withSignal, type AggregateResult }} from "./resilience.js";
+
+/**
+ * Aggregated result - optional sources are absent when they fail
+ */
+export interface {result_type} {{
+{chr(10).join(result_fields)}
+}}
+
+export class {aggregator_name}Aggregator {{
+{chr(10).join(service_properties)}
+
+  constructor({", ".join(constructor_params)}) {{
+{chr(10).join([f"    this.{camel_case(cd.replace('-', '_'))}Client = {camel_case(cd.replace('-', '_'))}Client;" for cd in core_domains_used])}
+  }}
+
+  /**
+   * {aggregator_config.description}
+   */
+  async execute(params?: any): Promise<AggregateResult<{result_type}>> {{
+    const {{ data, meta }} = await aggregateSources({{
+{chr(10).join(sources)}
+    }});
+    return {{ data: data as {result_type}, meta }};
+  }}
+}}
+"""
+
+        return class_content.strip()
+
+    @staticmethod
+    def build_resilience_module(header: str) -> str:
+        """
+        Build the shared resilience helper module used by all aggregators in a domain.
+
+        Provides per-source timeouts (AbortSignal.timeout), retries with full-jitter
+        exponential backoff, and Promise.allSettled fan-out with typed partial results.
+        """
+        return f"""{header}
+
+/**
+ * Resilience settings for a single aggregator source
+ */
+export interface SourceOptions {{
+  /** Per-attempt timeout in milliseconds */
+  timeoutMs: number;
+  /** Additional attempts after the first failure */
+  retries: number;
+  /** Required sources fail the aggregate; optional sources are reported in meta.errors */
+  required: boolean;
+}}
+
+export interface SourceCall<T> extends SourceOptions {{
+  call: (signal: AbortSignal) => Promise<T>;
+}}
+
+/**
+ * Failure metadata for a source that did not produce a value
+ */
+export interface SourceError {{
+  source: string;
+  message: string;
+  timedOut: boolean;
+  attempts: number;
+  required: boolean;
+}}
+
+/**
+ * Aggregate response envelope with partial-failure metadata
+ */
+export interface AggregateResult<T> {{
+  data: T;
+  meta: {{
+    errors: SourceError[];
+  }};
+}}
+
+/**
+ * Thrown when at least one required source fails
+ */
+export class AggregateSourceError extends Error {{
+  constructor(public readonly errors: SourceError[]) {{
+    super(`Required aggregator source(s) failed: ${{errors.map((e) => e.source).join(", ")}}`);
+    this.name = "AggregateSourceError";
+  }}
+}}
+
+const BASE_BACKOFF_MS = 50;
+const MAX_BACKOFF_MS = 1000;
+
+/**
+ * Full-jitter exponential backoff: random delay in [0, min(max, base * 2^attempt))
+ */
+export function backoffDelay(attempt: number): number {{
+  return Math.random() * Math.min(MAX_BACKOFF_MS, BASE_BACKOFF_MS * 2 ** attempt);
+}}
+
+const sleep = (ms: number) => new Promise<void>((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Settle a promise early when the signal aborts, even if the underlying call ignores it.
+ * Service client calls also receive the signal, so the aborted request itself is cancelled.
+ */
+export function withSignal<T>(promise: Promise<T>, signal: AbortSignal): Promise<T> {{
+  if (signal.aborted) {{
+    return Promise.reject(signal.reason);
+  }}
+  return new Promise<T>((resolve, reject) => {{
+    const onAbort = () => reject(signal.reason);
+    signal.addEventListener("abort", onAbort, {{ once: true }});
+    promise.then(
+      (value) => {{
+        signal.removeEventListener("abort", onAbort);
+        resolve(value);
+      }},
+      (error) => {{
+        signal.removeEventListener("abort", onAbort);
+        reject(error);
+      }}
+    );
+  }});
+}}
+
+class SourceFailure extends Error {{
+  constructor(
+    public readonly lastError: unknown,
+    public readonly attempts: number
+  ) {{
+    super(lastError instanceof Error ? lastError.message : String(lastError));
+  }}
+}}
+
+/**
+ * Run a source call with a per-attempt timeout and jittered retries
+ */
+export async function callWithResilience<T>(source: SourceCall<T>): Promise<T> {{
+  let lastError: unknown;
+  for (let attempt = 0; attempt <= source.retries; attempt++) {{
+    try {{
+      return await source.call(AbortSignal.timeout(source.timeoutMs));
+    }} catch (error) {{
+      lastError = error;
+      if (attempt < source.retries) {{
+        await sleep(backoffDelay(attempt));
+      }}
+    }}
+  }}
+  throw new SourceFailure(lastError, source.retries + 1);
+}}
+
+function isTimeout(error: unknown): boolean {{
+  return error instanceof Error && (error.name === "TimeoutError" || error.name === "AbortError");
+}}
+
+/**
+ * Fan out to all sources concurrently and collect typed partial results.
+ *
+ * Optional source failures are returned in meta.errors; any required source
+ * failure rejects with AggregateSourceError.
+ */
+export async function aggregateSources<T extends Record<string, unknown>>(sources: {{
+  [K in keyof T]: SourceCall<T[K]>;
+}}): Promise<AggregateResult<Partial<T>>> {{
+  const names = Object.keys(sources) as Array<keyof T & string>;
+  const settled = await Promise.allSettled(names.map((name) => callWithResilience(sources[name])));
+
+  const data: Partial<T> = {{}};
+  const errors: SourceError[] = [];
+  settled.forEach((outcome, index) => {{
+    const name = names[index];
+    if (outcome.status === "fulfilled") {{
+      data[name] = outcome.value;
+      return;
+    }}
+    const failure = outcome.reason as SourceFailure;
+    const cause = failure instanceof SourceFailure ? failure.lastError : outcome.reason;
+    errors.push({{
+      source: name,
+      message: cause instanceof Error ? cause.message : String(cause),
+      timedOut: isTimeout(cause),
+      attempts: failure instanceof SourceFailure ? failure.attempts : 1,
+      required: sources[name].required,
+    }});
+  }});
+
+  const requiredFailures = errors.filter((error) => error.required);
+  if (requiredFailures.length > 0) {{
+    throw new AggregateSourceError(requiredFailures);
+  }}
+
+  return {{ data, meta: {{ errors }} }};
+}}
+"""
@@ -0,0 +1,329 @@
+"""
+Circuit Breaker Builder - Generates circuit-breaker.ts (per core domain breaker + bulkhead)
+"""
+
+import json
+from pathlib import Path
+from typing import Optional, List
+from cuur_codegen.utils.file import write_file
+from ..config_reader import CircuitBreakerConfig, CoreDomainRegistry, load_orchestrator_domains_config
+
+
+class CircuitBreakerBuilder:
+    """Builds circuit-breaker.ts file"""
+
+    @staticmethod
+    def build_circuit_breaker(
+        domain_name: str,
+        core_domains: List[str],
+        registry: Optional[CoreDomainRegistry] = None,
+    ) -> str:
+        """Build circuit-breaker.ts content"""
+        default_settings = registry.circuit_breaker if registry else CircuitBreakerConfig()
+
+        settings_entries = []
+        for core_domain_name in sorted(set(core_domains)):
+            settings = registry.get_circuit_breaker(core_domain_name) if registry else default_settings
+            settings_entries.append(f"""  {json.dumps(core_domain_name)}: {{
+    failureThreshold: {settings.failure_threshold},
+    halfOpenAfterMs: {settings.half_open_after_ms},
+    maxConcurrency: {settings.max_concurrency},
+    maxQueue: {settings.max_queue},
+  }},""")
+
+        return f'''/**
+ * Circuit breakers and bulkheads for {domain_name} orchestrator
+ *
+ * Every core domain gets one breaker (consecutive-failure threshold with a
+ * single half-open probe) and one semaphore (max concurrent calls plus a
+ * bounded wait queue), so a degraded domain fails fast instead of tying up
+ * the event loop and DB pool.
+ *
+ * Only outages (transport errors, timeouts, 5xx) count as failures; 4xx errors pass through.
+ *
+ * Time is read through Date.now(), so vi.useFakeTimers() drives transitions.
+ */
+
+import {{ FlowError }} from "./errors/flow-error.js";
+
+export type BreakerState = "closed" | "open" | "half-open";
+
+export interface BreakerSettings {{
+  /** Consecutive failures before the circuit opens */
+  failureThreshold: number;
+  /** Time the circuit stays open before a probe call is allowed */
+  halfOpenAfterMs: number;
+  /** Max calls in flight */
+  maxConcurrency: number;
+  /** Max calls waiting for a slot; further calls are rejected */
+  maxQueue: number;
+}}
+
+export interface BreakerStatus {{
+  domain: string;
+  state: BreakerState;
+  failures: number;
+  inFlight: number;
+  queued: number;
+  openedAt: string | null;
+}}
+
+const DEFAULT_BREAKER_SETTINGS: BreakerSettings = {{
+  failureThreshold: {default_settings.failure_threshold},
+  halfOpenAfterMs: {default_settings.half_open_after_ms},
+  maxConcurrency: {default_settings.max_concurrency},
+  maxQueue: {default_settings.max_queue},
+}};
+
+const BREAKER_SETTINGS: Record<string, BreakerSettings> = {{
+{chr(10).join(settings_entries)}
+}};
+
+/** Node/undici network error codes that mean the domain could not be reached */
+const TRANSPORT_ERROR_CODES = new Set(["ECONNREFUSED", "ECONNRESET", "ETIMEDOUT", "EPIPE", "ENOTFOUND", "EAI_AGAIN", "EHOSTUNREACH"]);
+
+/** Prisma error codes for an unreachable or exhausted database */
+const DATABASE_UNAVAILABLE_CODES = new Set(["P1001", "P1002", "P1008", "P1017", "P2024"]);
+
+/**
+ * Whether an error counts against the breaker: transport errors, timeouts and 5xx responses.
+ *
+ * Client errors (4xx: not found, validation, conflict) mean the domain answered; they are
+ * rethrown without being recorded, so one caller's bad requests cannot open the circuit.
+ */
+export function isBreakerFailure(error: unknown): boolean {{
+  if (!error || typeof error !== "object") {{
+    return false;
+  }}
+  const {{ name, code, status, statusCode, cause }} = error as {{
+    name?: unknown;
+    code?: unknown;
+    status?: unknown;
+    statusCode?: unknown;
+    cause?: unknown;
+  }};
+  const httpStatus = typeof status === "number" ? status : statusCode;
+  if (typeof httpStatus === "number") {{
+    return httpStatus >= 500;
+  }}
+  if (name === "AbortError" || name === "TimeoutError" || name === "PrismaClientInitializationError") {{
+    return true;
+  }}
+  if (typeof code === "string" && (code.startsWith("UND_ERR") || TRANSPORT_ERROR_CODES.has(code) || DATABASE_UNAVAILABLE_CODES.has(code))) {{
+    return true;
+  }}
+  // fetch wraps network failures in a TypeError whose cause carries the code
+  return cause !== undefined && cause !== error && isBreakerFailure(cause);
+}}
+
+/**
+ * Counting semaphore with a bounded FIFO wait queue
+ */
+export class Semaphore {{
+  private active = 0;
+  private readonly waiters: Array<() => void> = [];
+
+  constructor(
+    private readonly maxConcurrency: number,
+    private readonly maxQueue: number
+  ) {{}}
+
+  get inFlight(): number {{
+    return this.active;
+  }}
+
+  get queued(): number {{
+    return this.waiters.length;
+  }}
+
+  /** Resolves once a slot is held; returns false when the queue is full */
+  async acquire(): Promise<boolean> {{
+    if (this.active < this.maxConcurrency) {{
+      this.active++;
+      return true;
+    }}
+    if (this.waiters.length >= this.maxQueue) {{
+      return false;
+    }}
+    await new Promise<void>((resolve) => this.waiters.push(resolve));
+    return true;
+  }}
+
+  release(): void {{
+    const next = this.waiters.shift();
+    if (next) {{
+      // Hand the slot straight to the next waiter
+      next();
+    }} else {{
+      this.active--;
+    }}
+  }}
+}}
+
+export class CircuitBreaker {{
+  private state: BreakerState = "closed";
+  private failures = 0;
+  private openedAt = 0;
+  private probing = false;
+  private readonly bulkhead: Semaphore;
+
+  constructor(
+    public readonly domain: string,
+    private readonly settings: BreakerSettings = DEFAULT_BREAKER_SETTINGS
+  ) {{
+    this.bulkhead = new Semaphore(settings.maxConcurrency, settings.maxQueue);
+  }}
+
+  async execute<T>(call: () => Promise<T>): Promise<T> {{
+    const probe = this.admit();
+
+    if (!(await this.bulkhead.acquire())) {{
+      if (probe) {{
+        this.probing = false;
+      }}
+      throw new FlowError(
+        "BULKHEAD_FULL",
+        `Too many concurrent calls to ${{this.domain}}`,
+        503,
+        {{ domain: this.domain }}
+      );
+    }}
+
+    try {{
+      const result = await call();
+      this.onSuccess();
+      return result;
+    }} catch (error) {{
+      if (isBreakerFailure(error)) {{
+        this.onFailure();
+      }}
+      throw error;
+    }} finally {{
+      if (probe) {{
+        this.probing = false;
+      }}
+      this.bulkhead.release();
+    }}
+  }}
+
+  status(): BreakerStatus {{
+    this.refresh();
+    return {{
+      domain: this.domain,
+      state: this.state,
+      failures: this.failures,
+      inFlight: this.bulkhead.inFlight,
+      queued: this.bulkhead.queued,
+      openedAt: this.state === "closed" ? null : new Date(this.openedAt).toISOString(),
+    }};
+  }}
+
+  /** Throws when the circuit rejects the call; returns true when the call is the half-open probe */
+  private admit(): boolean {{
+    this.refresh();
+    if (this.state === "closed") {{
+      return false;
+    }}
+    if (this.state === "half-open" && !this.probing) {{
+      this.probing = true;
+      return true;
+    }}
+    throw new FlowError(
+      "CIRCUIT_OPEN",
+      `${{this.domain}} is unavailable (circuit open)`,
+      503,
+      {{ domain: this.domain }}
+    );
+  }}
+
+  private refresh(): void {{
+    if (this.state === "open" && Date.now() - this.openedAt >= this.settings.halfOpenAfterMs) {{
+      this.state = "half-open";
+    }}
+  }}
+
+  private onSuccess(): void {{
+    this.failures = 0;
+    this.state = "closed";
+  }}
+
+  private onFailure(): void {{
+    this.failures++;
+    if (this.state === "half-open" || this.failures >= this.settings.failureThreshold) {{
+      this.state = "open";
+      this.openedAt = Date.now();
+    }}
+  }}
+}}
+
+const breakers = new Map<string, CircuitBreaker>();
+
+/**
+ * Get (or lazily create) the breaker for a core domain
+ */
+export function getBreaker(domain: string): CircuitBreaker {{
+  let breaker = breakers.get(domain);
+  if (!breaker) {{
+    breaker = new CircuitBreaker(domain, BREAKER_SETTINGS[domain] ?? DEFAULT_BREAKER_SETTINGS);
+    breakers.set(domain, breaker);
+  }}
+  return breaker;
+}}
+
+/**
+ * Breaker state for every core domain, for the health endpoint
+ */
+export function getBreakerStates(): BreakerStatus[] {{
+  return [...breakers.values()].map((breaker) => breaker.status());
+}}
+
+/**
+ * Drop all breakers (tests)
+ */
+export function resetBreakers(): void {{
+  breakers.clear();
+}}
+
+/**
+ * Wrap every method of a DAO repository or service client so calls go
+ * through the breaker and bulkhead. Wrapped methods are created once per
+ * property and cached.
+ */
+export function guard<T extends object>(target: T, breaker: CircuitBreaker): T {{
+  const wrapped = new Map<PropertyKey, unknown>();
+  return new Proxy(target, {{
+    get(obj, prop, receiver) {{
+      const value = Reflect.get(obj, prop, receiver);
+      if (typeof value !== "function") {{
+        return value;
+      }}
+      let method = wrapped.get(prop);
+      if (!method) {{
+        method = (...args: unknown[]) => breaker.execute(() => Promise.resolve(value.apply(obj, args)));
+        wrapped.set(prop, method);
+      }}
+      return method;
+    }},
+  }});
+}}
+'''
+
+    @staticmethod
+    def generate_circuit_breaker(output_dir: Path, domain_name: str, project_root: Path) -> Optional[Path]:
+        """Generate circuit-breaker.ts"""
+        core_domains: List[str] = []
+        registry: Optional[CoreDomainRegistry] = None
+        try:
+            orchestrator_config = load_orchestrator_domains_config(project_root)
+            registry = orchestrator_config.core_domain_registry
+            for domain_config in orchestrator_config.orchestrator_domains:
+                if domain_config.name == domain_name:
+                    core_domains = [cd.name for cd in domain_config.core_domains]
+                    break
+        except FileNotFoundError:
+            # No config - breakers fall back to default settings
+            pass
+
+        breaker_file = output_dir / "circuit-breaker.ts"
+        write_file(breaker_file, CircuitBreakerBuilder.build_circuit_breaker(domain_name, core_domains, registry))
+        return breaker_file
@@ -92,46 +92,15 @@ class DepsBuilder:
         # This matches the pattern used in flow files and works with tsconfig path mappings
         dao_client_rel = "@quub/adapters/shared/dao-client.js"
 
-        # Load orchestrator config to get core domains
-        core_domains = []
-        primary_core_domain = None
-
-        try:
-            orchestrator_config = load_orchestrator_domains_config(project_root)
-            for domain_config in orchestrator_config.orchestrator_domains:
-                if domain_config.name == domain_name:
-                    # Extract core domain names from CoreDomainConfig objects
-                    core_domains = [cd.name for cd in domain_config.core_domains]
-                    primary_core_domain = core_domains[0] if core_domains else None
-                    break
-        except Exception:
-            # Fallback: no core domains found
-            core_domains = []
-            primary_core_domain = None
-
-        # Discover repositories from handlers used in flows
-        # This scans the OpenAPI spec's x-orchestration-flow steps to find all handlers
-        # and maps them to their required repositories
-        dao_repos = DepsBuilder._discover_repositories_from_flows(spec, project_root)
-
-        # Also include repositories from core domains
-        core_domain_repos = DaoDiscovery.discover_dao_repositories(core_domains)
-
-        # Merge and deduplicate by repository variable name
-        repo_map = {}
-        for repo in dao_repos + core_domain_repos:
-            var_name = repo['var']
-            if var_name not in repo_map:
-                repo_map[var_name] = repo
-
-        dao_repos = list(repo_map.values())
-        # Sort by variable name for consistent output
-        dao_repos.sort(key=lambda r: r['var'])
+        core_domains = DepsBuilder._load_core_domains(domain_name, project_root)
+        primary_core_domain = core_domains[0] if core_domains else None
+        dao_repos = DepsBuilder.collect_repositories(domain_name, spec, project_root)
 
         # Use @quub/adapters path alias instead of relative paths
         adapters_index_rel = "@quub/adapters"
         dao_imports = DepsBuilder._generate_dao_imports(dao_repos, adapters_index_rel)
         dao_initializations = DepsBuilder._generate_dao_initializations(dao_repos)
+        tx_repo_props = DepsBuilder._generate_transaction_repo_props(dao_repos)
         dao_interface_props = DepsBuilder._generate_dao_interface_props(dao_repos)
 
         # Generate PrismaClient import and initialization
@@ -155,7 +124,12 @@ import {{ PrismaClient }} from "{prisma_rel}";'''
   }});
 
   // Cast PrismaClient to DaoClient for type compatibility
-  const dao = prisma as unknown as DaoClient;'''
+  const dao = prisma as unknown as DaoClient;
+
+  // Interactive transactions for flow steps grouped with `transaction: <group>`
+  const transactionManager = new PrismaTransactionManager(
+    prisma as unknown as ConstructorParameters<typeof PrismaTransactionManager>[0]
+  );'''
 
         content = f'''/**
  * Common dependency injector
@@ -164,14 +138,23 @@ import {{ PrismaClient }} from "{prisma_rel}";'''
  *
  * Note: Core handlers are called directly from flows (imported from @cuur/core).
  * No service clients needed since orchestrators and services are deployed together.
+ *
+ * Dependencies are a module-scope singleton: init() builds them once per cold
+ * start and every invocation reuses the same PrismaClient pool and repositories.
+ * Per-request state (JWT context) is passed to flows separately.
  */
 
 import type {{ DaoClient }} from "{dao_client_rel}";
+import {{ PrismaTransactionManager, type PrismaTransactionClient }} from "@cuur-cde/database";
+import {{ getBreaker, guard }} from "./circuit-breaker.js";
 {prisma_import}
 {dao_imports}
 
 export interface Dependencies {{
   dao: DaoClient;
+  transactionManager: PrismaTransactionManager;
+  /** Same repositories bound to an interactive transaction client (inside transactionManager.run) */
+  withTransaction(tx: PrismaTransactionClient): Dependencies;
 {chr(10).join(dao_interface_props)}
 }}
 
@@ -180,7 +163,8 @@ export interface Dependencies {{
  *
  * Initializes:
  * - PrismaClient and casts to DaoClient
- * - DAO repository instances
+ * - DAO repository instances, each guarded by its core domain's circuit breaker and bulkhead
+ * - PrismaTransactionManager for flow steps that share a transaction group
  *
  * Note: Core handlers are imported directly in flows from @cuur/core.
  */
@@ -190,15 +174,92 @@ export function createDependencies(): Dependencies {{
   // Initialize DAO repositories
 {chr(10).join(dao_initializations)}
 
+  // Transaction-bound repositories join the caller's transaction (their batch methods run on tx
+  // instead of nesting one). They are not guarded: the enclosing run() is the unit that commits or fails.
+  const withTransaction = (tx: PrismaTransactionClient): Dependencies => {{
+    const txDao = tx as unknown as DaoClient;
+    return {{
+      dao: txDao,
+      transactionManager,
+      withTransaction,
+{chr(10).join(tx_repo_props)}
+    }};
+  }};
+
   return {{
     dao,
+    transactionManager,
+    withTransaction,
 {chr(10).join([f"    {repo['var']}: {repo['var']}" + ("," if i < len(dao_repos) - 1 else "") for i, repo in enumerate(dao_repos)]) if dao_repos else "    // No DAO repositories configured"}
   }};
 }}
+
+let container: Dependencies | null = null;
+
+/**
+ * Get the shared dependency container, creating it on first use (once per cold start)
+ */
+export function init(): Dependencies {{
+  if (!container) {{
+    container = createDependencies();
+  }}
+  return container;
+}}
+
+/**
+ * Release the shared container (disconnects Prisma). Call from tests and shutdown hooks.
+ */
+export async function dispose(): Promise<void> {{
+  const current = container;
+  container = null;
+  if (current?.dao) {{
+    await (current.dao as unknown as {{ $disconnect?: () => Promise<void> }}).$disconnect?.();
+  }}
+}}
 '''
         write_file(deps_file, content)
         return deps_file
 
+    @staticmethod
+    def _load_core_domains(domain_name: str, project_root: Path) -> List[str]:
+        """Core domains mapped to an orchestrator domain (first one is the primary)"""
+        try:
+            orchestrator_config = load_orchestrator_domains_config(project_root)
+        except Exception:
+            return []
+        for domain_config in orchestrator_config.orchestrator_domains:
+            if domain_config.name == domain_name:
+                return [cd.name for cd in domain_config.core_domains]
+        return []
+
+    @staticmethod
+    def collect_repositories(domain_name: str, spec: Dict[str, Any], project_root: Path) -> List[Dict[str, str]]:
+        """
+        DAO repositories exposed on Dependencies, sorted by variable name.
+
+        Repositories used by handlers in x-orchestration-flow steps are merged with the
+        default repositories of the orchestrator domain's core domains.
+        """
+        # Discover repositories from handlers used in flows
+        # This scans the OpenAPI spec's x-orchestration-flow steps to find all handlers
+        # and maps them to their required repositories
+        flow_repos = DepsBuilder._discover_repositories_from_flows(spec, project_root)
+
+        # Also include repositories from core domains
+        core_domain_repos = DaoDiscovery.discover_dao_repositories(
+            DepsBuilder._load_core_domains(domain_name, project_root)
+        )
+
+        # Merge and deduplicate by repository variable name
+        repo_map = {}
+        for repo in flow_repos + core_domain_repos:
+            var_name = repo['var']
+            if var_name not in repo_map:
+                repo_map[var_name] = repo
+
+        # Sort by variable name for consistent output
+        return sorted(repo_map.values(), key=lambda r: r['var'])
+
     @staticmethod
     def _generate_dao_imports(dao_repos: List[Dict[str, str]], adapters_index_rel: str) -> str:
         """Generate imports for DAO repositories"""
@@ -225,9 +286,20 @@ export function createDependencies(): Dependencies {{
         """Generate DAO repository initialization code"""
         init_lines = []
         for repo in dao_repos:
-            init_lines.append(f"  const {repo['var']} = new {repo['name']}(dao);")
+            domain = repo.get("domain")
+            if domain:
+                init_lines.append(
+                    f"  const {repo['var']} = guard(new {repo['name']}(dao), getBreaker(\"{domain}\"));"
+                )
+            else:
+                init_lines.append(f"  const {repo['var']} = new {repo['name']}(dao);")
         return init_lines
 
+    @staticmethod
+    def _generate_transaction_repo_props(dao_repos: List[Dict[str, str]]) -> List[str]:
+        """Generate repository properties constructed over a transaction client"""
+        return [f"      {repo['var']}: new {repo['name']}(txDao, true)," for repo in dao_repos]
+
     @staticmethod
     def _discover_repositories_from_flows(spec: Dict[str, Any], project_root: Path) -> List[Dict[str, str]]:
         """Discover repositories by scanning handlers used in orchestration flows"""
@@ -1,19 +1,448 @@
 """
-GraphQL Builder - Builds GraphQL schema and resolvers
+GraphQL Builder - Builds GraphQL schema and resolvers from an orchestrator spec
+
+Object types are derived from the response schemas of the spec's GET operations
+(following $ref into components), Query fields from those operations and from the
+domain's configured aggregators. Entity types backed by a DAO repository get a
+per-request DataLoader, and `{entity}Id` fields expose the referenced entity through it.
 """
 
-from typing import Dict, Any, List
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Set, Tuple
 from cuur_codegen.core.context import GenerationContext
-from cuur_codegen.utils.string import camel_case, pascal_case, generate_file_name
+from cuur_codegen.utils.string import camel_case, pascal_case, kebab_case, generate_file_name
+
+from .aggregator_builder import AggregatorBuilder
+from .routes_builder import RoutesBuilder
+
+# Longest type path considered when computing the schema depth (guards self-referencing graphs)
+MAX_SCHEMA_DEPTH = 15
+# Default complexity budget; each list field multiplies the cost of its selection
+DEFAULT_MAX_COMPLEXITY = 1000
+LIST_COST_MULTIPLIER = 10
+# DataLoader batch size (bounds the IN (...) list of one findByIds query)
+LOADER_MAX_BATCH_SIZE = 500
+
+SCALAR_TYPES = {"ID", "String", "Int", "Float", "Boolean", "JSON"}
+GRAPHQL_NAME = re.compile(r"^[_A-Za-z][_0-9A-Za-z]*$")
+
+
+@dataclass
+class GraphQLFieldDef:
+    """Field on a generated object type"""
+    name: str
+    type_ref: str  # SDL type reference, e.g. "[Patient!]!"
+    named_type: str
+    is_list: bool = False
+    source_key: Optional[str] = None  # Parent property when it is not a valid GraphQL name
+    loader: Optional[str] = None  # Entity type resolved through its DataLoader
+    loader_key: Optional[str] = None  # Parent property holding the referenced id
+
+
+@dataclass
+class GraphQLTypeDef:
+    """Object type derived from an OpenAPI schema"""
+    name: str
+    fields: List[GraphQLFieldDef] = field(default_factory=list)
+    description: Optional[str] = None
+
+
+@dataclass
+class GraphQLArgDef:
+    """Query argument mapped from a path or query parameter"""
+    name: str
+    type_ref: str
+    location: str  # "path" | "query"
+    param_name: str
+
+
+@dataclass
+class GraphQLAggregatorDef:
+    """Aggregator exposed as a Query field"""
+    field_name: str
+    class_name: str
+    file_name: str
+    core_domains: List[str]
+    sources: List[str]
+
+
+@dataclass
+class GraphQLQueryDef:
+    """Query field resolved by an orchestrator flow or an aggregator"""
+    name: str
+    type_ref: str
+    named_type: str
+    args: List[GraphQLArgDef] = field(default_factory=list)
+    flow: Optional[str] = None
+    aggregator: Optional[GraphQLAggregatorDef] = None
+    description: Optional[str] = None
+
+
+@dataclass
+class GraphQLSchemaDef:
+    """Everything needed to emit schema.ts, limits.ts, context.ts, resolvers.ts and server.ts"""
+    types: Dict[str, GraphQLTypeDef] = field(default_factory=dict)
+    enums: Dict[str, List[str]] = field(default_factory=dict)
+    queries: List[GraphQLQueryDef] = field(default_factory=list)
+    entities: Dict[str, str] = field(default_factory=dict)  # entity type -> deps repository var
+    uses_json: bool = False
+    max_depth: int = 1
 
 
 class GraphQLBuilder:
     """Builder for GraphQL schema and resolvers"""
 
+    @staticmethod
+    def collect_schema(
+        spec: Dict[str, Any],
+        aggregators: List[Any],
+        repositories: List[Dict[str, str]],
+    ) -> GraphQLSchemaDef:
+        """
+        Derive the GraphQL schema definition for an orchestrator domain.
+
+        Args:
+            spec: Orchestrator OpenAPI spec (orchestrators/openapi/src/yaml/{domain}.yaml)
+            aggregators: AggregatorConfig entries of the orchestrator domain
+            repositories: DAO repositories exposed on Dependencies (DepsBuilder.collect_repositories)
+
+        Returns:
+            Schema definition
+        """
+        schema_def = GraphQLSchemaDef()
+        components = spec.get("components", {}).get("schemas", {}) or {}
+        flow_names = {
+            (route["method"], route["path"]): route["flow"]
+            for route in RoutesBuilder._collect_routes(spec)
+        }
+
+        for path, methods in spec.get("paths", {}).items():
+            operation = methods.get("get") if isinstance(methods, dict) else None
+            if not isinstance(operation, dict) or not operation.get("x-orchestration-flow"):
+                continue
+            operation_id = operation.get("operationId")
+            if not operation_id:
+                continue
+
+            response_schema = GraphQLBuilder._success_response_schema(operation)
+            if response_schema is None:
+                continue
+            named, is_list = GraphQLBuilder._map_schema(
+                response_schema, f"{pascal_case(operation_id)}Response", components, schema_def
+            )
+
+            args = []
+            for param in list(methods.get("parameters", [])) + list(operation.get("parameters", [])):
+                param = GraphQLBuilder._resolve_ref(param, spec)
+                if param.get("in") not in ("path", "query"):
+                    continue
+                param_schema = param.get("schema", {}) or {}
+                arg_named, arg_list = GraphQLBuilder._map_schema(param_schema, None, components, schema_def)
+                if arg_named not in SCALAR_TYPES and arg_named not in schema_def.enums:
+                    arg_named = "JSON"
+                    schema_def.uses_json = True
+                arg_type = f"[{arg_named}!]" if arg_list else arg_named
+                if param.get("required") or param.get("in") == "path":
+                    arg_type += "!"
+                args.append(GraphQLArgDef(
+                    name=GraphQLBuilder._field_name(param["name"]),
+                    type_ref=arg_type,
+                    location=param["in"],
+                    param_name=param["name"],
+                ))
+
+            schema_def.queries.append(GraphQLQueryDef(
+                name=camel_case(operation_id),
+                type_ref=f"[{named}!]" if is_list else named,
+                named_type=named,
+                args=args,
+                flow=flow_names.get(("GET", path)),
+                description=operation.get("summary"),
+            ))
+
+        for aggregator_config in aggregators:
+            GraphQLBuilder._add_aggregator(aggregator_config, schema_def)
+
+        # Entities: object types with an id that have a DAO repository on Dependencies
+        repo_vars = {repo["var"] for repo in repositories}
+        for type_name, type_def in schema_def.types.items():
+            repo_var = f"{camel_case(type_name)}Repo"
+            if repo_var in repo_vars and any(f.name == "id" for f in type_def.fields):
+                schema_def.entities[type_name] = repo_var
+
+        # {entity}Id fields also expose the referenced entity through its loader
+        for type_def in list(schema_def.types.values()):
+            existing = {f.name for f in type_def.fields}
+            for field_def in list(type_def.fields):
+                key = field_def.source_key or field_def.name
+                match = re.match(r"^(\w+?)_?[Ii]d$", key)
+                if not match or field_def.is_list:
+                    continue
+                target = pascal_case(match.group(1))
+                relation = camel_case(match.group(1))
+                repo_var = f"{camel_case(target)}Repo"
+                if target not in schema_def.types and target in components and repo_var in repo_vars:
+                    # Entity only reachable through the id reference
+                    GraphQLBuilder._register_object(components[target], target, components, schema_def)
+                    if any(f.name == "id" for f in schema_def.types.get(target, GraphQLTypeDef(target)).fields):
+                        schema_def.entities[target] = repo_var
+                if target not in schema_def.entities or relation in existing:
+                    continue
+                type_def.fields.append(GraphQLFieldDef(
+                    name=relation,
+                    type_ref=target,
+                    named_type=target,
+                    loader=target,
+                    loader_key=key,
+                ))
+                existing.add(relation)
+
+        schema_def.max_depth = GraphQLBuilder._schema_depth(schema_def)
+        return schema_def
+
+    @staticmethod
+    def _resolve_ref(schema: Any, root: Dict[str, Any]) -> Dict[str, Any]:
+        """Follow a local $ref ("#/components/parameters/Limit") from the spec root"""
+        if not isinstance(schema, dict) or "$ref" not in schema:
+            return schema if isinstance(schema, dict) else {}
+        target: Any = root
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            target = target.get(part, {}) if isinstance(target, dict) else {}
+        return target if isinstance(target, dict) else {}
+
+    @staticmethod
+    def _resolve_component(schema: Any, components: Dict[str, Any]) -> Dict[str, Any]:
+        """Follow a $ref to a component schema"""
+        if not isinstance(schema, dict) or "$ref" not in schema:
+            return schema if isinstance(schema, dict) else {}
+        return components.get(schema["$ref"].split("/")[-1], {}) or {}
+
+    @staticmethod
+    def _success_response_schema(operation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Schema of the first 2xx JSON response"""
+        for status, response in (operation.get("responses") or {}).items():
+            if not str(status).startswith("2") or not isinstance(response, dict):
+                continue
+            content = response.get("content", {}) or {}
+            media = content.get("application/json") or next(iter(content.values()), None)
+            if isinstance(media, dict) and media.get("schema"):
+                return media["schema"]
+        return None
+
+    @staticmethod
+    def _field_name(name: str) -> str:
+        """Valid GraphQL field name for an OpenAPI property or parameter name"""
+        if GRAPHQL_NAME.match(name):
+            return name
+        sanitized = camel_case(re.sub(r"[^0-9A-Za-z_]+", "_", name))
+        return sanitized if GRAPHQL_NAME.match(sanitized) else f"_{sanitized}"
+
+    @staticmethod
+    def _type_name(name: str) -> str:
+        """Valid GraphQL type name for a component schema name"""
+        return pascal_case(re.sub(r"[^0-9A-Za-z]+", "_", name)) if not GRAPHQL_NAME.match(name) else name
+
+    @staticmethod
+    def _map_schema(
+        schema: Dict[str, Any],
+        hint: Optional[str],
+        components: Dict[str, Any],
+        schema_def: GraphQLSchemaDef,
+    ) -> Tuple[str, bool]:
+        """
+        Map an OpenAPI schema to a GraphQL named type, registering object and enum types.
+
+        Returns:
+            (named type, is list)
+        """
+        if not isinstance(schema, dict):
+            schema_def.uses_json = True
+            return "JSON", False
+
+        if "$ref" in schema:
+            ref_name = schema["$ref"].split("/")[-1]
+            target = components.get(ref_name, {})
+            return GraphQLBuilder._map_schema(target, GraphQLBuilder._type_name(ref_name), components, schema_def)
+
+        schema_type = schema.get("type")
+        if schema_type == "array" or "items" in schema:
+            named, _ = GraphQLBuilder._map_schema(
+                schema.get("items", {}), f"{hint}Item" if hint else None, components, schema_def
+            )
+            return named, True
+
+        if "oneOf" in schema or "anyOf" in schema:
+            schema_def.uses_json = True
+            return "JSON", False
+
+        if "allOf" in schema:
+            parts = schema["allOf"]
+            if len(parts) == 1:
+                return GraphQLBuilder._map_schema(parts[0], hint, components, schema_def)
+            return GraphQLBuilder._register_object(schema, hint, components, schema_def)
+
+        if schema_type == "object" or "properties" in schema:
+            if not schema.get("properties") or not hint:
+                schema_def.uses_json = True
+                return "JSON", False
+            return GraphQLBuilder._register_object(schema, hint, components, schema_def)
+
+        if schema.get("enum") and hint and all(
+            isinstance(value, str) and GRAPHQL_NAME.match(value) for value in schema["enum"]
+        ):
+            schema_def.enums.setdefault(hint, list(schema["enum"]))
+            return hint, False
+
+        if schema_type == "integer":
+            # GraphQL Int is 32-bit; int64 values are exposed as Float
+            return ("Float" if schema.get("format") == "int64" else "Int"), False
+        if schema_type == "number":
+            return "Float", False
+        if schema_type == "boolean":
+            return "Boolean", False
+        if schema_type == "string":
+            return "String", False
+
+        schema_def.uses_json = True
+        return "JSON", False
+
+    @staticmethod
+    def _object_properties(
+        schema: Dict[str, Any], components: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Set[str]]:
+        """Properties and required names of an object schema, merging allOf parts"""
+        properties: Dict[str, Any] = {}
+        required: Set[str] = set(schema.get("required", []) or [])
+        for part in schema.get("allOf", []) or []:
+            resolved = GraphQLBuilder._resolve_component(part, components)
+            part_properties, part_required = GraphQLBuilder._object_properties(resolved, components)
+            properties.update(part_properties)
+            required |= part_required
+        properties.update(schema.get("properties", {}) or {})
+        return properties, required
+
+    @staticmethod
+    def _register_object(
+        schema: Dict[str, Any],
+        name: str,
+        components: Dict[str, Any],
+        schema_def: GraphQLSchemaDef,
+    ) -> Tuple[str, bool]:
+        """Register an object type (once per name) and map its properties"""
+        if name in schema_def.types:
+            return name, False
+
+        type_def = GraphQLTypeDef(name=name, description=schema.get("description"))
+        schema_def.types[name] = type_def  # Registered before mapping fields so cycles terminate
+
+        properties, required = GraphQLBuilder._object_properties(schema, components)
+        for prop_name, prop_schema in properties.items():
+            field_name = GraphQLBuilder._field_name(prop_name)
+            if prop_name == "id" and isinstance(prop_schema, dict) and prop_schema.get("type") in ("string", None):
+                named, is_list = "ID", False
+            else:
+                named, is_list = GraphQLBuilder._map_schema(
+                    prop_schema, f"{name}{pascal_case(field_name)}", components, schema_def
+                )
+            type_ref = f"[{named}!]" if is_list else named
+            if prop_name in required:
+                type_ref += "!"
+            type_def.fields.append(GraphQLFieldDef(
+                name=field_name,
+                type_ref=type_ref,
+                named_type=named,
+                is_list=is_list,
+                source_key=prop_name if field_name != prop_name else None,
+            ))
+
+        if not type_def.fields:
+            # Objects without properties have no selectable fields
+            del schema_def.types[name]
+            schema_def.uses_json = True
+            return "JSON", False
+        return name, False
+
+    @staticmethod
+    def _add_aggregator(aggregator_config: Any, schema_def: GraphQLSchemaDef) -> None:
+        """Expose an aggregator as `{name}(params: JSON): {Name}Aggregate!`"""
+        class_base = pascal_case(aggregator_config.name.replace(" ", "").replace("-", ""))
+        sources = AggregatorBuilder.source_names(aggregator_config.core_domain_calls)
+        type_name = f"{class_base}Aggregate"
+
+        fields = [
+            GraphQLFieldDef(name=source, type_ref="JSON", named_type="JSON")
+            for source in sources
+        ]
+        fields.append(GraphQLFieldDef(
+            name="errors", type_ref="[AggregateSourceError!]!", named_type="AggregateSourceError", is_list=True
+        ))
+        schema_def.types[type_name] = GraphQLTypeDef(
+            name=type_name, fields=fields, description=aggregator_config.description
+        )
+        schema_def.types.setdefault("AggregateSourceError", GraphQLTypeDef(
+            name="AggregateSourceError",
+            description="Optional aggregator source that failed (data for it is null)",
+            fields=[
+                GraphQLFieldDef(name="source", type_ref="String!", named_type="String"),
+                GraphQLFieldDef(name="message", type_ref="String!", named_type="String"),
+                GraphQLFieldDef(name="timedOut", type_ref="Boolean!", named_type="Boolean"),
+                GraphQLFieldDef(name="attempts", type_ref="Int!", named_type="Int"),
+                GraphQLFieldDef(name="required", type_ref="Boolean!", named_type="Boolean"),
+            ],
+        ))
+        schema_def.uses_json = True
+
+        schema_def.queries.append(GraphQLQueryDef(
+            name=camel_case(class_base),
+            type_ref=f"{type_name}!",
+            named_type=type_name,
+            args=[GraphQLArgDef(name="params", type_ref="JSON", location="body", param_name="params")],
+            aggregator=GraphQLAggregatorDef(
+                field_name=camel_case(class_base),
+                class_name=f"{class_base}Aggregator",
+                file_name=generate_file_name(aggregator_config.name, "aggregator").replace(".ts", ""),
+                core_domains=sorted({call.domain for call in aggregator_config.core_domain_calls}),
+                sources=sources,
+            ),
+            description=aggregator_config.description,
+        ))
+
+    @staticmethod
+    def _schema_depth(schema_def: GraphQLSchemaDef) -> int:
+        """
+        Longest field path from Query that does not revisit a type.
+
+        Any deeper query must repeat a type (e.g. walk a relation back and forth),
+        so this is the depth limit.
+        """
+        def depth_of(type_name: str, visiting: Set[str], level: int) -> int:
+            type_def = schema_def.types.get(type_name)
+            if type_def is None or type_name in visiting or level >= MAX_SCHEMA_DEPTH:
+                return 0
+            visiting.add(type_name)
+            deepest = 0
+            for field_def in type_def.fields:
+                deepest = max(deepest, depth_of(field_def.named_type, visiting, level + 1))
+            visiting.discard(type_name)
+            return 1 + deepest
+
+        deepest = 0
+        for query in schema_def.queries:
+            deepest = max(deepest, depth_of(query.named_type, set(), 1))
+        return min(MAX_SCHEMA_DEPTH, 1 + deepest)
+
+    @staticmethod
+    def _description(text: Optional[str], indent: str = "") -> str:
+        if not text:
+            return ""
+        return f"{indent}{json.dumps(' '.join(str(text).split()))}\n"
+
     @staticmethod
     def build_schema(
         context: GenerationContext,
-        schema_def: Dict[str, Any],
+        schema_def: GraphQLSchemaDef,
         header: str,
     ) -> str:
         """
@@ -21,118 +450,352 @@ class GraphQLBuilder:
 
         Args:
             context: Generation context
-            schema_def: GraphQL schema definition
+            schema_def: Schema definition from collect_schema()
             header: File header comment
 
         Returns:
             Generated TypeScript code
         """
-        schema_content = f"""{header}
+        blocks: List[str] = []
+        if schema_def.uses_json:
+            blocks.append('"Arbitrary JSON value"\nscalar JSON')
+
+        query_fields = []
+        for query in schema_def.queries:
+            args = ", ".join(f"{arg.name}: {arg.type_ref}" for arg in query.args)
+            signature = f"{query.name}({args})" if args else query.name
+            query_fields.append(f"{GraphQLBuilder._description(query.description, '  ')}  {signature}: {query.type_ref}")
+        blocks.append("type Query {\n" + "\n".join(query_fields) + "\n}")
+
+        for type_def in schema_def.types.values():
+            fields = "\n".join(f"  {f.name}: {f.type_ref}" for f in type_def.fields)
+            blocks.append(f"{GraphQLBuilder._description(type_def.description)}type {type_def.name} {{\n{fields}\n}}")
+
+        for enum_name, values in schema_def.enums.items():
+            blocks.append(f"enum {enum_name} {{\n" + "\n".join(f"  {value}" for value in values) + "\n}")
+
+        sdl = "\n\n".join(blocks).replace("\\", "\\\\").replace("`", "\\`").replace("${", "\\${")
+
+        return f"""{header}
 
 /**
  * GraphQL Schema
  *
- * Generated GraphQL schema for Orchestrator layer.
+ * Derived from the response schemas of the {context.domain_name} orchestrator spec
+ * and its configured aggregators.
  */
 
 export const typeDefs = `
-  type Query {{
-    dashboard(userId: String!, orgId: String!): Dashboard
-    portfolio(userId: String!, orgId: String!): Portfolio
-    tradingContext(userId: String!, orgId: String!): TradingContext
-  }}
+{sdl}
+`;
+"""
 
-  type Dashboard {{
-    portfolio: PortfolioData
-    trades: [Trade]
-    notifications: [Notification]
-    market: MarketSummary
-  }}
+    @staticmethod
+    def build_limits(
+        context: GenerationContext,
+        schema_def: GraphQLSchemaDef,
+        header: str,
+    ) -> str:
+        """Build limits.ts (depth/complexity validation rule)"""
+        return f"""{header}
 
-  type Portfolio {{
-    balances: [Balance]
-    positions: [Position]
-    escrowAccounts: [EscrowAccount]
-  }}
+/**
+ * Query Limits
+ *
+ * MAX_QUERY_DEPTH is the longest path through the schema that does not revisit a
+ * type ({schema_def.max_depth} for this schema); deeper queries can only be produced by walking
+ * relations back and forth. Complexity counts one per field, multiplying the cost of
+ * a list field's selection by LIST_COST_MULTIPLIER.
+ *
+ * server.ts passes `validationRules` to `validate()` alongside `specifiedRules`.
+ */
 
-  type TradingContext {{
-    markets: [Market]
-    riskLimits: RiskLimits
-    priceTicks: [PriceTick]
+import {{
+  GraphQLError,
+  Kind,
+  getNamedType,
+  getNullableType,
+  isInterfaceType,
+  isListType,
+  isObjectType,
+  type GraphQLNamedType,
+  type SelectionSetNode,
+  type ValidationContext,
+  type ValidationRule,
+}} from "graphql";
+
+export const MAX_QUERY_DEPTH = Number(process.env.GRAPHQL_MAX_DEPTH ?? {schema_def.max_depth});
+export const MAX_QUERY_COMPLEXITY = Number(process.env.GRAPHQL_MAX_COMPLEXITY ?? {DEFAULT_MAX_COMPLEXITY});
+export const LIST_COST_MULTIPLIER = {LIST_COST_MULTIPLIER};
+
+interface Measure {{
+  depth: number;
+  cost: number;
+}}
+
+function measure(
+  context: ValidationContext,
+  selectionSet: SelectionSetNode,
+  parentType: GraphQLNamedType | undefined,
+  depth: number,
+  fragments: Set<string>
+): Measure {{
+  let deepest = depth;
+  let cost = 0;
+
+  for (const selection of selectionSet.selections) {{
+    if (selection.kind === Kind.FIELD) {{
+      if (selection.name.value.startsWith("__")) {{
+        continue;
+      }}
+      const fields = parentType && (isObjectType(parentType) || isInterfaceType(parentType)) ? parentType.getFields() : {{}};
+      const fieldDef = fields[selection.name.value];
+      const multiplier = fieldDef && isListType(getNullableType(fieldDef.type)) ? LIST_COST_MULTIPLIER : 1;
+      if (selection.selectionSet) {{
+        const child = measure(context, selection.selectionSet, fieldDef ? getNamedType(fieldDef.type) : undefined, depth + 1, fragments);
+        deepest = Math.max(deepest, child.depth);
+        cost += multiplier * (1 + child.cost);
+      }} else {{
+        cost += 1;
+      }}
+    }} else if (selection.kind === Kind.INLINE_FRAGMENT) {{
+      const typeCondition = selection.typeCondition ? context.getSchema().getType(selection.typeCondition.name.value) : parentType;
+      const child = measure(context, selection.selectionSet, typeCondition ?? undefined, depth, fragments);
+      deepest = Math.max(deepest, child.depth);
+      cost += child.cost;
+    }} else {{
+      const name = selection.name.value;
+      const fragment = context.getFragment(name);
+      if (!fragment || fragments.has(name)) {{
+        continue;
+      }}
+      fragments.add(name);
+      const child = measure(
+        context,
+        fragment.selectionSet,
+        context.getSchema().getType(fragment.typeCondition.name.value) ?? undefined,
+        depth,
+        fragments
+      );
+      fragments.delete(name);
+      deepest = Math.max(deepest, child.depth);
+      cost += child.cost;
+    }}
   }}
 
-  type PortfolioData {{
-    totalValue: String
-    holdings: [Holding]
-  }}
+  return {{ depth: deepest, cost }};
+}}
 
-  type Holding {{
-    symbol: String
-    quantity: String
-    value: String
-  }}
+/**
+ * Rejects operations deeper than MAX_QUERY_DEPTH or costlier than MAX_QUERY_COMPLEXITY
+ */
+export const queryLimitRule: ValidationRule = (context) => ({{
+  OperationDefinition(node) {{
+    const rootType = context.getSchema().getRootType(node.operation) ?? undefined;
+    const {{ depth, cost }} = measure(context, node.selectionSet, rootType, 1, new Set());
+    if (depth > MAX_QUERY_DEPTH) {{
+      context.reportError(
+        new GraphQLError(`Query depth ${{depth}} exceeds the limit of ${{MAX_QUERY_DEPTH}}`, {{ nodes: [node] }})
+      );
+    }}
+    if (cost > MAX_QUERY_COMPLEXITY) {{
+      context.reportError(
+        new GraphQLError(`Query complexity ${{cost}} exceeds the limit of ${{MAX_QUERY_COMPLEXITY}}`, {{ nodes: [node] }})
+      );
+    }}
+  }},
+}});
 
-  type Trade {{
-    id: String
-    symbol: String
-    quantity: String
-    price: String
-    timestamp: String
-  }}
+export const validationRules: ValidationRule[] = [queryLimitRule];
+"""
 
-  type Notification {{
-    id: String
-    title: String
-    message: String
-    read: Boolean
-    timestamp: String
-  }}
+    @staticmethod
+    def build_context(
+        context: GenerationContext,
+        schema_def: GraphQLSchemaDef,
+        header: str,
+    ) -> str:
+        """Build context.ts (per-request GraphQL context with one DataLoader per entity type)"""
+        entities = sorted(schema_def.entities.items())
+        loader_props = "\n".join(f"  {name}: DataLoader<string, any | null>;" for name, _ in entities)
+        loader_inits = "\n".join(
+            f"    {name}: byIdLoader((ids) => deps.{repo_var}.findByIds(orgId, ids)),"
+            for name, repo_var in entities
+        )
 
-  type MarketSummary {{
-    totalMarkets: Int
-    activeMarkets: Int
-  }}
+        return f"""{header}
 
-  type Balance {{
-    asset: String
-    amount: String
-  }}
+/**
+ * GraphQL Request Context
+ *
+ * Created once per request: loaders batch every `load(id)` issued while resolving
+ * one tick into a single `findByIds` call per entity type and cache results for
+ * the rest of the request. Dependencies come from the shared container.
+ */
 
-  type Position {{
-    symbol: String
-    quantity: String
-  }}
+import DataLoader from "dataloader";
+import {{ init, type Dependencies }} from "../deps.js";
+import type {{ RequestContext }} from "../context.js";
+
+const LOADER_MAX_BATCH_SIZE = {LOADER_MAX_BATCH_SIZE};
+
+export interface Loaders {{
+{loader_props or "  // No entity types with a DAO repository"}
+}}
+
+export interface GraphQLContext {{
+  request: RequestContext;
+  deps: Dependencies;
+  loaders: Loaders;
+}}
+
+function byIdLoader<T extends {{ id: string }}>(
+  findByIds: (ids: readonly string[]) => Promise<T[]>
+): DataLoader<string, T | null> {{
+  return new DataLoader<string, T | null>(
+    async (ids) => {{
+      const records = await findByIds(ids);
+      const byId = new Map(records.map((record) => [record.id, record]));
+      return ids.map((id) => byId.get(id) ?? null);
+    }},
+    {{ maxBatchSize: LOADER_MAX_BATCH_SIZE }}
+  );
+}}
+
+export function createLoaders(orgId: string, deps: Dependencies): Loaders {{
+  return {{
+{loader_inits or "    // No entity types with a DAO repository"}
+  }};
+}}
+
+export function createGraphQLContext(request: RequestContext, deps: Dependencies = init()): GraphQLContext {{
+  return {{
+    request,
+    deps,
+    loaders: createLoaders(request.orgId, deps),
+  }};
+}}
+"""
 
-  type EscrowAccount {{
-    id: String
-    balance: String
-  }}
+    @staticmethod
+    def build_server(
+        context: GenerationContext,
+        schema_def: GraphQLSchemaDef,
+        header: str,
+    ) -> str:
+        """Build server.ts (executable schema and the parse/validate/execute entry point used by handler.ts)"""
+        return f"""{header}
 
-  type Market {{
-    id: String
-    symbol: String
-    status: String
+/**
+ * GraphQL Server
+ *
+ * Binds the resolvers to the generated schema and executes requests for the
+ * {context.domain_name} orchestrator. Validation runs the standard rules plus the depth and
+ * complexity limits from limits.ts, so over-limit queries are rejected before any
+ * resolver runs.
+ */
+
+import {{
+  GraphQLError,
+  GraphQLScalarType,
+  buildSchema,
+  execute,
+  isObjectType,
+  isScalarType,
+  parse,
+  specifiedRules,
+  validate,
+  type DocumentNode,
+  type ExecutionResult,
+  type GraphQLFieldResolver,
+  type GraphQLSchema,
+}} from "graphql";
+import {{ typeDefs }} from "./schema.js";
+import {{ resolvers }} from "./resolvers.js";
+import {{ validationRules }} from "./limits.js";
+import {{ createGraphQLContext }} from "./context.js";
+import type {{ RequestContext }} from "../context.js";
+import type {{ Dependencies }} from "../deps.js";
+
+type ResolverMap = Record<string, GraphQLScalarType | Record<string, GraphQLFieldResolver<any, any>>>;
+
+export interface GraphQLRequest {{
+  query: string;
+  variables?: Record<string, unknown> | null;
+  operationName?: string | null;
+}}
+
+export interface GraphQLResponse {{
+  statusCode: number;
+  result: ExecutionResult;
+}}
+
+/**
+ * Attach field resolvers and custom scalar implementations to the SDL-built schema
+ */
+function bindResolvers(schema: GraphQLSchema, map: ResolverMap): GraphQLSchema {{
+  for (const [typeName, typeResolvers] of Object.entries(map)) {{
+    const type = schema.getType(typeName);
+    if (isScalarType(type) && typeResolvers instanceof GraphQLScalarType) {{
+      Object.assign(type, {{
+        serialize: typeResolvers.serialize,
+        parseValue: typeResolvers.parseValue,
+        parseLiteral: typeResolvers.parseLiteral,
+      }});
+    }} else if (isObjectType(type) && !(typeResolvers instanceof GraphQLScalarType)) {{
+      const fields = type.getFields();
+      for (const [fieldName, resolve] of Object.entries(typeResolvers)) {{
+        if (fields[fieldName]) {{
+          fields[fieldName].resolve = resolve;
+        }}
+      }}
+    }}
   }}
+  return schema;
+}}
 
-  type RiskLimits {{
-    maxPositionSize: String
-    maxDailyLoss: String
+export const schema = bindResolvers(buildSchema(typeDefs), resolvers as ResolverMap);
+
+const rules = [...specifiedRules, ...validationRules];
+
+/**
+ * Parse, validate (including query limits) and execute one GraphQL request
+ */
+export async function executeGraphQL(
+  request: GraphQLRequest,
+  requestContext: RequestContext,
+  deps?: Dependencies
+): Promise<GraphQLResponse> {{
+  let document: DocumentNode;
+  try {{
+    document = parse(String(request.query ?? ""));
+  }} catch (error) {{
+    if (error instanceof GraphQLError) {{
+      return {{ statusCode: 400, result: {{ errors: [error] }} }};
+    }}
+    throw error;
   }}
 
-  type PriceTick {{
-    symbol: String
-    price: String
-    timestamp: String
+  const errors = validate(schema, document, rules);
+  if (errors.length > 0) {{
+    return {{ statusCode: 400, result: {{ errors }} }};
   }}
-`;
-"""
 
-        return schema_content.strip()
+  const result = await execute({{
+    schema,
+    document,
+    variableValues: request.variables ?? undefined,
+    operationName: request.operationName ?? undefined,
+    contextValue: createGraphQLContext(requestContext, deps),
+  }});
+  return {{ statusCode: 200, result }};
+}}
+"""
 
     @staticmethod
     def build_resolvers(
         context: GenerationContext,
-        resolvers: Dict[str, Any],
+        schema_def: GraphQLSchemaDef,
         header: str,
     ) -> str:
         """
@@ -140,42 +803,160 @@ export const typeDefs = `
 
         Args:
             context: Generation context
-            resolvers: Resolver definitions
+            schema_def: Schema definition from collect_schema()
             header: File header comment
 
         Returns:
             Generated TypeScript code
         """
-        resolvers_content = f"""{header}
+        imports: List[str] = []
+        flow_imports = sorted({q.flow for q in schema_def.queries if q.flow})
+        for flow in flow_imports:
+            imports.append(f'import {{ {flow} }} from "../flows/{kebab_case(flow.replace("Flow", ""))}.flow.js";')
+
+        aggregator_defs = [q.aggregator for q in schema_def.queries if q.aggregator]
+        client_domains = sorted({domain for agg in aggregator_defs for domain in agg.core_domains})
+        for agg in aggregator_defs:
+            imports.append(f'import {{ {agg.class_name} }} from "../aggregators/{agg.file_name}.js";')
+        for domain in client_domains:
+            client_file = generate_file_name(domain, "client").replace(".ts", "")
+            imports.append(
+                f'import {{ {pascal_case(domain.replace("-", "_"))}Client }} from "../services/clients/{client_file}.js";'
+            )
+
+        module_scope: List[str] = []
+        if aggregator_defs:
+            clients = "\n".join(
+                f"  {camel_case(domain.replace('-', '_'))}: new {pascal_case(domain.replace('-', '_'))}Client(),"
+                for domain in client_domains
+            )
+            aggregators = "\n".join(
+                f"  {agg.field_name}: new {agg.class_name}("
+                + ", ".join(f"clients.{camel_case(domain.replace('-', '_'))}" for domain in agg.core_domains)
+                + "),"
+                for agg in aggregator_defs
+            )
+            module_scope.append(f"""// Constructed once per cold start and shared by every request
+const clients = {{
+{clients}
+}};
+
+const aggregators = {{
+{aggregators}
+}};""")
+
+        query_resolvers: List[str] = []
+        for query in schema_def.queries:
+            if query.flow:
+                params = "{ " + ", ".join(f"{json.dumps(a.param_name)}: args.{a.name}" for a in query.args if a.location == "path") + " }"
+                query_params = "{ " + ", ".join(f"{json.dumps(a.param_name)}: args.{a.name}" for a in query.args if a.location == "query") + " }"
+                params = params if params != "{  }" else "{}"
+                query_params = query_params if query_params != "{  }" else "{}"
+                query_resolvers.append(f"""    {query.name}: (_parent: unknown, args: Args, ctx: GraphQLContext) =>
+      {query.flow}(
+        {{ context: ctx.request, body: undefined, params: toParams({params}), query: toParams({query_params}) }},
+        ctx.deps
+      ),""")
+            elif query.aggregator:
+                query_resolvers.append(f"""    {query.name}: async (_parent: unknown, args: Args, ctx: GraphQLContext) => {{
+      const {{ data, meta }} = await aggregators.{query.aggregator.field_name}.execute({{
+        ...((args.params as Record<string, unknown>) ?? {{}}),
+        orgId: ctx.request.orgId,
+      }});
+      return {{ ...data, errors: meta.errors }};
+    }},""")
+
+        type_resolvers: List[str] = []
+        for type_def in schema_def.types.values():
+            field_resolvers = []
+            for field_def in type_def.fields:
+                if field_def.loader:
+                    key = json.dumps(field_def.loader_key)
+                    field_resolvers.append(f"""    {field_def.name}: (parent: Parent, _args: Args, ctx: GraphQLContext) =>
+      parent[{key}] ? ctx.loaders.{field_def.loader}.load(String(parent[{key}])) : null,""")
+                elif field_def.source_key:
+                    field_resolvers.append(
+                        f"    {field_def.name}: (parent: Parent) => parent[{json.dumps(field_def.source_key)}],"
+                    )
+            if field_resolvers:
+                type_resolvers.append(f"  {type_def.name}: {{\n" + "\n".join(field_resolvers) + "\n  },")
+
+        json_scalar = ""
+        graphql_import = ""
+        if schema_def.uses_json:
+            graphql_import = 'import { GraphQLScalarType, Kind, type ValueNode } from "graphql";\n'
+            json_scalar = """
+function parseJsonLiteral(ast: ValueNode, variables?: Record<string, unknown> | null): unknown {
+  switch (ast.kind) {
+    case Kind.STRING:
+    case Kind.BOOLEAN:
+    case Kind.ENUM:
+      return ast.value;
+    case Kind.INT:
+    case Kind.FLOAT:
+      return Number(ast.value);
+    case Kind.LIST:
+      return ast.values.map((value) => parseJsonLiteral(value, variables));
+    case Kind.OBJECT:
+      return Object.fromEntries(ast.fields.map((f) => [f.name.value, parseJsonLiteral(f.value, variables)]));
+    case Kind.VARIABLE:
+      return variables?.[ast.name.value];
+    default:
+      return null;
+  }
+}
+
+const JSONScalar = new GraphQLScalarType({
+  name: "JSON",
+  serialize: (value) => value,
+  parseValue: (value) => value,
+  parseLiteral: parseJsonLiteral,
+});
+"""
+
+        to_params = ""
+        if flow_imports:
+            to_params = """
+/**
+ * Flow params/query are string records; drop unset args
+ */
+function toParams(values: Args): Record<string, string> {
+  const params: Record<string, string> = {};
+  for (const [key, value] of Object.entries(values)) {
+    if (value !== undefined && value !== null) {
+      params[key] = String(value);
+    }
+  }
+  return params;
+}
+"""
+
+        scalar_entry = "  JSON: JSONScalar,\n" if schema_def.uses_json else ""
+        imports_block = "\n".join(imports)
+        module_block = "\n\n".join(module_scope)
+
+        return f"""{header}
 
 /**
  * GraphQL Resolvers
  *
- * Generated resolvers for Orchestrator layer.
+ * Query fields call the orchestrator flows and aggregators in-process. Aggregators and
+ * their service clients are module-scope singletons; per-request state (auth context,
+ * DataLoaders) arrives through GraphQLContext.
  */
 
-import {{ DashboardAggregator }} from "../../services/aggregators/{generate_file_name("dashboard", "aggregator").replace(".ts", "")}.js";
-import {{ PortfolioAggregator }} from "../../services/aggregators/{generate_file_name("portfolio", "aggregator").replace(".ts", "")}.js";
-import {{ TradingAggregator }} from "../../services/aggregators/{generate_file_name("trading", "aggregator").replace(".ts", "")}.js";
+{graphql_import}import type {{ GraphQLContext }} from "./context.js";
+{imports_block}
 
-export const resolvers = {{
-  Query: {{
-    dashboard: async (_: any, {{ userId, orgId }}: {{ userId: string; orgId: string }}) => {{
-      const aggregator = new DashboardAggregator(/* inject service clients */);
-      return await aggregator.getDashboard(userId, orgId);
-    }},
-
-    portfolio: async (_: any, {{ userId, orgId }}: {{ userId: string; orgId: string }}) => {{
-      const aggregator = new PortfolioAggregator(/* inject service clients */);
-      return await aggregator.getPortfolio(userId, orgId);
-    }},
+type Args = Record<string, unknown>;
+type Parent = Record<string, unknown>;
+{to_params}{json_scalar}
+{module_block}
 
-    tradingContext: async (_: any, {{ userId, orgId }}: {{ userId: string; orgId: string }}) => {{
-      const aggregator = new TradingAggregator(/* inject service clients */);
-      return await aggregator.getTradingContext(userId, orgId);
-    }},
+export const resolvers = {{
+{scalar_entry}  Query: {{
+{chr(10).join(query_resolvers)}
   }},
+{chr(10).join(type_resolvers)}
 }};
 """
-
-        return resolvers_content.strip()
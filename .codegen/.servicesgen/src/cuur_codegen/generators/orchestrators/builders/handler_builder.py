@@ -11,8 +11,22 @@ class HandlerBuilder:
     """Builds handler.ts file"""
 
     @staticmethod
-    def build_handler(domain_name: str) -> str:
-        """Build handler.ts content"""
+    def build_handler(domain_name: str, graphql: bool = False) -> str:
+        """Build handler.ts content (graphql: serve POST /graphql through graphql/server.ts)"""
+        graphql_import = '\nimport { executeGraphQL } from "./graphql/server.js";' if graphql else ""
+        graphql_route = '''
+
+    // GraphQL endpoint: query depth/complexity limits are enforced during validation
+    if (event.httpMethod === "POST" && event.path === "/graphql") {
+      const { statusCode, result } = await executeGraphQL(JSON.parse(event.body || "{}"), context, deps);
+      return {
+        statusCode,
+        headers: {
+          "Content-Type": "application/json",
+        },
+        body: JSON.stringify(result),
+      };
+    }''' if graphql else ""
         return f'''/**
  * Lambda entrypoint for {domain_name} orchestrator
  *
@@ -23,17 +37,31 @@ class HandlerBuilder:
  */
 
 import type {{ APIGatewayProxyEvent, APIGatewayProxyResult }} from "aws-lambda";
-import {{ routes }} from "./routes.js";
-import {{ createDependencies }} from "./deps.js";
+import {{ matchRoute }} from "./routes.js";
+import {{ init }} from "./deps.js";
 import {{ extractContext }} from "./context.js";
 import {{ FlowError }} from "./errors/flow-error.js";
 import {{ logger }} from "./logger.js";
+import {{ getBreakerStates }} from "./circuit-breaker.js";{graphql_import}
 
 export async function handler(
   event: APIGatewayProxyEvent
 ): Promise<APIGatewayProxyResult> {{
   const requestId = event.requestContext?.requestId || "unknown";
 
+  // Health check (no JWT): reports circuit breaker state per core domain
+  if (event.httpMethod === "GET" && event.path === "/health") {{
+    const breakers = getBreakerStates();
+    const degraded = breakers.some((breaker) => breaker.state !== "closed");
+    return {{
+      statusCode: 200,
+      headers: {{
+        "Content-Type": "application/json",
+      }},
+      body: JSON.stringify({{ status: degraded ? "degraded" : "ok", breakers }}),
+    }};
+  }}
+
   try {{
     // Extract context from JWT token (orgId, accountId)
     const context = extractContext(event);
@@ -46,8 +74,10 @@ export async function handler(
       path: event.path,
     }}, "Processing request");
 
-    const deps = createDependencies();
-    const route = routes.find((r) => r.matches(event));
+    // Shared container - built once per cold start, reused across invocations
+    const deps = init();{graphql_route}
+
+    const route = matchRoute(event.httpMethod, event.path);
 
     if (!route) {{
       logger.warn({{ requestId, path: event.path }}, "Route not found");
@@ -61,7 +91,8 @@ export async function handler(
     }}
 
     // Pass context to route handler
-    const result = await route.handler(event, context, deps);
+    const params = {{ ...(event.pathParameters || {{}}), ...route.params }};
+    const result = await route.handler(event, context, deps, params);
 
     return {{
       statusCode: 200,
@@ -121,8 +152,10 @@ export async function handler(
 '''
 
     @staticmethod
-    def generate_handler(output_dir: Path, domain_name: str, spec: Dict[str, Any]) -> Optional[Path]:
+    def generate_handler(
+        output_dir: Path, domain_name: str, spec: Dict[str, Any], graphql: bool = False
+    ) -> Optional[Path]:
         """Generate handler.ts"""
         handler_file = output_dir / "handler.ts"
-        write_file(handler_file, HandlerBuilder.build_handler(domain_name))
+        write_file(handler_file, HandlerBuilder.build_handler(domain_name, graphql))
         return handler_file
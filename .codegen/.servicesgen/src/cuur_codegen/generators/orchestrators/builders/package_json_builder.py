@@ -27,20 +27,28 @@ class PackageJsonBuilder:
   "scripts": {{
     "build": "tsc",
     "test": "vitest",
+    "bench": "vitest bench",
     "test:coverage": "vitest --coverage"
   }},
   "dependencies": {{
     "@cuur/core": "workspace:*",
     "@quub/adapters": "workspace:*",
+    "dataloader": "^2.2.2",
+    "fastify": "^4.25.0",
+    "graphql": "^16.8.1",
     "jsonwebtoken": "^9.0.2",
     "zod": "^3.22.4",
     "pino": "^8.16.0",
-    "pino-pretty": "^10.2.3"
+    "pino-pretty": "^10.2.3",
+    "undici": "^6.19.8",
+    "@fastify/websocket": "^8.3.1",
+    "ws": "^8.16.0"
   }},
   "devDependencies": {{
     "@types/aws-lambda": "^8.10.130",
     "@types/jsonwebtoken": "^9.0.5",
     "@types/node": "^20.10.0",
+    "@types/ws": "^8.5.10",
     "typescript": "^5.3.3",
     "vitest": "^1.0.4",
     "@types/pino-pretty": "^5.0.0"
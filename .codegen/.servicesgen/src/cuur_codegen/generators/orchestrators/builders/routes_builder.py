@@ -42,11 +42,10 @@ class RoutesBuilder:
         return params
 
     @staticmethod
-    def build_routes(domain_name: str, spec: Dict[str, Any]) -> str:
-        """Build routes.ts content"""
+    def _collect_routes(spec: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Collect (method, path, flow) entries from the spec in declaration order"""
         paths = spec.get("paths", {})
-        routes_list = []
-        flow_imports = []
+        routes = []
 
         for path, methods in paths.items():
             for method, operation in methods.items():
@@ -62,47 +61,39 @@ class RoutesBuilder:
                 if not flow_name:
                     flow_name = camel_case(operation_id)
 
-                flow_import_name = f"{flow_name}Flow"
-                flow_file_name = kebab_case(flow_name)
-
-                # Check if flow already imported
-                if flow_import_name not in flow_imports:
-                    flow_imports.append(flow_import_name)
-
-                # Build route matcher
-                http_method = method.upper()
-                path_params = RoutesBuilder.extract_path_params(path)
-                regex_pattern = RoutesBuilder.convert_path_to_regex(path)
-
-                # Generate path parameter extraction code
-                if path_params:
-                    matches_code = f'''    matches: (event) => {{
-      if (event.httpMethod !== "{http_method}") return false;
-      const pathMatch = event.path.match(/^{regex_pattern}$/);
-      return pathMatch !== null;
-    }},'''
-                    handler_params_code = f'''      // Extract path parameters using regex
-      const pathMatch = event.path.match(/^{regex_pattern}$/);
-      const params = {{ ...(event.pathParameters || {{}}), ...(pathMatch?.groups || {{}}) }};'''
-                else:
-                    matches_code = f'''    matches: (event) =>
-      event.httpMethod === "{http_method}" && event.path === "{path}",'''
-                    handler_params_code = '''      const params = event.pathParameters || {};'''
-
-                route_code = f'''  {{
-{matches_code}
-    handler: async (event, context, deps) => {{
-      // Extract request data (body, path params, query params)
+                routes.append({
+                    "method": method.upper(),
+                    "path": path,
+                    "flow": f"{flow_name}Flow",
+                })
+
+        return routes
+
+    @staticmethod
+    def build_routes(domain_name: str, spec: Dict[str, Any]) -> str:
+        """Build routes.ts content"""
+        routes = RoutesBuilder._collect_routes(spec)
+
+        flow_imports = []
+        route_entries = []
+        for route in routes:
+            flow_import_name = route["flow"]
+            if flow_import_name not in flow_imports:
+                flow_imports.append(flow_import_name)
+
+            route_entries.append(f'''  {{
+    method: "{route["method"]}",
+    path: "{route["path"]}",
+    handler: async (event, context, deps, params) => {{
+      // Extract request data (body, query params); path params come from the router
       const body = event.body ? JSON.parse(event.body) : {{}};
-{handler_params_code}
       const query = event.queryStringParameters || {{}};
 
       // Pass context (orgId, accountId from JWT) and request data to flow
       // Note: orgId comes from context, never from params or query
       return {flow_import_name}({{ context, body, params, query }}, deps);
     }},
-  }}'''
-                routes_list.append(route_code)
+  }}''')
 
         # Generate imports
         imports = "\n".join([
@@ -113,7 +104,9 @@ class RoutesBuilder:
         return f'''/**
  * API Gateway route → flow mapping
  *
- * Maps incoming API Gateway events to the appropriate flow handlers.
+ * Routes are compiled into a segment trie at module load, keyed by path
+ * segment and then HTTP method. Dispatch is O(path segments) regardless of
+ * route count, and path params are extracted once during the walk.
  *
  * Security: orgId is passed from JWT context, never extracted from URL.
  */
@@ -123,14 +116,182 @@ import type {{ Dependencies }} from "./deps.js";
 import type {{ RequestContext }} from "./context.js";
 {imports}
 
-export interface Route {{
-  matches(event: APIGatewayProxyEvent): boolean;
-  handler(event: APIGatewayProxyEvent, context: RequestContext, deps: Dependencies): Promise<any>;
+export type RouteParams = Record<string, string>;
+
+export type RouteHandler = (
+  event: APIGatewayProxyEvent,
+  context: RequestContext,
+  deps: Dependencies,
+  params: RouteParams
+) => Promise<any>;
+
+export interface RouteDefinition {{
+  method: string;
+  /** OpenAPI path template, e.g. /markets/{{symbol}} */
+  path: string;
+  handler: RouteHandler;
 }}
 
-export const routes: Route[] = [
-{",".join(routes_list)}
+export interface RouteMatch {{
+  handler: RouteHandler;
+  params: RouteParams;
+}}
+
+interface RouteLeaf {{
+  handler: RouteHandler;
+  paramNames: string[];
+}}
+
+interface TrieNode {{
+  children: Map<string, TrieNode>;
+  param: TrieNode | null;
+  leaves: Map<string, RouteLeaf>;
+}}
+
+export const routeDefinitions: RouteDefinition[] = [
+{",".join(chr(10) + entry for entry in route_entries).lstrip(chr(10)) if route_entries else ""}
 ];
+
+function createNode(): TrieNode {{
+  return {{ children: new Map(), param: null, leaves: new Map() }};
+}}
+
+function splitPath(path: string): string[] {{
+  return path.split("/").filter((segment) => segment.length > 0);
+}}
+
+/**
+ * Compile route definitions into a trie (static segments before params)
+ */
+export function buildRouter(definitions: RouteDefinition[]): TrieNode {{
+  const root = createNode();
+  for (const definition of definitions) {{
+    let node = root;
+    const paramNames: string[] = [];
+    for (const segment of splitPath(definition.path)) {{
+      if (segment.startsWith("{{") && segment.endsWith("}}")) {{
+        paramNames.push(segment.slice(1, -1));
+        if (!node.param) {{
+          node.param = createNode();
+        }}
+        node = node.param;
+      }} else {{
+        let child = node.children.get(segment);
+        if (!child) {{
+          child = createNode();
+          node.children.set(segment, child);
+        }}
+        node = child;
+      }}
+    }}
+    node.leaves.set(definition.method.toUpperCase(), {{ handler: definition.handler, paramNames }});
+  }}
+  return root;
+}}
+
+function walk(
+  node: TrieNode,
+  segments: string[],
+  index: number,
+  method: string,
+  values: string[]
+): RouteLeaf | undefined {{
+  if (index === segments.length) {{
+    return node.leaves.get(method);
+  }}
+  const segment = segments[index];
+  const child = node.children.get(segment);
+  if (child) {{
+    const leaf = walk(child, segments, index + 1, method, values);
+    if (leaf) {{
+      return leaf;
+    }}
+  }}
+  if (node.param) {{
+    values.push(segment);
+    const leaf = walk(node.param, segments, index + 1, method, values);
+    if (leaf) {{
+      return leaf;
+    }}
+    values.pop();
+  }}
+  return undefined;
+}}
+
+const router = buildRouter(routeDefinitions);
+
+/**
+ * Find the handler for a request and extract its path params (null: no route, or a malformed escape)
+ */
+export function matchRoute(method: string, path: string, root: TrieNode = router): RouteMatch | null {{
+  const values: string[] = [];
+  const leaf = walk(root, splitPath(path), 0, method.toUpperCase(), values);
+  if (!leaf) {{
+    return null;
+  }}
+  const params: RouteParams = {{}};
+  for (let i = 0; i < leaf.paramNames.length; i++) {{
+    try {{
+      params[leaf.paramNames[i]] = decodeURIComponent(values[i]);
+    }} catch {{
+      // Malformed percent-escape (URIError): no resource can have that id, so not found
+      return null;
+    }}
+  }}
+  return {{ handler: leaf.handler, params }};
+}}
+'''
+
+    @staticmethod
+    def build_routes_bench(domain_name: str, spec: Dict[str, Any]) -> str:
+        """Build routes.bench.ts content (trie dispatch vs. linear regex scan)"""
+        routes = RoutesBuilder._collect_routes(spec)
+
+        samples = []
+        baseline = []
+        for route in routes:
+            sample_path = re.sub(r'\{(\w+)\}', lambda m: f"sample-{m.group(1)}", route["path"])
+            samples.append(f'  {{ method: "{route["method"]}", path: "{sample_path}" }},')
+            regex_pattern = RoutesBuilder.convert_path_to_regex(route["path"])
+            baseline.append(f'  {{ method: "{route["method"]}", pattern: /^{regex_pattern}$/ }},')
+
+        return f'''/**
+ * Route dispatch micro-benchmarks for {domain_name} orchestrator
+ *
+ * Run with: vitest bench
+ */
+
+import {{ bench, describe }} from "vitest";
+import {{ matchRoute }} from "./routes.js";
+
+const SAMPLE_REQUESTS = [
+{chr(10).join(samples)}
+  {{ method: "GET", path: "/__not-found__/sample" }},
+];
+
+// Baseline: linear scan with a regex per route, matched twice (match + param extraction)
+const LINEAR_ROUTES = [
+{chr(10).join(baseline)}
+];
+
+function linearMatch(method: string, path: string): Record<string, string> | null {{
+  const route = LINEAR_ROUTES.find((r) => r.method === method && r.pattern.test(path));
+  return route ? (path.match(route.pattern)?.groups ?? {{}}) : null;
+}}
+
+describe("{domain_name} route dispatch", () => {{
+  bench("trie matchRoute", () => {{
+    for (const request of SAMPLE_REQUESTS) {{
+      matchRoute(request.method, request.path);
+    }}
+  }});
+
+  bench("linear regex scan (baseline)", () => {{
+    for (const request of SAMPLE_REQUESTS) {{
+      linearMatch(request.method, request.path);
+    }}
+  }});
+}});
 '''
 
     @staticmethod
@@ -139,3 +300,10 @@ export const routes: Route[] = [
         routes_file = output_dir / "routes.ts"
         write_file(routes_file, RoutesBuilder.build_routes(domain_name, spec))
         return routes_file
+
+    @staticmethod
+    def generate_routes_bench(output_dir: Path, domain_name: str, spec: Dict[str, Any]) -> Optional[Path]:
+        """Generate routes.bench.ts"""
+        bench_file = output_dir / "routes.bench.ts"
+        write_file(bench_file, RoutesBuilder.build_routes_bench(domain_name, spec))
+        return bench_file
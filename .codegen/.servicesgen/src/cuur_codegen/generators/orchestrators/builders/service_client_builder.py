@@ -2,9 +2,11 @@
 Service Client Builder - Builds typed service client wrappers
 """
 
+import json
 from typing import Dict, Any, List
 from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.utils.string import camel_case, pascal_case, kebab_case
+from ..config_reader import CoreDomainRegistry
 
 
 class ServiceClientBuilder:
@@ -51,13 +53,16 @@ class ServiceClientBuilder:
  *
  * Type-safe client wrapper for {domain_name} domain service.
  * Uses types from @cuur/core for full type safety.
+ *
+ * Defaults to the shared pooled client, so every instance reuses the
+ * keep-alive connection pool for the {domain_name} host.
  */
 
-import {{ ServiceClient }} from "@quub/services/client/service-client.js";
+import {{ sharedServiceClient, type CallOptions, type ServiceCaller }} from "./http-pool.js";
 {type_imports}
 
 export class {domain_pascal}Client {{
-  constructor(private client: ServiceClient) {{}}
+  constructor(private client: ServiceCaller = sharedServiceClient) {{}}
 
 {chr(10).join(methods)}
 }}
@@ -132,6 +137,22 @@ export class {domain_pascal}Client {{
             return operation_id[6:]  # Remove "delete"
         return operation_id
 
+    @staticmethod
+    def positional_parameters(operation_data: Dict[str, Any]) -> List[str]:
+        """
+        Positional parameters of the generated client method, in order, before the trailing
+        `options?: CallOptions` (path parameters, then `params` and `body` when present).
+        """
+        operation = operation_data.get("operation", {})
+        method_http = operation_data.get("method", "GET").upper()
+        parameters = operation.get("parameters", [])
+        names = [p.get("name", "") for p in parameters if p.get("in") == "path"]
+        if any(p.get("in") == "query" for p in parameters):
+            names.append("params")
+        if operation.get("requestBody") and method_http in ["POST", "PUT", "PATCH"]:
+            names.append("body")
+        return names
+
     @staticmethod
     def _build_method(
         context: GenerationContext,
@@ -209,6 +230,9 @@ export class {domain_pascal}Client {{
         if request_body and method_http in ["POST", "PUT", "PATCH"]:
             params.append(f"body: {request_type}")
 
+        # Per-call overrides (timeout, abort signal, headers)
+        params.append("options?: CallOptions")
+
         # Build method body
         method_params_str = ", ".join(params)
 
@@ -225,6 +249,10 @@ export class {domain_pascal}Client {{
         if request_body and method_http in ["POST", "PUT", "PATCH"]:
             service_call += '\n      body,'
 
+        if query_params:
+            service_call += '\n      query: params,'
+
+        service_call += '\n      ...options,'
         service_call += '\n    });'
 
         method = f"""  /**
@@ -235,3 +263,240 @@ export class {domain_pascal}Client {{
   }}"""
 
         return method
+
+    @staticmethod
+    def build_http_pool_module(
+        header: str,
+        registry: CoreDomainRegistry,
+        core_domains: List[str],
+    ) -> str:
+        """
+        Build the shared HTTP pool module (http-pool.ts) for an orchestrator domain.
+
+        One undici Pool is kept per target origin and reused by every service client,
+        so keep-alive sockets survive across requests. Pool size, keep-alive timeout,
+        pipelining and the default per-call timeout come from coreDomainRegistry
+        (connectionPool defaults, connectionPools per-domain overrides).
+
+        Args:
+            header: File header comment
+            registry: Core domain registry from the orchestrator domains config
+            core_domains: Core domains called by this orchestrator domain
+
+        Returns:
+            Generated TypeScript code
+        """
+        origins = []
+        pool_settings = []
+        for core_domain_name in sorted(set(core_domains)):
+            port = registry.ports.get(core_domain_name)
+            if port:
+                origins.append(f'  {json.dumps(core_domain_name)}: "{registry.base_url}:{port}",')
+            pool = registry.get_connection_pool(core_domain_name)
+            pool_settings.append(f"""  {json.dumps(core_domain_name)}: {{
+    connections: {pool.connections},
+    keepAliveTimeoutMs: {pool.keep_alive_timeout_ms},
+    pipelining: {pool.pipelining},
+    requestTimeoutMs: {pool.request_timeout_ms},
+  }},""")
+
+        default_pool = registry.connection_pool
+        return f"""{header}
+
+/**
+ * Shared HTTP connection pools for core domain service clients.
+ *
+ * One undici Pool per target origin, created lazily and reused for the
+ * lifetime of the process so TCP/TLS setup is paid once per socket.
+ */
+
+import {{ Pool }} from "undici";
+
+export interface PoolSettings {{
+  /** Max sockets per origin */
+  connections: number;
+  /** Idle socket lifetime in milliseconds */
+  keepAliveTimeoutMs: number;
+  /** Requests in flight per socket (1 disables pipelining) */
+  pipelining: number;
+  /** Default per-call timeout in milliseconds */
+  requestTimeoutMs: number;
+}}
+
+export interface CallOptions {{
+  method?: string;
+  body?: unknown;
+  query?: object;
+  headers?: Record<string, string>;
+  /** Overrides the domain's requestTimeoutMs */
+  timeoutMs?: number;
+  signal?: AbortSignal;
+}}
+
+/**
+ * Minimal contract implemented by service clients (pooled or test doubles)
+ */
+export interface ServiceCaller {{
+  call<T>(domain: string, path: string, options?: CallOptions): Promise<T>;
+}}
+
+export interface PoolStats {{
+  domain: string;
+  origin: string;
+  connected: number;
+  free: number;
+  pending: number;
+  queued: number;
+  running: number;
+  size: number;
+}}
+
+export class ServiceCallError extends Error {{
+  constructor(
+    public readonly domain: string,
+    public readonly status: number,
+    public readonly body: string
+  ) {{
+    super(`${{domain}} service responded with ${{status}}`);
+    this.name = "ServiceCallError";
+  }}
+}}
+
+const DEFAULT_POOL_SETTINGS: PoolSettings = {{
+  connections: {default_pool.connections},
+  keepAliveTimeoutMs: {default_pool.keep_alive_timeout_ms},
+  pipelining: {default_pool.pipelining},
+  requestTimeoutMs: {default_pool.request_timeout_ms},
+}};
+
+const POOL_SETTINGS: Record<string, PoolSettings> = {{
+{chr(10).join(pool_settings)}
+}};
+
+const SERVICE_ORIGINS: Record<string, string> = {{
+{chr(10).join(origins)}
+}};
+
+const pools = new Map<string, {{ domain: string; pool: Pool }}>();
+const poolsByDomain = new Map<string, Pool>();
+
+/**
+ * Resolve the origin for a core domain ({{DOMAIN}}_SERVICE_URL overrides the registry)
+ */
+export function resolveOrigin(domain: string): string {{
+  const envKey = `${{domain.replace(/-/g, "_").toUpperCase()}}_SERVICE_URL`;
+  const origin = process.env[envKey] ?? SERVICE_ORIGINS[domain];
+  if (!origin) {{
+    throw new Error(`No service URL configured for core domain: ${{domain}} (set ${{envKey}})`);
+  }}
+  return new URL(origin).origin;
+}}
+
+export function poolSettingsFor(domain: string): PoolSettings {{
+  return POOL_SETTINGS[domain] ?? DEFAULT_POOL_SETTINGS;
+}}
+
+/**
+ * Get (or lazily create) the pool for a core domain's origin
+ */
+export function getPool(domain: string): Pool {{
+  const cached = poolsByDomain.get(domain);
+  if (cached) {{
+    return cached;
+  }}
+  const origin = resolveOrigin(domain);
+  const existing = pools.get(origin);
+  if (existing) {{
+    poolsByDomain.set(domain, existing.pool);
+    return existing.pool;
+  }}
+  const settings = poolSettingsFor(domain);
+  const pool = new Pool(origin, {{
+    connections: settings.connections,
+    keepAliveTimeout: settings.keepAliveTimeoutMs,
+    pipelining: settings.pipelining,
+  }});
+  pools.set(origin, {{ domain, pool }});
+  poolsByDomain.set(domain, pool);
+  return pool;
+}}
+
+function withQuery(path: string, query?: object): string {{
+  if (!query) {{
+    return path;
+  }}
+  const search = new URLSearchParams();
+  for (const [key, value] of Object.entries(query)) {{
+    if (value === undefined || value === null) {{
+      continue;
+    }}
+    for (const item of Array.isArray(value) ? value : [value]) {{
+      search.append(key, String(item));
+    }}
+  }}
+  const qs = search.toString();
+  return qs ? `${{path}}${{path.includes("?") ? "&" : "?"}}${{qs}}` : path;
+}}
+
+/**
+ * Service client backed by the shared per-origin pools
+ */
+export class PooledServiceClient implements ServiceCaller {{
+  async call<T>(domain: string, path: string, options: CallOptions = {{}}): Promise<T> {{
+    const pool = getPool(domain);
+    const timeoutMs = options.timeoutMs ?? poolSettingsFor(domain).requestTimeoutMs;
+    const timeoutSignal = AbortSignal.timeout(timeoutMs);
+    const signal = options.signal ? AbortSignal.any([options.signal, timeoutSignal]) : timeoutSignal;
+    const hasBody = options.body !== undefined;
+
+    const {{ statusCode, body }} = await pool.request({{
+      path: withQuery(path, options.query),
+      method: (options.method ?? "GET") as "GET",
+      headers: {{
+        accept: "application/json",
+        ...(hasBody ? {{ "content-type": "application/json" }} : {{}}),
+        ...options.headers,
+      }},
+      body: hasBody ? JSON.stringify(options.body) : undefined,
+      headersTimeout: timeoutMs,
+      bodyTimeout: timeoutMs,
+      signal,
+    }});
+
+    // Always consume the body so the socket returns to the pool
+    const text = await body.text();
+    if (statusCode >= 400) {{
+      throw new ServiceCallError(domain, statusCode, text);
+    }}
+    return (text ? JSON.parse(text) : undefined) as T;
+  }}
+}}
+
+export const sharedServiceClient = new PooledServiceClient();
+
+/**
+ * Snapshot of every open pool, for metrics endpoints
+ */
+export function getPoolStats(): PoolStats[] {{
+  return [...pools.entries()].map(([origin, {{ domain, pool }}]) => ({{
+    domain,
+    origin,
+    connected: pool.stats.connected,
+    free: pool.stats.free,
+    pending: pool.stats.pending,
+    queued: pool.stats.queued,
+    running: pool.stats.running,
+    size: pool.stats.size,
+  }}));
+}}
+
+/**
+ * Close all pools (graceful shutdown)
+ */
+export async function closePools(): Promise<void> {{
+  const open = [...pools.values()];
+  pools.clear();
+  poolsByDomain.clear();
+  await Promise.all(open.map(({{ pool }}) => pool.close()));
+}}
+"""
@@ -1,120 +1,601 @@
 """
-WebSocket Builder - Builds WebSocket handlers
+WebSocket Builder - Builds WebSocket handlers from the `x-websocket` spec extension
+
+Channels and events are declared at the top level of the orchestrator spec:
+
+    x-websocket:
+      heartbeatIntervalMs: 30000        # ping interval; clients missing a pong are terminated
+      channels:
+        alert-escalation:
+          description: Alert lifecycle updates
+          topicKey: alertId             # optional per-entity topics ({channel}:{orgId}:{alertId})
+          highWaterMark: 1048576        # bytes buffered per socket before the overflow policy applies
+          overflow: coalesce            # drop | coalesce | disconnect
+          pendingOverflow: disconnect   # coalesce only: drop | disconnect once queued frames exceed highWaterMark
+          events:
+            - alert.created
+            - name: alert.escalated
+              coalesceBy: alertId       # coalesce keeps only the latest frame per alertId
+        decision-session:
+          overflow: drop
+          events: [session.started, session.step-completed, session.completed]
 """
 
-from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
 from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.utils.string import camel_case, pascal_case
 
+DEFAULT_HIGH_WATER_MARK = 1024 * 1024
+DEFAULT_OVERFLOW = "drop"
+DEFAULT_HEARTBEAT_INTERVAL_MS = 30000
+OVERFLOW_POLICIES = ("drop", "coalesce", "disconnect")
+DEFAULT_PENDING_OVERFLOW = "disconnect"
+PENDING_OVERFLOW_POLICIES = ("drop", "disconnect")
+
+
+@dataclass
+class WebSocketEvent:
+    """Event published on a channel"""
+    name: str
+    description: Optional[str] = None
+    coalesce_by: Optional[str] = None  # Data field identifying frames that supersede each other
+
+
+@dataclass
+class WebSocketChannel:
+    """Channel declared under x-websocket.channels"""
+    name: str
+    description: str
+    events: List[WebSocketEvent] = field(default_factory=list)
+    topic_key: Optional[str] = None
+    high_water_mark: int = DEFAULT_HIGH_WATER_MARK
+    overflow: str = DEFAULT_OVERFLOW
+    pending_overflow: str = DEFAULT_PENDING_OVERFLOW  # Policy once coalesced frames fill highWaterMark
+
+
+@dataclass
+class WebSocketConfig:
+    """Parsed x-websocket extension"""
+    channels: List[WebSocketChannel] = field(default_factory=list)
+    heartbeat_interval_ms: int = DEFAULT_HEARTBEAT_INTERVAL_MS
+
 
 class WebSocketBuilder:
     """Builder for WebSocket handlers"""
 
-    # Common WebSocket handler patterns
-    WEBSOCKET_PATTERNS = {
-        "market-data": {
-            "name": "MarketDataHandler",
-            "description": "WebSocket handler for real-time market data",
-            "events": ["price_update", "trade_update", "orderbook_update"],
-        },
-        "notifications": {
-            "name": "NotificationsHandler",
-            "description": "WebSocket handler for real-time notifications",
-            "events": ["notification", "alert", "system_message"],
-        },
-    }
-
     @staticmethod
-    def build_handler(
-        context: GenerationContext,
-        handler_name: str,
-        pattern: Dict[str, Any],
-        header: str,
-    ) -> str:
+    def parse_config(spec: Dict[str, Any]) -> WebSocketConfig:
         """
-        Build WebSocket handler.
-
-        Args:
-            context: Generation context
-            handler_name: Name of the handler (e.g., "MarketDataHandler")
-            pattern: Handler pattern definition
-            header: File header comment
+        Parse the x-websocket extension of an orchestrator spec.
 
-        Returns:
-            Generated TypeScript code
+        Raises:
+            ValueError: When a channel declares an unknown overflow or pendingOverflow policy
         """
-        events = pattern.get("events", [])
+        extension = spec.get("x-websocket") or {}
+        config = WebSocketConfig(
+            heartbeat_interval_ms=int(extension.get("heartbeatIntervalMs", DEFAULT_HEARTBEAT_INTERVAL_MS))
+        )
+
+        for channel_name, channel in (extension.get("channels") or {}).items():
+            channel = channel or {}
+            overflow = channel.get("overflow", DEFAULT_OVERFLOW)
+            if overflow not in OVERFLOW_POLICIES:
+                raise ValueError(
+                    f"x-websocket channel '{channel_name}': overflow must be one of "
+                    f"{', '.join(OVERFLOW_POLICIES)} (got '{overflow}')"
+                )
+            pending_overflow = channel.get("pendingOverflow", DEFAULT_PENDING_OVERFLOW)
+            if pending_overflow not in PENDING_OVERFLOW_POLICIES:
+                raise ValueError(
+                    f"x-websocket channel '{channel_name}': pendingOverflow must be one of "
+                    f"{', '.join(PENDING_OVERFLOW_POLICIES)} (got '{pending_overflow}')"
+                )
 
-        # Build event handler methods
-        event_handlers = []
-        for event in events:
-            event_handler = WebSocketBuilder._build_event_handler(event)
-            event_handlers.append(event_handler)
+            events = []
+            for event in channel.get("events", []) or []:
+                if isinstance(event, str):
+                    events.append(WebSocketEvent(name=event))
+                elif isinstance(event, dict) and event.get("name"):
+                    events.append(WebSocketEvent(
+                        name=event["name"],
+                        description=event.get("description"),
+                        coalesce_by=event.get("coalesceBy"),
+                    ))
 
-        # Build class
-        class_content = f"""{header}
+            config.channels.append(WebSocketChannel(
+                name=channel_name,
+                description=channel.get("description") or f"{pascal_case(channel_name)} updates",
+                events=events,
+                topic_key=channel.get("topicKey"),
+                high_water_mark=int(channel.get("highWaterMark", DEFAULT_HIGH_WATER_MARK)),
+                overflow=overflow,
+                pending_overflow=pending_overflow,
+            ))
+
+        return config
+
+    @staticmethod
+    def build_hub(config: WebSocketConfig, header: str) -> str:
+        """Build websocket/hub.ts (subscription index, backpressure policy, heartbeat)"""
+        return f"""{header}
 
 /**
- * {pattern["description"]}
+ * WebSocket Hub
  *
- * Handles WebSocket connections and real-time event streaming.
+ * - Subscriptions are indexed by topic, so a publish only visits that topic's subscribers.
+ * - Each publish serializes its frame once; every subscriber is sent the same Buffer.
+ * - A socket whose bufferedAmount would exceed the channel's highWaterMark is handled by
+ *   the channel's overflow policy: drop the frame, coalesce it (keep the latest frame per
+ *   key and flush once the socket drains) or disconnect the slow consumer.
+ * - Coalesced frames waiting for a socket are bounded by the same highWaterMark; once
+ *   they would exceed it, the channel's pendingOverflow policy (drop or disconnect) applies.
+ * - Every heartbeat interval each socket is pinged; sockets that did not answer the
+ *   previous ping are terminated.
  */
 
-import type {{ SocketStream }} from "@fastify/websocket";
+import type {{ WebSocket }} from "ws";
 
-export class {handler_name} {{
-  private connections: Map<string, SocketStream> = new Map();
+export type OverflowPolicy = "drop" | "coalesce" | "disconnect";
+
+export interface ChannelOptions {{
+  highWaterMark: number;
+  overflow: OverflowPolicy;
+  /** coalesce only: what to do once the queued frames would exceed highWaterMark bytes */
+  pendingOverflow?: "drop" | "disconnect";
+}}
+
+export const HEARTBEAT_INTERVAL_MS = Number(process.env.WS_HEARTBEAT_INTERVAL_MS ?? {config.heartbeat_interval_ms});
+/** How often coalesced frames are retried while a socket is above its high-water mark */
+const FLUSH_INTERVAL_MS = 25;
+const OPEN = 1;
+
+interface Client {{
+  id: string;
+  socket: WebSocket;
+  topics: Set<string>;
+  alive: boolean;
+  /** Coalesced frames waiting for the socket to drain, latest per key */
+  pending: Map<string, Buffer>;
+  /** Total bytes of the frames in pending */
+  pendingBytes: number;
+  pendingHighWaterMark: number;
+  flushTimer: NodeJS.Timeout | null;
+}}
+
+export interface HubStats {{
+  connections: number;
+  topics: number;
+  sent: number;
+  dropped: number;
+  coalesced: number;
+  disconnected: number;
+  heartbeatTimeouts: number;
+}}
+
+export class WebSocketHub {{
+  private readonly clients = new Map<string, Client>();
+  private readonly topics = new Map<string, Set<Client>>();
+  private heartbeat: NodeJS.Timeout | null = null;
+  private readonly counters = {{ sent: 0, dropped: 0, coalesced: 0, disconnected: 0, heartbeatTimeouts: 0 }};
+
+  constructor(private readonly heartbeatIntervalMs: number = HEARTBEAT_INTERVAL_MS) {{}}
 
   /**
-   * Handle new WebSocket connection
+   * Track a socket; it is removed from every topic when it closes or errors
    */
-  handleConnection(connection: SocketStream, connectionId: string): void {{
-    this.connections.set(connectionId, connection);
-    connection.socket.on("close", () => {{
-      this.connections.delete(connectionId);
+  register(id: string, socket: WebSocket): void {{
+    const client: Client = {{
+      id,
+      socket,
+      topics: new Set(),
+      alive: true,
+      pending: new Map(),
+      pendingBytes: 0,
+      pendingHighWaterMark: 0,
+      flushTimer: null,
+    }};
+    this.clients.set(id, client);
+    socket.on("pong", () => {{
+      client.alive = true;
     }});
+    socket.on("close", () => this.remove(client));
+    socket.on("error", () => this.remove(client));
+    this.startHeartbeat();
+  }}
+
+  subscribe(id: string, topic: string): void {{
+    const client = this.clients.get(id);
+    if (!client) {{
+      return;
+    }}
+    client.topics.add(topic);
+    let subscribers = this.topics.get(topic);
+    if (!subscribers) {{
+      subscribers = new Set();
+      this.topics.set(topic, subscribers);
+    }}
+    subscribers.add(client);
+  }}
+
+  unsubscribe(id: string, topic: string): void {{
+    const client = this.clients.get(id);
+    if (!client) {{
+      return;
+    }}
+    client.topics.delete(topic);
+    this.detach(client, topic);
   }}
 
   /**
-   * Broadcast message to all connected clients
+   * Publish an event to the subscribers of one or more topics
+   *
+   * A client subscribed to several of the topics receives the frame once.
+   *
+   * @returns Number of subscribers the frame was sent or queued to
    */
-  broadcast(event: string, data: any): void {{
-    const message = JSON.stringify({{ event, data }});
-    this.connections.forEach((connection) => {{
-      if (connection.socket.readyState === 1) {{ // OPEN
-        connection.socket.send(message);
+  publish(
+    topics: string | string[],
+    event: string,
+    data: unknown,
+    options: ChannelOptions,
+    coalesceKey?: string
+  ): number {{
+    const topicList = Array.isArray(topics) ? topics : [topics];
+    const recipients = new Set<Client>();
+    for (const topic of topicList) {{
+      for (const client of this.topics.get(topic) ?? []) {{
+        recipients.add(client);
       }}
-    }});
+    }}
+    if (recipients.size === 0) {{
+      return 0;
+    }}
+
+    const frame = Buffer.from(JSON.stringify({{ topic: topicList[topicList.length - 1], event, data }}));
+    const key = coalesceKey ?? event;
+    let delivered = 0;
+    for (const client of recipients) {{
+      if (this.deliver(client, frame, options, key)) {{
+        delivered++;
+      }}
+    }}
+    return delivered;
+  }}
+
+  stats(): HubStats {{
+    return {{ connections: this.clients.size, topics: this.topics.size, ...this.counters }};
   }}
 
   /**
-   * Send message to specific connection
+   * Stop the heartbeat and terminate every socket (shutdown hooks, tests)
    */
-  send(connectionId: string, event: string, data: any): void {{
-    const connection = this.connections.get(connectionId);
-    if (connection && connection.socket.readyState === 1) {{
-      const message = JSON.stringify({{ event, data }});
-      connection.socket.send(message);
+  close(): void {{
+    if (this.heartbeat) {{
+      clearInterval(this.heartbeat);
+      this.heartbeat = null;
+    }}
+    for (const client of [...this.clients.values()]) {{
+      client.socket.terminate();
+      this.remove(client);
+    }}
+  }}
+
+  private deliver(client: Client, frame: Buffer, options: ChannelOptions, key: string): boolean {{
+    const {{ socket }} = client;
+    if (socket.readyState !== OPEN) {{
+      return false;
+    }}
+
+    if (client.pending.size === 0 && socket.bufferedAmount + frame.length <= options.highWaterMark) {{
+      socket.send(frame);
+      this.counters.sent++;
+      return true;
+    }}
+
+    switch (options.overflow) {{
+      case "coalesce": {{
+        const previous = client.pending.get(key);
+        const pendingBytes = client.pendingBytes - (previous?.length ?? 0) + frame.length;
+        if (pendingBytes > options.highWaterMark) {{
+          // The queue of distinct keys is full as well: fall back to drop / disconnect
+          if ((options.pendingOverflow ?? "{DEFAULT_PENDING_OVERFLOW}") === "disconnect") {{
+            this.disconnect(client);
+          }} else {{
+            this.counters.dropped++;
+          }}
+          return false;
+        }}
+        if (previous) {{
+          this.counters.coalesced++;
+          client.pending.delete(key); // Re-insert so frames flush in publish order
+        }}
+        client.pending.set(key, frame);
+        client.pendingBytes = pendingBytes;
+        client.pendingHighWaterMark = options.highWaterMark;
+        this.scheduleFlush(client);
+        return true;
+      }}
+      case "disconnect":
+        this.disconnect(client);
+        return false;
+      default:
+        this.counters.dropped++;
+        return false;
+    }}
+  }}
+
+  private disconnect(client: Client): void {{
+    this.counters.disconnected++;
+    client.socket.terminate();
+    this.remove(client);
+  }}
+
+  private scheduleFlush(client: Client): void {{
+    if (client.flushTimer) {{
+      return;
     }}
+    client.flushTimer = setTimeout(() => {{
+      client.flushTimer = null;
+      if (client.socket.readyState !== OPEN) {{
+        client.pending.clear();
+        client.pendingBytes = 0;
+        return;
+      }}
+      for (const [key, frame] of client.pending) {{
+        if (client.socket.bufferedAmount + frame.length > client.pendingHighWaterMark) {{
+          this.scheduleFlush(client);
+          return;
+        }}
+        client.socket.send(frame);
+        client.pending.delete(key);
+        client.pendingBytes -= frame.length;
+        this.counters.sent++;
+      }}
+    }}, FLUSH_INTERVAL_MS);
+  }}
+
+  private startHeartbeat(): void {{
+    if (this.heartbeat || this.heartbeatIntervalMs <= 0) {{
+      return;
+    }}
+    this.heartbeat = setInterval(() => {{
+      for (const client of [...this.clients.values()]) {{
+        if (!client.alive) {{
+          this.counters.heartbeatTimeouts++;
+          client.socket.terminate();
+          this.remove(client);
+          continue;
+        }}
+        client.alive = false;
+        client.socket.ping();
+      }}
+      if (this.clients.size === 0 && this.heartbeat) {{
+        clearInterval(this.heartbeat);
+        this.heartbeat = null;
+      }}
+    }}, this.heartbeatIntervalMs);
+    this.heartbeat.unref();
   }}
 
-{chr(10).join(event_handlers)}
+  private detach(client: Client, topic: string): void {{
+    const subscribers = this.topics.get(topic);
+    if (!subscribers) {{
+      return;
+    }}
+    subscribers.delete(client);
+    if (subscribers.size === 0) {{
+      this.topics.delete(topic);
+    }}
+  }}
+
+  private remove(client: Client): void {{
+    if (this.clients.get(client.id) !== client) {{
+      return;
+    }}
+    this.clients.delete(client.id);
+    for (const topic of client.topics) {{
+      this.detach(client, topic);
+    }}
+    client.topics.clear();
+    client.pending.clear();
+    client.pendingBytes = 0;
+    if (client.flushTimer) {{
+      clearTimeout(client.flushTimer);
+      client.flushTimer = null;
+    }}
+  }}
 }}
+
+/** Hub shared by every channel handler of this orchestrator domain */
+export const hub = new WebSocketHub();
 """
 
-        return class_content.strip()
+    @staticmethod
+    def build_routes(config: WebSocketConfig, header: str) -> str:
+        """Build websocket/index.ts (one upgrade route per channel and the shared handler instances)"""
+        imports = []
+        instances = []
+        routes = []
+        for channel in config.channels:
+            handler_name = f"{pascal_case(channel.name)}Handler"
+            instance_name = f"{camel_case(channel.name)}Handler"
+            imports.append(f'import {{ {handler_name} }} from "./{channel.name}.handler.js";')
+            instances.append(f"export const {instance_name} = new {handler_name}();")
+            routes.append(f"""  fastify.get("/ws/{channel.name}", {{ websocket: true }}, (connection: SocketStream, request: FastifyRequest) => {{
+    const context = authenticate(connection, request);
+    if (context) {{
+      {instance_name}.handleConnection(connection, randomUUID(), context);
+    }}
+  }});""")
+
+        return f"""{header}
+
+/**
+ * WebSocket Routes
+ *
+ * GET /ws/{{channel}} upgrades to a socket for that channel. The RequestContext comes from
+ * the same JWT headers as REST requests; unauthenticated upgrades are closed with 1008.
+ * Flows publish through the exported handler instances, which share the hub.
+ */
+
+import {{ randomUUID }} from "node:crypto";
+import type {{ APIGatewayProxyEvent }} from "aws-lambda";
+import type {{ FastifyInstance, FastifyRequest }} from "fastify";
+import type {{ SocketStream }} from "@fastify/websocket";
+import {{ extractContext, type RequestContext }} from "../context.js";
+{chr(10).join(imports)}
+
+export {{ hub }} from "./hub.js";
+
+{chr(10).join(instances)}
+
+function authenticate(connection: SocketStream, request: FastifyRequest): RequestContext | null {{
+  try {{
+    return extractContext({{ headers: request.headers }} as unknown as APIGatewayProxyEvent);
+  }} catch {{
+    connection.socket.close(1008, "Unauthorized");
+    return null;
+  }}
+}}
+
+/**
+ * Register the channel routes (the instance must have @fastify/websocket registered)
+ */
+export async function registerWebSocketRoutes(fastify: FastifyInstance): Promise<void> {{
+{chr(10).join(routes)}
+}}
+"""
 
     @staticmethod
-    def _build_event_handler(event_name: str) -> str:
-        """Build an event handler method"""
-        method_name = camel_case(event_name)
+    def build_handler(
+        context: GenerationContext,
+        channel: WebSocketChannel,
+        header: str,
+    ) -> str:
+        """
+        Build the handler for one x-websocket channel.
 
-        handler_code = f"""  /**
-   * Handle {event_name} event
+        Args:
+            context: Generation context
+            channel: Channel definition from parse_config()
+            header: File header comment
+
+        Returns:
+            Generated TypeScript code
+        """
+        handler_name = f"{pascal_case(channel.name)}Handler"
+        options_name = f"{camel_case(channel.name)}Channel"
+        event_type = f"{pascal_case(channel.name)}Event"
+        event_union = " | ".join(f'"{event.name}"' for event in channel.events) or "never"
+
+        topic_doc = (
+            f"`{channel.name}:{{orgId}}` (all events) and `{channel.name}:{{orgId}}:{{{channel.topic_key}}}`"
+            if channel.topic_key else f"`{channel.name}:{{orgId}}`"
+        )
+
+        publish_methods = []
+        for event in channel.events:
+            method_name = f"publish{pascal_case(event.name.replace('.', '_').replace('-', '_'))}"
+            description = event.description or f"Publish {event.name}"
+            if event.coalesce_by:
+                coalesce_arg = f'`{event.name}:${{String((data as Record<string, unknown>)?.["{event.coalesce_by}"] ?? "")}}`'
+            else:
+                coalesce_arg = f'"{event.name}"'
+            publish_methods.append(f"""  /**
+   * {description}
    */
-  handle{method_name.capitalize()}(connectionId: string, data: any): void {{
-    // Process {event_name} event
-    this.send(connectionId, "{event_name}", data);
-  }}"""
+  {method_name}(orgId: string, data: unknown{", key?: string" if channel.topic_key else ""}): number {{
+    return this.publish(orgId, "{event.name}", data, {coalesce_arg}{", key" if channel.topic_key else ""});
+  }}""")
+
+        if channel.topic_key:
+            publish_body = f"""    const topics = key ? [this.topic(orgId), this.topic(orgId, key)] : this.topic(orgId);
+    return this.hub.publish(topics, event, data, {options_name}, coalesceKey);"""
+            message_handling = f"""    // Clients narrow the stream with {{ "action": "subscribe" | "unsubscribe", "{channel.topic_key}": "..." }}
+    socket.on("message", (raw) => {{
+      let message: {{ action?: string; {channel.topic_key}?: string }};
+      try {{
+        message = JSON.parse(raw.toString());
+      }} catch {{
+        return;
+      }}
+      const key = message.{channel.topic_key};
+      if (typeof key !== "string" || key.length === 0) {{
+        return;
+      }}
+      if (message.action === "subscribe") {{
+        this.hub.subscribe(connectionId, this.topic(context.orgId, key));
+      }} else if (message.action === "unsubscribe") {{
+        this.hub.unsubscribe(connectionId, this.topic(context.orgId, key));
+      }}
+    }});"""
+            subscribe_default = """    if (subscribeAll) {
+      this.hub.subscribe(connectionId, this.topic(context.orgId));
+    }"""
+            connection_params = "connection: SocketStream, connectionId: string, context: RequestContext, subscribeAll = true"
+        else:
+            publish_body = f"""    return this.hub.publish(this.topic(orgId), event, data, {options_name}, coalesceKey);"""
+            message_handling = ""
+            subscribe_default = "    this.hub.subscribe(connectionId, this.topic(context.orgId));"
+            connection_params = "connection: SocketStream, connectionId: string, context: RequestContext"
+
+        topic_signature = "orgId: string, key?: string" if channel.topic_key else "orgId: string"
+        topic_body = (
+            f"return key ? `{channel.name}:${{orgId}}:${{key}}` : `{channel.name}:${{orgId}}`;"
+            if channel.topic_key else f"return `{channel.name}:${{orgId}}`;"
+        )
+        publish_signature = (
+            f"orgId: string, event: {event_type}, data: unknown, coalesceKey: string, key?: string"
+            if channel.topic_key else f"orgId: string, event: {event_type}, data: unknown, coalesceKey: string"
+        )
+
+        pending_doc = f" ({channel.pending_overflow} once coalesced frames fill it)" if channel.overflow == "coalesce" else ""
+        pending_option = f'\n  pendingOverflow: "{channel.pending_overflow}",' if channel.overflow == "coalesce" else ""
+
+        connection_body = f"""    const {{ socket }} = connection;
+    this.hub.register(connectionId, socket);
+{message_handling + chr(10) if message_handling else ""}{subscribe_default}"""
+
+        return f"""{header}
+
+/**
+ * {channel.description}
+ *
+ * Topics: {topic_doc}. orgId always comes from the
+ * authenticated RequestContext, never from client messages.
+ * Overflow policy: {channel.overflow} above {channel.high_water_mark} buffered bytes{pending_doc}.
+ */
 
-        return handler_code
+import type {{ SocketStream }} from "@fastify/websocket";
+import type {{ RequestContext }} from "../context.js";
+import {{ hub as sharedHub, type ChannelOptions, type WebSocketHub }} from "./hub.js";
+
+export type {event_type} = {event_union};
+
+export const {options_name}: ChannelOptions = {{
+  highWaterMark: {channel.high_water_mark},
+  overflow: "{channel.overflow}",{pending_option}
+}};
+
+export class {handler_name} {{
+  constructor(private readonly hub: WebSocketHub = sharedHub) {{}}
+
+  topic({topic_signature}): string {{
+    {topic_body}
+  }}
+
+  /**
+   * Handle new WebSocket connection
+   */
+  handleConnection({connection_params}): void {{
+{connection_body}
+  }}
+
+{chr(10).join(chr(10).join([m, ""]) for m in publish_methods).rstrip()}
+
+  private publish({publish_signature}): number {{
+{publish_body}
+  }}
+}}
+"""
@@ -12,7 +12,7 @@ import json
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -29,6 +29,9 @@ class AggregatorCall:
     domain: str
     operation: str
     params: Optional[Dict[str, any]] = None
+    timeout_ms: int = 5000  # Per-attempt timeout (AbortSignal.timeout)
+    retries: int = 0  # Additional attempts with jittered exponential backoff
+    required: bool = True  # Required sources fail the aggregate; optional ones degrade to errors[]
 
 
 @dataclass
@@ -58,11 +61,63 @@ class OrchestratorDomainConfig:
     aggregators: List[AggregatorConfig]
     business_types: Optional[Dict[str, any]] = None
 
+@dataclass
+class ConnectionPoolConfig:
+    """HTTP connection pool settings for calls to a core domain service"""
+    connections: int = 10  # Max sockets per target host
+    keep_alive_timeout_ms: int = 4000  # Idle socket lifetime
+    pipelining: int = 1  # Requests in flight per socket (1 = no pipelining)
+    request_timeout_ms: int = 10000  # Default per-call timeout
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], base: Optional["ConnectionPoolConfig"] = None) -> "ConnectionPoolConfig":
+        """Parse pool settings, falling back to base (or defaults) for missing keys"""
+        base = base or cls()
+        return cls(
+            connections=data.get("connections", base.connections),
+            keep_alive_timeout_ms=data.get("keepAliveTimeoutMs", data.get("keep_alive_timeout_ms", base.keep_alive_timeout_ms)),
+            pipelining=data.get("pipelining", base.pipelining),
+            request_timeout_ms=data.get("requestTimeoutMs", data.get("request_timeout_ms", base.request_timeout_ms)),
+        )
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Circuit breaker and bulkhead settings for calls into a core domain"""
+    failure_threshold: int = 5  # Consecutive failures before the circuit opens
+    half_open_after_ms: int = 30000  # Wait before letting a single probe call through
+    max_concurrency: int = 50  # Bulkhead: calls in flight at once
+    max_queue: int = 100  # Bulkhead: calls waiting for a slot before being rejected
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], base: Optional["CircuitBreakerConfig"] = None) -> "CircuitBreakerConfig":
+        """Parse breaker settings, falling back to base (or defaults) for missing keys"""
+        base = base or cls()
+        return cls(
+            failure_threshold=data.get("failureThreshold", data.get("failure_threshold", base.failure_threshold)),
+            half_open_after_ms=data.get("halfOpenAfterMs", data.get("half_open_after_ms", base.half_open_after_ms)),
+            max_concurrency=data.get("maxConcurrency", data.get("max_concurrency", base.max_concurrency)),
+            max_queue=data.get("maxQueue", data.get("max_queue", base.max_queue)),
+        )
+
+
 @dataclass
 class CoreDomainRegistry:
     """Registry of core domain service URLs"""
     base_url: str
     ports: Dict[str, int]
+    connection_pool: ConnectionPoolConfig = field(default_factory=ConnectionPoolConfig)
+    connection_pools: Dict[str, ConnectionPoolConfig] = field(default_factory=dict)
+    circuit_breaker: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
+    circuit_breakers: Dict[str, CircuitBreakerConfig] = field(default_factory=dict)
+
+    def get_connection_pool(self, core_domain_name: str) -> ConnectionPoolConfig:
+        """Get pool settings for a core domain (per-domain override or registry default)"""
+        return self.connection_pools.get(core_domain_name, self.connection_pool)
+
+    def get_circuit_breaker(self, core_domain_name: str) -> CircuitBreakerConfig:
+        """Get breaker/bulkhead settings for a core domain (per-domain override or registry default)"""
+        return self.circuit_breakers.get(core_domain_name, self.circuit_breaker)
 
 
 @dataclass
@@ -146,7 +201,10 @@ class OrchestratorDomainConfigReader:
                         core_domain_calls.append(AggregatorCall(
                             domain=call_data["domain"],
                             operation=call_data["operation"],
-                            params=call_data.get("params")
+                            params=call_data.get("params"),
+                            timeout_ms=call_data.get("timeoutMs", call_data.get("timeout_ms", 5000)),
+                            retries=call_data.get("retries", 0),
+                            required=call_data.get("required", True)
                         ))
                     aggregators.append(AggregatorConfig(
                         name=agg_data["name"],
@@ -165,9 +223,21 @@ class OrchestratorDomainConfigReader:
 
         # Parse coreDomainRegistry - optional, defaults provided
         registry_data = data.get("coreDomainRegistry", {})
+        default_pool = ConnectionPoolConfig.from_dict(registry_data.get("connectionPool", {}))
+        default_breaker = CircuitBreakerConfig.from_dict(registry_data.get("circuitBreaker", {}))
         registry = CoreDomainRegistry(
             base_url=registry_data.get("baseUrl") or registry_data.get("base_url", "http://localhost"),
-            ports=registry_data.get("ports", {})
+            ports=registry_data.get("ports", {}),
+            connection_pool=default_pool,
+            connection_pools={
+                name: ConnectionPoolConfig.from_dict(pool_data or {}, default_pool)
+                for name, pool_data in registry_data.get("connectionPools", {}).items()
+            },
+            circuit_breaker=default_breaker,
+            circuit_breakers={
+                name: CircuitBreakerConfig.from_dict(breaker_data or {}, default_breaker)
+                for name, breaker_data in registry_data.get("circuitBreakers", {}).items()
+            }
         )
 
         self._config = OrchestratorDomainsConfig(
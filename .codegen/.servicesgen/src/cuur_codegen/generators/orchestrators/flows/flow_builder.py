@@ -135,6 +135,68 @@ class FlowBuilder:
 
         return files
 
+    @staticmethod
+    def _wrap_transaction_groups(steps_code: List[str], backend_blocks: List[Dict[str, Any]]) -> List[str]:
+        """
+        Wrap contiguous backend calls tagged with the same `transaction: <group>` in a single
+        `deps.transactionManager.run(...)` call.
+
+        The grouped handlers receive repositories bound to the transaction client
+        (`deps.withTransaction(tx)`), so their writes share one commit (one WAL flush) and roll
+        back together. A group is only wrapped when it holds at least two steps, one of them a
+        write - a lone statement is already atomic and the extra BEGIN/COMMIT would cost a round trip.
+        Steps that split a group (an untagged step sorted in between) end it; the next run of the
+        same group commits separately and is flagged in a comment.
+        """
+        runs: List[List[Dict[str, Any]]] = []
+        for block in backend_blocks:
+            group = block["transaction"]
+            if not group:
+                continue
+            previous = runs[-1] if runs else None
+            if previous and previous[-1]["transaction"] == group and previous[-1]["end"] == block["start"]:
+                previous.append(block)
+            else:
+                runs.append([block])
+
+        # A group that reappears after an untagged step commits once per contiguous run
+        groups_seen: Set[str] = set()
+        split_runs: Set[int] = set()
+        for index, run in enumerate(runs):
+            group = run[0]["transaction"]
+            if group in groups_seen:
+                split_runs.add(index)
+            groups_seen.add(group)
+
+        wrapped = list(steps_code)
+        # Rewrite from the bottom so earlier line ranges stay valid
+        for index in reversed(range(len(runs))):
+            run = runs[index]
+            group = run[0]["transaction"]
+            start, end = run[0]["start"], run[-1]["end"]
+            if len(run) >= 2 and any(block["is_write"] for block in run):
+                var_names = [block["var_name"] for block in run]
+                body = [
+                    "  " + re.sub(r"\(deps\.", "(txDeps.", line) if line else line
+                    for line in steps_code[start:end]
+                ]
+                first_step, last_step = run[0]["step_number"], run[-1]["step_number"]
+                wrapped[start:end] = [
+                    f'    // Transaction "{group}": steps {first_step}-{last_step} commit atomically',
+                    f"    const {{ {', '.join(var_names)} }} = await deps.transactionManager.run(async (tx) => {{",
+                    "      const txDeps = deps.withTransaction(tx);",
+                    *body,
+                    f"      return {{ {', '.join(var_names)} }};",
+                    "    });",
+                ]
+            if index in split_runs:
+                wrapped.insert(
+                    start,
+                    f'    // Note: transaction "{group}" is split by an untagged step - this part commits separately',
+                )
+
+        return wrapped
+
     @staticmethod
     def build_flow_content(domain_name: str, operation_id: str, flow_steps: List[Dict], operation: Dict, project_root: Path) -> str:
         """Generate flow file content"""
@@ -218,6 +280,7 @@ class FlowBuilder:
         validation_code: List[str] = []  # Collect validation code
         validated_vars: Dict[str, str] = {}  # Map original vars to validated vars (body -> validatedBody)
         step_results: Dict[str, str] = {}  # Map step_id -> variable_name for passing results
+        backend_blocks: List[Dict[str, Any]] = []  # steps_code ranges of backend calls (for transaction groups)
 
         # Process steps in topological order
         step_number = 0
@@ -251,6 +314,7 @@ class FlowBuilder:
                     else:
                         steps_code.append("    const result = {};")
             elif step_kind == "backend-call":
+                block_start = len(steps_code)
                 service = step.get("service", "")
                 operation_id_call = step.get("operationId", "")
                 handler_field = step.get("handler", "")
@@ -435,6 +499,18 @@ class FlowBuilder:
                 steps_code.append(call_code)
                 result_vars.append(var_name)
 
+                backend_blocks.append({
+                    "start": block_start,
+                    "end": len(steps_code),
+                    "transaction": step.get("transaction"),
+                    "var_name": var_name,
+                    "step_number": config_step_number,
+                    "is_write": HandlerMapper.is_write_operation(verb, method),
+                })
+
+        # Wrap contiguous steps sharing a `transaction` group in one interactive transaction
+        steps_code = FlowBuilder._wrap_transaction_groups(steps_code, backend_blocks)
+
         # Build return statement
         if "composeResponse" in [s.get("stepId") for s in flow_steps]:
             return_code = "    return result;"
@@ -154,3 +154,11 @@ class HandlerMapper:
             "needs_params": needs_params,
             "needs_body": needs_body,
         }
+
+    @staticmethod
+    def is_write_operation(verb: str, method: str) -> bool:
+        """Whether a handler call writes to the database (create/update/delete or a mutating method)"""
+        return (
+            method.upper() in ["POST", "PUT", "PATCH", "DELETE"]
+            or verb.lower() in ["create", "update", "delete", "cancel", "patch"]
+        )
@@ -12,6 +12,11 @@ import yaml
 from cuur_codegen.base.generator_bases import FileGenerator
 from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.utils.file import ensure_directory, write_file
+from cuur_codegen.utils.orchestrators import (
+    build_graphql_schema,
+    build_graphql_resolvers,
+    build_websocket_handlers,
+)
 
 from .builders import (
     ContextBuilder,
@@ -20,6 +25,7 @@ from .builders import (
     HandlerBuilder,
     RoutesBuilder,
     DepsBuilder,
+    CircuitBreakerBuilder,
     ConfigBuilder,
     PackageJsonBuilder,
 )
@@ -115,8 +121,19 @@ class OrchestratorFlowGenerator(FileGenerator):
         write_file(logger_file, LoggerBuilder.build_logger(domain_name))
         files.append(logger_file)
 
+        # Generate graphql/ (schema, limits, per-request context, resolvers, server) when the spec has queries
+        graphql_files = build_graphql_schema(context, domain_output_dir, context.logger)
+        if graphql_files:
+            graphql_files.extend(build_graphql_resolvers(context, domain_output_dir, context.logger))
+        files.extend(graphql_files)
+
+        # Generate websocket/ (hub, channel handlers, routes) when the spec declares x-websocket channels
+        files.extend(build_websocket_handlers(context, domain_output_dir, context.logger))
+
         # Generate handler.ts
-        handler_file = HandlerBuilder.generate_handler(domain_output_dir, domain_name, spec)
+        handler_file = HandlerBuilder.generate_handler(
+            domain_output_dir, domain_name, spec, graphql=bool(graphql_files)
+        )
         if handler_file:
             files.append(handler_file)
 
@@ -125,6 +142,16 @@ class OrchestratorFlowGenerator(FileGenerator):
         if routes_file:
             files.append(routes_file)
 
+        # Generate routes.bench.ts (dispatch micro-benchmarks)
+        routes_bench_file = RoutesBuilder.generate_routes_bench(domain_output_dir, domain_name, spec)
+        if routes_bench_file:
+            files.append(routes_bench_file)
+
+        # Generate circuit-breaker.ts (per core domain breaker + bulkhead, used by deps.ts)
+        breaker_file = CircuitBreakerBuilder.generate_circuit_breaker(domain_output_dir, domain_name, project_root)
+        if breaker_file:
+            files.append(breaker_file)
+
         # Generate deps.ts
         deps_file = DepsBuilder.generate_deps(domain_output_dir, domain_name, spec, project_root)
         if deps_file:
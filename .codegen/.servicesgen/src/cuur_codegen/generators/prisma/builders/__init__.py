@@ -5,9 +5,20 @@ Prisma Schema Builders
 from .schema_builder import PrismaSchemaBuilder
 from .model_builder import PrismaModelBuilder
 from .type_converter import PrismaTypeConverter
+from .partial_index_builder import PartialIndexBuilder, PartialIndex
+from .partition_builder import PartitionBuilder, PartitionConfig, PartitionedTable
+from .row_width_builder import RowWidthBuilder, ModelWidth, ColumnWidth
 
 __all__ = [
     "PrismaSchemaBuilder",
     "PrismaModelBuilder",
-    "PrismaTypeConverter"
+    "PrismaTypeConverter",
+    "PartialIndexBuilder",
+    "PartialIndex",
+    "PartitionBuilder",
+    "PartitionConfig",
+    "PartitionedTable",
+    "RowWidthBuilder",
+    "ModelWidth",
+    "ColumnWidth",
 ]
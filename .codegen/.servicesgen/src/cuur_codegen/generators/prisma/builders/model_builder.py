@@ -2,10 +2,13 @@
 Prisma Model Builder - Builds Prisma model definitions from OpenAPI schemas
 """
 
-from typing import Dict, Any, List, Optional, Set
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Set, Tuple
 from cuur_codegen.core.context import GenerationContext
-from cuur_codegen.utils.openapi import extract_schemas
+from cuur_codegen.utils.openapi import extract_schemas, extract_schema_name_from_ref
 from cuur_codegen.utils.string import camel_case, pascal_case, kebab_case
+from .partition_builder import PartitionBuilder
 from .type_converter import PrismaTypeConverter
 
 # Domain prefix mapping (2-letter uppercase codes)
@@ -40,13 +43,43 @@ DOMAIN_PREFIX_MAP = {
 }
 
 
+@dataclass
+class EntityClassification:
+    """Outcome of the usage analysis that decides which component schemas become models"""
+    entities: List[str] = field(default_factory=list)
+    # Schemas the old name heuristic would have turned into models, with the reason they were not
+    dropped: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class PrismaRelation:
+    """A foreign key from a child model to a parent model, with both sides of the Prisma relation"""
+    model: str  # Child Prisma model (holds the FK)
+    fk_field: str  # FK property name on the child (e.g., patientId)
+    target: str  # Parent Prisma model
+    name: str  # Relation name shared by both sides
+    relation_field: str  # Child-side relation field (e.g., patient)
+    back_field: str = ""  # Parent-side list field (e.g., encounters)
+    optional: bool = False
+    on_delete: str = "Restrict"
+    embedded_in_child: bool = False  # Child response schema embeds the parent under relation_field
+    embedded_in_parent: bool = False  # Parent response schema embeds the children under back_field
+
+
 class PrismaModelBuilder:
     """Builds Prisma model definitions"""
 
+    # onDelete actions accepted in x-references
+    ON_DELETE_ACTIONS = ("Cascade", "Restrict", "NoAction", "SetNull", "SetDefault")
+
+    # Last path segment that is a path parameter (e.g., /patients/{id})
+    PATH_PARAM_SEGMENT = re.compile(r"^\{[^}]+\}$")
+
     @staticmethod
     def build_models(
         context: GenerationContext,
-        entity_schemas: Dict[str, Dict[str, Any]]
+        entity_schemas: Dict[str, Dict[str, Any]],
+        entity_filter: Optional[Set[str]] = None
     ) -> List[str]:
         """
         Build Prisma model definitions from entity schemas.
@@ -54,6 +87,7 @@ class PrismaModelBuilder:
         Args:
             context: Generation context
             entity_schemas: Dictionary of entity schema definitions
+            entity_filter: Only build these entities; relations to other models stay scalar FKs
 
         Returns:
             List of Prisma model strings
@@ -69,10 +103,21 @@ class PrismaModelBuilder:
             context.logger.warn(f"Expected dict from extract_schemas, got {type(all_schemas)}")
             return models
 
-        # Find entity schemas (those that are used in responses, not requests)
-        entity_names = PrismaModelBuilder._identify_entity_schemas(
-            context, all_schemas
-        )
+        # Find entity schemas (returned by GET-by-id/list operations, not request-only DTOs)
+        classification = PrismaModelBuilder.classify_entity_schemas(context, all_schemas)
+        entity_names = classification.entities
+        if classification.dropped:
+            context.logger.info(
+                f"Prisma: skipped {len(classification.dropped)} non-entity schemas for {context.domain_name}"
+            )
+            for schema_name, reason in sorted(classification.dropped.items()):
+                context.logger.debug(f"  - {schema_name}: {reason}")
+
+        if entity_filter is not None:
+            entity_names = [name for name in entity_names if name in entity_filter]
+
+        # Resolve foreign keys once for all models (child side and back-relations)
+        relations = PrismaModelBuilder.resolve_relations(context, entity_names, all_schemas)
 
         for entity_name in entity_names:
             # Ensure entity_name is a string
@@ -93,7 +138,7 @@ class PrismaModelBuilder:
             # Build model
             try:
                 model_str = PrismaModelBuilder._build_model(
-                    context, entity_name, schema, all_schemas
+                    context, entity_name, schema, all_schemas, relations
                 )
                 if model_str:
                     models.append(model_str)
@@ -110,55 +155,396 @@ class PrismaModelBuilder:
         schemas: Dict[str, Dict[str, Any]]
     ) -> List[str]:
         """Identify which schemas are entities (not DTOs)"""
-        entity_names: List[str] = []
+        return PrismaModelBuilder.classify_entity_schemas(context, schemas).entities
+
+    @staticmethod
+    def classify_entity_schemas(
+        context: GenerationContext,
+        schemas: Dict[str, Dict[str, Any]]
+    ) -> EntityClassification:
+        """
+        Classify component schemas into entities and DTOs by how the spec uses them.
+
+        A schema is an entity when a GET-by-id or list operation returns it and it carries
+        an `id` property. Schemas only reached through a requestBody are DTOs. An explicit
+        `x-entity: true|false` on the schema overrides either decision.
+        """
+        classification = EntityClassification()
 
-        # Ensure schemas is a dict
         if not isinstance(schemas, dict):
             context.logger.warn(f"Expected dict for schemas, got {type(schemas)}")
-            return entity_names
+            return classification
+
+        spec = context.spec if isinstance(context.spec, dict) else {}
+        returned: Set[str] = set()
+        returned_without_id: Set[str] = set()
+        request_only: Set[str] = set()
+        response_refs: Set[str] = set()
+
+        for path, path_item in (spec.get("paths") or {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            segments = [segment for segment in str(path).split("/") if segment]
+            is_get_by_id = bool(segments) and bool(PrismaModelBuilder.PATH_PARAM_SEGMENT.match(segments[-1]))
+
+            for method, operation in path_item.items():
+                if not isinstance(operation, dict):
+                    continue
+
+                body_schema = (
+                    (operation.get("requestBody") or {}).get("content", {}).get("application/json", {}).get("schema")
+                )
+                if body_schema:
+                    request_only |= PrismaModelBuilder._referenced_schemas(body_schema, schemas)
+
+                for response in (operation.get("responses") or {}).values():
+                    response_schema = (
+                        (response or {}).get("content", {}).get("application/json", {}).get("schema")
+                        if isinstance(response, dict) else None
+                    )
+                    if not response_schema:
+                        continue
+                    response_refs |= PrismaModelBuilder._referenced_schemas(response_schema, schemas)
+
+                    if method.lower() != "get":
+                        continue
+                    for name, in_array, has_id in PrismaModelBuilder._returned_schemas(
+                        response_schema, schemas, in_array=False, visited=set()
+                    ):
+                        # GET-by-id returns the entity itself, list operations return it in an array
+                        if not (is_get_by_id or in_array):
+                            continue
+                        if has_id:
+                            returned.add(name)
+                        else:
+                            returned_without_id.add(name)
+
+        request_only -= response_refs
 
-        # Look for schemas that are used in GET/POST responses
-        # and don't end with "Request" or "Response"
         for schema_name, schema in schemas.items():
-            # Ensure schema_name is a string (not a list or other type)
-            if not isinstance(schema_name, str):
-                context.logger.debug(f"Skipping non-string schema name: {type(schema_name)} = {schema_name}")
+            if not isinstance(schema_name, str) or not schema_name or not isinstance(schema, dict):
                 continue
 
-            # Skip empty names
-            if not schema_name:
+            override = schema.get("x-entity")
+            if override is True:
+                classification.entities.append(schema_name)
+                continue
+            if schema_name in returned and override is not False:
+                classification.entities.append(schema_name)
                 continue
 
-            # Skip request/response wrappers
-            if schema_name.endswith("Request") or schema_name.endswith("Response"):
+            # Only report schemas the name heuristic used to turn into models
+            if not PrismaModelBuilder._was_model_candidate(schema_name, schema):
                 continue
-            if schema_name.endswith("Envelope") or schema_name.endswith("Params"):
+            if override is False:
+                reason = "x-entity: false"
+            elif schema_name in request_only:
+                reason = "only used as a request body (DTO)"
+            elif schema_name in returned_without_id:
+                reason = "returned by a GET operation but has no id property"
+            else:
+                reason = "not returned by a GET-by-id or list operation"
+            classification.dropped[schema_name] = reason
+
+        classification.entities.sort()
+        return classification
+
+    @staticmethod
+    def resolve_relations(
+        context: GenerationContext,
+        entity_names: List[str],
+        schemas: Dict[str, Dict[str, Any]]
+    ) -> List[PrismaRelation]:
+        """
+        Resolve `*Id` properties of entity models to relations between generated models.
+
+        The target is taken from `x-references` on the property (`Patient` or
+        `{ model: Patient, onDelete: Cascade }`), otherwise from the naming rules: the field stem
+        names an entity (`patientId` -> Patient), or exactly one entity ends with it
+        (`armId` -> ExperimentArm). FKs to models outside the domain stay scalar columns, and so do
+        FKs to `x-partition` models: their primary key is (id, partition key), so no foreign key
+        can reference them by id alone.
+        """
+        # Name index built once: lowercase entity name -> entity name
+        entity_index = {name.lower(): name for name in entity_names}
+        partitioned = {
+            pascal_case(name) for name in entity_names if PartitionBuilder.extract_config(name, context.spec)
+        }
+        relations: List[PrismaRelation] = []
+
+        for entity_name in entity_names:
+            schema = schemas.get(entity_name)
+            if not isinstance(schema, dict):
                 continue
+            properties, required = PrismaModelBuilder.merge_properties(schema, schemas)
+            model = pascal_case(entity_name)
+
+            for prop_name, prop_schema in properties.items():
+                if not isinstance(prop_name, str) or not isinstance(prop_schema, dict):
+                    continue
+                if prop_name in ("orgId", "org_id") or not prop_name.endswith(("Id", "_id")):
+                    continue
+
+                target, on_delete = PrismaModelBuilder._relation_target(
+                    context, model, prop_name, prop_schema, entity_index
+                )
+                if not target:
+                    continue
+                if pascal_case(target) in partitioned:
+                    context.logger.debug(f"{model}.{prop_name} -> partitioned {target}: kept as a scalar column")
+                    continue
+
+                optional = not PrismaTypeConverter.is_required(prop_name, prop_schema, required)
+                stem = camel_case(prop_name[:-3] if prop_name.endswith("_id") else prop_name[:-2])
+                relation_field = stem if stem not in properties else f"{stem}Ref"
+                embedded = PrismaModelBuilder._embeds_entity(properties.get(stem), target, schemas)
+                relations.append(PrismaRelation(
+                    model=model,
+                    fk_field=prop_name,
+                    target=target,
+                    name=f"{model}_{camel_case(prop_name)}",
+                    relation_field=stem if embedded else relation_field,
+                    optional=optional,
+                    on_delete=on_delete or ("SetNull" if optional else "Restrict"),
+                    embedded_in_child=embedded,
+                ))
+
+        # Back-relation list fields on the parent (disambiguated when a child has several FKs to it)
+        for relation in relations:
+            parent_schema = schemas.get(relation.target) or schemas.get(
+                entity_index.get(relation.target.lower(), "")
+            )
+            parent_properties, _ = PrismaModelBuilder.merge_properties(parent_schema or {}, schemas)
+            siblings = [r for r in relations if r.target == relation.target and r.model == relation.model]
+            plural = f"{camel_case(relation.model)}s"
+            # Self-relations and repeated FKs name the list after the FK (ordersByParentOrderId)
+            if len(siblings) == 1 and relation.model != relation.target:
+                back_field = plural
+            else:
+                back_field = f"{plural}By{pascal_case(relation.fk_field)}"
+            embedded = PrismaModelBuilder._embeds_entity(
+                parent_properties.get(back_field), relation.model, schemas, as_list=True
+            )
+            if back_field in parent_properties and not embedded:
+                back_field = f"{back_field}Rel"
+            relation.back_field = back_field
+            relation.embedded_in_parent = embedded
+
+        return relations
+
+    @staticmethod
+    def embedded_includes(context: GenerationContext, entity_name: str) -> List[str]:
+        """Relation fields the entity's response schema embeds (Prisma `include` keys for DAO reads)"""
+        schemas = extract_schemas(context.spec)
+        if not isinstance(schemas, dict):
+            return []
+        entity_names = PrismaModelBuilder.classify_entity_schemas(context, schemas).entities
+        if entity_name not in entity_names:
+            return []
+
+        model = pascal_case(entity_name)
+        includes: List[str] = []
+        for relation in PrismaModelBuilder.resolve_relations(context, entity_names, schemas):
+            if relation.model == model and relation.embedded_in_child:
+                includes.append(relation.relation_field)
+            if relation.target == model and relation.embedded_in_parent:
+                includes.append(relation.back_field)
+        return sorted(set(includes))
+
+    @staticmethod
+    def _relation_target(
+        context: GenerationContext,
+        model: str,
+        prop_name: str,
+        prop_schema: Dict[str, Any],
+        entity_index: Dict[str, str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve (target model, onDelete) for an FK property; (None, None) when unresolved"""
+        references = prop_schema.get("x-references")
+        if references is False:
+            return None, None
+        if references:
+            target_name = references.get("model") if isinstance(references, dict) else references
+            on_delete = references.get("onDelete") if isinstance(references, dict) else None
+            if on_delete and on_delete not in PrismaModelBuilder.ON_DELETE_ACTIONS:
+                context.logger.warn(f"{model}.{prop_name}: unsupported x-references onDelete '{on_delete}'")
+                on_delete = None
+            target = entity_index.get(str(target_name).lower())
+            if not target:
+                context.logger.warn(f"{model}.{prop_name}: x-references target '{target_name}' is not a model")
+                return None, None
+            return pascal_case(target), on_delete
+
+        stem = (prop_name[:-3] if prop_name.endswith("_id") else prop_name[:-2]).replace("_", "").lower()
+        if not stem:
+            return None, None
+        if stem in entity_index:
+            return pascal_case(entity_index[stem]), None
+        suffix_matches = [name for key, name in entity_index.items() if key.endswith(stem)]
+        if len(suffix_matches) == 1:
+            return pascal_case(suffix_matches[0]), None
+        return None, None
 
-            # Check if schema has properties (it's a model, not a primitive)
-            if isinstance(schema, dict) and "properties" in schema:
-                # Ensure we're adding a string, not a list
-                if isinstance(schema_name, str):
-                    entity_names.append(schema_name)
+    @staticmethod
+    def _embeds_entity(
+        prop_schema: Any,
+        target: str,
+        schemas: Dict[str, Dict[str, Any]],
+        as_list: bool = False
+    ) -> bool:
+        """Whether a property embeds the target entity ($ref, or an array of $refs when as_list)"""
+        if not isinstance(prop_schema, dict):
+            return False
+        if as_list:
+            if prop_schema.get("type") != "array":
+                return False
+            prop_schema = prop_schema.get("items") or {}
+        ref = prop_schema.get("$ref")
+        name = extract_schema_name_from_ref(ref) if isinstance(ref, str) else None
+        return bool(name) and pascal_case(name) == target
+
+    @staticmethod
+    def _was_model_candidate(schema_name: str, schema: Dict[str, Any]) -> bool:
+        """Whether the previous name heuristic would have generated a model for the schema"""
+        if schema_name.endswith(("Request", "Response", "Envelope", "Params")):
+            return False
+        return "properties" in schema
+
+    @staticmethod
+    def _referenced_schemas(
+        schema: Any,
+        schemas: Dict[str, Dict[str, Any]],
+        visited: Optional[Set[str]] = None
+    ) -> Set[str]:
+        """Collect every component schema reachable from schema through $ref"""
+        if visited is None:
+            visited = set()
+        if isinstance(schema, list):
+            for item in schema:
+                PrismaModelBuilder._referenced_schemas(item, schemas, visited)
+            return visited
+        if not isinstance(schema, dict):
+            return visited
+
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            name = extract_schema_name_from_ref(ref)
+            if name and name not in visited:
+                visited.add(name)
+                PrismaModelBuilder._referenced_schemas(schemas.get(name), schemas, visited)
+            return visited
+
+        for value in schema.values():
+            if isinstance(value, (dict, list)):
+                PrismaModelBuilder._referenced_schemas(value, schemas, visited)
+        return visited
+
+    @staticmethod
+    def _returned_schemas(
+        schema: Any,
+        schemas: Dict[str, Dict[str, Any]],
+        in_array: bool,
+        visited: Set[str]
+    ) -> List[Tuple[str, bool, bool]]:
+        """
+        Find the resource schemas a response returns.
+
+        Walks $ref, allOf/oneOf/anyOf, properties (e.g. the `data` envelope field) and array
+        items, and stops at the first named schema that carries an `id`. Returns
+        (schema name, returned inside an array, has id) tuples.
+        """
+        found: List[Tuple[str, bool, bool]] = []
+        if not isinstance(schema, dict):
+            return found
+
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            name = extract_schema_name_from_ref(ref)
+            target = schemas.get(name) if name else None
+            if not name or name in visited or not isinstance(target, dict):
+                return found
+            visited = visited | {name}
+            properties, _ = PrismaModelBuilder.merge_properties(target, schemas)
+            if "id" in properties:
+                return [(name, in_array, True)]
+            nested = PrismaModelBuilder._returned_schemas(target, schemas, in_array, visited)
+            if not nested and properties and not PrismaModelBuilder._is_envelope(properties):
+                return [(name, in_array, False)]
+            return nested
+
+        for key in ("allOf", "oneOf", "anyOf"):
+            for sub_schema in schema.get(key) or []:
+                found.extend(PrismaModelBuilder._returned_schemas(sub_schema, schemas, in_array, visited))
+
+        for prop_schema in (schema.get("properties") or {}).values():
+            found.extend(PrismaModelBuilder._returned_schemas(prop_schema, schemas, in_array, visited))
+
+        if isinstance(schema.get("items"), dict):
+            found.extend(PrismaModelBuilder._returned_schemas(schema["items"], schemas, True, visited))
+
+        return found
 
-        # Sort and return only strings
-        return sorted([name for name in entity_names if isinstance(name, str)])
+    @staticmethod
+    def _is_envelope(properties: Dict[str, Any]) -> bool:
+        """Response wrappers (data/meta/pagination) are not resources themselves"""
+        return bool(set(properties) & {"data", "items", "meta", "pagination"})
+
+    @staticmethod
+    def merge_properties(
+        schema: Dict[str, Any],
+        schemas: Dict[str, Dict[str, Any]],
+        visited: Optional[Set[str]] = None
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Merge properties and required fields across $ref and allOf (e.g. allOf: [Timestamps, {...}])"""
+        if visited is None:
+            visited = set()
+        properties: Dict[str, Any] = {}
+        required: List[str] = []
+        if not isinstance(schema, dict):
+            return properties, required
+
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            name = extract_schema_name_from_ref(ref)
+            if not name or name in visited:
+                return properties, required
+            return PrismaModelBuilder.merge_properties(schemas.get(name), schemas, visited | {name})
+
+        for sub_schema in schema.get("allOf") or []:
+            sub_properties, sub_required = PrismaModelBuilder.merge_properties(sub_schema, schemas, visited)
+            properties.update(sub_properties)
+            required.extend(name for name in sub_required if name not in required)
+
+        own_properties = schema.get("properties")
+        if isinstance(own_properties, dict):
+            properties.update(own_properties)
+        own_required = schema.get("required")
+        if isinstance(own_required, list):
+            required.extend(name for name in own_required if name not in required)
+
+        return properties, required
 
     @staticmethod
     def _build_model(
         context: GenerationContext,
         model_name: str,
         schema: Dict[str, Any],
-        all_schemas: Dict[str, Dict[str, Any]]
+        all_schemas: Dict[str, Dict[str, Any]],
+        relations: Optional[List[PrismaRelation]] = None
     ) -> str:
         """Build a single Prisma model"""
         # Convert model name to Prisma naming (PascalCase)
         prisma_model_name = pascal_case(model_name)
+        relations = relations or []
+        own_relations = {r.fk_field: r for r in relations if r.model == prisma_model_name}
+        # Properties embedding a related model are served by the relation field, not a Json column
+        embedded_properties = {r.relation_field for r in own_relations.values() if r.embedded_in_child}
+        embedded_properties |= {
+            r.back_field for r in relations if r.target == prisma_model_name and r.embedded_in_parent
+        }
 
-        # Get required fields - ensure it's a list
-        required_fields = schema.get("required", [])
-        if not isinstance(required_fields, list):
-            required_fields = []
+        # Merge properties and required fields across allOf (entities often extend Timestamps)
+        properties, required_fields = PrismaModelBuilder.merge_properties(schema, all_schemas)
 
         # Build fields
         fields: List[str] = []
@@ -171,14 +557,12 @@ class PrismaModelBuilder:
         domain_prefix = DOMAIN_PREFIX_MAP.get(domain_name, "XX")
         # ID should be generated at application level with domain prefix
         # No @default() - IDs must be generated with correct domain prefix
-        fields.append(f"  id        String   @id @db.Char(33) /// Format: {domain_prefix}_<ULID>")
+        # x-partition models: partitions.sql makes the primary key (id, partition key), declared via @@id
+        partition = PartitionBuilder.extract_config(model_name, context.spec)
+        id_attribute = "" if partition else " @id"
+        fields.append(f"  id        String  {id_attribute} @db.Char(33) /// Format: {domain_prefix}_<ULID>")
 
         # Add orgId for multi-tenancy (if not already present)
-        properties = schema.get("properties", {})
-        if not isinstance(properties, dict):
-            context.logger.warn(f"Model {model_name} has non-dict properties: {type(properties)}")
-            properties = {}
-
         if "orgId" not in properties and "org_id" not in properties:
             fields.append("  orgId     String   @map(\"org_id\")")
 
@@ -196,22 +580,12 @@ class PrismaModelBuilder:
             # Skip id and orgId (already added)
             if prop_name in ["id", "orgId", "org_id"]:
                 continue
+            if prop_name in embedded_properties:
+                continue
 
             try:
-                # Check if this field is a potential foreign key
-                relation_info = None
-                if prop_name.endswith("Id") or prop_name.endswith("_id"):
-                    # Try to detect relationship
-                    potential_model_name = prop_name.replace("_id", "Id").replace("Id", "")
-                    if potential_model_name:
-                        for entity_name in all_schemas.keys():
-                            if (entity_name.lower() == potential_model_name.lower() or
-                                entity_name.lower() == potential_model_name.lower() + "s"):
-                                relation_info = {
-                                    "ref_model": pascal_case(entity_name),
-                                    "field_name": camel_case(prop_name)
-                                }
-                                break
+                relation = own_relations.get(prop_name)
+                relation_info = {"ref_model": relation.target} if relation else None
 
                 field_str = PrismaModelBuilder._build_field(
                     context, prop_name, prop_schema, required_fields, all_schemas, relation_info
@@ -242,28 +616,30 @@ class PrismaModelBuilder:
 
         # Build indexes - extract field names from generated fields to check if orgId exists
         field_names = set()
-        for field in fields:
+        for field_line in fields:
             # Extract field name from field string (e.g., "  orgId     String   @map(\"org_id\")" -> "orgId")
-            parts = field.strip().split()
+            parts = field_line.strip().split()
             if parts:
                 field_names.add(parts[0])
 
         indexes = PrismaModelBuilder._build_indexes(model_name, properties, field_names)
+        indexes.extend(PrismaModelBuilder._build_json_path_indexes(context, properties))
 
         # Build unique constraints - add unique constraints on critical fields
         unique_constraints = PrismaModelBuilder._build_unique_constraints(
             model_name, properties, field_names
         )
 
-        # Build foreign key relationships - detect and add relationships
-        relationships = PrismaModelBuilder._build_relationships(
-            context, model_name, prisma_model_name, properties, all_schemas, field_names
-        )
+        # Relation fields (FK side and back-relation lists) for resolved foreign keys
+        relationships = PrismaModelBuilder._build_relationships(prisma_model_name, relations)
 
         # Build model string
+        primary_key = [f"  @@id([id, {partition.by}])"] if partition else []
+
         model_lines = [
             f"model {prisma_model_name} {{",
             *fields,
+            *primary_key,
             *indexes,
             *unique_constraints,
             *relationships,
@@ -304,8 +680,8 @@ class PrismaModelBuilder:
             prisma_type = "String @db.Char(33)"
 
         # Add nullable if not required
-        if not is_required and not prisma_type.endswith("?"):
-            prisma_type += "?"
+        if not is_required:
+            prisma_type = PrismaTypeConverter.with_optional(prisma_type)
 
         # Get default value
         default_value = PrismaTypeConverter.get_default_value(prop_schema)
@@ -321,17 +697,6 @@ class PrismaModelBuilder:
         if default_value:
             field_parts.append(default_value)
 
-        # CRITICAL FIX: Add @relation annotation for foreign keys
-        # Note: This is a simplified implementation. Full FK support requires:
-        # 1. Detecting relationship direction (one-to-many vs many-to-one)
-        # 2. Adding reverse relation fields
-        # 3. Handling cascade deletes
-        # For now, we'll add a comment and index the FK field
-        if relation_info:
-            # Add comment indicating relationship
-            # Full @relation will be added in a future enhancement
-            field_parts.append(f'/// FK: References {relation_info["ref_model"]}')
-
         return " ".join(field_parts)
 
     @staticmethod
@@ -353,29 +718,53 @@ class PrismaModelBuilder:
 
         # Index common query fields
         common_index_fields = ["status", "type", "createdAt", "updatedAt"]
-        for field in common_index_fields:
-            camel_field = camel_case(field)
-            if field in field_names or camel_field in field_names:
+        for index_field in common_index_fields:
+            camel_field = camel_case(index_field)
+            if index_field in field_names or camel_field in field_names:
                 indexes.append(f"  @@index([{camel_field}])")
 
-        # Index soft delete field for filtering
-        if "deletedAt" in field_names or "deleted_at" in field_names:
-            indexes.append("  @@index([deletedAt])")
+        # Soft-delete filtering is served by partial indexes (WHERE deleted_at IS NULL) that
+        # PartialIndexBuilder emits as companion SQL; a full B-tree on deletedAt is mostly nulls
 
         # CRITICAL FIX: Index foreign key fields (fields ending in Id)
         # Foreign keys should always be indexed for JOIN performance
         indexed_fk_fields = set()
-        for field_name in field_names:
+        # Sorted so regenerated schemas are byte-identical (content hashes stay stable)
+        for field_name in sorted(field_names):
             if field_name.endswith("Id") and field_name != "orgId":
                 # Avoid duplicate indexes
                 if field_name not in indexed_fk_fields:
                     indexes.append(f"  @@index([{field_name}])")
                     indexed_fk_fields.add(field_name)
 
-        # Composite index for orgId + status (only if both exist)
-        if "orgId" in field_names and ("status" in field_names or camel_case("status") in field_names):
-            indexes.append("  @@index([orgId, status])")
+        return indexes
+
+    @staticmethod
+    def _build_json_path_indexes(
+        context: GenerationContext,
+        properties: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Build GIN indexes for JSONB properties marked `x-query-path`.
 
+        The extension lists the JSON paths queries filter on (e.g. `x-query-path: [source, tags]`);
+        a jsonb_path_ops GIN index serves containment (@>) lookups on any of them.
+        """
+        indexes: List[str] = []
+        for prop_name, prop_schema in properties.items():
+            if not isinstance(prop_name, str) or not isinstance(prop_schema, dict):
+                continue
+            query_paths = prop_schema.get("x-query-path")
+            if not query_paths or not PrismaTypeConverter.is_json_schema(prop_schema, context.spec):
+                continue
+            if query_paths is True:
+                query_paths = []
+            elif not isinstance(query_paths, list):
+                query_paths = [query_paths]
+            index = f"  @@index([{camel_case(prop_name)}(ops: JsonbPathOps)], type: Gin)"
+            if query_paths:
+                index += f" // x-query-path: {', '.join(str(path) for path in query_paths)}"
+            indexes.append(index)
         return indexes
 
     @staticmethod
@@ -420,58 +809,28 @@ class PrismaModelBuilder:
 
     @staticmethod
     def _build_relationships(
-        context: GenerationContext,
-        model_name: str,
         prisma_model_name: str,
-        properties: Dict[str, Any],
-        all_schemas: Dict[str, Dict[str, Any]],
-        field_names: Optional[set] = None
+        relations: List[PrismaRelation]
     ) -> List[str]:
         """
-        Build Prisma foreign key relationships.
+        Build Prisma relation fields for a model.
 
-        CRITICAL FIX: Detects and adds relationship comments for:
-        - Fields ending in "Id" that match model names (e.g., chainId -> Chain)
-        - Adds relationship documentation comments
+        - FK side: `patient Patient @relation("Encounter_patientId", fields: [patientId], references: [id], onDelete: Restrict)`
+        - Parent side: `encounters Encounter[] @relation("Encounter_patientId")`
 
-        Note: Full @relation annotations require detecting relationship direction
-        (one-to-many vs many-to-one) and will be added in a future enhancement.
+        Relations are always named so self-relations and several FKs to the same model stay unambiguous.
         """
-        relationships: List[str] = []
-
-        # Use field_names if provided, otherwise check properties
-        if field_names is None:
-            field_names = set(properties.keys()) if isinstance(properties, dict) else set()
-
-        # Look for fields that might be foreign keys
-        for prop_name in properties.keys():
-            if not isinstance(prop_name, str):
+        lines: List[str] = []
+        for relation in relations:
+            if relation.model != prisma_model_name:
                 continue
-
-            # Skip if not a potential foreign key (doesn't end with Id)
-            if not (prop_name.endswith("Id") or prop_name.endswith("_id")):
+            optional = "?" if relation.optional else ""
+            lines.append(
+                f'  {relation.relation_field} {relation.target}{optional} @relation("{relation.name}", '
+                f"fields: [{camel_case(relation.fk_field)}], references: [id], onDelete: {relation.on_delete})"
+            )
+        for relation in relations:
+            if relation.target != prisma_model_name:
                 continue
-
-            # Extract potential referenced model name
-            # e.g., "chainId" -> "Chain", "walletId" -> "Wallet"
-            potential_model_name = prop_name.replace("_id", "Id").replace("Id", "")
-            if not potential_model_name:
-                continue
-
-            # Try to find matching model (case-insensitive)
-            matching_model = None
-            for entity_name in all_schemas.keys():
-                # Check exact match or singularized match
-                if (entity_name.lower() == potential_model_name.lower() or
-                    entity_name.lower() == potential_model_name.lower() + "s" or
-                    potential_model_name.lower() + "s" == entity_name.lower()):
-                    matching_model = entity_name
-                    break
-
-            if matching_model:
-                # Found a relationship - add comment
-                prisma_ref_model_name = pascal_case(matching_model)
-                camel_field_name = camel_case(prop_name)
-                relationships.append(f"  // Relationship: {camel_field_name} -> {prisma_ref_model_name}")
-
-        return relationships
+            lines.append(f'  {relation.back_field} {relation.model}[] @relation("{relation.name}")')
+        return lines
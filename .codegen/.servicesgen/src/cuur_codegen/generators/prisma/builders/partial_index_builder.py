@@ -0,0 +1,217 @@
+"""
+Partial Index Builder - Builds soft-delete-aware partial indexes that Prisma cannot express
+
+Generated DAO list/get queries always filter live rows (`deletedAt: null`). Prisma's schema
+language has no WHERE clause for @@index, so the composite list-query indexes are emitted as a
+companion SQL fragment (`CREATE INDEX ... WHERE deleted_at IS NULL`) next to schema.prisma.
+
+A JSON manifest records every index the fragment manages. It is read back on the next run so
+indexes that disappear from the spec are dropped (`DROP INDEX IF EXISTS`) instead of orphaned,
+and every statement is guarded (`IF NOT EXISTS` / `IF EXISTS`) so the fragment can be re-applied.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Columns added by PrismaModelBuilder when the schema does not declare the property
+AUTO_COLUMNS = {
+    "orgId": "org_id",
+    "createdAt": "created_at",
+    "updatedAt": "updated_at",
+    "deletedAt": "deleted_at",
+}
+
+# PostgreSQL truncates identifiers longer than 63 bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+
+@dataclass
+class PartialIndex:
+    """A partial index over live (not soft-deleted) rows"""
+    name: str
+    table: str
+    columns: List[str]  # Quoted column expressions, e.g. '"created_at" DESC'
+    predicate: str
+
+    @property
+    def statement(self) -> str:
+        return (
+            f'CREATE INDEX IF NOT EXISTS "{self.name}" ON "{self.table}" '
+            f'({", ".join(self.columns)}) WHERE {self.predicate};'
+        )
+
+
+class PartialIndexBuilder:
+    """Builds the partial index SQL fragment and its manifest"""
+
+    MANIFEST_VERSION = 1
+
+    @staticmethod
+    def build_model_indexes(
+        model_name: str,
+        properties: Dict[str, Any],
+        sort_field: str = "createdAt",
+        sort_direction: str = "desc"
+    ) -> List[PartialIndex]:
+        """
+        Build the live-row indexes backing a model's list queries.
+
+        - (orgId, sortField, id) matches the keyset list query (`orgId = ? AND deletedAt IS NULL
+          ORDER BY sortField, id`)
+        - (orgId, status) serves status-filtered lists when the model has a status column
+        """
+        table = model_name
+        predicate = f'"{PartialIndexBuilder._column("deletedAt", properties)}" IS NULL'
+        org_id = f'"{PartialIndexBuilder._column("orgId", properties)}"'
+        direction = "DESC" if sort_direction.lower() == "desc" else "ASC"
+
+        indexes: List[PartialIndex] = []
+        if sort_field == "id":
+            list_fields = ["orgId", "id"]
+            list_columns = [org_id, f'"id" {direction}']
+        else:
+            list_fields = ["orgId", sort_field, "id"]
+            list_columns = [
+                org_id,
+                f'"{PartialIndexBuilder._column(sort_field, properties)}" {direction}',
+                f'"id" {direction}',
+            ]
+        indexes.append(PartialIndex(
+            name=PartialIndexBuilder._index_name(table, list_fields),
+            table=table,
+            columns=list_columns,
+            predicate=predicate,
+        ))
+
+        if "status" in properties:
+            indexes.append(PartialIndex(
+                name=PartialIndexBuilder._index_name(table, ["orgId", "status"]),
+                table=table,
+                columns=[org_id, '"status"'],
+                predicate=predicate,
+            ))
+
+        return indexes
+
+    @staticmethod
+    def load_manifest(manifest_file: Path) -> Dict[str, Any]:
+        """Read the manifest written by the previous run (empty when missing or unreadable)"""
+        if not manifest_file.exists():
+            return {}
+        try:
+            manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    @staticmethod
+    def dropped_index_names(indexes: List[PartialIndex], previous_manifest: Dict[str, Any]) -> List[str]:
+        """Indexes managed by earlier runs that are no longer generated (kept until re-added)"""
+        current = {index.name for index in indexes}
+        previous = set((previous_manifest.get("indexes") or {}).keys())
+        dropped = set(previous_manifest.get("dropped") or []) | previous
+        return sorted(name for name in dropped - current if isinstance(name, str))
+
+    @staticmethod
+    def build_sql(
+        domain_name: str,
+        indexes: List[PartialIndex],
+        dropped: List[str],
+        version: str
+    ) -> str:
+        """Build the SQL fragment (stable ordering so unchanged specs produce identical files)"""
+        lines = [
+            "-- Partial indexes for live (not soft-deleted) rows",
+            f"-- Generated by Adapter Generator v{version}",
+            f"-- Domain: {domain_name}",
+            "--",
+            "-- Prisma cannot express partial indexes; append this fragment to a migration created with",
+            "-- `prisma migrate dev --create-only`, or apply it with `prisma db execute --file`.",
+            "-- Every statement is guarded, so re-applying the fragment is a no-op.",
+            "--",
+            "-- ⚠️  DO NOT EDIT THIS FILE MANUALLY - tracked in partial-indexes.manifest.json",
+            "",
+        ]
+        for name in dropped:
+            lines.append(f'DROP INDEX IF EXISTS "{name}";')
+        if dropped:
+            lines.append("")
+        for index in sorted(indexes, key=lambda i: i.name):
+            lines.append(index.statement)
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def build_manifest(indexes: List[PartialIndex], dropped: List[str]) -> str:
+        """Build the manifest listing managed indexes and the checksum of their definitions"""
+        manifest = {
+            "version": PartialIndexBuilder.MANIFEST_VERSION,
+            "indexes": {
+                index.name: {
+                    "table": index.table,
+                    "checksum": hashlib.sha256(index.statement.encode("utf-8")).hexdigest()[:16],
+                }
+                for index in sorted(indexes, key=lambda i: i.name)
+            },
+            "dropped": dropped,
+        }
+        return json.dumps(manifest, indent=2) + "\n"
+
+    @staticmethod
+    def build_snapshot_test(
+        header: str,
+        sql_path: str,
+        manifest_path: str
+    ) -> str:
+        """Build a vitest file snapshotting the emitted SQL and checking it against the manifest"""
+        return f"""{header}import {{ readFileSync }} from "node:fs";
+import {{ describe, expect, it }} from "vitest";
+
+const sql = readFileSync(new URL({json.dumps(sql_path)}, import.meta.url), "utf-8");
+const manifest = JSON.parse(
+  readFileSync(new URL({json.dumps(manifest_path)}, import.meta.url), "utf-8")
+) as {{ indexes: Record<string, {{ table: string }}>; dropped: string[] }};
+
+const createStatements = sql.split("\\n").filter((line) => line.startsWith("CREATE INDEX"));
+
+describe("partial indexes", () => {{
+  it("matches the SQL snapshot", async () => {{
+    await expect(sql).toMatchFileSnapshot("./__snapshots__/partial-indexes.sql");
+  }});
+
+  it("creates every manifest index exactly once", () => {{
+    for (const name of Object.keys(manifest.indexes)) {{
+      expect(createStatements.filter((line) => line.includes(`"${{name}}"`))).toHaveLength(1);
+    }}
+    expect(createStatements).toHaveLength(Object.keys(manifest.indexes).length);
+  }});
+
+  it("guards every statement so the fragment can be re-applied", () => {{
+    for (const line of createStatements) {{
+      expect(line).toContain("IF NOT EXISTS");
+      expect(line).toMatch(/WHERE "[A-Za-z_]+" IS NULL;$/);
+    }}
+    for (const name of manifest.dropped) {{
+      expect(sql).toContain(`DROP INDEX IF EXISTS "${{name}}";`);
+    }}
+  }});
+}});
+"""
+
+    @staticmethod
+    def _column(field_name: str, properties: Dict[str, Any]) -> str:
+        """Database column for a model field (spec properties are mapped to their own name)"""
+        if field_name in properties:
+            return field_name
+        return AUTO_COLUMNS.get(field_name, field_name)
+
+    @staticmethod
+    def _index_name(table: str, fields: List[str], suffix: str = "live_idx") -> str:
+        """Prisma-style index name ({Model}_{fields}_idx), shortened with a hash past 63 chars"""
+        name = f"{table}_{'_'.join(fields)}_{suffix}"
+        if len(name) <= MAX_IDENTIFIER_LENGTH:
+            return name
+        digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:8]
+        return f"{name[:MAX_IDENTIFIER_LENGTH - len(suffix) - 10]}_{digest}_{suffix}"
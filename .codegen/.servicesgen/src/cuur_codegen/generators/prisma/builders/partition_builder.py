@@ -0,0 +1,213 @@
+"""
+Partition Builder - Builds time-partitioned tables for high-volume models (x-partition)
+
+Entity schemas opt in with `x-partition: { by: createdAt, interval: month, retain: 24 }`.
+Prisma's schema language cannot declare partitioned tables, so the companion SQL fragment
+(partitions.sql, next to schema.prisma) converts the table Prisma created into a range-partitioned
+parent, and defines a maintenance function that creates the partitions for the retention window
+(plus a few ahead) and drops expired ones. DAO list queries always bound the partition column so
+PostgreSQL prunes partitions outside the window.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .partial_index_builder import AUTO_COLUMNS
+
+# interval -> (date_trunc unit, partition name suffix format)
+INTERVALS = {
+    "day": ("day", "YYYYMMDD"),
+    "week": ("week", "YYYYMMDD"),
+    "month": ("month", "YYYYMM"),
+    "year": ("year", "YYYY"),
+}
+
+
+@dataclass
+class PartitionConfig:
+    """A model's x-partition settings"""
+    by: str = "createdAt"  # Partition key (Prisma field name, DateTime)
+    interval: str = "month"  # day, week, month or year
+    retain: int = 24  # Intervals kept before partitions are dropped
+    premake: int = 3  # Intervals created ahead of the current one
+
+
+@dataclass
+class PartitionedTable:
+    """A table converted to a range-partitioned parent"""
+    table: str
+    column: str  # Database column of the partition key
+    config: PartitionConfig
+
+
+class PartitionBuilder:
+    """Builds the partitioning SQL fragment"""
+
+    @staticmethod
+    def extract_config(entity_name: str, spec: Optional[dict] = None) -> Optional[PartitionConfig]:
+        """
+        Read `x-partition` from the entity schema (None when absent or invalid).
+
+        `x-partition: true` uses the defaults (createdAt, month, 24 retained).
+        """
+        if not spec or not isinstance(spec, dict):
+            return None
+        schemas = spec.get("components", {}).get("schemas", {})
+        entity_schema = schemas.get(entity_name) if isinstance(schemas, dict) else None
+        if not isinstance(entity_schema, dict):
+            return None
+
+        raw = entity_schema.get("x-partition")
+        if raw is True:
+            return PartitionConfig()
+        if not isinstance(raw, dict):
+            return None
+
+        config = PartitionConfig()
+        by = raw.get("by", config.by)
+        interval = str(raw.get("interval", config.interval)).lower()
+        retain = raw.get("retain", config.retain)
+        premake = raw.get("premake", config.premake)
+        if not isinstance(by, str) or interval not in INTERVALS:
+            return None
+        if not isinstance(retain, int) or retain < 1 or not isinstance(premake, int) or premake < 1:
+            return None
+
+        properties = entity_schema.get("properties", {})
+        by_schema = properties.get(by) if isinstance(properties, dict) else None
+        if by_schema is None and by not in AUTO_COLUMNS:
+            return None
+        if isinstance(by_schema, dict) and by_schema.get("format") not in (None, "date-time", "date"):
+            return None
+
+        return PartitionConfig(by=by, interval=interval, retain=retain, premake=premake)
+
+    @staticmethod
+    def build_table(model_name: str, properties: Dict[str, Any], config: PartitionConfig) -> PartitionedTable:
+        """Resolve the partition key column (spec properties keep their name, auto columns are mapped)"""
+        column = config.by if config.by in properties else AUTO_COLUMNS.get(config.by, config.by)
+        return PartitionedTable(table=model_name, column=column, config=config)
+
+    @staticmethod
+    def build_sql(domain_name: str, tables: List[PartitionedTable], version: str) -> str:
+        """Build partitions.sql (stable ordering so unchanged specs produce identical files)"""
+        lines = [
+            "-- Range-partitioned tables for high-volume models (x-partition)",
+            f"-- Generated by Adapter Generator v{version}",
+            f"-- Domain: {domain_name}",
+            "--",
+            "-- Prisma cannot declare partitioned tables; append this fragment (after partial-indexes.sql) to",
+            "-- the migration that creates the tables (`prisma migrate dev --create-only`). The conversion only",
+            "-- runs while a table is still a plain heap, so re-applying the fragment just adds partitions.",
+            "-- The primary key becomes (id, partition key); unique indexes without the key are skipped.",
+            "-- Outgoing foreign keys are re-added to the parent (self-references are skipped). The Prisma",
+            "-- model declares the same @@id and has no relations pointing at it, so nothing references it.",
+            "--",
+            "-- Schedule the maintenance functions daily (pg_cron or an application job) so the next",
+            "-- partitions exist before rows arrive; rows outside every range land in the DEFAULT partition.",
+            "--",
+            "-- ⚠️  DO NOT EDIT THIS FILE MANUALLY",
+            "",
+        ]
+        for table in sorted(tables, key=lambda t: t.table):
+            lines.append(PartitionBuilder._maintenance_function(table))
+            lines.append("")
+            lines.append(PartitionBuilder._conversion_block(table))
+            lines.append("")
+            lines.append(f'SELECT "{table.table}_maintain_partitions"();')
+            lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _maintenance_function(table: PartitionedTable) -> str:
+        """CREATE OR REPLACE FUNCTION {table}_maintain_partitions(): create upcoming, drop expired"""
+        unit, suffix = INTERVALS[table.config.interval]
+        step = f"interval '1 {table.config.interval}'"
+        name = table.table
+        return f"""-- {name}: partitions by {table.column} per {table.config.interval}, {table.config.retain} retained, {table.config.premake} ahead
+CREATE OR REPLACE FUNCTION "{name}_maintain_partitions"() RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+  current_start timestamp := date_trunc('{unit}', now()::timestamp);
+  retained_from timestamp := current_start - {table.config.retain} * {step};
+  bound timestamp := retained_from;
+  expired record;
+BEGIN
+  WHILE bound <= current_start + {table.config.premake} * {step} LOOP
+    EXECUTE format(
+      'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+      '{name}_' || to_char(bound, '{suffix}'), '{name}', bound, bound + {step}
+    );
+    bound := bound + {step};
+  END LOOP;
+
+  FOR expired IN
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = '{name}'
+      AND child.relname ~ '^{name}_[0-9]+$'
+      AND child.relname < '{name}_' || to_char(retained_from, '{suffix}')
+  LOOP
+    EXECUTE format('DROP TABLE IF EXISTS %I', expired.relname);
+  END LOOP;
+END;
+$$;"""
+
+    @staticmethod
+    def _conversion_block(table: PartitionedTable) -> str:
+        """DO block converting the Prisma-created heap into a partitioned parent (no-op afterwards)"""
+        name = table.table
+        column = table.column
+        return f"""DO $$
+DECLARE
+  index_definitions text[];
+  foreign_keys text[];
+  definition text;
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM pg_class
+    WHERE relname = '{name}' AND relkind = 'r' AND relnamespace = current_schema()::regnamespace
+  ) THEN
+    SELECT coalesce(array_agg(indexdef), '{{}}') INTO index_definitions
+    FROM pg_indexes
+    WHERE schemaname = current_schema() AND tablename = '{name}' AND indexname <> '{name}_pkey';
+
+    -- LIKE ... INCLUDING CONSTRAINTS copies CHECK constraints only; capture outgoing foreign keys
+    -- (self-references cannot target the composite primary key, so they are skipped)
+    SELECT coalesce(array_agg(format('ALTER TABLE %I ADD CONSTRAINT %I %s', '{name}', conname, pg_get_constraintdef(oid))), '{{}}')
+    INTO foreign_keys
+    FROM pg_constraint
+    WHERE conrelid = '"{name}"'::regclass AND contype = 'f' AND confrelid <> conrelid;
+    FOR definition IN
+      SELECT conname FROM pg_constraint WHERE conrelid = '"{name}"'::regclass AND contype = 'f' AND confrelid = conrelid
+    LOOP
+      RAISE NOTICE '{name}: skipping self-referencing foreign key %', definition;
+    END LOOP;
+
+    ALTER TABLE "{name}" RENAME TO "{name}_unpartitioned";
+    ALTER TABLE "{name}_unpartitioned" RENAME CONSTRAINT "{name}_pkey" TO "{name}_unpartitioned_pkey";
+    CREATE TABLE "{name}" (LIKE "{name}_unpartitioned" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+      PARTITION BY RANGE ("{column}");
+    ALTER TABLE "{name}" ADD CONSTRAINT "{name}_pkey" PRIMARY KEY ("id", "{column}");
+    PERFORM "{name}_maintain_partitions"();
+    CREATE TABLE IF NOT EXISTS "{name}_default" PARTITION OF "{name}" DEFAULT;
+
+    INSERT INTO "{name}" SELECT * FROM "{name}_unpartitioned";
+    DROP TABLE "{name}_unpartitioned";
+
+    FOREACH definition IN ARRAY index_definitions LOOP
+      IF definition LIKE 'CREATE UNIQUE%' AND position('{column}' IN definition) = 0 THEN
+        RAISE NOTICE '{name}: skipping unique index without the partition key: %', definition;
+        CONTINUE;
+      END IF;
+      EXECUTE definition;
+    END LOOP;
+
+    FOREACH definition IN ARRAY foreign_keys LOOP
+      EXECUTE definition;
+    END LOOP;
+  END IF;
+END;
+$$;"""
@@ -0,0 +1,168 @@
+"""
+Row Width Builder - Estimates per-model PostgreSQL row widths from the generated schema
+
+The estimate is read back from the generated schema.prisma text (so it reflects the native
+types actually emitted) and written as a markdown report next to it. Widths are upper bounds
+for bounded columns (Char/VarChar/Decimal) and a nominal guess for unbounded ones (text, Json,
+arrays), which the report lists separately as candidates for tightening.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Tuple
+
+# Heap tuple header (23 bytes, padded to 24) plus the item pointer
+TUPLE_OVERHEAD = 28
+
+# Fixed-width storage per Prisma scalar / native type
+FIXED_WIDTHS = {
+    "Boolean": 1,
+    "Int": 4,
+    "SmallInt": 2,
+    "BigInt": 8,
+    "Float": 8,
+    "DateTime": 8,
+    "Date": 4,
+    "Uuid": 16,
+}
+
+# Nominal bytes assumed for unbounded columns
+UNBOUNDED_WIDTHS = {
+    "String": 32,
+    "Json": 128,
+    "Bytes": 64,
+    "Decimal": 16,
+}
+
+# Enums are stored as a 4-byte OID reference
+ENUM_WIDTH = 4
+
+_MODEL = re.compile(r"^(model|enum)\s+(\w+)\s*\{", re.MULTILINE)
+_NATIVE = re.compile(r"@db\.(\w+)(?:\(([^)]*)\))?")
+
+
+@dataclass
+class ColumnWidth:
+    """Estimated storage for one column"""
+    name: str
+    prisma_type: str
+    bytes: int
+    bounded: bool
+
+
+@dataclass
+class ModelWidth:
+    """Estimated row width for one model"""
+    model: str
+    columns: List[ColumnWidth] = field(default_factory=list)
+
+    @property
+    def bytes(self) -> int:
+        return TUPLE_OVERHEAD + math.ceil(len(self.columns) / 8) + sum(column.bytes for column in self.columns)
+
+    @property
+    def unbounded(self) -> List[ColumnWidth]:
+        return [column for column in self.columns if not column.bounded]
+
+
+class RowWidthBuilder:
+    """Builds the estimated row-width report for a generated Prisma schema"""
+
+    @staticmethod
+    def estimate(schema_text: str) -> List[ModelWidth]:
+        """Estimate the row width of every model declared in a schema"""
+        blocks = RowWidthBuilder._blocks(schema_text)
+        enums = {name for kind, name, _ in blocks if kind == "enum"}
+        models = {name for kind, name, _ in blocks if kind == "model"}
+
+        widths: List[ModelWidth] = []
+        for kind, name, body in blocks:
+            if kind != "model":
+                continue
+            model = ModelWidth(model=name)
+            for line in body:
+                column = RowWidthBuilder._column(line, enums, models)
+                if column:
+                    model.columns.append(column)
+            widths.append(model)
+        return widths
+
+    @staticmethod
+    def build_report(domain_name: str, schema_text: str, version: str) -> str:
+        """Build row-width.md (widest models first, then their unbounded columns)"""
+        widths = sorted(RowWidthBuilder.estimate(schema_text), key=lambda m: (-m.bytes, m.model))
+        lines = [
+            "# Estimated row widths",
+            "",
+            f"Generated by Adapter Generator v{version} for domain `{domain_name}`.",
+            "",
+            f"Bytes per heap row: {TUPLE_OVERHEAD}-byte tuple overhead, null bitmap and column storage "
+            "(alignment padding excluded). Char/VarChar/Decimal columns count at their declared maximum; "
+            "unbounded columns (text, Json, arrays) use a nominal size - add `maxLength`, `pattern` or "
+            "`multipleOf` to the spec to tighten them.",
+            "",
+            "| Model | Columns | Estimated bytes | Unbounded columns |",
+            "| --- | ---: | ---: | --- |",
+        ]
+        for model in widths:
+            unbounded = ", ".join(f"`{column.name}`" for column in model.unbounded) or "-"
+            lines.append(f"| {model.model} | {len(model.columns)} | {model.bytes} | {unbounded} |")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _blocks(schema_text: str) -> List[Tuple[str, str, List[str]]]:
+        """(kind, name, body lines) for every model/enum block"""
+        blocks = []
+        for match in _MODEL.finditer(schema_text):
+            end = schema_text.find("\n}", match.end())
+            body = schema_text[match.end():end if end != -1 else len(schema_text)]
+            blocks.append((match.group(1), match.group(2), body.splitlines()))
+        return blocks
+
+    @staticmethod
+    def _column(line: str, enums: Set[str], models: Set[str]) -> Optional[ColumnWidth]:
+        """Column width for a field line (None for block attributes, comments and relation fields)"""
+        code = line.split("//", 1)[0].strip()
+        if not code or code.startswith("@@"):
+            return None
+        parts = code.split()
+        if len(parts) < 2:
+            return None
+
+        name, prisma_type = parts[0], parts[1]
+        base = prisma_type.rstrip("?")
+        is_list = base.endswith("[]")
+        base = base[:-2] if is_list else base
+        if base in models:
+            return None
+
+        native = _NATIVE.search(code)
+        native_type = native.group(1) if native else None
+        arguments = [a.strip() for a in native.group(2).split(",")] if native and native.group(2) else []
+
+        width, bounded = RowWidthBuilder._scalar_width(base, native_type, arguments, enums)
+        if is_list:
+            # Array header plus a nominal handful of elements
+            width, bounded = 24 + 4 * width, False
+        return ColumnWidth(name=name, prisma_type=prisma_type, bytes=width, bounded=bounded)
+
+    @staticmethod
+    def _scalar_width(base: str, native_type: Optional[str], arguments: List[str], enums: Set[str]) -> Tuple[int, bool]:
+        """(bytes, bounded) for a single scalar value"""
+        if base in enums:
+            return ENUM_WIDTH, True
+        if native_type in ("Char", "VarChar") and arguments and arguments[0].isdigit():
+            length = int(arguments[0])
+            # Short varlena header for values under 127 bytes
+            return length + (1 if length < 127 else 4), True
+        if native_type == "Decimal" and arguments and arguments[0].isdigit():
+            # numeric: 2 bytes per 4 decimal digits plus header/weight/scale
+            return 5 + 2 * math.ceil(int(arguments[0]) / 4), True
+        if native_type in FIXED_WIDTHS:
+            return FIXED_WIDTHS[native_type], True
+        if native_type == "JsonB":
+            return UNBOUNDED_WIDTHS["Json"], False
+        if base in FIXED_WIDTHS:
+            return FIXED_WIDTHS[base], True
+        return UNBOUNDED_WIDTHS.get(base, UNBOUNDED_WIDTHS["String"]), False
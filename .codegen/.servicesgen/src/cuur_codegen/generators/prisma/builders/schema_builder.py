@@ -2,7 +2,10 @@
 Prisma Schema Builder - Builds complete Prisma schema file
 """
 
-from typing import Dict, Any, Optional
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, Any, Optional, Set
 from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.utils.openapi import extract_schemas
 from .model_builder import PrismaModelBuilder
@@ -12,10 +15,15 @@ from .type_converter import PrismaTypeConverter
 class PrismaSchemaBuilder:
     """Builds complete Prisma schema files"""
 
+    # Header line carrying the content hash of a generated schema file
+    CONTENT_HASH_PREFIX = "// Content hash: "
+
     @staticmethod
     def build_schema(
         context: GenerationContext,
-        header: str
+        header: str,
+        entity_filter: Optional[Set[str]] = None,
+        client_output: str = "./generated"
     ) -> str:
         """
         Build complete Prisma schema file content.
@@ -23,12 +31,36 @@ class PrismaSchemaBuilder:
         Args:
             context: Generation context
             header: File header comment
+            entity_filter: Only generate these entity models (e.g., the models a service's DAOs use)
+            client_output: Prisma client output directory (relative to the schema file)
 
         Returns:
             Complete Prisma schema file content
         """
-        domain_name = context.domain_name
+        schema_content = header + PrismaSchemaBuilder.build_datasource_block(client_output)
+        return schema_content + PrismaSchemaBuilder.build_domain_body(context, entity_filter)
+
+    @staticmethod
+    def build_datasource_block(client_output: Optional[str] = "./generated") -> str:
+        """Build the generator and datasource blocks (the main file of a prismaSchemaFolder)"""
+        output_line = f'\n  output   = "{client_output}"' if client_output else ""
+        return f"""generator client {{
+  provider = "prisma-client-js"{output_line}
+}}
 
+datasource db {{
+  provider = "postgresql"
+  url      = env("DATABASE_URL")
+}}
+
+"""
+
+    @staticmethod
+    def build_domain_body(
+        context: GenerationContext,
+        entity_filter: Optional[Set[str]] = None
+    ) -> str:
+        """Build the enums and models of a domain (one file of a prismaSchemaFolder)"""
         # Extract schemas from OpenAPI spec
         try:
             schemas = extract_schemas(context.spec)
@@ -41,7 +73,7 @@ class PrismaSchemaBuilder:
 
         # Build models
         try:
-            models = PrismaModelBuilder.build_models(context, schemas)
+            models = PrismaModelBuilder.build_models(context, schemas, entity_filter)
         except Exception as e:
             context.logger.error(f"Error building models: {e}")
             import traceback
@@ -50,40 +82,53 @@ class PrismaSchemaBuilder:
 
         # Build enums (if any)
         try:
-            enums = PrismaSchemaBuilder._build_enums(context, schemas)
+            enums = PrismaSchemaBuilder._build_enums(context, schemas, entity_filter)
         except Exception as e:
             context.logger.error(f"Error building enums: {e}")
             import traceback
             context.logger.debug(traceback.format_exc())
             enums = []
 
-        # Build schema file
-        schema_content = f"""{header}generator client {{
-  provider = "prisma-client-js"
-  output   = "./generated"
-}}
-
-datasource db {{
-  provider = "postgresql"
-  url      = env("DATABASE_URL")
-}}
-
-"""
+        body = ""
 
         # Add enums
         if enums:
-            schema_content += "\n".join(enums) + "\n\n"
+            body += "\n".join(enums) + "\n\n"
 
         # Add models
         if models:
-            schema_content += "\n\n".join(models) + "\n"
+            body += "\n\n".join(models) + "\n"
 
-        return schema_content
+        return body
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """Short sha256 of generated schema content (stored in the file to skip unchanged rewrites)"""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def read_content_hash(schema_file: Path) -> Optional[str]:
+        """Content hash recorded in an existing schema file (None when missing)"""
+        if not schema_file.exists():
+            return None
+        with schema_file.open(encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith(PrismaSchemaBuilder.CONTENT_HASH_PREFIX):
+                    return line[len(PrismaSchemaBuilder.CONTENT_HASH_PREFIX):].strip()
+                if not line.startswith("//"):
+                    break
+        return None
+
+    @staticmethod
+    def declared_names(content: str) -> Set[str]:
+        """Model and enum names declared in Prisma schema content"""
+        return set(re.findall(r"^(?:model|enum)\s+(\w+)\s*\{", content, re.MULTILINE))
 
     @staticmethod
     def _build_enums(
         context: GenerationContext,
-        schemas: Dict[str, Dict[str, Any]]
+        schemas: Dict[str, Dict[str, Any]],
+        entity_filter: Optional[Set[str]] = None
     ) -> list:
         """Build Prisma enum definitions from OpenAPI schemas"""
         enums: list = []
@@ -171,6 +216,8 @@ datasource db {{
 
         # Extract all models and check their fields for $ref to enums or inline enums
         entity_names = PrismaModelBuilder._identify_entity_schemas(context, schemas)
+        if entity_filter is not None:
+            entity_names = [name for name in entity_names if name in entity_filter]
         for entity_name in entity_names:
             if not isinstance(entity_name, str):
                 continue
@@ -178,9 +225,7 @@ datasource db {{
             if not isinstance(entity_schema, dict):
                 continue
 
-            properties = entity_schema.get("properties", {})
-            if not isinstance(properties, dict):
-                continue
+            properties, _ = PrismaModelBuilder.merge_properties(entity_schema, schemas)
 
             for prop_name, prop_schema in properties.items():
                 if not isinstance(prop_schema, dict):
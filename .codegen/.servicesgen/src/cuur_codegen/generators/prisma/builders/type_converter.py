@@ -2,7 +2,9 @@
 Prisma Type Converter - Converts OpenAPI types to Prisma types
 """
 
-from typing import Dict, Any, Optional
+import re
+from decimal import Decimal
+from typing import Dict, Any, Optional, Tuple
 from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.utils.openapi import extract_schema_name_from_ref
 
@@ -19,10 +21,13 @@ class PrismaTypeConverter:
         "array": "String[]",  # Default for arrays, can be overridden
     }
 
+    # Object-typed and free-form properties are stored as native JSONB (no string round-trip)
+    JSON_TYPE = "Json @db.JsonB"
+
     # Format-specific mappings
     FORMAT_MAPPING = {
         "date-time": "DateTime",
-        "date": "DateTime",
+        "date": "DateTime @db.Date",
         "time": "String",  # Prisma doesn't have a Time type, use String
         "uuid": "String @db.Uuid",
         "email": "String",
@@ -34,11 +39,21 @@ class PrismaTypeConverter:
         "int64": "BigInt",
         "float": "Float",
         "double": "Decimal",
+        "decimal": "Decimal",
         "password": "String",  # Store passwords as String
         "ipv4": "String",
         "ipv6": "String",
     }
 
+    # PostgreSQL smallint range (Int is int4)
+    SMALLINT_RANGE = (-32768, 32767)
+
+    # Precision/scale for decimals without explicit constraints
+    DEFAULT_DECIMAL = (18, 8)
+
+    # Regex atoms whose single match is one character: escape, character class or literal
+    _PATTERN_ATOM = re.compile(r"(\\.|\[(?:\\.|[^\]])+\]|[^\\\[\](){}|*+?.^$])(\{(\d+)(?:,(\d+))?\})?")
+
     # Field name patterns that suggest DateTime type
     DATETIME_FIELD_PATTERNS = [
         "createdat", "created_at", "created",
@@ -116,6 +131,9 @@ class PrismaTypeConverter:
                         # It's an enum - generate enum name from schema name
                         enum_name = ref_name.replace("Enum", "").replace("Type", "") + "Enum"
                         return enum_name
+                    # Embedded value objects (e.g., CodeableConcept) live in a JSONB column
+                    if PrismaTypeConverter.is_json_schema(ref_schema, context.spec):
+                        return PrismaTypeConverter.JSON_TYPE
                     # Check if referenced schema has type/format info we can use
                     if "type" in ref_schema or "format" in ref_schema:
                         # Recursively convert the referenced schema
@@ -131,6 +149,10 @@ class PrismaTypeConverter:
             enum_name = PrismaTypeConverter._get_enum_name(field_name, schema)
             return enum_name
 
+        # Handle objects and free-form maps (type: object / additionalProperties)
+        if PrismaTypeConverter.is_json_schema(schema, context.spec if context else None):
+            return PrismaTypeConverter.JSON_TYPE
+
         # Handle type
         schema_type = schema.get("type")
         if not schema_type:
@@ -148,26 +170,29 @@ class PrismaTypeConverter:
                 # Empty items - default to String[]
                 return "String[]"
 
+            # Arrays of objects are stored as a single JSONB array
+            if PrismaTypeConverter.is_json_schema(items, context.spec if context else None):
+                return PrismaTypeConverter.JSON_TYPE
+
             # Recursively convert array item type
             item_type = PrismaTypeConverter.convert_openapi_to_prisma_type(
                 items, f"{field_name}Item", context
             )
 
-            # Handle nested arrays (array of arrays)
-            if isinstance(items, dict) and items.get("type") == "array":
-                # Already handled recursively, just return with []
-                return f"{item_type}[]"
-
-            return f"{item_type}[]"
+            # Native type attributes follow the list marker (String[] @db.VarChar(64))
+            base_type, _, attributes = item_type.partition(" ")
+            return f"{base_type.rstrip('?')}[] {attributes}".rstrip()
 
         # Handle format-specific types (highest priority after enum/ref/array)
         format_type = schema.get("format")
         if format_type:
             if format_type in PrismaTypeConverter.FORMAT_MAPPING:
-                base_type = PrismaTypeConverter.FORMAT_MAPPING[format_type]
+                base_type = PrismaTypeConverter.apply_constraints(
+                    PrismaTypeConverter.FORMAT_MAPPING[format_type], schema
+                )
                 # Add nullable if needed
                 if schema.get("nullable", False):
-                    return f"{base_type}?"
+                    return PrismaTypeConverter.with_optional(base_type)
                 return base_type
             else:
                 # Unknown format - log warning but continue with type inference
@@ -189,11 +214,14 @@ class PrismaTypeConverter:
             elif base_type == "Decimal" and schema_type == "number":
                 # Check if it's a currency/decimal field
                 if any(keyword in field_name.lower() for keyword in ["decimal", "amount", "price", "balance", "cost", "fee", "rate"]):
-                    return "Decimal @db.Decimal(18, 8)"  # Standard decimal precision
+                    base_type = "Decimal @db.Decimal(18, 8)"  # Standard decimal precision
+
+            # Spec constraints (maxLength, pattern, minimum/maximum, multipleOf) narrow the column
+            base_type = PrismaTypeConverter.apply_constraints(base_type, schema)
 
             # Add nullable if needed
             if schema.get("nullable", False):
-                return f"{base_type}?"
+                return PrismaTypeConverter.with_optional(base_type)
             return base_type
 
         # Default fallback - try field name inference
@@ -203,6 +231,135 @@ class PrismaTypeConverter:
 
         return "String"
 
+    @staticmethod
+    def apply_constraints(prisma_type: str, schema: Dict[str, Any]) -> str:
+        """
+        Narrow a scalar Prisma type using the property's validation constraints.
+
+        - String: fixed-length `pattern` -> @db.Char(n); `maxLength` (or a bounded pattern)
+          -> @db.VarChar(n)
+        - Int: `minimum`/`maximum` within smallint -> @db.SmallInt; BigInt only for `format: int64`
+        - Decimal: `x-precision`/`x-scale`, or `multipleOf` and `maximum` -> @db.Decimal(p, s)
+
+        Types that already carry a native attribute (e.g. @db.Uuid, @db.Date) are kept.
+        """
+        base_type, _, attributes = prisma_type.partition(" ")
+
+        if base_type == "String" and not attributes:
+            pattern_length = PrismaTypeConverter._pattern_length(schema.get("pattern"))
+            max_length = schema.get("maxLength")
+            if pattern_length and pattern_length[0] == pattern_length[1]:
+                return f"String @db.Char({pattern_length[0]})"
+            if pattern_length and not isinstance(max_length, int):
+                max_length = pattern_length[1]
+            if isinstance(max_length, int) and max_length > 0:
+                return f"String @db.VarChar({max_length})"
+            return prisma_type
+
+        if base_type == "Int" and not attributes:
+            # The declared format decides the column width; bounds only narrow it
+            if schema.get("format") == "int64":
+                return "BigInt"
+            minimum, maximum = schema.get("minimum"), schema.get("maximum")
+            if not isinstance(minimum, (int, float)) or not isinstance(maximum, (int, float)):
+                return prisma_type
+            if PrismaTypeConverter.SMALLINT_RANGE[0] <= minimum and maximum <= PrismaTypeConverter.SMALLINT_RANGE[1]:
+                return "Int @db.SmallInt"
+            return prisma_type
+
+        if base_type == "Decimal":
+            precision_scale = PrismaTypeConverter._decimal_precision(schema)
+            if precision_scale:
+                return f"Decimal @db.Decimal({precision_scale[0]}, {precision_scale[1]})"
+            if schema.get("format") == "decimal" and not attributes:
+                return "Decimal @db.Decimal({}, {})".format(*PrismaTypeConverter.DEFAULT_DECIMAL)
+
+        return prisma_type
+
+    @staticmethod
+    def _pattern_length(pattern: Optional[str]) -> Optional[Tuple[int, int]]:
+        """
+        (min, max) length of strings matching an anchored pattern built from single-character
+        atoms with optional {n} / {m,n} quantifiers (e.g. ^[A-Z]{3}$ -> (3, 3)).
+
+        Returns None for anything else (alternation, groups, unbounded repetition).
+        """
+        if not isinstance(pattern, str) or not pattern.startswith("^") or not pattern.endswith("$"):
+            return None
+        body = pattern[1:-1]
+        if body.endswith("\\"):
+            return None
+
+        minimum = maximum = 0
+        position = 0
+        while position < len(body):
+            match = PrismaTypeConverter._PATTERN_ATOM.match(body, position)
+            if not match:
+                return None
+            low = int(match.group(3)) if match.group(3) else 1
+            high = int(match.group(4)) if match.group(4) else low
+            minimum += low
+            maximum += high
+            position = match.end()
+
+        return (minimum, maximum) if maximum > 0 else None
+
+    @staticmethod
+    def _decimal_precision(schema: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        """Decimal (precision, scale) from x-precision/x-scale or multipleOf + maximum"""
+        precision, scale = schema.get("x-precision"), schema.get("x-scale")
+        if isinstance(precision, int) and precision > 0:
+            return (precision, scale if isinstance(scale, int) else 0)
+
+        multiple_of = schema.get("multipleOf")
+        if not isinstance(multiple_of, (int, float)) or multiple_of <= 0 or multiple_of >= 1:
+            return None
+        # Exact decimal digits of the step (0.25 -> 2, 0.005 -> 3); log10 undercounts non-powers of ten
+        scale = max(0, -Decimal(str(multiple_of)).as_tuple().exponent)
+        # Digits left of the decimal point come from the largest allowed magnitude
+        bounds = [abs(bound) for bound in (schema.get("minimum"), schema.get("maximum")) if isinstance(bound, (int, float))]
+        if bounds:
+            integer_digits = len(str(int(max(bounds)))) if max(bounds) >= 1 else 1
+        else:
+            integer_digits = PrismaTypeConverter.DEFAULT_DECIMAL[0] - PrismaTypeConverter.DEFAULT_DECIMAL[1]
+        return (integer_digits + scale, scale)
+
+    @staticmethod
+    def is_json_schema(
+        schema: Dict[str, Any],
+        spec: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Check whether a property schema maps to a Json column.
+
+        True for `type: object`, free-form `additionalProperties` maps, allOf compositions
+        and $refs to object schemas (resolved when the spec is available).
+        """
+        if not isinstance(schema, dict) or "enum" in schema:
+            return False
+
+        if "$ref" in schema:
+            if not spec:
+                return False
+            from cuur_codegen.utils.openapi import resolve_ref
+            ref_schema = resolve_ref(spec, schema["$ref"])
+            return PrismaTypeConverter.is_json_schema(ref_schema or {}, spec)
+
+        schema_type = schema.get("type")
+        if schema_type == "object":
+            return True
+        if schema_type is None:
+            return any(key in schema for key in ("properties", "additionalProperties", "allOf"))
+        return False
+
+    @staticmethod
+    def with_optional(prisma_type: str) -> str:
+        """Mark a Prisma type optional, keeping native type attributes after the `?`"""
+        base_type, _, attributes = prisma_type.partition(" ")
+        if base_type.endswith("?"):
+            return prisma_type
+        return f"{base_type}? {attributes}".rstrip()
+
     @staticmethod
     def _infer_type_from_field_name(field_name: str) -> Optional[str]:
         """
@@ -165,6 +165,13 @@ class MainBuilder:
             # Use @quub/adapters alias for consistency
             prisma_import_path = f"@quub/adapters/{domain_name}/prisma/generated/index.js"
 
+        # Per-service client (layers.adapters.per_service_clients): the adapter generator writes
+        # services/src/{domain}/db/prisma/schema.prisma with only this service's DAO models
+        prisma_source = "adapters-generated client"
+        if config.layers.adapters.per_service_clients:
+            prisma_import_path = "../db/prisma/generated/index.js"
+            prisma_source = "this service's client (db/prisma/schema.prisma, `prisma:generate`)"
+
         return f"""{header}/**
  * {service_name} Service - Main Entry Point
  *
@@ -175,7 +182,7 @@ class MainBuilder:
  * - Graceful shutdown handling
  */
 
-// Import Prisma client from adapters-generated client
+// Import Prisma client from {prisma_source}
 import {{ PrismaClient }} from "{prisma_import_path}";
 import {{ startService, createDependencies }} from "./index.js";
 import type {{ DaoClient }} from "@quub/adapters/shared/dao-client.js";
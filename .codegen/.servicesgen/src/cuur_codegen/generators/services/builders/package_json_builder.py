@@ -21,6 +21,17 @@ class PackageJsonBuilder:
         service_name = pascal_case(domain_name)
         package_name = f"@quub/service-{domain_name}"
 
+        # Per-service Prisma client: generate it from db/prisma/schema.prisma before building
+        prisma_scripts = ""
+        prisma_dev_dependency = ""
+        if context.config.layers.adapters.per_service_clients:
+            prisma_scripts = """
+    "prisma:generate": "prisma generate --schema db/prisma/schema.prisma",
+    "prebuild": "pnpm run prisma:generate",
+    "predev": "pnpm run prisma:generate","""
+            prisma_dev_dependency = """
+    "prisma": "^6.0.1","""
+
         return f"""{header}{{
   "name": "{package_name}",
   "version": "1.0.0",
@@ -28,11 +39,12 @@ class PackageJsonBuilder:
   "type": "module",
   "main": "./dist/index.js",
   "types": "./dist/index.d.ts",
-  "scripts": {{
+  "scripts": {{{prisma_scripts}
     "dev": "tsx watch src/main.ts",
     "build": "tsc",
     "start": "node dist/main.js",
-    "test": "vitest"
+    "test": "vitest",
+    "loadtest": "tsx loadtest/{domain_name}.loadtest.ts"
   }},
   "dependencies": {{
     "@cuur/core": "workspace:*",
@@ -42,8 +54,10 @@ class PackageJsonBuilder:
   }},
   "devDependencies": {{
     "@types/node": "^20.0.0",
+    "hdr-histogram-js": "^3.0.0",{prisma_dev_dependency}
     "tsx": "^4.7.0",
     "typescript": "^5.3.3",
+    "undici": "^6.19.8",
     "vitest": "^1.0.0"
   }}
 }}
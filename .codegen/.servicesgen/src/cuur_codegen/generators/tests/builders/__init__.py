@@ -13,6 +13,10 @@ from .test_setup_builder import TestSetupBuilder
 from .test_case_builders import TestCaseBuilders
 from .handler_test_builder import HandlerTestBuilder
 from .flow_test_builder import FlowTestBuilder
+from .perf_test_builder import PerfTestBuilder
+from .query_plan_test_builder import QueryPlanTestBuilder
+from .cache_test_builder import CacheTestBuilder
+from .countable_test_builder import CountableTestBuilder
 from .test_index_builder import TestIndexBuilder
 from .package_json_builder import PackageJsonBuilder
 from .package_json_constants import (
@@ -43,6 +47,10 @@ __all__ = [
     "TestCaseBuilders",
     "HandlerTestBuilder",
     "FlowTestBuilder",
+    "PerfTestBuilder",
+    "QueryPlanTestBuilder",
+    "CacheTestBuilder",
+    "CountableTestBuilder",
     "TestIndexBuilder",
     "PackageJsonBuilder",
     "SHARED_DEPENDENCIES",
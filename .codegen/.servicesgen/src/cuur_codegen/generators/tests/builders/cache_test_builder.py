@@ -0,0 +1,226 @@
+"""
+Cache Test Builder
+
+Generates unit tests for the opt-in read-through cache wrappers (Cached{Interface}):
+hit, miss, TTL expiry, invalidation on writes, single-flight de-duplication and the
+stale-write guard for loads that overlap an invalidation.
+"""
+
+from typing import List, Optional, Tuple
+from .repository_discovery import RepositoryInfo
+
+
+class CacheTestBuilder:
+    """Builds the per-domain cached repository test suite"""
+
+    @staticmethod
+    def build_domain_suite(
+        repositories: List[RepositoryInfo],
+        domain_name: str,
+        header: str
+    ) -> str:
+        """Build cache/{domain}.cache.test.ts (one describe block per cached repository)"""
+        blocks = [CacheTestBuilder._build_repository_block(repo) for repo in repositories]
+        classes = sorted(f"Cached{repo.interface_name}" for repo in repositories)
+
+        return f"""{header}
+/**
+ * {domain_name} Read-Through Cache
+ *
+ * Each Cached{{Interface}} wraps an in-memory fake repository whose reads can be held
+ * open (deferred) to exercise concurrent misses and writes that race a running load.
+ */
+
+import {{ describe, expect, it, vi }} from "vitest";
+import {{
+{chr(10).join(f"  {name}," for name in classes)}
+  InMemoryLruCacheStore,
+}} from "@quub/adapters";
+
+const ORG_ID = "org_cache_test";
+const TTL_MS = 1_000;
+
+type Row = {{ id: string; version: number }};
+
+/** Let every pending microtask (store lookups, single-flight registration) run */
+const flush = () => new Promise((done) => setTimeout(done, 0));
+
+function deferred<T>() {{
+  let resolve!: (value: T) => void;
+  const promise = new Promise<T>((done) => {{
+    resolve = done;
+  }});
+  return {{ promise, resolve }};
+}}
+
+/**
+ * Fake inner repository: rows in a Map, reads counted, optional gate to hold reads open
+ */
+function createInner() {{
+  const rows = new Map<string, Row>([["row_1", {{ id: "row_1", version: 1 }}]]);
+  let gate: Promise<void> | null = null;
+  const read = async (_orgId: string, id: string) => {{
+    const row = rows.get(id) ?? null;
+    if (gate) {{
+      await gate;
+    }}
+    return row;
+  }};
+  const inner = {{
+    findById: vi.fn(read),
+    get: vi.fn(read),
+    update: vi.fn(async (_orgId: string, id: string) => {{
+      const row = {{ id, version: (rows.get(id)?.version ?? 0) + 1 }};
+      rows.set(id, row);
+      return row;
+    }}),
+    delete: vi.fn(async (_orgId: string, id: string) => {{
+      rows.delete(id);
+    }}),
+    exists: vi.fn(async (_orgId: string, id: string) => rows.has(id)),
+    count: vi.fn(async () => rows.size),
+  }};
+  return {{
+    rows,
+    inner,
+    hold() {{
+      const release = deferred<void>();
+      gate = release.promise;
+      return () => {{
+        gate = null;
+        release.resolve();
+      }};
+    }},
+  }};
+}}
+
+describe("{domain_name} cached repositories", () => {{
+{(chr(10) * 2).join(blocks)}
+}});
+"""
+
+    @staticmethod
+    def _build_repository_block(repo: RepositoryInfo) -> str:
+        """describe block for one Cached{Interface}"""
+        class_name = f"Cached{repo.interface_name}"
+        tests = [
+            """    it("serves a repeated findById from the cache", async () => {
+      const { inner } = createInner();
+      const cached = create(inner);
+
+      const first = await cached.findById(ORG_ID as never, "row_1");
+      const second = await cached.findById(ORG_ID as never, "row_1");
+
+      expect(second).toEqual(first);
+      expect(inner.findById).toHaveBeenCalledTimes(1);
+    });""",
+            """    it("loads a get miss with a single inner.get call", async () => {
+      const { inner } = createInner();
+      const cached = create(inner);
+
+      await cached.get(ORG_ID as never, "row_1");
+      await cached.get(ORG_ID as never, "row_1");
+
+      expect(inner.get).toHaveBeenCalledTimes(1);
+      expect(inner.findById).not.toHaveBeenCalled();
+    });""",
+            """    it("does not cache missing rows", async () => {
+      const { inner } = createInner();
+      const cached = create(inner);
+
+      expect(await cached.findById(ORG_ID as never, "row_missing")).toBeNull();
+      await cached.findById(ORG_ID as never, "row_missing");
+
+      expect(inner.findById).toHaveBeenCalledTimes(2);
+    });""",
+            """    it("never caches exists or count", async () => {
+      const { rows, inner } = createInner();
+      const cached = create(inner);
+
+      expect(await cached.count(ORG_ID as never)).toBe(1);
+      rows.set("row_2", { id: "row_2", version: 1 });
+      expect(await cached.count(ORG_ID as never)).toBe(2);
+      expect(await cached.exists(ORG_ID as never, "row_2")).toBe(true);
+
+      expect(inner.count).toHaveBeenCalledTimes(2);
+      expect(inner.exists).toHaveBeenCalledTimes(1);
+      expect(cached.estimatedCount).toBeUndefined();
+    });""",
+            """    it("reloads after the TTL expires", async () => {
+      const { inner } = createInner();
+      let now = 0;
+      const cached = create(inner, () => now);
+
+      await cached.findById(ORG_ID as never, "row_1");
+      now += TTL_MS - 1;
+      await cached.findById(ORG_ID as never, "row_1");
+      expect(inner.findById).toHaveBeenCalledTimes(1);
+
+      now += 1;
+      await cached.findById(ORG_ID as never, "row_1");
+      expect(inner.findById).toHaveBeenCalledTimes(2);
+    });""",
+            """    it("shares one load between concurrent misses", async () => {
+      const fake = createInner();
+      const cached = create(fake.inner);
+      const release = fake.hold();
+
+      const loads = Promise.all([
+        cached.findById(ORG_ID as never, "row_1"),
+        cached.findById(ORG_ID as never, "row_1"),
+        cached.findById(ORG_ID as never, "row_1"),
+      ]);
+      await flush();
+      release();
+      const [first, second, third] = await loads;
+
+      expect(fake.inner.findById).toHaveBeenCalledTimes(1);
+      expect(second).toBe(first);
+      expect(third).toBe(first);
+    });""",
+        ]
+
+        write = CacheTestBuilder._invalidating_write(repo)
+        if write:
+            tests.append(f"""    it("invalidates the cached row on {write[0]}", async () => {{
+      const {{ inner }} = createInner();
+      const cached = create(inner);
+
+      await cached.findById(ORG_ID as never, "row_1");
+      {write[1]}
+      await cached.findById(ORG_ID as never, "row_1");
+
+      expect(inner.findById).toHaveBeenCalledTimes(2);
+    }});""")
+            tests.append(f"""    it("does not write back a load that overlapped {write[0]}", async () => {{
+      const fake = createInner();
+      const cached = create(fake.inner);
+      const release = fake.hold();
+
+      const stale = cached.findById(ORG_ID as never, "row_1");
+      await flush();
+      {write[1]}
+      release();
+      await stale;
+
+      const fresh = await cached.findById(ORG_ID as never, "row_1");
+      expect(fake.inner.findById).toHaveBeenCalledTimes(2);
+      expect(fresh).toEqual(fake.rows.get("row_1") ?? null);
+    }});""")
+
+        test_cases = "\n\n".join(tests)
+        return f"""  describe("{class_name}", () => {{
+    const create = (inner: ReturnType<typeof createInner>["inner"], now?: () => number) =>
+      new {class_name}(inner as never, new InMemoryLruCacheStore(100, now) as never, TTL_MS);
+
+{test_cases}
+  }});"""
+
+    @staticmethod
+    def _invalidating_write(repo: RepositoryInfo) -> Optional[Tuple[str, str]]:
+        """(label, call) for a write that invalidates row_1, or None for read-only repositories"""
+        if repo.has_update:
+            return ("update", 'await cached.update(ORG_ID as never, "row_1", {} as never);')
+        if repo.has_delete:
+            return ("delete", 'await cached.delete(ORG_ID as never, "row_1");')
+        return None
@@ -0,0 +1,120 @@
+"""
+Countable Test Builder
+
+Generates unit tests for the CountableRepository methods of the mock repositories
+(exists, count, estimatedCount), including the list/count agreement list handlers
+rely on when an envelope declares a total.
+"""
+
+from typing import Dict, List, Optional
+from .repository_discovery import RepositoryInfo
+from cuur_codegen.generators.adapters.builders.method_builder import PaginationConfig
+from cuur_codegen.utils.string import camel_case
+
+
+class CountableTestBuilder:
+    """Builds the per-domain mock repository count/exists test suite"""
+
+    @staticmethod
+    def build_domain_suite(
+        repositories: List[RepositoryInfo],
+        domain_name: str,
+        header: str,
+        paginations: Optional[Dict[str, PaginationConfig]] = None
+    ) -> str:
+        """Build repositories/{domain}.countable.test.ts (one describe block per mock repository)"""
+        blocks = [
+            CountableTestBuilder._build_repository_block(
+                repo, (paginations or {}).get(repo.entity_name) or PaginationConfig()
+            )
+            for repo in repositories
+        ]
+        mocks = sorted(f"Mock{repo.interface_name}" for repo in repositories)
+
+        return f"""{header}
+/**
+ * {domain_name} Repository Counts
+ *
+ * Rows are seeded straight into each mock's store so read-only repositories are covered too.
+ */
+
+import {{ beforeEach, describe, expect, it }} from "vitest";
+import {{
+{chr(10).join(f"  {name}," for name in mocks)}
+}} from "../mocks/index.js";
+
+const ORG_ID = "org_count_test";
+const OTHER_ORG_ID = "org_count_other";
+
+/**
+ * Replace a mock repository's rows (createdAt is spaced so the keyset order is stable)
+ */
+function seed(repo: object, store: string, rows: Array<Record<string, unknown>>): void {{
+  (repo as unknown as Record<string, unknown[]>)[store] = rows.map((row, index) => ({{
+    createdAt: new Date(Date.UTC(2024, 0, 1, 0, 0, index)),
+    updatedAt: new Date(Date.UTC(2024, 0, 1, 0, 0, index)),
+    ...row,
+  }}));
+}}
+
+describe("{domain_name} repository counts", () => {{
+{(chr(10) * 2).join(blocks)}
+}});
+"""
+
+    @staticmethod
+    def _build_repository_block(repo: RepositoryInfo, pagination: PaginationConfig) -> str:
+        """describe block for one Mock{Interface}"""
+        mock_class = f"Mock{repo.interface_name}"
+        store = f"{camel_case(repo.entity_name)}s"
+        # Count filters accept any column; list filters only the spec's filter parameters
+        field = pagination.filter_fields[0] if pagination.filter_fields else "status"
+
+        tests = [
+            """    it("reports existence only within the organization", async () => {
+      expect(await repo.exists(ORG_ID as never, "row_1")).toBe(true);
+      expect(await repo.exists(OTHER_ORG_ID as never, "row_1")).toBe(false);
+      expect(await repo.exists(ORG_ID as never, "row_missing")).toBe(false);
+    });""",
+            """    it("counts the organization's rows only", async () => {
+      expect(await repo.count(ORG_ID as never)).toBe(3);
+      expect(await repo.count(OTHER_ORG_ID as never)).toBe(1);
+    });""",
+            f"""    it("applies equality filters to count", async () => {{
+      expect(await repo.count(ORG_ID as never, {{ {field}: "match" }})).toBe(2);
+      expect(await repo.count(ORG_ID as never, {{ {field}: "none" }})).toBe(0);
+    }});""",
+            f"""    it("ignores undefined filter values, like a Prisma where clause", async () => {{
+      expect(await repo.count(ORG_ID as never, {{ {field}: undefined }})).toBe(3);
+    }});""",
+            """    it("estimates the whole table", async () => {
+      expect(await repo.estimatedCount()).toBe(4);
+    });""",
+        ]
+        if pagination.filter_fields:
+            tests.append(f"""    it("counts the same rows the filtered list pages through", async () => {{
+      const params = {{ {field}: "match", limit: 1 }} as never;
+      const first = await repo.list(ORG_ID as never, params);
+      const second = await repo.list(ORG_ID as never, {{ {field}: "match", limit: 1, cursor: first.nextCursor }} as never);
+
+      expect(second.nextCursor).toBeNull();
+      expect([...first.items, ...second.items].map((item) => item.id).sort()).toEqual(["row_1", "row_2"]);
+      expect(await repo.count(ORG_ID as never, {{ {field}: "match" }})).toBe(2);
+    }});""")
+
+        test_cases = "\n\n".join(tests)
+        return f"""  describe("{mock_class}", () => {{
+    const repo = new {mock_class}();
+
+    beforeEach(() => {{
+      repo.reset();
+      seed(repo, "{store}", [
+        {{ id: "row_1", orgId: ORG_ID, {field}: "match" }},
+        {{ id: "row_2", orgId: ORG_ID, {field}: "match" }},
+        {{ id: "row_3", orgId: ORG_ID, {field}: "other" }},
+        {{ id: "row_4", orgId: OTHER_ORG_ID, {field}: "match" }},
+      ]);
+    }});
+
+{test_cases}
+  }});"""
@@ -62,6 +62,11 @@ class MockDependenciesBuilder:
         # Remove empty strings
         repo_vars = {v for v in repo_vars if v}
 
+        # Transactions run the callback inline and hand back the same mocks, so assertions
+        # on repositories hold for steps grouped with `transaction: <group>`
+        tx_mocks = """    transactionManager: { run: (fn: (tx: any) => Promise<any>) => fn({}) } as any,
+    withTransaction: () => deps,"""
+
         if not repo_vars:
             return f"""{header}
 /**
@@ -73,9 +78,11 @@ class MockDependenciesBuilder:
 import type {{ Dependencies }} from "@quub/orchestrators/{orchestrator_domain}/deps.js";
 
 export function createMockDependencies(): Dependencies {{
-  return {{
+  const deps: Dependencies = {{
     dao: {{}} as any,
+{tx_mocks}
   }};
+  return deps;
 }}
 """
 
@@ -97,10 +104,12 @@ export function createMockDependencies(): Dependencies {{
 import type {{ Dependencies }} from "@quub/orchestrators/{orchestrator_domain}/deps.js";
 
 export function createMockDependencies(): Dependencies {{
-  return {{
+  const deps: Dependencies = {{
     dao: {{}} as any,
+{tx_mocks}
 {mocks_str}
   }};
+  return deps;
 }}
 """
 
@@ -4,8 +4,9 @@ Mock Repository Builder
 Generates mock repository implementations for testing
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from .repository_discovery import RepositoryInfo
+from cuur_codegen.generators.adapters.builders.method_builder import MethodBuilder, PaginationConfig
 from cuur_codegen.utils.string import camel_case
 
 
@@ -59,7 +60,8 @@ class MockRepositoryBuilder:
         repo: RepositoryInfo,
         domain_name: str,
         header: str,
-        include_imports: bool = True
+        include_imports: bool = True,
+        pagination: Optional[PaginationConfig] = None
     ) -> str:
         """Build mock repository class"""
         mock_class_name = f"Mock{repo.interface_name}"
@@ -99,10 +101,13 @@ import type {{
 }} from "@cuur/core/shared/helpers/index.js";
 import {{ {transaction_id_function} }} from "@cuur/core/shared/helpers/id-generator.js";
 
+{MockRepositoryBuilder.build_cursor_helpers()}
+
 """
 
         methods = MockRepositoryBuilder._build_mock_methods(
-            repo, entity_pascal, entity_var, entities_var, transaction_id_function
+            repo, entity_pascal, entity_var, entities_var, transaction_id_function,
+            pagination or PaginationConfig()
         )
 
         return f"""{header}{imports}export class {mock_class_name} implements {repo.interface_name} {{
@@ -117,17 +122,64 @@ import {{ {transaction_id_function} }} from "@cuur/core/shared/helpers/id-genera
     this.idCounter = 1;
   }}
 
+  /**
+   * Equality filter; undefined values are ignored, as in a Prisma where clause
+   */
+  private matches(item: {entity_pascal}, filter?: Record<string, unknown>): boolean {{
+    return Object.entries(filter ?? {{}}).every(
+      ([key, value]) => value === undefined || (item as any)[key] === value
+    );
+  }}
+
 {methods}
 }}
 """
 
+    @staticmethod
+    def build_cursor_helpers() -> str:
+        """
+        Build the keyset cursor helpers shared by the mock repositories.
+
+        Cursors use the DAO encoding (base64url JSON of [sortValue, id]) so handler tests
+        exercise the same opaque pagination contract as the Prisma repositories.
+        """
+        return """type ListCursor = [sortValue: string, id: string];
+
+function encodeCursor(sortValue: unknown, id: string): string {
+  const value = sortValue instanceof Date ? sortValue.toISOString() : String(sortValue);
+  return Buffer.from(JSON.stringify([value, id])).toString("base64url");
+}
+
+function decodeCursor(cursor: string): ListCursor | null {
+  try {
+    const decoded = JSON.parse(Buffer.from(cursor, "base64url").toString("utf8"));
+    return Array.isArray(decoded) && decoded.length === 2 ? (decoded as ListCursor) : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Compare (sortValue, id) keys; dates and numeric columns compare by value, not as strings
+ */
+function compareKeyset(a: [unknown, string], b: [unknown, string]): number {
+  const sortKey = (value: unknown) =>
+    value instanceof Date ? value.getTime() : typeof value === "number" || typeof value === "bigint" ? Number(value) : String(value ?? "");
+  const [left, right] = [sortKey(a[0]), sortKey(b[0])];
+  if (left !== right) {
+    return left < right ? -1 : 1;
+  }
+  return a[1] < b[1] ? -1 : a[1] > b[1] ? 1 : 0;
+}"""
+
     @staticmethod
     def _build_mock_methods(
         repo: RepositoryInfo,
         entity_pascal: str,
         entity_var: str,
         entities_var: str,
-        transaction_id_function: str
+        transaction_id_function: str,
+        pagination: PaginationConfig
     ) -> str:
         """Build mock repository methods"""
         methods = []
@@ -137,21 +189,37 @@ import {{ {transaction_id_function} }} from "@cuur/core/shared/helpers/id-genera
         if any(list_params_type.startswith(util) for util in typescript_utility_types):
             list_params_type = "PaginationParams"
 
-        # list method
+        # list method - keyset pagination over (sortField, id) like the DAO list()
+        sort_field = pagination.sort_field
+        sign = "-" if pagination.sort_direction == "desc" else ""
+        # Mock entities hold numbers for Decimal columns, so decimal cursors compare numerically
+        value_type = "number" if pagination.sort_value_type == "decimal" else pagination.sort_value_type
+        cursor_value = MethodBuilder.CURSOR_VALUE_DECODERS.get(value_type, "cursor[0]")
+        # Same equality filters as the DAO list(), so list pages and count() totals agree
+        filter_entries = ", ".join(f"{field}: (params as any)?.{field}" for field in pagination.filter_fields)
+        filter_clause = (
+            f" && this.matches(item, {{ {filter_entries} }})" if pagination.filter_fields else ""
+        )
         methods.append(f"""  async list(
     orgId: string,
     params?: {list_params_type}
   ): Promise<PaginatedResult<{entity_pascal}>> {{
-    let items = this.{entities_var}.filter((item) => item.orgId === orgId);
-
-    const limit = (params as any)?.limit ?? 50;
-    if (limit) {{
-      items = items.slice(0, limit);
-    }}
+    const limit = (params as any)?.limit ?? {pagination.default_limit};
+    const cursor = (params as any)?.cursor ? decodeCursor((params as any).cursor) : null;
+    const key = (item: {entity_pascal}): [unknown, string] => [(item as any).{sort_field}, item.id];
+
+    const sorted = this.{entities_var}
+      .filter((item) => item.orgId === orgId{filter_clause})
+      .sort((a, b) => {sign}compareKeyset(key(a), key(b)));
+    const remaining = cursor
+      ? sorted.filter((item) => {sign}compareKeyset(key(item), [{cursor_value}, cursor[1]]) > 0)
+      : sorted;
+    const items = remaining.slice(0, limit);
+    const last = items[items.length - 1];
 
     return {{
       items,
-      nextCursor: items.length === limit ? items[items.length - 1]?.id : undefined,
+      nextCursor: remaining.length > limit && last ? encodeCursor((last as any).{sort_field}, last.id) : null,
       prevCursor: undefined,
     }};
   }}""")
@@ -166,6 +234,19 @@ import {{ {transaction_id_function} }} from "@cuur/core/shared/helpers/id-genera
     return this.findById(orgId, id);
   }}""")
 
+        # exists/count/estimatedCount (CountableRepository)
+        methods.append(f"""  async exists(orgId: string, id: string): Promise<boolean> {{
+    return this.{entities_var}.some((item) => item.id === id && item.orgId === orgId);
+  }}""")
+
+        methods.append(f"""  async count(orgId: string, filter?: Record<string, unknown>): Promise<number> {{
+    return this.{entities_var}.filter((item) => item.orgId === orgId && this.matches(item, filter)).length;
+  }}""")
+
+        methods.append(f"""  async estimatedCount(): Promise<number> {{
+    return this.{entities_var}.length;
+  }}""")
+
         # create method (if has create)
         if repo.has_create or repo.is_crud:
             create_type = repo.create_type or f"Create{entity_pascal}Request"
@@ -209,9 +290,10 @@ import {{ {transaction_id_function} }} from "@cuur/core/shared/helpers/id-genera
     def build_combined_mocks(
         repositories: list[RepositoryInfo],
         domain_name: str,
-        header: str
+        header: str,
+        paginations: Optional[Dict[str, PaginationConfig]] = None
     ) -> str:
-        """Build combined mocks file with all mock repositories"""
+        """Build combined mocks file with all mock repositories (paginations keyed by entity name)"""
         transaction_id_function = _get_domain_transaction_id_function(domain_name)
 
         # Collect unique imports
@@ -310,13 +392,15 @@ import {{ {transaction_id_function} }} from "@cuur/core/shared/helpers/id-genera
         import_statements.append(f"""import {{ {transaction_id_function} }} from "@cuur/core/shared/helpers/id-generator.js";""")
 
         imports = chr(10).join(import_statements) + chr(10) if import_statements else ""
+        imports += chr(10) + MockRepositoryBuilder.build_cursor_helpers() + chr(10)
 
         # Build mock classes
         mock_classes = []
         for repo in repositories:
             mock_header = f"/**\n * Mock {repo.interface_name} for testing\n */"
             mock_content = MockRepositoryBuilder.build_mock_repository(
-                repo, domain_name, mock_header, include_imports=False
+                repo, domain_name, mock_header, include_imports=False,
+                pagination=(paginations or {}).get(repo.entity_name)
             )
             mock_classes.append(mock_content)
 
@@ -22,9 +22,11 @@ ORCHESTRATOR_DEPENDENCIES = {
 
 # Shared dev dependencies for all test packages
 SHARED_DEV_DEPENDENCIES = {
+    "@electric-sql/pglite": "^0.2.17",
     "@types/node": "^20.0.0",
     "@types/jsonwebtoken": "^9.0.6",
     "@testcontainers/postgresql": "^11.0.0",
+    "pglite-prisma-adapter": "^0.6.1",
     "typescript": "^5.3.3",
     "vite-tsconfig-paths": "^5.1.4",
     "vitest": "^1.0.0",
@@ -40,6 +42,8 @@ TEST_SCRIPTS = {
     "test": "vitest",
     "test:watch": "vitest --watch",
     "test:coverage": "vitest --coverage",
+    "bench": "vitest bench",
+    "test:query-plan": "QUERY_PLAN_TESTS=1 vitest run query-plan",
 }
 
 
@@ -0,0 +1,371 @@
+"""
+Perf Test Builder
+
+Generates Vitest benchmark suites (`vitest bench`) for handlers and orchestrator flows,
+plus the shared harness that records p95 latencies and gates them against a committed
+JSON baseline.
+"""
+
+import json
+from typing import Optional, List
+from cuur_codegen.core.context import GenerationContext
+from cuur_codegen.utils.string import kebab_case, pascal_case, singularize
+from .handler_discovery import HandlerInfo
+from .repository_discovery import RepositoryInfo
+from .flow_discovery import FlowInfo
+from .flow_test_builder import FlowTestBuilder
+from .test_constants import TEST_CONSTANTS, generate_test_constants
+
+
+class PerfTestBuilder:
+    """Builds benchmark suites and the p95 regression harness"""
+
+    @staticmethod
+    def build_perf_harness(
+        header: str,
+        payload_sizes: List[int],
+        regression_threshold_percent: float
+    ) -> str:
+        """Build perf/perf-harness.ts (payload sizes, p95 recorder, baseline gate)"""
+        sizes = ", ".join(str(size) for size in payload_sizes)
+        return f"""{header}
+/**
+ * Perf Harness
+ *
+ * Every benchmark body is wrapped with recorder.timed(), which keeps its own
+ * per-iteration samples so p95 can be computed (Vitest bench reports p75/p99).
+ * recorder.check() runs in afterAll and fails the suite when a p95 exceeds
+ * the committed baseline by more than PERF_REGRESSION_PCT percent, or when a
+ * benchmark has no baseline entry yet. baseline.json is only written on request,
+ * so new and refreshed entries show up in review.
+ *
+ * PERF_UPDATE_BASELINE=1 vitest bench   # record / refresh baseline.json
+ */
+
+import {{ existsSync, readFileSync, writeFileSync }} from "node:fs";
+import {{ fileURLToPath }} from "node:url";
+
+export const PAYLOAD_SIZES: number[] = process.env.PERF_PAYLOAD_SIZES
+  ? process.env.PERF_PAYLOAD_SIZES.split(",").map((size) => Number(size.trim()))
+  : [{sizes}];
+
+export const REGRESSION_THRESHOLD_PERCENT = Number(process.env.PERF_REGRESSION_PCT ?? {regression_threshold_percent});
+
+const BASELINE_PATH = fileURLToPath(new URL("./baseline.json", import.meta.url));
+const MAX_SAMPLES = 50_000;
+/** Fraction of leading samples treated as warmup and ignored */
+const WARMUP_FRACTION = 0.1;
+
+interface BaselineEntry {{
+  p95Ms: number;
+  samples: number;
+}}
+
+type Baseline = Record<string, BaselineEntry>;
+
+export function percentile(sorted: number[], p: number): number {{
+  if (sorted.length === 0) {{
+    return 0;
+  }}
+  const index = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, index)];
+}}
+
+function readBaseline(): Baseline {{
+  return existsSync(BASELINE_PATH) ? (JSON.parse(readFileSync(BASELINE_PATH, "utf-8")) as Baseline) : {{}};
+}}
+
+/**
+ * Resize every array in a factory payload to `size` items (cycling existing items)
+ */
+export function scaleArrays<T>(value: T, size: number): T {{
+  if (Array.isArray(value)) {{
+    if (value.length === 0) {{
+      return value;
+    }}
+    return Array.from({{ length: size }}, (_, i) => scaleArrays(value[i % value.length], size)) as T;
+  }}
+  if (value && typeof value === "object" && !(value instanceof Date)) {{
+    return Object.fromEntries(
+      Object.entries(value as Record<string, unknown>).map(([key, item]) => [key, scaleArrays(item, size)])
+    ) as T;
+  }}
+  return value;
+}}
+
+export interface PerfRecorder {{
+  /** Time fn per iteration; prepare (untimed) runs before each iteration to restore state */
+  timed<A extends unknown[]>(
+    name: string,
+    fn: (...args: A) => Promise<unknown>,
+    prepare?: () => Promise<unknown>
+  ): (...args: A) => Promise<void>;
+  check(): void;
+}}
+
+export function createPerfRecorder(suite: string): PerfRecorder {{
+  const samples = new Map<string, number[]>();
+
+  return {{
+    timed(name, fn, prepare) {{
+      const key = `${{suite}} :: ${{name}}`;
+      const durations: number[] = [];
+      samples.set(key, durations);
+      return async (...args) => {{
+        await prepare?.();
+        const start = performance.now();
+        await fn(...args);
+        if (durations.length < MAX_SAMPLES) {{
+          durations.push(performance.now() - start);
+        }}
+      }};
+    }},
+
+    check() {{
+      const baseline = readBaseline();
+      const update = process.env.PERF_UPDATE_BASELINE === "1";
+      const failures: string[] = [];
+
+      for (const [key, durations] of samples) {{
+        const measured = durations.slice(Math.floor(durations.length * WARMUP_FRACTION)).sort((a, b) => a - b);
+        if (measured.length === 0) {{
+          continue;
+        }}
+        const p95Ms = percentile(measured, 95);
+        const previous = baseline[key];
+
+        if (update) {{
+          baseline[key] = {{ p95Ms: Number(p95Ms.toFixed(4)), samples: measured.length }};
+          continue;
+        }}
+        if (!previous) {{
+          failures.push(`${{key}}: no baseline entry (run with PERF_UPDATE_BASELINE=1 and commit baseline.json)`);
+          continue;
+        }}
+
+        const limit = previous.p95Ms * (1 + REGRESSION_THRESHOLD_PERCENT / 100);
+        if (p95Ms > limit) {{
+          failures.push(
+            `${{key}}: p95 ${{p95Ms.toFixed(3)}}ms > baseline ${{previous.p95Ms}}ms (+${{REGRESSION_THRESHOLD_PERCENT}}%)`
+          );
+        }}
+      }}
+
+      if (update) {{
+        writeFileSync(BASELINE_PATH, `${{JSON.stringify(sortKeys(baseline), null, 2)}}\\n`);
+      }}
+
+      if (failures.length > 0) {{
+        throw new Error(`p95 regression(s):\\n${{failures.join("\\n")}}`);
+      }}
+    }},
+  }};
+}}
+
+function sortKeys(baseline: Baseline): Baseline {{
+  return Object.fromEntries(Object.entries(baseline).sort(([a], [b]) => a.localeCompare(b)));
+}}
+"""
+
+    @staticmethod
+    def build_baseline_file() -> str:
+        """Initial (empty) perf/baseline.json - populated by a PERF_UPDATE_BASELINE=1 run"""
+        return json.dumps({}, indent=2) + "\n"
+
+    @staticmethod
+    def build_handler_bench(
+        operation: HandlerInfo,
+        repo: Optional[RepositoryInfo],
+        domain_name: str,
+        header: str
+    ) -> Optional[str]:
+        """Build perf/{verb}-{resource}.bench.ts for one handler (None when it has no repository)"""
+        if not repo:
+            return None
+
+        handler_name = operation.handler_name
+        handler_call = f"{handler_name}Handler"
+        mock_repo_name = f"Mock{repo.interface_name}"
+        entity_pascal = repo.entity_name or pascal_case(singularize(operation.resource))
+        factory_function = f"create{entity_pascal}"
+        suite = f"{domain_name}/{kebab_case(operation.verb)}-{kebab_case(operation.resource)}"
+
+        verb = operation.verb.lower()
+        if verb == "list":
+            body = f"await {handler_call}(repo, TEST_ORG_ID, {{ limit: size }});"
+        elif verb == "get":
+            body = f"await {handler_call}(repo, TEST_ORG_ID, target.id);"
+        elif verb == "create":
+            body = f"await {handler_call}(repo, TEST_ORG_ID, {factory_function}());"
+        elif verb == "update":
+            body = f"await {handler_call}(repo, TEST_ORG_ID, target.id, {{}});"
+        elif verb == "delete":
+            body = f"await {handler_call}(repo, TEST_ORG_ID, target.id);"
+        else:
+            return None
+
+        # Writes must not change the repository size between iterations: create restores the
+        # seeded records and delete creates its target before each (untimed) iteration
+        if verb == "create":
+            prepare = ",\n        reseed"
+        elif verb == "delete":
+            prepare = f""",
+        async () => {{
+          target = await repo.create(TEST_ORG_ID, {factory_function}());
+        }}"""
+        else:
+            prepare = ""
+
+        # get/update act on the last seeded record, delete on the record prepared for the iteration
+        needs_target = verb in ("get", "update", "delete")
+        target_declaration = '\n    let target: { id: string } = { id: "" };' if needs_target else ""
+        seed_statement = (
+            "target = await repo.create(TEST_ORG_ID, payload);"
+            if verb in ("get", "update")
+            else "await repo.create(TEST_ORG_ID, payload);"
+        )
+
+        return f"""{header}
+/**
+ * {handler_name} Handler Benchmarks
+ *
+ * In-process (mock repository, no database). Each payload size seeds that many
+ * records before the benchmark runs.
+ */
+
+import {{ afterAll, bench, describe }} from "vitest";
+import {{ {handler_name} as {handler_call} }} from "@cuur/core/{domain_name}/handlers/index.js";
+import {{ {mock_repo_name} }} from "../mocks/index.js";
+import {{ seedFaker, {factory_function} }} from "@quub/factories";
+import {{ PAYLOAD_SIZES, createPerfRecorder }} from "./perf-harness.js";
+
+describe("{handler_name} perf", () => {{
+{generate_test_constants()}
+  const recorder = createPerfRecorder("{suite}");
+
+  afterAll(() => recorder.check());
+
+  for (const size of PAYLOAD_SIZES) {{
+    const repo = new {mock_repo_name}();{target_declaration}
+    let seeds: ReturnType<typeof {factory_function}>[] = [];
+
+    /** Restore the repository to exactly `size` seeded records */
+    const reseed = async () => {{
+      repo.reset();
+      for (const payload of seeds) {{
+        {seed_statement}
+      }}
+    }};
+
+    bench(
+      `n=${{size}}`,
+      recorder.timed(
+        `n=${{size}}`,
+        async () => {{
+          {body}
+        }}{prepare}
+      ),
+      {{
+        setup: async () => {{
+          seedFaker(FAKER_SEED);
+          seeds = Array.from({{ length: size }}, () => {factory_function}());
+          await reseed();
+        }},
+      }}
+    );
+  }}
+}});
+"""
+
+    @staticmethod
+    def build_flow_bench(
+        flow: FlowInfo,
+        domain_name: str,
+        header: str,
+        context: GenerationContext
+    ) -> str:
+        """Build perf/{flow}.bench.ts for one orchestrator flow (handlers mocked with scaled factory payloads)"""
+        from .factory_builder import FactoryBuilder
+
+        flow_name = flow.flow_name
+        flow_base_name = flow_name.replace("Flow", "")
+        flow_pascal = pascal_case(flow_base_name)
+        flow_kebab = kebab_case(flow_base_name)
+
+        handler_mocks = FlowTestBuilder._detect_handler_imports(
+            flow.flow_file,
+            context.config.paths.project_root
+        )
+        mock_calls, mock_imports = FlowTestBuilder._generate_handler_mocks(handler_mocks)
+        logger_mock_call, _ = FlowTestBuilder._generate_logger_mock(domain_name)
+
+        _, field_to_handler = FactoryBuilder._extract_flow_response_structure_from_yaml(
+            flow.operation_id,
+            domain_name,
+            context,
+            flow_kebab
+        )
+        mock_setup_code = FlowTestBuilder._generate_mock_setup_code(
+            handler_mocks, field_to_handler or {}, flow_pascal
+        )
+        # Re-indent for the bench setup() body
+        mock_setup_code = "\n".join(
+            f"          {line.strip()}" for line in mock_setup_code.splitlines() if line.strip()
+        )
+
+        request_fields = ["context"]
+        if flow.has_body:
+            request_fields.append("body: {}")
+        if flow.has_params:
+            request_fields.append("params: {}")
+        if flow.has_query:
+            request_fields.append("query: { limit: size }")
+
+        mock_sections = [section for section in (logger_mock_call, mock_calls) if section]
+
+        return f"""{header}
+/**
+ * {flow_name} Flow Benchmarks
+ *
+ * In-process: core handlers are mocked and resolve factory payloads whose
+ * arrays are scaled to each payload size.
+ */
+
+import {{ afterAll, bench, describe, vi }} from "vitest";
+{chr(10).join(mock_sections)}
+{mock_imports}
+import {{ {flow_name} }} from "@quub/orchestrators/{domain_name}/flows/{flow_kebab}.flow.js";
+import type {{ RequestContext }} from "@quub/orchestrators/{domain_name}/context.js";
+import {{ seedFaker }} from "../factories/shared/faker-helpers.js";
+import {{ create{flow_pascal}Response }} from "../factories/flows/{flow_kebab}.factory.js";
+import {{ createMockDependencies }} from "../mocks/index.js";
+import {{ PAYLOAD_SIZES, createPerfRecorder, scaleArrays }} from "./perf-harness.js";
+
+describe("{flow_name} perf", () => {{
+{generate_test_constants()}
+  const recorder = createPerfRecorder("{domain_name}/{flow_kebab}");
+  const deps = createMockDependencies();
+  const context: RequestContext = {{
+    orgId: TEST_ORG_ID,
+    accountId: "{TEST_CONSTANTS.TEST_ACCOUNT_ID}",
+  }};
+
+  afterAll(() => recorder.check());
+
+  for (const size of PAYLOAD_SIZES) {{
+    bench(
+      `n=${{size}}`,
+      recorder.timed(`n=${{size}}`, async () => {{
+        await {flow_name}({{ {", ".join(request_fields)} }}, deps);
+      }}),
+      {{
+        setup: () => {{
+          seedFaker(FAKER_SEED);
+          const expected = scaleArrays(create{flow_pascal}Response(), size);
+{mock_setup_code or "          void expected;"}
+        }},
+      }}
+    );
+  }}
+}});
+"""
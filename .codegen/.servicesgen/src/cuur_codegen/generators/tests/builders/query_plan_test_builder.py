@@ -0,0 +1,392 @@
+"""
+Query Plan Test Builder
+
+Generates the query-plan regression suite: every generated DAO method runs against an
+in-process PGlite database (generated schema + partial indexes, seeded from the factories),
+Prisma's query log is captured and each statement is EXPLAINed. A sequential scan on a
+table holding more rows than the threshold fails the suite, and a method -> index report
+is written for review.
+"""
+
+import json
+from typing import List, Optional, Set
+from cuur_codegen.utils.string import camel_case
+from .repository_discovery import RepositoryInfo
+
+
+class QueryPlanTestBuilder:
+    """Builds the PGlite query-plan harness and the per-domain DAO plan suite"""
+
+    @staticmethod
+    def build_harness(
+        header: str,
+        domain_name: str,
+        prisma_dir: str,
+        row_threshold: int
+    ) -> str:
+        """Build query-plan/query-plan-harness.ts (PGlite database, query capture, EXPLAIN, report)"""
+        prisma_client_import = f"@quub/adapters/{domain_name}/prisma/generated/index.js"
+        return f"""{header}
+/**
+ * Query Plan Harness
+ *
+ * Runs the generated Prisma client against PGlite (Postgres compiled to WASM, in process,
+ * no network). The schema comes from `prisma migrate diff --from-empty` on the generated
+ * schema.prisma (or QUERY_PLAN_MIGRATIONS_DIR when migrations are committed), followed by
+ * partial-indexes.sql and partitions.sql.
+ *
+ * capture() records every statement Prisma logs while a DAO method runs and EXPLAINs it.
+ * assertIndexed() fails on a Seq Scan over a table with more than ROW_THRESHOLD rows
+ * (planner estimate after ANALYZE). assertPruned() fails when a query on a partitioned
+ * table scans every partition. writeReport() renders the method -> index table.
+ *
+ * QUERY_PLAN_TESTS=1 vitest run query-plan
+ */
+
+import {{ execFileSync }} from "node:child_process";
+import {{ existsSync, readdirSync, readFileSync, writeFileSync }} from "node:fs";
+import {{ join }} from "node:path";
+import {{ fileURLToPath }} from "node:url";
+import {{ PGlite }} from "@electric-sql/pglite";
+import {{ PrismaPGlite }} from "pglite-prisma-adapter";
+import {{ expect }} from "vitest";
+import {{ PrismaClient }} from "{prisma_client_import}";
+
+export const ROW_THRESHOLD = Number(process.env.QUERY_PLAN_ROW_THRESHOLD ?? {row_threshold});
+/** Seeded rows per table - above the threshold so the planner has a reason to use indexes */
+export const SEED_ROWS = ROW_THRESHOLD * 2;
+/** Rows are spread over several tenants so the orgId predicate is selective */
+export const SEED_ORG_IDS = Array.from({{ length: 50 }}, (_, i) => `org_query_plan_${{i}}`);
+export const ORG_ID = SEED_ORG_IDS[0];
+
+const PRISMA_DIR = fileURLToPath(new URL({json.dumps(prisma_dir)}, import.meta.url));
+const CREATE_MANY_CHUNK = 500;
+const EXPLAINABLE = /^\\s*(SELECT|UPDATE|DELETE|WITH)\\b/i;
+
+interface PlanNode {{
+  "Node Type": string;
+  "Relation Name"?: string;
+  "Index Name"?: string;
+  Plans?: PlanNode[];
+}}
+
+export interface PlanScan {{
+  node: string;
+  table?: string;
+  index?: string;
+}}
+
+export interface PlanEntry {{
+  method: string;
+  sql: string;
+  scans: PlanScan[];
+}}
+
+export interface QueryPlanHarness {{
+  prisma: PrismaClient;
+  analyze(): Promise<void>;
+  capture(method: string, fn: () => Promise<unknown>): Promise<PlanEntry[]>;
+  assertIndexed(method: string, fn: () => Promise<unknown>): Promise<void>;
+  assertPruned(method: string, fn: () => Promise<unknown>): Promise<void>;
+  writeReport(path: string): void;
+  close(): Promise<void>;
+}}
+
+function schemaSql(): string {{
+  const migrationsDir = process.env.QUERY_PLAN_MIGRATIONS_DIR;
+  const statements: string[] = [];
+
+  if (migrationsDir && existsSync(migrationsDir)) {{
+    for (const migration of readdirSync(migrationsDir).sort()) {{
+      const file = join(migrationsDir, migration, "migration.sql");
+      if (existsSync(file)) {{
+        statements.push(readFileSync(file, "utf-8"));
+      }}
+    }}
+  }} else {{
+    statements.push(
+      execFileSync(
+        "npx",
+        ["prisma", "migrate", "diff", "--from-empty", "--to-schema-datamodel", join(PRISMA_DIR, "schema.prisma"), "--script"],
+        {{ encoding: "utf-8" }}
+      )
+    );
+  }}
+
+  // Partitioning runs last: it carries the table's indexes over to the partitioned parent
+  for (const fragment of ["partial-indexes.sql", "partitions.sql"]) {{
+    const file = join(PRISMA_DIR, fragment);
+    if (existsSync(file)) {{
+      statements.push(readFileSync(file, "utf-8"));
+    }}
+  }}
+  return statements.join("\\n");
+}}
+
+function collectScans(node: PlanNode, scans: PlanScan[] = []): PlanScan[] {{
+  if (node["Relation Name"] || node["Index Name"]) {{
+    scans.push({{ node: node["Node Type"], table: node["Relation Name"], index: node["Index Name"] }});
+  }}
+  for (const child of node.Plans ?? []) {{
+    collectScans(child, scans);
+  }}
+  return scans;
+}}
+
+export async function createQueryPlanHarness(): Promise<QueryPlanHarness> {{
+  const db = new PGlite();
+  await db.exec(schemaSql());
+
+  const captured: Array<{{ query: string; params: string }}> = [];
+  const prisma = new PrismaClient({{
+    adapter: new PrismaPGlite(db),
+    log: [{{ emit: "event", level: "query" }}],
+  }});
+  prisma.$on("query", (event) => captured.push({{ query: event.query, params: event.params }}));
+
+  const entries: PlanEntry[] = [];
+  const tableRows = new Map<string, number>();
+  const partitions = new Map<string, Set<string>>();
+
+  async function explain(sql: string, params: string): Promise<PlanNode> {{
+    const values = JSON.parse(params || "[]") as unknown[];
+    const result = await db.query<{{ "QUERY PLAN": Array<{{ Plan: PlanNode }}> }}>(`EXPLAIN (FORMAT JSON) ${{sql}}`, values);
+    return result.rows[0]["QUERY PLAN"][0].Plan;
+  }}
+
+  async function capture(method: string, fn: () => Promise<unknown>): Promise<PlanEntry[]> {{
+    captured.length = 0;
+    await fn();
+    const statements = captured.splice(0).filter((statement) => EXPLAINABLE.test(statement.query));
+    const methodEntries: PlanEntry[] = [];
+    for (const statement of statements) {{
+      const plan = await explain(statement.query, statement.params);
+      methodEntries.push({{ method, sql: statement.query, scans: collectScans(plan) }});
+    }}
+    entries.push(...methodEntries);
+    return methodEntries;
+  }}
+
+  return {{
+    prisma,
+
+    async analyze() {{
+      await db.exec("ANALYZE");
+      const result = await db.query<{{ relname: string; rows: number }}>(
+        "SELECT relname, reltuples::float8 AS rows FROM pg_class WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace"
+      );
+      tableRows.clear();
+      for (const row of result.rows) {{
+        tableRows.set(row.relname, Number(row.rows));
+      }}
+
+      const inherits = await db.query<{{ parent: string; child: string }}>(
+        "SELECT parent.relname AS parent, child.relname AS child FROM pg_inherits " +
+          "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent " +
+          "JOIN pg_class child ON child.oid = pg_inherits.inhrelid WHERE parent.relkind = 'p'"
+      );
+      partitions.clear();
+      for (const row of inherits.rows) {{
+        partitions.set(row.parent, (partitions.get(row.parent) ?? new Set()).add(row.child));
+      }}
+    }},
+
+    capture,
+
+    async assertIndexed(method, fn) {{
+      const methodEntries = await capture(method, fn);
+      const seqScans = methodEntries.flatMap((entry) =>
+        entry.scans
+          .filter((scan) => scan.node === "Seq Scan" && scan.table && (tableRows.get(scan.table) ?? 0) > ROW_THRESHOLD)
+          .map((scan) => `${{method}}: Seq Scan on "${{scan.table}}" (${{tableRows.get(scan.table!)}} rows)\\n  ${{entry.sql}}`)
+      );
+      expect(seqScans, "sequential scans above the row threshold").toEqual([]);
+    }},
+
+    async assertPruned(method, fn) {{
+      const methodEntries = await capture(method, fn);
+      const unpruned = methodEntries.flatMap((entry) => {{
+        const scanned = new Set(entry.scans.map((scan) => scan.table));
+        return [...partitions]
+          .filter(([, children]) => children.size > 1 && [...children].every((child) => scanned.has(child)))
+          .map(([parent, children]) => `${{method}}: scans all ${{children.size}} partitions of "${{parent}}"\\n  ${{entry.sql}}`);
+      }});
+      expect(unpruned, "partitioned tables scanned without pruning").toEqual([]);
+    }},
+
+    writeReport(path) {{
+      const rows = entries
+        .flatMap((entry) =>
+          entry.scans.map(
+            (scan) => `| \\`${{entry.method}}\\` | ${{scan.table ?? ""}} | ${{scan.node}} | ${{scan.index ? `\\`${{scan.index}}\\`` : "-"}} |`
+          )
+        )
+        .filter((row, index, all) => all.indexOf(row) === index)
+        .sort();
+      const report = [
+        "# Query plans",
+        "",
+        `Generated by the query-plan suite (${{SEED_ROWS}} seeded rows per table, seq-scan threshold ${{ROW_THRESHOLD}}).`,
+        "",
+        "| DAO method | Table | Access path | Index |",
+        "| --- | --- | --- | --- |",
+        ...rows,
+        "",
+      ].join("\\n");
+      writeFileSync(path, report);
+    }},
+
+    async close() {{
+      await prisma.$disconnect();
+      await db.close();
+    }},
+  }};
+}}
+
+/**
+ * Seed SEED_ROWS rows spread over SEED_ORG_IDS; returns the ids created for ORG_ID
+ */
+export async function seedRows<T extends {{ id: string }}>(
+  createMany: (orgId: string, items: unknown[]) => Promise<T[]>,
+  factory: () => unknown
+): Promise<string[]> {{
+  const perOrg = Math.ceil(SEED_ROWS / SEED_ORG_IDS.length);
+  const ids: string[] = [];
+  for (const orgId of SEED_ORG_IDS) {{
+    for (let offset = 0; offset < perOrg; offset += CREATE_MANY_CHUNK) {{
+      const items = Array.from({{ length: Math.min(CREATE_MANY_CHUNK, perOrg - offset) }}, () => factory());
+      const created = await createMany(orgId, items);
+      if (orgId === ORG_ID) {{
+        ids.push(...created.map((record) => record.id));
+      }}
+    }}
+  }}
+  return ids;
+}}
+"""
+
+    @staticmethod
+    def build_domain_suite(
+        repositories: List[RepositoryInfo],
+        domain_name: str,
+        header: str,
+        partitioned_entities: Optional[Set[str]] = None
+    ) -> str:
+        """Build query-plan/{domain}.query-plan.test.ts (seed every DAO, then plan each generated method)"""
+        daos = []
+        factories = set()
+        seed_lines = []
+        blocks = []
+
+        for repo in repositories:
+            dao_class = f"Dao{repo.interface_name}"
+            dao_var = camel_case(repo.name)
+            daos.append(dao_class)
+            can_seed = repo.has_create or repo.is_crud
+            if can_seed:
+                factory = f"create{repo.entity_name}"
+                factories.add(factory)
+                seed_lines.append(
+                    f"    seeded.{dao_var} = await seedRows((orgId, items) => daos.{dao_var}.createMany(orgId as never, items as never), {factory});"
+                )
+
+            cases = [
+                ("list", "await dao().list(ORG_ID as never, { limit: PAGE_SIZE } as never);", ""),
+                (
+                    "list (next page)",
+                    "await dao().list(ORG_ID as never, { limit: PAGE_SIZE, cursor: first.nextCursor ?? undefined } as never);",
+                    "const first = await dao().list(ORG_ID as never, { limit: PAGE_SIZE } as never);\n      ",
+                ),
+                ("findById", "await dao().findById(ORG_ID as never, ids()[0]);", ""),
+                ("findByIds", "await dao().findByIds(ORG_ID as never, ids().slice(0, PAGE_SIZE));", ""),
+                ("get", "await dao().get(ORG_ID as never, ids()[0]);", ""),
+                ("exists", "await dao().exists(ORG_ID as never, ids()[0]);", ""),
+                ("count", "await dao().count(ORG_ID as never);", ""),
+            ]
+            if repo.has_update:
+                cases.append(("update", "await dao().update(ORG_ID as never, ids()[1], {} as never);", ""))
+            if repo.has_delete:
+                cases.append(("delete", "await dao().delete(ORG_ID as never, ids()[ids().length - 1]);", ""))
+
+            tests = []
+            if repo.entity_name in (partitioned_entities or set()):
+                tests.append(f"""    it("list prunes partitions", async () => {{
+      await harness.assertPruned("{dao_class}.list (partitions)", async () => {{
+        await dao().list(ORG_ID as never, {{ limit: PAGE_SIZE }} as never);
+      }});
+    }});""")
+            for name, call, setup in cases:
+                method = f"{dao_class}.{name.split(' ')[0]}" + (" (cursor)" if "next page" in name else "")
+                tests.append(f"""    it({json.dumps(name)}, async () => {{
+      {setup}await harness.assertIndexed({json.dumps(method)}, async () => {{
+        {call}
+      }});
+    }});""")
+
+            skip = "" if can_seed else ".skip"
+            test_cases = "\n\n".join(tests)
+            blocks.append(f"""  describe{skip}("{dao_class}", () => {{
+    const dao = () => daos.{dao_var};
+    const ids = () => seeded.{dao_var} ?? [];
+
+{test_cases}
+  }});""")
+
+        factory_import = (
+            f'import {{ seedFaker, {", ".join(sorted(factories))} }} from "@quub/factories";\n'
+            if factories else ""
+        )
+        dao_blocks = "\n\n".join(blocks)
+        seed_faker = "    seedFaker(FAKER_SEED);\n" if factories else ""
+        dao_entries = "\n".join(
+            f"      {camel_case(repo.name)}: new Dao{repo.interface_name}(harness.prisma as unknown as DaoClient),"
+            for repo in repositories
+        )
+
+        return f"""{header}
+/**
+ * {domain_name} DAO Query Plans
+ *
+ * Seeds every table above the seq-scan threshold, runs each generated DAO method and
+ * EXPLAINs the SQL Prisma issued. Fails on a sequential scan over a large table and
+ * writes query-plan/report.md (DAO method -> index) for review.
+ */
+
+import {{ fileURLToPath }} from "node:url";
+import {{ afterAll, beforeAll, describe, it }} from "vitest";
+import type {{ DaoClient }} from "@quub/adapters/shared/dao-client.js";
+import {{
+{chr(10).join(f"  {dao}," for dao in sorted(daos))}
+}} from "@quub/adapters";
+{factory_import}import {{ ORG_ID, createQueryPlanHarness, seedRows, type QueryPlanHarness }} from "./query-plan-harness.js";
+
+const FAKER_SEED = 12345;
+const PAGE_SIZE = 20;
+const REPORT_PATH = fileURLToPath(new URL("./report.md", import.meta.url));
+
+describe.runIf(process.env.QUERY_PLAN_TESTS === "1")("{domain_name} query plans", () => {{
+  let harness: QueryPlanHarness;
+  let daos: ReturnType<typeof createDaos>;
+  const seeded: Partial<Record<keyof ReturnType<typeof createDaos>, string[]>> = {{}};
+
+  function createDaos() {{
+    return {{
+{dao_entries}
+    }};
+  }}
+
+  beforeAll(async () => {{
+    harness = await createQueryPlanHarness();
+    daos = createDaos();
+{seed_faker}{chr(10).join(seed_lines)}
+    await harness.analyze();
+  }}, 300_000);
+
+  afterAll(async () => {{
+    harness?.writeReport(REPORT_PATH);
+    await harness?.close();
+  }});
+
+{dao_blocks}
+}});
+"""
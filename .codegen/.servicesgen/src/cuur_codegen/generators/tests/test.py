@@ -2,6 +2,7 @@
 Test Generator - Generates test infrastructure and test files
 """
 
+import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from collections import defaultdict
@@ -20,6 +21,10 @@ from .builders import (
     TestSetupBuilder,
     HandlerTestBuilder,
     FlowTestBuilder,
+    PerfTestBuilder,
+    QueryPlanTestBuilder,
+    CacheTestBuilder,
+    CountableTestBuilder,
     TestIndexBuilder,
     PackageJsonBuilder,
     FactoryBuilder,
@@ -284,13 +289,24 @@ class TestGenerator(FileGenerator):
             context,
             "Mock Repositories for Testing"
         )
+        from cuur_codegen.generators.adapters.builders.method_builder import MethodBuilder
+
+        # Mocks paginate with the same keyset cursor (sort field, direction, page size) as the DAO
+        paginations = {
+            repo.entity_name: MethodBuilder._extract_pagination_config(repo.entity_name, context.spec)
+            for repo in repositories
+        }
         mocks_index_content = MockRepositoryBuilder.build_combined_mocks(
             repositories,
             domain_name,
-            mocks_index_header
+            mocks_index_header,
+            paginations
         )
         write_file(mocks_index_file, mocks_index_content)
         files.append(mocks_index_file)
+        TestGenerator._generate_countable_tests(
+            domain_name, test_dir, context, files, repositories, paginations
+        )
 
         # Continue with handler test generation...
         return TestGenerator._continue_handler_test_generation(
@@ -475,6 +491,19 @@ class TestGenerator(FileGenerator):
                 write_file(test_file_path, test_content)
                 files.append(test_file_path)
 
+        if context.config.layers.tests.generate_perf_tests:
+            TestGenerator._generate_perf_tests(
+                domain_name, test_dir, context, files,
+                handlers=handlers, repositories=repositories
+            )
+
+        if context.config.layers.tests.generate_query_plan_tests:
+            TestGenerator._generate_query_plan_tests(
+                domain_name, test_dir, context, files, repositories
+            )
+
+        TestGenerator._generate_cache_tests(domain_name, test_dir, context, files, repositories)
+
         # Generate test index
         test_index_file = test_dir / "index.ts"
         test_index_header = generator.generate_header(
@@ -515,6 +544,171 @@ class TestGenerator(FileGenerator):
 
         return files
 
+    @staticmethod
+    def _generate_perf_tests(
+        domain_name: str,
+        test_dir: Path,
+        context: GenerationContext,
+        files: List[Path],
+        handlers: Optional[List] = None,
+        repositories: Optional[List] = None,
+        flows: Optional[List] = None
+    ) -> List[Path]:
+        """Generate perf/ benchmark suites (vitest bench) and the p95 baseline harness"""
+        tests_config = context.config.layers.tests
+        generator = TestGenerator()
+        generator.logger = context.logger
+
+        perf_dir = test_dir / "perf"
+        ensure_directory(perf_dir)
+
+        harness_file = perf_dir / "perf-harness.ts"
+        harness_header = generator.generate_header(context, "Perf harness (payload sizes, p95 baseline gate)")
+        write_file(
+            harness_file,
+            PerfTestBuilder.build_perf_harness(
+                harness_header,
+                tests_config.perf_payload_sizes,
+                tests_config.perf_regression_threshold
+            )
+        )
+        files.append(harness_file)
+
+        # baseline.json is committed and only rewritten by PERF_UPDATE_BASELINE=1 runs - never overwrite it
+        baseline_file = perf_dir / "baseline.json"
+        if not baseline_file.exists():
+            write_file(baseline_file, PerfTestBuilder.build_baseline_file())
+            files.append(baseline_file)
+
+        for handler in handlers or []:
+            repo = next(
+                (r for r in repositories or [] if kebab_case(r.name) == kebab_case(handler.resource)),
+                None
+            )
+            bench_name = f"{kebab_case(handler.verb)}-{kebab_case(handler.resource)}"
+            bench_header = generator.generate_header(context, f"{handler.handler_name} Handler Benchmarks")
+            bench_content = PerfTestBuilder.build_handler_bench(handler, repo, domain_name, bench_header)
+            if bench_content is None:
+                continue
+            bench_file = perf_dir / generate_file_name(bench_name, "bench")
+            write_file(bench_file, bench_content)
+            files.append(bench_file)
+
+        for flow in flows or []:
+            bench_name = kebab_case(flow.flow_name.replace("Flow", ""))
+            bench_header = generator.generate_header(context, f"{flow.flow_name} Flow Benchmarks")
+            bench_file = perf_dir / generate_file_name(bench_name, "bench")
+            write_file(bench_file, PerfTestBuilder.build_flow_bench(flow, domain_name, bench_header, context))
+            files.append(bench_file)
+
+        return files
+
+    @staticmethod
+    def _generate_cache_tests(
+        domain_name: str,
+        test_dir: Path,
+        context: GenerationContext,
+        files: List[Path],
+        repositories: List
+    ) -> List[Path]:
+        """Generate cache/{domain}.cache.test.ts for repositories with a Cached{Interface} wrapper"""
+        from cuur_codegen.generators.adapters.builders import CachedRepositoryBuilder
+
+        cache_config = context.config.layers.adapters.cache
+        cached_repositories = [
+            repo for repo in repositories or []
+            if CachedRepositoryBuilder.resolve_cache_settings(repo, context.spec, cache_config)
+        ]
+        if not cached_repositories:
+            return files
+
+        generator = TestGenerator()
+        generator.logger = context.logger
+        cache_dir = test_dir / "cache"
+        ensure_directory(cache_dir)
+
+        suite_file = cache_dir / f"{domain_name}.cache.test.ts"
+        suite_header = generator.generate_header(context, f"{domain_name} cached repository tests")
+        write_file(suite_file, CacheTestBuilder.build_domain_suite(cached_repositories, domain_name, suite_header))
+        files.append(suite_file)
+
+        return files
+
+    @staticmethod
+    def _generate_countable_tests(
+        domain_name: str,
+        test_dir: Path,
+        context: GenerationContext,
+        files: List[Path],
+        repositories: List,
+        paginations: Dict
+    ) -> List[Path]:
+        """Generate repositories/{domain}.countable.test.ts for the mock repositories' exists/count"""
+        generator = TestGenerator()
+        generator.logger = context.logger
+        countable_dir = test_dir / "repositories"
+        ensure_directory(countable_dir)
+
+        suite_file = countable_dir / f"{domain_name}.countable.test.ts"
+        suite_header = generator.generate_header(context, f"{domain_name} repository count tests")
+        write_file(
+            suite_file,
+            CountableTestBuilder.build_domain_suite(repositories, domain_name, suite_header, paginations)
+        )
+        files.append(suite_file)
+
+        return files
+
+    @staticmethod
+    def _generate_query_plan_tests(
+        domain_name: str,
+        test_dir: Path,
+        context: GenerationContext,
+        files: List[Path],
+        repositories: List
+    ) -> List[Path]:
+        """Generate query-plan/ (PGlite harness + DAO EXPLAIN suite against the adapter's Prisma schema)"""
+        from cuur_codegen.generators.prisma.builders import PartitionBuilder
+        from cuur_codegen.utils.generator_setup import GeneratorSetup
+
+        if not repositories:
+            return files
+
+        generator = TestGenerator()
+        generator.logger = context.logger
+
+        query_plan_dir = test_dir / "query-plan"
+        ensure_directory(query_plan_dir)
+        prisma_dir = GeneratorSetup.get_output_directory_no_clean(context, "adapter", "adapters") / "prisma"
+
+        harness_file = query_plan_dir / "query-plan-harness.ts"
+        harness_header = generator.generate_header(context, "Query plan harness (PGlite, EXPLAIN, seq-scan gate)")
+        write_file(
+            harness_file,
+            QueryPlanTestBuilder.build_harness(
+                harness_header,
+                domain_name,
+                os.path.relpath(prisma_dir, query_plan_dir) + "/",
+                context.config.layers.tests.query_plan_row_threshold
+            )
+        )
+        files.append(harness_file)
+
+        # Entities declaring x-partition also check that list queries prune partitions
+        partitioned_entities = {
+            repo.entity_name for repo in repositories
+            if PartitionBuilder.extract_config(repo.entity_name, context.spec)
+        }
+        suite_file = query_plan_dir / f"{domain_name}.query-plan.test.ts"
+        suite_header = generator.generate_header(context, f"{domain_name} DAO query plan tests")
+        write_file(
+            suite_file,
+            QueryPlanTestBuilder.build_domain_suite(repositories, domain_name, suite_header, partitioned_entities)
+        )
+        files.append(suite_file)
+
+        return files
+
     @staticmethod
     def _generate_orchestrator_flow_tests(
         orchestrator_domain: str,
@@ -801,6 +995,11 @@ class TestGenerator(FileGenerator):
             write_file(test_file_path, test_content)
             files.append(test_file_path)
 
+        if context.config.layers.tests.generate_perf_tests:
+            TestGenerator._generate_perf_tests(
+                orchestrator_domain, test_dir, context, files, flows=flows
+            )
+
         # Generate test index
         test_index_file = test_dir / "index.ts"
         test_index_header = generator.generate_header(
@@ -8,6 +8,7 @@ from cuur_codegen.pipeline.layer_config import (
     get_layer_config,
     get_all_layer_names,
     get_core_domain_layers,
+    get_default_core_domain_layers,
     get_orchestrator_layers,
     is_orchestrator_layer,
     is_core_domain_layer,
@@ -23,6 +24,7 @@ __all__ = [
     "get_layer_config",
     "get_all_layer_names",
     "get_core_domain_layers",
+    "get_default_core_domain_layers",
     "get_orchestrator_layers",
     "is_orchestrator_layer",
     "is_core_domain_layer",
@@ -77,6 +77,22 @@ LAYER_CONFIGS: Dict[str, LayerConfig] = {
         requires_openapi_spec=True,
     ),
 
+    "loadtest": LayerConfig(
+        name="loadtest",
+        description="Load tests - In-process Fastify service load tests with HDR histogram reports",
+        generators=[
+            LayerGeneratorConfig(
+                name="loadtest",
+                description="Generates an undici load driver, per-operation scenarios and seeding against startService",
+                enabled_by_default=False,  # Opt-in: --layer loadtest
+                requires_spec=True,
+            ),
+        ],
+        execution_order=["loadtest"],  # Runs after services (boots the generated service)
+        domain_type="core",
+        requires_openapi_spec=True,
+    ),
+
     "tests": LayerConfig(
         name="tests",
         description="Test files - Unit tests for handlers and repositories",
@@ -142,6 +158,15 @@ def get_core_domain_layers() -> List[str]:
     ]
 
 
+def get_default_core_domain_layers() -> List[str]:
+    """Get core domain layers that run when no layer is selected (skips opt-in layers)"""
+    return [
+        name for name, config in LAYER_CONFIGS.items()
+        if config.domain_type == "core"
+        and any(generator.enabled_by_default for generator in config.generators)
+    ]
+
+
 def get_orchestrator_layers() -> List[str]:
     """Get list of layers that process orchestrator domains"""
     return [
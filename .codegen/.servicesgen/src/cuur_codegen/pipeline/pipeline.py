@@ -27,7 +27,7 @@ from cuur_codegen.pipeline.layer_config import (
     is_core_domain_layer,
     get_execution_order_for_layers,
     get_generators_for_layers,
-    get_core_domain_layers,
+    get_default_core_domain_layers,
     get_orchestrator_layers,
 )
 
@@ -35,6 +35,7 @@ from cuur_codegen.pipeline.layer_config import (
 from cuur_codegen.generators.services.service import ServiceGenerator
 from cuur_codegen.generators.adapters.adapter import AdapterGenerator
 from cuur_codegen.generators.tests.test import TestGenerator
+from cuur_codegen.generators.loadtest.loadtest import LoadTestGenerator
 from cuur_codegen.generators.orchestrators.aggregator import AggregatorGenerator
 from cuur_codegen.generators.orchestrators.orchestrator_flow import OrchestratorFlowGenerator
 
@@ -122,6 +123,7 @@ class Pipeline:
         self.registry.register("adapter", AdapterGenerator)  # AdapterGenerator includes Prisma schema generation
         self.registry.register("service", ServiceGenerator)
         self.registry.register("tests", TestGenerator)
+        self.registry.register("loadtest", LoadTestGenerator)
         # Orchestrator generators
         self.registry.register("orchestrator_aggregator", AggregatorGenerator)
         self.registry.register("orchestrator_flow", OrchestratorFlowGenerator)
@@ -153,7 +155,7 @@ class Pipeline:
         start_time = datetime.now()
 
         # Determine which layers are being processed
-        selected_layers = options.layers or get_core_domain_layers()  # Default to core domain layers
+        selected_layers = options.layers or get_default_core_domain_layers()  # Default to core domain layers (opt-in layers excluded)
 
         # Determine if we're processing orchestrator or core domains
         processing_orchestrator = any(is_orchestrator_layer(layer) for layer in selected_layers)
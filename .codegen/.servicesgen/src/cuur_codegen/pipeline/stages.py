@@ -58,8 +58,8 @@ class DomainProcessingStage:
         )
 
         # Check if this is an orchestrator layer generation using layer config
-        from cuur_codegen.pipeline.layer_config import is_orchestrator_layer as check_orchestrator_layer, get_core_domain_layers
-        selected_layers = options.layers or get_core_domain_layers()
+        from cuur_codegen.pipeline.layer_config import is_orchestrator_layer as check_orchestrator_layer, get_default_core_domain_layers
+        selected_layers = options.layers or get_default_core_domain_layers()
         is_orchestrator_layer = any(check_orchestrator_layer(layer) for layer in selected_layers)
 
         # Check if domain is an orchestrator domain (for tests layer which handles both)
@@ -105,11 +105,11 @@ class DomainProcessingStage:
         from cuur_codegen.pipeline.layer_config import (
             get_execution_order_for_layers,
             get_generators_for_layers,
-            get_core_domain_layers,
+            get_default_core_domain_layers,
         )
 
         # Determine which layers to process
-        selected_layers = options.layers or get_core_domain_layers()  # Default to core layers
+        selected_layers = options.layers or get_default_core_domain_layers()  # Default to core layers
 
         # Get generators for selected layers (layer_config handles orchestrator filtering)
         generators_to_run = set(get_generators_for_layers(selected_layers))
@@ -175,6 +175,8 @@ class DomainProcessingStage:
             return self.config.layers.services.services.enabled
         elif generator_name == "tests":
             return self.config.layers.tests.tests.enabled
+        elif generator_name == "loadtest":
+            return self.config.layers.loadtest.loadtest.enabled
 
         return True
 
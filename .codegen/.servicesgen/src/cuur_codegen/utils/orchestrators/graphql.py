@@ -11,84 +11,117 @@ from typing import List
 from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.core.logger import Logger
 from cuur_codegen.utils.file import ensure_directory, write_file
-from cuur_codegen.generators.orchestrators.builders import GraphQLBuilder
+from cuur_codegen.generators.orchestrators.builders import GraphQLBuilder, DepsBuilder
+from cuur_codegen.generators.orchestrators.builders.graphql_builder import GraphQLSchemaDef
+from .spec import load_orchestrator_spec
+
+
+def _graphql_dir(context: GenerationContext) -> Path:
+    """orchestrators/domains/src/{domain}/graphql (next to deps.ts, flows/ and aggregators/)"""
+    project_root = context.config.paths.project_root
+    return project_root / "orchestrators" / "domains" / "src" / context.domain_name / "graphql"
+
+
+def _load_schema_definition(context: GenerationContext, logger: Logger) -> GraphQLSchemaDef:
+    """Collect the schema definition from the orchestrator spec and aggregator configuration"""
+    project_root = context.config.paths.project_root
+    spec = load_orchestrator_spec(context, logger)
+
+    aggregators = []
+    from cuur_codegen.generators.orchestrators.config_reader import load_orchestrator_domains_config
+    try:
+        orchestrator_config = load_orchestrator_domains_config(project_root)
+        for domain in orchestrator_config.orchestrator_domains:
+            if domain.name == context.domain_name:
+                aggregators = domain.aggregators
+                break
+    except FileNotFoundError:
+        logger.warn("Orchestrator domains config not found, GraphQL schema has no aggregators")
+
+    repositories = DepsBuilder.collect_repositories(context.domain_name, spec, project_root)
+    return GraphQLBuilder.collect_schema(spec, aggregators, repositories)
 
 
 def build_graphql_schema(
     context: GenerationContext,
     output_dir: Path,
     logger: Logger,
-) -> Path:
+) -> List[Path]:
     """
-    Build GraphQL schema file.
+    Build GraphQL schema and query limit files.
 
     Args:
-        context: Generation context
-        output_dir: Output directory (orchestrators/src/api/graphql)
+        context: Generation context (domain_name is orchestrator domain name)
+        output_dir: Output directory (orchestrators/domains/src/{domain}/graphql)
         logger: Logger instance
 
     Returns:
-        Path to generated schema file
+        Paths to generated schema.ts and limits.ts (empty when the domain has no queries)
     """
-    # GraphQL is cross-domain, so we generate it once
-    project_root = context.config.paths.project_root
-    graphql_dir = project_root / "orchestrators" / "src" / "api" / "graphql"
+    schema_def = _load_schema_definition(context, logger)
+    if not schema_def.queries:
+        logger.warn(f"No GET flows or aggregators for {context.domain_name} - skipping GraphQL schema")
+        return []
+
+    graphql_dir = _graphql_dir(context)
     ensure_directory(graphql_dir)
 
-    # Generate schema file
-    schema_file = graphql_dir / "schema.ts"
     from cuur_codegen.base.builder import BaseBuilder
-    schema_header = BaseBuilder.generate_header(
-        context,
-        "GraphQL Schema",
-    )
-    schema_content = GraphQLBuilder.build_schema(
-        context,
-        {},
-        schema_header,
-    )
-    write_file(schema_file, schema_content)
+    schema_file = graphql_dir / "schema.ts"
+    schema_header = BaseBuilder.generate_header(context, "GraphQL Schema")
+    write_file(schema_file, GraphQLBuilder.build_schema(context, schema_def, schema_header))
+
+    limits_file = graphql_dir / "limits.ts"
+    limits_header = BaseBuilder.generate_header(context, "GraphQL query depth and complexity limits")
+    write_file(limits_file, GraphQLBuilder.build_limits(context, schema_def, limits_header))
 
-    logger.info(f"Generated GraphQL schema: {schema_file.name}")
+    logger.info(
+        f"Generated GraphQL schema: {schema_file.name} "
+        f"({len(schema_def.types)} types, max depth {schema_def.max_depth})"
+    )
 
-    return schema_file
+    return [schema_file, limits_file]
 
 
 def build_graphql_resolvers(
     context: GenerationContext,
     output_dir: Path,
     logger: Logger,
-) -> Path:
+) -> List[Path]:
     """
-    Build GraphQL resolvers file.
+    Build GraphQL resolvers, per-request context and server files.
 
     Args:
-        context: Generation context
-        output_dir: Output directory (orchestrators/src/api/graphql)
+        context: Generation context (domain_name is orchestrator domain name)
+        output_dir: Output directory (orchestrators/domains/src/{domain}/graphql)
         logger: Logger instance
 
     Returns:
-        Path to generated resolvers file
+        Paths to generated context.ts, resolvers.ts and server.ts (empty when the domain has no queries)
     """
-    # GraphQL is cross-domain, so we generate it once
-    project_root = context.config.paths.project_root
-    graphql_dir = project_root / "orchestrators" / "src" / "api" / "graphql"
+    schema_def = _load_schema_definition(context, logger)
+    if not schema_def.queries:
+        return []
+
+    graphql_dir = _graphql_dir(context)
     ensure_directory(graphql_dir)
 
-    # Generate resolvers file
-    resolvers_file = graphql_dir / "resolvers.ts"
     from cuur_codegen.base.builder import BaseBuilder
-    resolvers_header = BaseBuilder.generate_header(
-        context,
-        "GraphQL Resolvers",
-    )
-    resolvers_content = GraphQLBuilder.build_resolvers(
-        context,
-        {},
-        resolvers_header,
-    )
-    write_file(resolvers_file, resolvers_content)
+    context_file = graphql_dir / "context.ts"
+    context_header = BaseBuilder.generate_header(context, "GraphQL per-request context and DataLoaders")
+    write_file(context_file, GraphQLBuilder.build_context(context, schema_def, context_header))
+
+    resolvers_file = graphql_dir / "resolvers.ts"
+    resolvers_header = BaseBuilder.generate_header(context, "GraphQL Resolvers")
+    write_file(resolvers_file, GraphQLBuilder.build_resolvers(context, schema_def, resolvers_header))
+
+    server_file = graphql_dir / "server.ts"
+    server_header = BaseBuilder.generate_header(context, "GraphQL Server")
+    write_file(server_file, GraphQLBuilder.build_server(context, schema_def, server_header))
 
-    logger.info(f"Generated GraphQL resolvers: {resolvers_file.name}")
+    logger.info(
+        f"Generated GraphQL resolvers: {resolvers_file.name} "
+        f"({len(schema_def.entities)} DataLoaders)"
+    )
 
-    return resolvers_file
+    return [context_file, resolvers_file, server_file]
@@ -66,8 +66,21 @@ def build_service_clients(
     # Ensure output directory exists
     ensure_directory(output_dir)
 
-    # Generate service clients for each core domain used by this orchestrator domain
+    # Generate shared keep-alive pools used by every client in this domain
     from cuur_codegen.base.builder import BaseBuilder
+    pool_file = output_dir / "http-pool.ts"
+    pool_header = BaseBuilder.generate_header(
+        context,
+        f"Shared HTTP connection pools (used by {context.domain_name} orchestrator domain)",
+    )
+    write_file(pool_file, ServiceClientBuilder.build_http_pool_module(
+        pool_header,
+        orchestrator_config.core_domain_registry,
+        [cd.name for cd in orchestrator_domain_config.core_domains],
+    ))
+    files.append(pool_file)
+
+    # Generate service clients for each core domain used by this orchestrator domain
     for core_domain_config in orchestrator_domain_config.core_domains:
         core_domain_name = core_domain_config.name
 
@@ -0,0 +1,33 @@
+"""
+Orchestrator Spec Loader - Loads an orchestrator domain's YAML OpenAPI spec
+
+This is a utility function, not a generator. It is shared by the orchestrator
+utilities that derive code from the spec (GraphQL, WebSocket).
+"""
+
+from typing import Dict, Any
+
+import yaml
+
+from cuur_codegen.core.context import GenerationContext
+from cuur_codegen.core.logger import Logger
+
+
+def load_orchestrator_spec(context: GenerationContext, logger: Logger) -> Dict[str, Any]:
+    """
+    Load orchestrators/openapi/src/yaml/{domain}.yaml.
+
+    Args:
+        context: Generation context (domain_name is orchestrator domain name)
+        logger: Logger instance
+
+    Returns:
+        Parsed spec ({} when the file does not exist)
+    """
+    project_root = context.config.paths.project_root
+    spec_path = project_root / "orchestrators" / "openapi" / "src" / "yaml" / f"{context.domain_name}.yaml"
+    if not spec_path.exists():
+        logger.warn(f"Orchestrator YAML spec not found: {spec_path}")
+        return {}
+    with open(spec_path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
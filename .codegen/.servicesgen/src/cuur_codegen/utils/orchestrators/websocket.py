@@ -12,6 +12,7 @@ from cuur_codegen.core.context import GenerationContext
 from cuur_codegen.core.logger import Logger
 from cuur_codegen.utils.file import ensure_directory, write_file
 from cuur_codegen.generators.orchestrators.builders import WebSocketBuilder
+from .spec import load_orchestrator_spec
 
 
 def build_websocket_handlers(
@@ -20,37 +21,49 @@ def build_websocket_handlers(
     logger: Logger,
 ) -> List[Path]:
     """
-    Build WebSocket handler files.
+    Build WebSocket hub, channel handler and route files from the spec's x-websocket extension.
 
     Args:
-        context: Generation context
-        output_dir: Output directory (orchestrators/src/api/websocket/handlers)
+        context: Generation context (domain_name is orchestrator domain name)
+        output_dir: Output directory (orchestrators/domains/src/{domain}/websocket)
         logger: Logger instance
 
     Returns:
-        List of generated file paths
+        List of generated file paths (empty when the spec declares no channels)
     """
     files: List[Path] = []
 
-    # WebSocket handlers are cross-domain, so we generate them once
+    spec = load_orchestrator_spec(context, logger)
+    config = WebSocketBuilder.parse_config(spec)
+    if not config.channels:
+        logger.debug(f"No x-websocket channels for {context.domain_name} - skipping WebSocket handlers")
+        return files
+
+    # Handlers import ../context.js, so they live inside the orchestrator domain
     project_root = context.config.paths.project_root
-    handlers_dir = project_root / "orchestrators" / "src" / "api" / "websocket" / "handlers"
-    ensure_directory(handlers_dir)
+    websocket_dir = project_root / "orchestrators" / "domains" / "src" / context.domain_name / "websocket"
+    ensure_directory(websocket_dir)
 
-    # Generate handlers for each pattern
     from cuur_codegen.base.builder import BaseBuilder
-    for pattern_name, pattern in WebSocketBuilder.WEBSOCKET_PATTERNS.items():
-        handler_file = handlers_dir / f"{pattern_name}.handler.ts"
+    hub_file = websocket_dir / "hub.ts"
+    hub_header = BaseBuilder.generate_header(
+        context,
+        "WebSocket hub - topic index, backpressure and heartbeat",
+    )
+    write_file(hub_file, WebSocketBuilder.build_hub(config, hub_header))
+    files.append(hub_file)
+
+    for channel in config.channels:
+        handler_file = websocket_dir / f"{channel.name}.handler.ts"
 
         header = BaseBuilder.generate_header(
             context,
-            f"{pattern['name']} - {pattern['description']}",
+            f"{channel.name} - {channel.description}",
         )
 
         content = WebSocketBuilder.build_handler(
             context,
-            pattern["name"],
-            pattern,
+            channel,
             header,
         )
 
@@ -59,4 +72,9 @@ def build_websocket_handlers(
 
         logger.info(f"Generated WebSocket handler: {handler_file.name}")
 
+    routes_file = websocket_dir / "index.ts"
+    routes_header = BaseBuilder.generate_header(context, "WebSocket routes")
+    write_file(routes_file, WebSocketBuilder.build_routes(config, routes_header))
+    files.append(routes_file)
+
     return files
@@ -17,6 +17,7 @@ export type {
   CreateUpdateReadRepository,
   CreateDeleteReadRepository,
   CrudRepository,
+  CountableRepository,
   ActionRepository,
 } from "./repositories/_base-repository.js";
 
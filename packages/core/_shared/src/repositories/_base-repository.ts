@@ -386,6 +386,32 @@ export interface SearchableRepository {
   // Add search/indexing methods in implementing repository interface.
 }
 
+/**
+ * Repositories answering existence and count questions without loading rows.
+ * Generated domain repositories extend this alongside their base interface.
+ */
+export interface CountableRepository<
+  TId = string,
+  TFilter = Record<string, unknown>
+> {
+  /**
+   * Whether a live (not soft-deleted) resource exists. Reads only the id column.
+   */
+  exists(orgId: OrgId, id: TId): Promise<boolean>;
+
+  /**
+   * Exact number of live resources matching the filter (SELECT COUNT(*)).
+   */
+  count(orgId: OrgId, filter?: TFilter): Promise<number>;
+
+  /**
+   * Planner estimate of the table's row count (pg_class.reltuples), across all
+   * organizations. Opt-in per entity; for unfiltered totals on large tables
+   * where an exact count would scan every row.
+   */
+  estimatedCount?(): Promise<number>;
+}
+
 /**
  * =======================================================================
  * ACTION REPOSITORY MIXIN